@@ -12,14 +12,7 @@ from argparse import SUPPRESS, ArgumentDefaultsHelpFormatter, ArgumentParser
 from logging import getLogger
 from tkinter import Tk
 
-from pygnssutils import (
-    VERBOSITY_CRITICAL,
-    VERBOSITY_DEBUG,
-    VERBOSITY_HIGH,
-    VERBOSITY_LOW,
-    VERBOSITY_MEDIUM,
-    set_logging,
-)
+from pygnssutils import VERBOSITY_LOW, set_logging
 
 from pygpsclient._version import __version__ as VERSION
 from pygpsclient.app import App
@@ -29,6 +22,7 @@ from pygpsclient.globals import (
     SPARTN_BASEDATE_CURRENT,
     SPARTN_BASEDATE_DATASTREAM,
 )
+from pygpsclient.helpers import add_logging_args
 from pygpsclient.strings import EPILOG
 
 
@@ -111,31 +105,7 @@ def main():
         help="Fully qualified path to TLS CRT (certificate) file",
         default=SUPPRESS,
     )
-    ap.add_argument(
-        "--verbosity",
-        help=(
-            f"Log message verbosity "
-            f"{VERBOSITY_CRITICAL} = critical, "
-            f"{VERBOSITY_LOW} = low (error), "
-            f"{VERBOSITY_MEDIUM} = medium (warning), "
-            f"{VERBOSITY_HIGH} = high (info), {VERBOSITY_DEBUG} = debug, "
-            f"default = {VERBOSITY_CRITICAL}"
-        ),
-        type=int,
-        choices=[
-            VERBOSITY_LOW,
-            VERBOSITY_MEDIUM,
-            VERBOSITY_HIGH,
-            VERBOSITY_DEBUG,
-            VERBOSITY_CRITICAL,
-        ],
-        default=VERBOSITY_LOW,
-    )
-    ap.add_argument(
-        "--logtofile",
-        help="fully qualified log file name, or '' for no log file",
-        default="",
-    )
+    add_logging_args(ap, VERBOSITY_LOW)
     kwargs = vars(ap.parse_args())
 
     # set up global logging configuration
@@ -37,17 +37,20 @@ Created on 12 Sep 2020
 # pylint: disable=no-member
 
 import logging
+from collections import deque
 from datetime import datetime, timedelta
 from inspect import currentframe, getfile
 from os import path
 from queue import Empty, Queue
+from socket import AF_INET6
 from subprocess import CalledProcessError, run
 from sys import executable
-from threading import Thread
+from threading import Event, Thread
 from tkinter import EW, NSEW, NW, Frame, Label, PhotoImage, Tk, Toplevel, font
 from types import NoneType
 
-from pygnssutils import GNSSMQTTClient, GNSSNTRIPClient, MQTTMessage
+from pygnssutils import GNSSMQTTClient, MQTTMessage
+from pygnssutils.globals import PYGPSMP
 from pygnssutils.gnssreader import (
     NMEA_PROTOCOL,
     POLL,
@@ -56,11 +59,11 @@ from pygnssutils.gnssreader import (
     SBF_PROTOCOL,
     UBX_PROTOCOL,
     UNI_PROTOCOL,
+    GNSSMessage,
 )
-from pygnssutils.socket_server import ClientHandler, ClientHandlerTLS, SocketServer
 from pynmeagps import NMEAMessage
 from pyqgc import QGCMessage
-from pyrtcm import RTCMMessage
+from pyrtcm import RTCMMessage, RTCMMessageError, RTCMParseError, RTCMReader
 from pysbf2 import SBFMessage
 from pyspartn import SPARTNMessage
 from pyubx2 import UBXMessage
@@ -68,10 +71,20 @@ from pyunigps import UNIMessage
 from serial import SerialException, SerialTimeoutException
 
 from pygpsclient._version import __version__ as VERSION
+from pygpsclient.async_server import AsyncSocketServer
 from pygpsclient.banner_frame import BannerFrame
 from pygpsclient.configuration import Configuration
+from pygpsclient.correction_capture import (
+    CAPEXT,
+    CAPGNSS,
+    CaptureQueue,
+    CaptureWriter,
+)
+from pygpsclient.correction_latency import CorrectionLatency
+from pygpsclient.correction_passthrough import PassthroughNTRIPClient, PassthroughQueue
 from pygpsclient.dialog_state import DLGTNMEA, DLGTTTY, DLGTUBX, DialogState
 from pygpsclient.file_handler import FileHandler
+from pygpsclient.formatted_message import FormattedMessage
 from pygpsclient.globals import (
     BGCOL,
     CLASS,
@@ -88,15 +101,18 @@ from pygpsclient.globals import (
     GNSS_ERR_EVENT,
     GNSS_EVENT,
     GNSS_TIMEOUT_EVENT,
+    HOME,
     ICON_APP128,
     INFOCOL,
     MAINSCALE,
+    MAPCACHEDIR,
     MQTT_PROTOCOL,
     NOPORTS,
     NTRIP_EVENT,
     OKCOL,
     RTCMSTR,
-    SOCKSERVER_MAX_CLIENTS,
+    SOURCETABLECACHEDIR,
+    SPARTN_DECODED_EVENT,
     SPARTN_EVENT,
     SPARTN_PROTOCOL,
     STATUS_PRIORITY,
@@ -109,29 +125,51 @@ from pygpsclient.helpers import (
     brew_installed,
     check_for_updates,
     check_latest,
+    set_filename,
     set_geom,
 )
+from pygpsclient.map_fetcher import MapCache
 from pygpsclient.menu_bar import MenuBar
+from pygpsclient.mountpoint_source import MountpointSource
 from pygpsclient.nmea_handler import NMEAHandler
 from pygpsclient.qgc_handler import QGCHandler
 from pygpsclient.rtcm3_handler import RTCM3Handler
+from pygpsclient.rtcm_stats import RTCMStats
 from pygpsclient.sbf_handler import SBFHandler
 from pygpsclient.settings_frame import SettingsFrame
+from pygpsclient.socket_fanout import (
+    FanOut,
+    FanoutClientHandler,
+    FanoutClientHandlerTLS,
+    FanoutSocketServer,
+)
+from pygpsclient.sourcetable_index import (
+    MountpointSelector,
+    SourcetableCache,
+    SourcetableIndex,
+)
+from pygpsclient.spartn_decoder import SPARTNDecoder, spartn_basedate
 from pygpsclient.sqlite_handler import DBINMEM, SQLOK, SqliteHandler
 from pygpsclient.status_frame import StatusFrame
 from pygpsclient.stream_handler import StreamHandler
 from pygpsclient.strings import (
     BREWUPDATE,
+    CAPTUREERR,
+    CAPTURESTART,
+    CAPTURESTOP,
     CONFIGERR,
     DLG,
     DLGSTOPRTK,
     DLGTNTRIP,
     DLGTRECORD,
+    DLGTSERVER,
     DLGTSETTINGS,
     ENDOFFILE,
     INACTIVE_TIMEOUT,
     INTROTXTNOPORTS,
     KILLSWITCH,
+    MENUCAPSTART,
+    MENUCAPSTOP,
     NA,
     NOTCONN,
     SAVECONFIGBAD,
@@ -202,10 +240,18 @@ class App(Frame):
         self.__master.iconphoto(True, PhotoImage(file=ICON_APP128))
 
         self._server_status = -1  # socket server status -1 = inactive
-        self.gnss_inqueue = Queue()  # messages from GNSS receiver
+        self.gnss_inqueue = CaptureQueue(CAPGNSS)  # messages from GNSS receiver
         self.gnss_outqueue = Queue()  # messages to GNSS receiver
-        self.ntrip_inqueue = Queue()  # messages from NTRIP source
-        self.spartn_inqueue = Queue()  # messages from SPARTN correction rcvr
+        self.correction_latency = CorrectionLatency()
+        self.rtcm_stats = RTCMStats()
+        # messages from NTRIP source
+        self.ntrip_inqueue = PassthroughQueue(
+            self.gnss_outqueue, self.correction_latency, "NTRIP", self.rtcm_stats
+        )
+        # messages from SPARTN correction rcvr
+        self.spartn_inqueue = PassthroughQueue(
+            self.gnss_outqueue, self.correction_latency, "SPARTN"
+        )
         self.spartn_outqueue = Queue()  # messages to SPARTN correction rcvr
         self.socket_inqueue = Queue()  # message from socket
         self.socket_outqueue = Queue()  # message to socket
@@ -220,9 +266,24 @@ class App(Frame):
         self.uni_handler = UNIHandler(self)
         self.rtcm_handler = RTCM3Handler(self)
         self.tty_handler = TTYHandler(self)
-        self.ntrip_handler = GNSSNTRIPClient(self)
+        self.ntrip_handler = PassthroughNTRIPClient(self)
         self.spartn_handler = GNSSMQTTClient(self)
+        self.spartn_decoder = SPARTNDecoder(
+            lambda: self.__master.event_generate(SPARTN_DECODED_EVENT)
+        )
         self.sqlite_handler = SqliteHandler(self)
+        self.map_cache = MapCache(  # web map image cache shared by all map canvases
+            MAPCACHEDIR,
+            self.configuration.get("mapcachesize_n") * 1000000,
+            self.configuration.get("mapcacheexpiry_n") * 3600,
+        )
+        self.ntrip_index = SourcetableIndex()  # NTRIP client sourcetable
+        self.sourcetable_cache = SourcetableCache(
+            SOURCETABLECACHEDIR, self.configuration.get("ntripclientstexpiry_n") * 3600
+        )
+        self.mountpoint_selector = MountpointSelector(
+            self.configuration.get("ntripclientautoselectdist_n")
+        )
         self.frm_settings = None
         self._conn_status = DISCONNECTED
         self._rtk_conn_status = DISCONNECTED
@@ -231,7 +292,9 @@ class App(Frame):
         self._last_status_update = now
         self._socket_thread = None
         self._socket_server = None
-        self.consoledata = []
+        self._mountpoints = []  # additional NTRIP caster mountpoints
+        self._capture = None  # GNSS & correction data capture
+        self.consoledata = deque(maxlen=self.configuration.get("maxlines_n"))
         self.last_map_update = 0
         self._recorded_commands = []  # captured by RecorderDialog
         self.recording = False  # RecordDialog status
@@ -373,6 +436,7 @@ class App(Frame):
         self.__master.bind(GNSS_ERR_EVENT, self.on_stream_error)
         self.__master.bind(NTRIP_EVENT, self.on_ntrip_read)
         self.__master.bind(SPARTN_EVENT, self.on_spartn_read)
+        self.__master.bind(SPARTN_DECODED_EVENT, self.on_spartn_decoded)
         self.__master.bind_all("<Control-q>", self.on_exit)
         self.__master.bind_all("<Control-k>", self.on_killswitch)
         # <Control-u> also bound in check_updates
@@ -557,6 +621,39 @@ class App(Frame):
         else:  # save failed
             self.status_label = (SAVECONFIGBAD.format(err), ERRCOL)
 
+    def capture_toggle(self):
+        """
+        Start or stop capture of GNSS and correction data menu option.
+
+        GNSS receiver output and incoming NTRIP / SPARTN correction data are
+        captured to a time-stamped file in the data log directory, which can
+        be replayed with original relative timing via the file stream option.
+        """
+
+        queues = (self.gnss_inqueue, self.ntrip_inqueue, self.spartn_inqueue)
+        if self._capture is None:
+            logpath = self.configuration.get("logpath_s") or HOME
+            _, fpath = set_filename(logpath, "capture", CAPEXT)
+            try:
+                self._capture = CaptureWriter(fpath)
+            except OSError as err:
+                self.status_label = (CAPTUREERR.format(err), ERRCOL)
+                return
+            for que in queues:
+                que.capture = self._capture
+            self.menu.file_menu.entryconfig(MENUCAPSTART, label=MENUCAPSTOP)
+            self.status_label = (CAPTURESTART.format(fpath), OKCOL)
+        else:
+            for que in queues:
+                que.capture = None
+            self._capture.close()
+            self.menu.file_menu.entryconfig(MENUCAPSTOP, label=MENUCAPSTART)
+            self.status_label = (
+                CAPTURESTOP.format(self._capture.records, self._capture.filename),
+                OKCOL,
+            )
+            self._capture = None
+
     def update_widgets(self):
         """
         Update widget configuration (self.widget_state.state).
@@ -584,9 +681,13 @@ class App(Frame):
                 if hasattr(frm, "update_frame") and wdgdata[VISIBLE]:
                     if wdg == WDGCONSOLE:
                         frm.update_frame(self.consoledata)
-                        self.consoledata = []
+                        self.consoledata = deque(
+                            maxlen=self.configuration.get("maxlines_n")
+                        )
                     else:
                         frm.update_frame()
+        if self.server_status >= 0 and self.dialog(DLGTSERVER) is not None:
+            self.dialog(DLGTSERVER).update_clients(self.server_clients)
 
     def start_dialog(self, dlg: str):
         """
@@ -618,6 +719,7 @@ class App(Frame):
         """
 
         cfg = self.configuration
+        self.ntriprtcmstr = ntriprtcmstr
         ntripmode = cfg.get("sockmode_b")
         host = cfg.get("sockhost_s")
         if ntripmode:  # NTRIP CASTER
@@ -628,6 +730,19 @@ class App(Frame):
         ntripuser = cfg.get("ntripcasteruser_s")
         ntrippassword = cfg.get("ntripcasterpassword_s")
         tlspempath = cfg.get("tlspempath_s")
+        fanout = FanOut(cfg.get("sockqueuesize_n"), cfg.get("sockslowclient_s"))
+        self._mountpoints = []
+        if ntripmode:
+            for name, source in cfg.get("ntripcastermountpoints_l"):
+                if name == PYGPSMP:  # reserved for main GNSS connection
+                    continue
+                mpt = MountpointSource(
+                    name,
+                    source,
+                    FanOut(cfg.get("sockqueuesize_n"), cfg.get("sockslowclient_s")),
+                )
+                mpt.start()
+                self._mountpoints.append(mpt)
         self._socket_thread = Thread(
             target=self._sockserver_thread,
             args=(
@@ -639,8 +754,9 @@ class App(Frame):
                 ntriprtcmstr,
                 ntripuser,
                 ntrippassword,
-                SOCKSERVER_MAX_CLIENTS,
+                cfg.get("sockmaxclients_n"),
                 self.socket_outqueue,
+                fanout,
             ),
             daemon=True,
         )
@@ -654,6 +770,9 @@ class App(Frame):
 
         if self._socket_server is not None:
             self._socket_server.shutdown()
+        for mpt in self._mountpoints:
+            mpt.stop()
+        self._mountpoints = []
         self.server_status = -1  # -1 = inactive
 
     def _sockserver_thread(
@@ -668,6 +787,7 @@ class App(Frame):
         ntrippassword: str,
         maxclients: int,
         socketqueue: Queue,
+        fanout: FanOut,
     ):
         """
         THREADED PROCESS
@@ -681,25 +801,47 @@ class App(Frame):
         :param str ntriprtcmstr: NTRIP caster RTCM type(rate) sourcetable entry
         :param int maxclients: max num of clients (5)
         :param Queue socketqueue: socket server read queue
+        :param FanOut fanout: client fan-out layer
         """
 
-        requesthandler = ClientHandlerTLS if https else ClientHandler
+        server = None
         try:
-            with SocketServer(
-                self,
-                ntripmode,
-                maxclients,
-                socketqueue,
-                (host, port),
-                requesthandler,
-                ntripuser=ntripuser,
-                ntrippassword=ntrippassword,
-                tlspempath=tlspempath,
-                ntriprtcmstr=ntriprtcmstr,
-            ) as self._socket_server:
+            if self.configuration.get("sockasync_b"):
+                server = AsyncSocketServer(
+                    self,
+                    ntripmode,
+                    maxclients,
+                    socketqueue,
+                    (host, port),
+                    fanout,
+                    https=https,
+                    ntripuser=ntripuser,
+                    ntrippassword=ntrippassword,
+                    tlspempath=tlspempath,
+                    ntriprtcmstr=ntriprtcmstr,
+                    mountpoints=self._mountpoints,
+                )
+            else:
+                server = FanoutSocketServer(
+                    self,
+                    ntripmode,
+                    maxclients,
+                    socketqueue,
+                    (host, port),
+                    FanoutClientHandlerTLS if https else FanoutClientHandler,
+                    ntripuser=ntripuser,
+                    ntrippassword=ntrippassword,
+                    tlspempath=tlspempath,
+                    ntriprtcmstr=ntriprtcmstr,
+                    fanout=fanout,
+                    mountpoints=self._mountpoints,
+                )
+            with server as self._socket_server:
                 self._socket_server.serve_forever()
         except OSError as err:
             self.status_label = (f"Error starting socket server {err}", ERRCOL)
+        if self._socket_server is server:  # not superseded by a restarted server
+            self._socket_server = None
 
     def update_clients(self, clients: int):
         """
@@ -711,6 +853,22 @@ class App(Frame):
 
         self.server_status = clients
 
+    @property
+    def server_clients(self) -> list:
+        """
+        Getter for socket server client statistics.
+
+        :return: list of ClientStats, one per connected client
+        :rtype: list
+        """
+
+        server = self._socket_server
+        if server is None:
+            return []
+        return [
+            stats for mpt in server.mountpoints.values() for stats in mpt.fanout.stats()
+        ]
+
     def _shutdown(self):
         """
         Shut down running handlers.
@@ -718,8 +876,12 @@ class App(Frame):
 
         self.sockserver_stop()
         self.stream_handler.stop()
+        self.spartn_decoder.stop()
+        if self._capture is not None:
+            self.capture_toggle()
         self.sqlite_handler.close()
         self.file_handler.close_logfile()
+        self.file_handler.close_rinexlog()
         self.file_handler.close_trackfile()
 
     def on_exit(self, *args, **kwargs):  # pylint: disable=unused-argument
@@ -759,9 +921,10 @@ class App(Frame):
         try:
             raw_data, parsed_data = self.gnss_inqueue.get(False)
             if raw_data is not None and parsed_data is not None:
+                self.rtcm_stats.update(raw_data, "GNSS")
                 self.process_data(raw_data, parsed_data)
-                # if socket server is running, output raw data to socket
-                if self.server_status:
+                # if socket server has clients, output raw data to socket
+                if self.server_status > 0:
                     self.socket_outqueue.put(raw_data)
             self.gnss_inqueue.task_done()
         except Empty:
@@ -823,12 +986,26 @@ class App(Frame):
                     source = "NTRIP"
                 else:
                     source = "OTHER"
-                if isinstance(parsed_data, (RTCMMessage, SPARTNMessage)):
-                    self.send_to_device(raw_data)
-                    self.process_data(raw_data, parsed_data, source + ">>")
+                if isinstance(parsed_data, (RTCMMessage, SPARTNMessage, GNSSMessage)):
+                    # in passthrough mode, data has already been sent to device
+                    if not self.ntrip_inqueue.passthrough:
+                        self.send_to_device(raw_data)
+                        self.rtcm_stats.update(raw_data, source)
+                    if isinstance(parsed_data, GNSSMessage):  # deferred RTCM3 parse
+                        try:
+                            parsed_data = RTCMReader.parse(raw_data, labelmsm=1)
+                        except (RTCMMessageError, RTCMParseError):
+                            pass  # display metadata only
+                    if isinstance(parsed_data, SPARTNMessage):
+                        # NTRIP SPARTN is unencrypted so always decoded
+                        self._process_spartn(raw_data, parsed_data, source + ">>", 1)
+                    else:
+                        self.process_data(raw_data, parsed_data, source + ">>")
                 elif isinstance(parsed_data, NMEAMessage):
                     # i.e. NMEA GGA sentence sent to NTRIP server
                     self.process_data(raw_data, parsed_data, source + "<<")
+            elif isinstance(raw_data, list):  # sourcetable
+                self.update_sourcetable(raw_data)
             self.ntrip_inqueue.task_done()
         except Empty:
             pass
@@ -853,11 +1030,16 @@ class App(Frame):
                     source = "MQTT"
                 else:
                     source = "OTHER"
-                self.process_data(
-                    raw_data,
-                    parsed_data,
-                    source + ">>",
-                )
+                if isinstance(parsed_data, SPARTNMessage):
+                    cfg = self.configuration
+                    self._process_spartn(
+                        raw_data,
+                        parsed_data,
+                        source + ">>",
+                        cfg.get("spartndecode_b") and cfg.get("spartnkey_s") != "",
+                    )
+                else:
+                    self.process_data(raw_data, parsed_data, source + ">>")
             self.spartn_inqueue.task_done()
 
         except Empty:
@@ -876,6 +1058,72 @@ class App(Frame):
         if self.dialog(DLGTNTRIP) is not None:
             self.dialog(DLGTNTRIP).set_controls(status, msgt)
 
+    def update_sourcetable(self, sourcetable: list):
+        """
+        Index and cache sourcetable retrieved by NTRIP client, if not
+        already indexed.
+
+        :param list sourcetable: sourcetable as list of entries
+        """
+
+        if not sourcetable or sourcetable is self.ntrip_index.sourcetable:
+            return
+        self.ntrip_index.load(sourcetable)
+        self.mountpoint_selector.reset()
+        settings = self.ntrip_handler.settings
+        self.sourcetable_cache.put(settings["server"], settings["port"], sourcetable)
+
+    def cached_sourcetable(self, server: str, port: int) -> list:
+        """
+        Get cached sourcetable for NTRIP caster (if available) and index it.
+
+        :param str server: NTRIP caster URL
+        :param int port: NTRIP caster port
+        :return: sourcetable as list of entries (empty if not cached)
+        :rtype: list
+        """
+
+        sourcetable = self.sourcetable_cache.get(server, port) or []
+        self.ntrip_index.load(sourcetable)
+        self.mountpoint_selector.reset()
+        return sourcetable
+
+    def _check_mountpoint(self):
+        """
+        If NTRIP mountpoint auto-selection is enabled, reconnect to the
+        nearest mountpoint in the indexed sourcetable whenever the rover
+        has moved more than the configured threshold distance.
+        """
+
+        if not (
+            self.configuration.get("ntripclientautoselect_b")
+            and self.ntrip_handler.connected
+        ):
+            return
+        settings = dict(self.ntrip_handler.settings)
+        lat, lon = self.gnss_status.lat, self.gnss_status.lon
+        if settings["ggamode"] != 0 or not (
+            isinstance(lat, float) and isinstance(lon, float)
+        ):
+            return  # fixed reference or no live position
+        name, dist = self.mountpoint_selector.update(
+            self.ntrip_index, lat, lon, settings["mountpoint"], settings["datatype"]
+        )
+        if name is None:
+            return
+        self.logger.info(f"NTRIP mountpoint {name} selected, baseline {dist:.1f} km")
+        self.ntrip_handler.stop()
+        settings["mountpoint"] = name
+        settings["ipprot"] = "IPv6" if settings["ipprot"] == AF_INET6 else "IPv4"
+        settings["sourcetable"] = self.ntrip_index.sourcetable
+        self.ntrip_handler.run(
+            **settings,
+            output=self.ntrip_inqueue,
+            stopevent=Event(),  # previous connection thread retains old stopevent
+        )
+        self.configuration.set("ntripclientmountpoint_s", name)
+        self.update_ntrip_status(True)
+
     def get_coordinates(self) -> dict:
         """
         Supply current coordinates and fix data to any widget
@@ -904,6 +1152,50 @@ class App(Frame):
             "diffstation": self.gnss_status.diff_station,
         }
 
+    def on_spartn_decoded(self, event):  # pylint: disable=unused-argument
+        """
+        EVENT TRIGGERED
+        Action on <<spartn_decoded>> event - decoded SPARTN messages available.
+
+        :param event event: decoded event
+        """
+
+        for raw_data, parsed_data, marker in self.spartn_decoder.completed():
+            self.process_data(raw_data, parsed_data, marker)
+
+    def _process_spartn(
+        self, raw_data: bytes, parsed_data: SPARTNMessage, marker: str, decode: int
+    ):
+        """
+        Process undecoded SPARTN message. If decoded content is required for
+        display, the message is decoded asynchronously and processed when
+        the <<spartn_decoded>> event fires.
+
+        :param bytes raw_data: raw SPARTN message
+        :param SPARTNMessage parsed_data: undecoded SPARTN message
+        :param str marker: string prepended to console entries e.g. "MQTT>>"
+        :param int decode: decode SPARTN message for display 0 = no, 1 = yes
+        """
+
+        wdgs = self.widget_state.state
+        cfg = self.configuration
+        if (
+            decode
+            and (
+                (wdgs[WDGCONSOLE][VISIBLE] and self.protocol_mask & SPARTN_PROTOCOL)
+                or wdgs[WDGCHART][VISIBLE]
+            )
+            and self.spartn_decoder.submit(
+                raw_data,
+                parsed_data,
+                marker,
+                cfg.get("spartnkey_s"),
+                spartn_basedate(cfg.get("spartnbasedate_n")),
+            )
+        ):
+            return
+        self.process_data(raw_data, parsed_data, marker)
+
     def process_data(self, raw_data: bytes, parsed_data: object, marker: str = ""):
         """
         THIS IS THE MAIN GNSS DATA PROCESSING LOOP
@@ -916,6 +1208,8 @@ class App(Frame):
         """
 
         # self.logger.debug(f"data received {parsed_data.identity}")
+        # string representations shared by console and data log
+        fmsg = FormattedMessage(raw_data, parsed_data, marker)
         msgprot = 0
         protfilter = self.protocol_mask
         if isinstance(parsed_data, NMEAMessage):
@@ -938,7 +1232,7 @@ class App(Frame):
             if self.configuration.get("ttyprot_b"):
                 msgprot = TTY_PROTOCOL
             else:
-                marker = WARNING
+                fmsg.marker = WARNING
 
         if msgprot == UBX_PROTOCOL and msgprot & protfilter:
             self.ubx_handler.process_data(raw_data, parsed_data)
@@ -969,7 +1263,7 @@ class App(Frame):
         if self.widget_state.state[WDGCONSOLE][VISIBLE] and (
             msgprot in (0, MQTT_PROTOCOL) or msgprot & protfilter
         ):
-            self.consoledata.append((raw_data, parsed_data, marker))
+            self.consoledata.append(fmsg)
 
         # periodically update widgets if visible
         now = datetime.now()
@@ -977,6 +1271,7 @@ class App(Frame):
             seconds=self.configuration.get("guiupdateinterval_f")
         ):
             self._refresh_widgets()
+            self._check_mountpoint()
             # update database if enabled
             if self.configuration.get("database_b"):
                 self.sqlite_handler.load_data()
@@ -992,7 +1287,11 @@ class App(Frame):
 
         # update log file if enabled
         if self.configuration.get("datalog_b"):
-            self.file_handler.write_logfile(raw_data, parsed_data)
+            self.file_handler.write_logfile(fmsg)
+
+        # update real-time RINEX log if enabled
+        if self.configuration.get("rinexlog_b"):
+            self.file_handler.write_rinexlog(fmsg)
 
         self.update_idletasks()
 
@@ -0,0 +1,380 @@
+"""
+async_server.py
+
+Asyncio socket server and NTRIP caster.
+
+An alternative to the thread-per-client pygnssutils SocketServer, in
+which all client connections are handled by coroutines in a single event
+loop thread, so that many concurrent clients can be served with low
+per-connection memory. Raw data is distributed to clients via the same
+fan-out layer (bounded per-client queues and slow client policy) as
+the threaded server.
+
+Operates in either of two modes according to ntripmode setting:
+
+- ntripmode=0. Open socket server mode - streams GNSS data to any
+  connected client without authentication.
+- ntripmode=1. NTRIP caster mode - responds to NTRIP client authentication,
+  sourcetable and RTCM3 data stream requests. Additional mountpoints, each
+  with their own fan-out layer, may be published alongside the default
+  mountpoint.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import asyncio
+import logging
+from functools import partial
+from queue import Empty, Queue
+from ssl import PROTOCOL_TLS_SERVER, SSLContext
+from threading import Event, Thread
+from time import monotonic
+
+from pygnssutils.globals import (
+    CONNECTED,
+    DISCONNECTED,
+    NTRIP2,
+    PYGNSSUTILS_PEM,
+    PYGPSMP,
+    RTCMSTR,
+)
+
+from pygpsclient.ntrip_caster import Mountpoint, ntrip_credentials, ntrip_response
+from pygpsclient.socket_fanout import CLIENTTIMEOUT, ClientQueue, FanOut
+
+BUFSIZE = 1024
+
+
+class AsyncClientQueue(ClientQueue):
+    """
+    Client queue which can be awaited from the server event loop.
+
+    NB: put() and close() must be called from the event loop thread.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Constructor.
+        """
+
+        super().__init__(*args, **kwargs)
+        self._ready = asyncio.Event()
+
+    def put(self, raw: bytes, stamp: float) -> bool:
+        """
+        Add frame to queue and wake writer.
+
+        :param bytes raw: raw frame
+        :param float stamp: monotonic time frame was received
+        :return: False if client has been evicted, otherwise True
+        :rtype: bool
+        """
+
+        res = super().put(raw, stamp)
+        self._ready.set()
+        return res
+
+    def _close(self):
+        """
+        Close queue and wake writer.
+        """
+
+        super()._close()
+        self._ready.set()
+
+    async def aget(self) -> list:
+        """
+        Wait for and remove queued frames.
+
+        :return: list of (raw, timestamp), or None if closed
+        :rtype: list
+        """
+
+        while True:
+            batch = self.get(0)
+            if batch is None or batch:
+                return batch
+            self._ready.clear()
+            await self._ready.wait()
+
+
+class AsyncSocketServer:
+    """
+    Asyncio socket server / NTRIP caster class.
+    """
+
+    def __init__(
+        self,
+        app,
+        ntripmode: int,
+        maxclients: int,
+        msgqueue: Queue,
+        server_address: tuple,
+        fanout: FanOut = None,
+        mountpoints: list = None,
+        **kwargs,
+    ):
+        """
+        Constructor.
+
+        :param object app: reference to main application class (if any)
+        :param int ntripmode: 0 = open socket server, 1 = NTRIP caster
+        :param int maxclients: maximum number of clients
+        :param Queue msgqueue: queue containing raw GNSS frames
+        :param tuple server_address: (host, port)
+        :param FanOut fanout: client fan-out layer
+        :param list mountpoints: additional Mountpoints
+        :param bool https: (kwarg) enable TLS (False)
+        :param str tlspempath: (kwarg) path to TLS PEM file
+        :param str ntripuser: (kwarg) NTRIP authentication user name
+        :param str ntrippassword: (kwarg) NTRIP authentication password
+        :param str ntriprtcmstr: (kwarg) RTCM types sourcetable entry
+        :param str ntripversion: (kwarg) NTRIP version "1.0" or "2.0"
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        self.__app = app
+        self.logger = logging.getLogger(__name__)
+        self._ntripmode = ntripmode
+        self._maxclients = maxclients
+        self._msgqueue = msgqueue
+        self.server_address = server_address
+        self.fanout = FanOut() if fanout is None else fanout
+        self._https = kwargs.get("https", False)
+        self.tlspempath = kwargs.get("tlspempath", PYGNSSUTILS_PEM)
+        self._credentials = ntrip_credentials(
+            kwargs.get("ntripuser", "anon"), kwargs.get("ntrippassword", "password")
+        )
+        self.ntriprtcmstr = kwargs.get("ntriprtcmstr", RTCMSTR)
+        self.ntripversion = kwargs.get("ntripversion", NTRIP2)
+        self._mountpoints = {
+            PYGPSMP: Mountpoint(PYGPSMP, self.fanout, self.ntriprtcmstr)
+        }
+        for mpt in mountpoints or []:
+            self._mountpoints[mpt.name] = mpt
+        self._connections = 0
+        self._loop = None
+        self._stop = None
+        self._stopped = False
+        self._stopread = Event()
+        self.started = Event()
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.server_close()
+
+    def serve_forever(self):
+        """
+        Run server event loop in calling thread until shutdown() is called.
+
+        :raises: OSError if server cannot bind to address
+        """
+
+        asyncio.run(self._serve())
+
+    def shutdown(self):
+        """
+        Stop server (may be called from any thread).
+        """
+
+        self._stopped = True
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._stop.set)
+            except RuntimeError:  # loop already closed
+                pass
+
+    def server_close(self):
+        """
+        Stop GNSS message reader thread.
+        """
+
+        self._stopread.set()
+
+    async def _serve(self):
+        """
+        Main server coroutine.
+        """
+
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        ssl = None
+        if self._https:
+            ssl = SSLContext(PROTOCOL_TLS_SERVER)
+            ssl.load_cert_chain(certfile=self.tlspempath)
+        server = await asyncio.start_server(
+            self._handle,
+            self.server_address[0],
+            self.server_address[1],
+            ssl=ssl,
+            reuse_address=True,
+        )
+        self.server_address = server.sockets[0].getsockname()[0:2]
+        while not self._msgqueue.empty():  # flush queue
+            self._msgqueue.get()
+        Thread(target=self._read_thread, daemon=True).start()
+        # additional mountpoints publish via the event loop
+        for mpt in self._mountpoints.values():
+            if mpt.fanout is not self.fanout:
+                mpt.publish = partial(self._publish, mpt.fanout)
+        self.started.set()
+        async with server:
+            if not self._stopped:
+                await self._stop.wait()
+            for mpt in self._mountpoints.values():
+                mpt.fanout.clear()
+        self.server_close()
+
+    def _publish(self, fanout: FanOut, raw: bytes):
+        """
+        Pass raw frame to event loop for fan-out (may be called from any thread).
+
+        :param FanOut fanout: fan-out layer
+        :param bytes raw: raw frame
+        """
+
+        try:
+            self._loop.call_soon_threadsafe(fanout.publish, raw)
+        except RuntimeError:  # loop closed
+            pass
+
+    def _read_thread(self):
+        """
+        THREADED
+        Read from main GNSS message queue and pass to event loop for fan-out.
+        """
+
+        while not self._stopread.is_set():
+            try:
+                raw = self._msgqueue.get(timeout=1)
+            except Empty:
+                continue
+            if raw is None:
+                continue
+            try:
+                self._loop.call_soon_threadsafe(self.fanout.publish, raw)
+            except RuntimeError:  # loop closed
+                break
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Handle client connection.
+
+        :param asyncio.StreamReader reader: client stream reader
+        :param asyncio.StreamWriter writer: client stream writer
+        """
+
+        address = writer.get_extra_info("peername")[0:2]
+        if self._connections >= self._maxclients:
+            self.logger.info(
+                f"Request {address} rejected - maximum clients reached "
+                f"{self._connections}/{self._maxclients}."
+            )
+            writer.close()
+            return
+        self._notify(address, CONNECTED)
+        try:
+            fanout = self.fanout
+            if self._ntripmode:
+                data = await asyncio.wait_for(reader.read(BUFSIZE), CLIENTTIMEOUT)
+                resp, mpt = ntrip_response(
+                    data,
+                    self._credentials,
+                    self.ntripversion,
+                    self.server_address,
+                    self.mountpoints,
+                )
+                fanout = None if mpt is None else mpt.fanout
+                writer.write(resp)
+                await asyncio.wait_for(writer.drain(), CLIENTTIMEOUT)
+            if fanout is not None:
+                await self._stream(address, writer, fanout)
+        except (OSError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
+            self._notify(address, DISCONNECTED)
+
+    async def _stream(
+        self, address: tuple, writer: asyncio.StreamWriter, fanout: FanOut
+    ):
+        """
+        Write client's queued frames to socket until client
+        disconnects or is evicted.
+
+        :param tuple address: client address
+        :param asyncio.StreamWriter writer: client stream writer
+        :param FanOut fanout: fan-out layer of requested mountpoint
+        """
+
+        clq = fanout.register(address, writer.transport.abort, AsyncClientQueue)
+        try:
+            while True:
+                batch = await clq.aget()
+                if batch is None:  # evicted
+                    return
+                for raw, _ in batch:
+                    writer.write(raw)
+                await asyncio.wait_for(writer.drain(), CLIENTTIMEOUT)
+                now = monotonic()
+                for raw, stamp in batch:
+                    clq.stats.sent(len(raw), now - stamp)
+        finally:
+            fanout.unregister(clq)
+
+    def _notify(self, address: tuple, status: int):
+        """
+        Update client connection count.
+
+        :param tuple address: client address
+        :param int status: DISCONNECTED or CONNECTED
+        """
+
+        self._connections += 1 if status == CONNECTED else -1
+        self.logger.info(
+            f"Client {address} {'connected' if status == CONNECTED else 'disconnected'}. "
+            f"Total clients {self._connections}/{self._maxclients}."
+        )
+        if hasattr(self.__app, "update_clients"):
+            self.__app.update_clients(self._connections)
+
+    @property
+    def latlon(self) -> tuple:
+        """
+        Get current lat / lon from receiver.
+
+        :return: tuple of (lat, lon)
+        :rtype: tuple
+        """
+
+        if hasattr(self.__app, "gnss_status"):
+            return (self.__app.gnss_status.lat, self.__app.gnss_status.lon)
+        return ("", "")
+
+    @property
+    def mountpoints(self) -> dict:
+        """
+        Getter for published mountpoints, with default mountpoint
+        at current receiver position.
+
+        :return: dict of {name: Mountpoint}
+        :rtype: dict
+        """
+
+        mpt = self._mountpoints[PYGPSMP]
+        mpt.lat, mpt.lon = self.latlon
+        return self._mountpoints
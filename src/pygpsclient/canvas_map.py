@@ -23,21 +23,20 @@ Created on 13 Sep 2020
 
 # pylint: disable=too-many-positional-arguments, too-many-arguments, unused-argument
 
-from http.client import responses
 from io import BytesIO
 from math import sqrt
 from random import randrange
+from threading import Thread
 from tkinter import (
     ALL,
     CENTER,
     Canvas,
     S,
+    TclError,
 )
 
 from PIL import Image, ImageTk, UnidentifiedImageError
 from pynmeagps import planar
-from requests import ConnectionError as ConnError
-from requests import ConnectTimeout, RequestException, get
 
 from pygpsclient.canvas_subclasses import create_circle  # pylint: disable=unused-import
 from pygpsclient.globals import (
@@ -49,37 +48,40 @@ from pygpsclient.globals import (
     IMG_WORLD,
     IMG_WORLD_BOUNDS,
     IMPORT,
+    MAPTILEDIR,
     PNTCOL,
+    TRK_TOLERANCE,
     WORLD,
     Area,
     AreaXY,
     Point,
 )
 from pygpsclient.helpers import (
-    area_in_bounds,
     get_track_bounds,
     ll2xy,
-    normalise_area,
-    point_in_bounds,
+    ll2xy_batch,
     scale_font,
+    simplify_track,
 )
+from pygpsclient.map_fetcher import MapCache, MapFetcher
+from pygpsclient.map_index import MapIndex
+from pygpsclient.map_pyramid import MapPyramid
 from pygpsclient.mapquest_handler import (
     HYB,
     MAP,
-    MAPQTIMEOUT,
     POINTLIMIT,
     SAT,
     format_mapquest_request,
 )
 from pygpsclient.strings import (
     DLGGPXOOB,
+    MAPBUILDING,
     MAPCONFIGERR,
     MAPOPENERR,
     MAPPERMERR,
-    NOCONN,
-    NOWEBMAPCONN,
+    MAPSIZEERR,
+    MAPTILEERR,
     NOWEBMAPFIX,
-    NOWEBMAPHTTP,
     NOWEBMAPKEY,
     OUTOFBOUNDS,
 )
@@ -94,7 +96,10 @@ TAG_MARKER = "mark"
 TAG_HACC = "hacc"
 TAG_CLOCK = "clok"
 TAG_LOCATION = "loc"
+MAPFETCH_EVENT = "<<map_fetched>>"
+MAPBUILD_EVENT = "<<map_built>>"
 MARKERSIZE = 6
+TRK_CACHE = 8  # number of simplified tracks (zoom levels) cached
 MAX_SIZE = 100000000  # 154,746,100 pixels for PIL/Image
 """Maximum image size allowed by PIL Image library"""
 MAPTYPES = (WORLD, MAP, SAT, HYB, CUSTOM)
@@ -128,14 +133,24 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
         self._bounds = None
         self._native_bounds = None
         self._track = None
+        self._trackcache = {}  # simplified track per display scale
+        self._trackid = None
         self._marker = None
         self._zoom = None
         self._zoommin = False
         self._last_map_update = 0
-        self._last_image = None
+        self._last_box = None
         self._last_bounds = None
         self._lastmaptype = ""
         self._lastmappath = ""
+        self._building = None  # path of map image whose pyramid is being built
+        self._build_result = None  # (path, pyramid, error) of completed build
+        self._build_errors = {}  # pyramid key: error of failed builds
+        self._draw_args = None  # arguments of most recent draw_map()
+        self._mapindex = None
+        self._fetcher = MapFetcher(self._on_fetch_complete, self.__app.map_cache)
+        self._online_key = None  # cache key of displayed online map
+        self._pending_key = None  # cache key of requested online map
         self._font = self.__app.font_sm
         self._fonth = self._font.metrics("linespace")
 
@@ -145,6 +160,9 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
         self.bind("<Configure>", self._on_resize)
         self.bind("<Double-Button-2>", self.on_clear)
         self.bind("<Double-Button-3>", self.on_clear)
+        self.bind(MAPFETCH_EVENT, self._on_map_fetched)
+        self.bind(MAPBUILD_EVENT, self._on_map_built)
+        self.bind("<Destroy>", self._on_destroy)
 
     def draw_map(
         self,
@@ -171,6 +189,16 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
         """
 
         self._zoom = zoom
+        self._draw_args = (
+            maptype,
+            location,
+            marker,
+            track,
+            hacc,
+            mappath,
+            bounds,
+            zoom,
+        )
         if maptype in (WORLD, CUSTOM, IMPORT):
             self._draw_offline_map(
                 maptype, location, marker, track, hacc, mappath, bounds, zoom
@@ -208,7 +236,7 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
 
         err = self.open_offline_map(maptype, location, mappath, bounds)
         if err != "":
-            self.draw_msg(err, ERRCOL)
+            self.draw_msg(err, ERRCOL if self._building is None else PNTCOL)
             return
 
         self._lastmaptype = maptype
@@ -219,17 +247,20 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
             or maptype == WORLD
             or self.__app.configuration.get("mapzoom_disabled_b")
         ):
-            image = self._mapimage
+            box = (0, 0, self._mapimage.width, self._mapimage.height)
         else:
-            image, self._bounds = self._zoom_offline_map(
+            box, self._bounds = self._zoom_offline_map(
                 self._mapimage, self._native_bounds, location, zoom
             )
-            self._last_image = image
+            self._last_box = box
             self._last_bounds = self._bounds
-        if image is None:
+        if box is None:
             self.draw_msg(DLGGPXOOB, ERRCOL)
             return
-        self._img = ImageTk.PhotoImage(image.resize((self.width, self.height)))
+        # compose only the map tiles visible in box
+        self._img = ImageTk.PhotoImage(
+            self._mapimage.render(box, (self.width, self.height))
+        )
         self.create_image(
             self.width / 2, self.height / 2, image=self._img, anchor=CENTER
         )
@@ -278,45 +309,108 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
             elif self._lastmappath == mpath:  # don't bother opening again
                 err = ""
             else:
-                self._mapimage = Image.open(mpath)
-                self._lastmappath = mpath
-                err = ""
+                err = self._open_pyramid(mpath)
         except (ValueError, IndexError):
             err = MAPCONFIGERR
         except PermissionError:
             err = MAPPERMERR.format(mpath.split("/")[-1])
-        except (FileNotFoundError, UnidentifiedImageError):
+        except FileNotFoundError:
             err = MAPOPENERR.format(mpath.split("/")[-1])
 
         return err
 
+    def _open_pyramid(self, mpath: str) -> str:
+        """
+        Open map tile pyramid of map image, if already built, otherwise
+        start building it in the background.
+
+        :param str mpath: path to map image
+        :return: error code
+        :rtype: str
+        :raises: FileNotFoundError, PermissionError
+        """
+
+        if self._building is not None:  # wait for current build
+            return MAPBUILDING.format(self._building.split("/")[-1])
+        pyramid = MapPyramid(mpath, MAPTILEDIR, build=False)
+        if pyramid.built:
+            self._mapimage = pyramid
+            self._lastmappath = mpath
+            return ""
+        if pyramid.key in self._build_errors:
+            return self._build_errors[pyramid.key]
+        # build pyramid in background; completion is notified via MAPBUILD_EVENT
+        self._building = mpath
+        Thread(target=self._build_map, args=(mpath, pyramid), daemon=True).start()
+        return MAPBUILDING.format(mpath.split("/")[-1])
+
+    def _build_map(self, mpath: str, pyramid: MapPyramid):
+        """
+        THREADED
+        Build map tile pyramid and notify tkinter event loop on completion.
+
+        :param str mpath: path to map image
+        :param MapPyramid pyramid: unbuilt map pyramid
+        """
+
+        fname = mpath.split("/")[-1]
+        err = ""
+        try:
+            pyramid.build()
+        except Image.DecompressionBombError:
+            err = MAPSIZEERR.format(fname)
+        except PermissionError:
+            err = MAPPERMERR.format(fname)
+        except (FileNotFoundError, UnidentifiedImageError):
+            err = MAPOPENERR.format(fname)
+        except OSError:  # e.g. unable to write tile cache
+            err = MAPTILEERR.format(fname)
+        self._build_result = (mpath, pyramid, err)
+        try:
+            self.event_generate(MAPBUILD_EVENT)
+        except (RuntimeError, TclError):  # canvas destroyed
+            pass
+
+    def _on_map_built(self, event):  # pylint: disable=unused-argument
+        """
+        EVENT TRIGGERED
+        Action on <<map_built>> event - redraw map using built pyramid.
+
+        :param event event: map built event
+        """
+
+        mpath, pyramid, err = self._build_result
+        self._building = None
+        if err != "":
+            self._build_errors[pyramid.key] = err
+        else:
+            self._mapimage = pyramid
+            self._lastmappath = mpath
+        if self._draw_args is not None:
+            self.draw_map(*self._draw_args)
+
     def _find_offline_map(self, location: Point, bounds: Area) -> str:
         """
-        Find first map image with bounds containing location.
+        Find highest resolution map image with bounds containing location.
 
         :param Point location: location
         :param Area bounds: native extents of map image, if known
         :return: map path
         :rtype: str
         """
-        # pylint: disable=arguments-out-of-order
 
-        mpath = None
+        # (re)build spatial index if usermaps have changed
         usermaps = self.__app.configuration.get("usermaps_l")
-        for fpath, extent in usermaps:
-            extents = normalise_area((extent[0], extent[1], extent[2], extent[3]))
-            # check if bounds or location are within map extents
-            if (bounds is not None and area_in_bounds(extents, bounds)) or (
-                location is not None and point_in_bounds(extents, location)
-            ):
-                mpath = fpath
-                self._bounds = extents
-                self._native_bounds = extents
-                break
+        if self._mapindex is None or self._mapindex.usermaps != usermaps:
+            self._mapindex = MapIndex(usermaps)
+        mpath, extents = self._mapindex.find(location, bounds)
+        if mpath is not None:
+            self._bounds = extents
+            self._native_bounds = extents
         return mpath
 
     def _zoom_offline_map(
-        self, image: Image, extents: Area, location: Point, zoom: int
+        self, image: MapPyramid, extents: Area, location: Point, zoom: int
     ) -> tuple:
         """
         Zoom (crop) offline image centered at location and
@@ -325,11 +419,11 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
         Automatically increments zoom until image is
         entirely within zoom bounds.
 
-        ;param Image image: native map image
+        ;param MapPyramid image: native map image
         :param Area extents: native map extents
         :param Point location: location (center point)
         :param int zoom: zoom level
-        :return: tuple of (zoomed image, zoomed bounds)
+        :return: tuple of (zoomed image box, zoomed bounds)
         :rtype: tuple
         """
 
@@ -347,10 +441,10 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
         size = (x2 - x1) * (y2 - y1)
         if size >= MAX_SIZE:
             self._zoommin = True
-            return self._last_image, self._last_bounds
+            return self._last_box, self._last_bounds
 
         self._zoommin = False
-        return image.crop(AreaXY(x1, y1, x2, y2)), zoombounds
+        return AreaXY(x1, y1, x2, y2), zoombounds
 
     def _draw_online_map(
         self,
@@ -374,8 +468,6 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
         :param int zoom: zoom level
         """
 
-        sc = NOCONN
-        err = ""
         hacc = hacc if isinstance(hacc, (float, int)) else 0
 
         if maptype != self._lastmaptype:
@@ -402,6 +494,16 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
                 bounds = self.zoom_bounds(
                     self.height, self.width, location, zoom, maptype
                 )
+
+        key = MapCache.key(
+            maptype, bounds, zoom, self.width, self.height, tuple(points), hacc
+        )
+        if key == self._online_key:  # already displayed
+            self._pending_key = None
+            self._show_online_map()
+            return
+        if key == self._pending_key:  # already requested
+            return
         url = format_mapquest_request(
             mqapikey,
             maptype,
@@ -412,27 +514,60 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
             bounds,  # bbox
             hacc,
         )
+        # retrieve map image in background; result is
+        # notified via MAPFETCH_EVENT
+        self._pending_key = key
+        self._fetcher.request(key, url, bounds)
+
+    def _on_fetch_complete(self):
+        """
+        THREADED
+        Notify tkinter event loop that map fetch result is available.
+        """
 
         try:
-            response = get(url, timeout=MAPQTIMEOUT)
-            sc = responses[response.status_code]  # get descriptive HTTP status
-            response.raise_for_status()  # raise Exception on HTTP error
-            if sc == "OK":
-                self._bounds = bounds
-                img_data = response.content
-                self._img = ImageTk.PhotoImage(Image.open(BytesIO(img_data)))
-                self.delete(ALL)
-                self.create_image(
-                    self.width / 2, self.height / 2, image=self._img, anchor=CENTER
-                )
-                self.update_idletasks()
-                return
-        except (ConnError, ConnectTimeout):
-            err = NOWEBMAPCONN
-        except RequestException:
-            err = NOWEBMAPHTTP.format(sc)
+            self.event_generate(MAPFETCH_EVENT)
+        except (RuntimeError, TclError):  # canvas destroyed
+            pass
+
+    def _on_map_fetched(self, event):  # pylint: disable=unused-argument
+        """
+        EVENT TRIGGERED
+        Action on <<map_fetched>> event - display fetched map image,
+        unless it has been superseded by a later request.
+
+        :param event event: map fetched event
+        """
 
-        self.draw_msg(err, ERRCOL)
+        res = self._fetcher.result()
+        if res is None:
+            return
+        key, bounds, data, err = res
+        if key != self._pending_key:  # superseded
+            return
+        self._pending_key = None
+        if data is None:
+            self.draw_msg(err, ERRCOL)
+            return
+        try:
+            self._img = ImageTk.PhotoImage(Image.open(BytesIO(data)))
+        except UnidentifiedImageError:
+            self.draw_msg(MAPOPENERR.format("web map"), ERRCOL)
+            return
+        self._bounds = bounds
+        self._online_key = key
+        self._show_online_map()
+
+    def _show_online_map(self):
+        """
+        Display most recently fetched online map image.
+        """
+
+        self.delete(ALL)
+        self.create_image(
+            self.width / 2, self.height / 2, image=self._img, anchor=CENTER
+        )
+        self.update_idletasks()
 
     def draw_track(self, track: list):
         """
@@ -442,21 +577,51 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
         """
 
         self.delete(TAG_TRACK)
-        i = 0
-        for i, pnt in enumerate(track):
-            x, y = ll2xy(self.width, self.height, self._bounds, Point(pnt.lat, pnt.lon))
-            if i:
-                x2, y2 = x, y
-                self.create_line(x1, y1, x2, y2, fill=TRK_COL, width=3, tags=TAG_TRACK)
-                x1, y1 = x2, y2
-            else:
-                x1, y1 = x, y
-                xstart, ystart = x, y
-        if i:
+        if len(track) < 2:
+            return
+        track = self._simplified_track(track)
+        # transform all track points in one batch and draw as single polyline
+        xy = ll2xy_batch(
+            self.width,
+            self.height,
+            self._bounds,
+            [pnt.lat for pnt in track],
+            [pnt.lon for pnt in track],
+        )
+        if len(xy) > 2:
+            self.create_line(*xy, fill=TRK_COL, width=3, tags=TAG_TRACK)
+            self.create_image(
+                xy[0], xy[1], image=self._img_start, anchor=S, tags=TAG_TRACK
+            )
             self.create_image(
-                xstart, ystart, image=self._img_start, anchor=S, tags=TAG_TRACK
+                xy[-2], xy[-1], image=self._img_end, anchor=S, tags=TAG_TRACK
             )
-            self.create_image(x2, y2, image=self._img_end, anchor=S, tags=TAG_TRACK)
+
+    def _simplified_track(self, track: list) -> list:
+        """
+        Get track simplified to within TRK_TOLERANCE pixels at the current
+        display scale. Simplified tracks are cached per scale (i.e. zoom
+        level) until the track changes.
+
+        :param list track: list of track points
+        :return: simplified list of track points
+        :rtype: list
+        """
+
+        trackid = (id(track), len(track), track[0], track[-1])
+        if trackid != self._trackid:
+            self._trackcache = {}
+            self._trackid = trackid
+        xscale = self.width / (self._bounds.lon2 - self._bounds.lon1)
+        yscale = self.height / (self._bounds.lat2 - self._bounds.lat1)
+        key = (round(xscale, 6), round(yscale, 6))
+        simplified = self._trackcache.get(key, None)
+        if simplified is None:
+            if len(self._trackcache) >= TRK_CACHE:
+                self._trackcache.pop(next(iter(self._trackcache)))
+            simplified = simplify_track(track, TRK_TOLERANCE, xscale, yscale)
+            self._trackcache[key] = simplified
+        return simplified
 
     def draw_marker(self, marker: Point, markertype: str = TAG_LOCATION):
         """
@@ -579,6 +744,16 @@ class CanvasMap(Canvas):  # pylint: disable=too-many-ancestors
         self.width, self.height = self.get_size()
         self._font, self._fonth = scale_font(self.width, 10, 25, 20)
 
+    def _on_destroy(self, event):
+        """
+        Stop map fetcher thread when canvas is destroyed.
+
+        :param event event: destroy event
+        """
+
+        if event.widget is self:
+            self._fetcher.stop(False)  # don't block on retrieval in progress
+
     def get_size(self) -> tuple:
         """
         Get current canvas size.
@@ -6,6 +6,7 @@ Various custom canvas methods and subclasses (see also canvas_map.py).
 - CanvasContainer: scrollable and resizeable container for Toplevel dialogs
 - CanvasGraph: configurable x,y graph plotter
 - CanvasCompass: configurable compass plotter
+- CanvasItemPool: pool of reusable keyed canvas data items
 
 Created on 20 Nov 2025
 
@@ -41,13 +42,15 @@ from tkinter import (
 from typing import Literal
 
 from pygpsclient.globals import GRIDLEGEND, GRIDMAJCOL, GRIDMINCOL, PNTCOL, SQRT2, TIME0
-from pygpsclient.helpers import fitfont
+from pygpsclient.helpers import fitfont, linear2xy, polar2xy
 
 TAG_DATA = "dat"
 TAG_GRID = "grd"
 TAG_XLABEL = "xlb"
 TAG_YLABEL = "ylb"
 TAG_WAIT = "wait"
+TAG_POOL = "pool"
+TAG_STATIC = "stc"
 MODE_CEL = "ele"
 MODE_POL = "lin"
 DEFRADII = {"ele": (0, 30, 45, 60, 75, 90), "lin": range(10, 1, -2)}
@@ -103,6 +106,193 @@ def create_alert(
 Canvas.create_alert = create_alert
 
 
+def sized_font(self: Canvas, size: int) -> font.Font:
+    """
+    Extends tkinter.Canvas class to return a cached font of the
+    specified size, rather than instantiating a new font on every redraw.
+
+    :param int size: font size
+    :return: font
+    :rtype: font.Font
+    """
+
+    fonts = self.__dict__.setdefault("_sized_fonts", {})
+    fnt = fonts.get(size, None)
+    if fnt is None:
+        fnt = fonts[size] = font.Font(size=size)
+    return fnt
+
+
+Canvas.sized_font = sized_font
+
+
+def _stale_layers(canvas: Canvas, tags: tuple, signatures: dict) -> tuple:
+    """
+    Get those static layers (grid, labels) which need to be redrawn.
+
+    Static layer items are tagged with both their layer tag and TAG_STATIC,
+    and are only deleted and redrawn if the layer's signature (the canvas
+    geometry and axis parameters it was drawn with) has changed, or if its
+    items have since been deleted. Any other items sharing the layer tag
+    are always deleted.
+
+    :param Canvas canvas: canvas
+    :param tuple tags: layer tags requested for redraw
+    :param dict signatures: dict of {tag: layer signature}
+    :return: tuple of layer tags to be redrawn
+    :rtype: tuple
+    """
+
+    layers = canvas.__dict__.setdefault("_static_layers", {})
+    stale = []
+    for tag in tags:
+        sig = signatures.get(tag, None)
+        canvas.delete(f"{tag}&&!{TAG_STATIC}")
+        if (
+            sig is not None
+            and layers.get(tag, None) == sig
+            and canvas.find_withtag(f"{tag}&&{TAG_STATIC}")
+        ):
+            continue  # layer unchanged, reuse existing items
+        canvas.delete(tag)
+        layers[tag] = sig
+        stale.append(tag)
+    return tuple(stale)
+
+
+class CanvasItemPool:
+    """
+    Pool of reusable canvas data items, keyed on an arbitrary hashable
+    identifier e.g. (gnssId, svid) or (gnssId, svid, sigid).
+
+    Rather than deleting and recreating every data item on each refresh,
+    existing items are updated in place via `coords` and `itemconfig`
+    (and only if their coordinates or options have actually changed).
+    Items are only created or deleted when pool membership changes.
+
+    Usage::
+
+        pool.start()
+        for data in datalist:
+            pool.draw(key, "rectangle", (x0, y0, x1, y1), fill=col)
+            pool.draw(key, "text", (x, y), text=txt)
+        pool.purge()
+    """
+
+    def __init__(self, canvas: Canvas, tags: str | tuple = TAG_POOL):
+        """
+        Constructor.
+
+        :param Canvas canvas: canvas containing pooled items
+        :param str | tuple tags: tag(s) applied to all pooled items
+        """
+
+        self._canvas = canvas
+        self._tags = tags
+        # {(key, itemtype, n): [item id, coords, options]}
+        self._items = {}
+        self._counts = {}
+        self._drawn = []
+        self._new = []
+        self._order = []
+
+    def start(self):
+        """
+        Start new refresh cycle.
+        """
+
+        self._counts = {}
+        self._drawn = []
+        self._new = []
+
+    def draw(self, key: object, itemtype: str, coords: tuple, **kwargs) -> int:
+        """
+        Create or update pooled canvas item.
+
+        Multiple items of the same type can be drawn for the same key;
+        these are distinguished by the order in which they are drawn.
+
+        :param object key: hashable item key e.g. (gnssId, svid)
+        :param str itemtype: canvas item type e.g. "rectangle", "text"
+        :param tuple coords: item coordinates
+        :param kwargs: item options e.g. fill, text
+        :return: canvas item id
+        :rtype: int
+        """
+
+        n = self._counts.get((key, itemtype), 0)
+        self._counts[(key, itemtype)] = n + 1
+        ikey = (key, itemtype, n)
+        self._drawn.append(ikey)
+        coords = tuple(coords)
+
+        item = self._items.get(ikey, None)
+        if item is None:  # new member
+            iid = getattr(self._canvas, f"create_{itemtype}")(
+                *coords, tags=self._tags, **kwargs
+            )
+            self._items[ikey] = [iid, coords, kwargs]
+            self._new.append(ikey)
+            return iid
+
+        iid, pcoords, pkwargs = item
+        if coords != pcoords:
+            self._canvas.coords(iid, *coords)
+            item[1] = coords
+        changed = {k: v for k, v in kwargs.items() if pkwargs.get(k, None) != v}
+        if changed:
+            self._canvas.itemconfigure(iid, **changed)
+            item[2] = kwargs
+        return iid
+
+    def purge(self):
+        """
+        End refresh cycle. Delete any items not drawn since `start()`
+        and restore drawing (stacking) order if it has changed.
+        """
+
+        drawn = set(self._drawn)
+        for ikey in [ikey for ikey in self._items if ikey not in drawn]:
+            self._canvas.delete(self._items.pop(ikey)[0])
+        # new items are created on top, so only restack if order differs
+        stacked = [ikey for ikey in self._order if ikey in drawn] + self._new
+        if self._drawn != stacked:
+            for ikey in self._drawn:
+                self._canvas.tag_raise(self._items[ikey][0])
+        self._order = self._drawn
+
+    def lift(self):
+        """
+        Raise all pooled items above other canvas items
+        (e.g. after grid has been redrawn).
+        """
+
+        self._canvas.tag_raise(self._tags)
+
+    def clear(self):
+        """
+        Delete all pooled items.
+        """
+
+        for iid, _, _ in self._items.values():
+            self._canvas.delete(iid)
+        self._items = {}
+        self._counts = {}
+        self._drawn = []
+        self._new = []
+        self._order = []
+
+    def __len__(self) -> int:
+        """
+        Number of pooled canvas items.
+
+        :return: number of items
+        :rtype: int
+        """
+
+        return len(self._items)
+
+
 class CanvasContainer(Canvas):
     """
     Custom expandable and scrollable Canvas Container class,
@@ -238,11 +428,9 @@ class CanvasGraph(Canvas):
             for i in range(num):
                 yield round(start + step * i, 4)
 
-        # delete stale tags
+        # delete stale data
         self.delete(TAG_DATA)
         tags = kwargs.pop("tags", (TAG_GRID, TAG_XLABEL, TAG_YLABEL))
-        for tag in tags:
-            self.delete(tag)
 
         # convert single y channel arguments to tuples
         if not isinstance(ydatamax, tuple):
@@ -262,7 +450,9 @@ class CanvasGraph(Canvas):
         self.width = w = self.winfo_width()
         self.height = h = self.winfo_height()
         rc = 0
-        self.font = kwargs.pop("font", font.Font(size=int(min(w, h) / fontscale)))
+        self.font = kwargs.pop("font", None) or self.sized_font(
+            int(min(w, h) / fontscale)
+        )
         # instance attributes can be accessed by other Canvas graph methods
         self.fnth = self.font.metrics("linespace")
         self.xoffl = self.fnth * ceil(len(ydatamax) / 2) * 1.5
@@ -285,6 +475,23 @@ class CanvasGraph(Canvas):
         ]
         self.xscale = (self.xdatamax - self.xdatamin) / (w - self.xoffr - self.xoffl)
 
+        # only redraw static layers whose geometry or axes have changed
+        geom = (w, h, self.xoffl, self.xoffr, self.yofft, self.yoffb, str(self.font))
+        tags = _stale_layers(
+            self,
+            tags,
+            {
+                TAG_GRID: geom
+                + (xtickmaj, xtickmin, ytickmaj, ytickmin, fillmaj, fillmin)
+                + tuple(kwargs.items()),
+                TAG_XLABEL: geom
+                + (xdatamax, xdatamin, xtickmaj, xdp, xlegend, xtimeformat)
+                + (xcol, xlabels, xangle),
+                TAG_YLABEL: geom
+                + (ydatamax, ydatamin, ytickmaj, ydp, ylegend, ycol, ylabels),
+            },
+        )
+
         # draw minor and major x axes
         for jn, (tik, fl) in enumerate(((xtickmin, fillmin), (xtickmaj, fillmaj))):
             if tik > 0:  # if num ticks > 0
@@ -297,7 +504,7 @@ class CanvasGraph(Canvas):
                             h - self.yoffb,
                             fill=fl,
                             width=1,
-                            tags=TAG_GRID,
+                            tags=(TAG_GRID, TAG_STATIC),
                             **kwargs,
                         )
                     if xlabels and jn and TAG_XLABEL in tags:  # major x axis
@@ -322,7 +529,7 @@ class CanvasGraph(Canvas):
                             fill=xcol,
                             anchor=an,
                             angle=xangle,
-                            tags=TAG_XLABEL,
+                            tags=(TAG_XLABEL, TAG_STATIC),
                         )
 
         # draw minor and major y axes
@@ -339,7 +546,7 @@ class CanvasGraph(Canvas):
                             y,
                             fill=fl,
                             width=1,
-                            tags=TAG_GRID,
+                            tags=(TAG_GRID, TAG_STATIC),
                             **kwargs,
                         )
                     if ylabels and jn == 1 and TAG_YLABEL in tags:  # major y axis
@@ -372,7 +579,7 @@ class CanvasGraph(Canvas):
                                 fill=ycol[chn],
                                 anchor=an,
                                 angle=90,
-                                tags=TAG_YLABEL,
+                                tags=(TAG_YLABEL, TAG_STATIC),
                             )
 
         # draw x axis legend
@@ -384,7 +591,7 @@ class CanvasGraph(Canvas):
                 font=self.font,
                 fill=xcol,
                 anchor=SE,
-                tags=TAG_XLABEL,
+                tags=(TAG_XLABEL, TAG_STATIC),
             )
         # draw y channel legend(s)
         if ylabels and TAG_YLABEL in tags:
@@ -405,7 +612,7 @@ class CanvasGraph(Canvas):
                         fill=ycol[chn],
                         anchor=an,
                         angle=90,
-                        tags=TAG_YLABEL,
+                        tags=(TAG_YLABEL, TAG_STATIC),
                     )
 
         return rc
@@ -432,6 +639,33 @@ class CanvasGraph(Canvas):
         except ZeroDivisionError:
             return 0, 0
 
+    def d2xy_batch(self, datax: list, datay: list, chn: int = 0) -> list:
+        """
+        Convert sequences of cartesian data points to flattened list
+        of pixel coordinates [x0, y0, x1, y1, ...] in graph units,
+        suitable for passing directly to e.g. create_line() or coords().
+
+        :param list datax: x data values (list, tuple or array)
+        :param list datay: y data values (list, tuple or array)
+        :param int chn: y data channel
+        :return: flattened list of canvas x,y pixel coordinates
+        :rtype: list
+        """
+
+        try:
+            xscale = 1 / self.xscale
+            yscale = 1 / self.yscale[chn]
+            return linear2xy(
+                datax,
+                datay,
+                xscale,
+                self.xoffl - self.xdatamin * xscale,
+                -yscale,
+                self.height - self.yoffb + self.ydatamin[chn] * yscale,
+            )
+        except ZeroDivisionError:
+            return []
+
     def xy2d(self, x: float, y: float, chn: int = 0) -> tuple:
         """
         Convert pixel x,y to cartesian data point in graph units.
@@ -543,17 +777,15 @@ class CanvasCompass(Canvas):
         :raises: ValueError if invalid mode
         """
 
-        # delete stale tags
+        # delete stale data
         self.delete(TAG_DATA)
         tags = kwargs.pop("tags", (TAG_GRID, TAG_XLABEL))
-        for tag in tags:
-            self.delete(tag)
 
         self.width = self.winfo_width()
         self.height = self.winfo_height()
         rc = 0
-        self.font = kwargs.pop(
-            "font", font.Font(size=int(min(self.width, self.height) / fontscale))
+        self.font = kwargs.pop("font", None) or self.sized_font(
+            int(min(self.width, self.height) / fontscale)
         )
         self.fnth = self.font.metrics("linespace")
         outline = kwargs.get("fill", GRIDMAJCOL)
@@ -568,6 +800,18 @@ class CanvasCompass(Canvas):
         # offset max radius by height of font
         self.maxr = (min(self.width, self.height) / 2) - self.fnth
 
+        # only redraw static layers whose geometry or scale have changed
+        geom = (self.width, self.height, self.maxr, str(self.font), self._mode)
+        geom += (tuple(radii),) + tuple(kwargs.items())
+        tags = _stale_layers(
+            self,
+            tags,
+            {
+                TAG_GRID: geom + (outline, fill),
+                TAG_XLABEL: geom + (legend, scale, dp, unit),
+            },
+        )
+
         # draw x,y axes
         if TAG_GRID in tags:
             for x0, y0, x1, y1 in (
@@ -575,7 +819,7 @@ class CanvasCompass(Canvas):
                 (xc + self.maxr, yc, xc - self.maxr, yc),
             ):
                 rc = self.create_line(
-                    x0, y0, x1, y1, fill=fill, tags=TAG_GRID, **kwargs
+                    x0, y0, x1, y1, fill=fill, tags=(TAG_GRID, TAG_STATIC), **kwargs
                 )
 
         # draw compass points
@@ -593,7 +837,7 @@ class CanvasCompass(Canvas):
                     anchor=a,
                     font=self.font,
                     fill=legend,
-                    tags=TAG_XLABEL,
+                    tags=(TAG_XLABEL, TAG_STATIC),
                     **kwargs,
                 )
 
@@ -610,7 +854,7 @@ class CanvasCompass(Canvas):
                     xc + s,
                     yc + s,
                     outline=outline,
-                    tags=TAG_GRID,
+                    tags=(TAG_GRID, TAG_STATIC),
                     width=1,
                 )
             if TAG_XLABEL in tags:
@@ -620,7 +864,7 @@ class CanvasCompass(Canvas):
                     text=f"{rad*scale:.{dp}f}{unit}",
                     font=self.font,
                     fill=legend,
-                    tags=TAG_XLABEL,
+                    tags=(TAG_XLABEL, TAG_STATIC),
                     **kwargs,
                 )
 
@@ -656,6 +900,34 @@ class CanvasCompass(Canvas):
         except ZeroDivisionError:
             return 0, 0
 
+    def d2xy_batch(self: Canvas, azis: list, datay: list) -> list:
+        """
+        Convert sequences of polar (azimuth/distance) or celestial
+        (azimuth/elevation) coordinates to flattened list of pixel
+        coordinates [x0, y0, x1, y1, ...] in compass units.
+
+        :param list azis: azimuths in degrees (list, tuple or array)
+        :param list datay: elevations or distances (list, tuple or array)
+        :return: flattened list of canvas x,y pixel coordinates
+        :rtype: list
+        """
+
+        try:
+            if self._mode == MODE_POL:  # polar coordinates
+                rscale = self.maxr / (self.scal * self.maxgrid)
+            else:  # celestial coordinates
+                rscale = self.maxr
+            return polar2xy(
+                azis,
+                datay,
+                self.width / 2,
+                self.height / 2,
+                rscale,
+                self._mode == MODE_CEL,
+            )
+        except ZeroDivisionError:
+            return []
+
     @property
     def mode(self) -> str:
         """
@@ -563,38 +563,26 @@ class ChartviewFrame(Frame):
 
         self._spn_timrange.configure(fg=LBLCOL, readonlybackground=BGCOL)
 
-        # plot each channel's data points
+        # plot each channel's data points as a single polyline
         for chn in range(self._num_chans):
-            tm2 = self._mintim
-            vl2 = 0
-            for n, (tim, channels) in enumerate(data.items()):
-
-                try:
-                    val = channels[chn]
-                except KeyError:
-                    val = None
-
-                if val is None:
+            scale = float(self._data_scale[chn].get())
+            tims = []
+            vals = []
+            for tim, channels in data.items():
+                val = channels.get(chn, None)
+                if val is None or tim <= self._mintim:
                     continue
-
-                scale = float(self._data_scale[chn].get())
-                if scale != 1:
-                    val /= scale  # scale data
-
-                tm1, vl1 = tm2, vl2
-                tm2, vl2 = tim, val
-                if n and tm1 > self._mintim:
-                    self._canvas.create_gline(
-                        tm1,
-                        vl1,
-                        tm2,
-                        vl2,
-                        fill=self._canvas.ycol[chn],
-                        width=OL_WID,
-                        chn=chn,
-                        tags=(TAG_DATA,),
-                    )
-                self.update_idletasks()
+                tims.append(tim)
+                vals.append(val / scale if scale != 1 else val)
+            xy = self._canvas.d2xy_batch(tims, vals, chn)
+            if len(xy) > 2:
+                self._canvas.create_line(
+                    *xy,
+                    fill=self._canvas.ycol[chn],
+                    width=OL_WID,
+                    tags=(TAG_DATA,),
+                )
+        self.update_idletasks()
 
     def _on_clipboard(self, event):  # pylint: disable=unused-argument
         """
@@ -5,6 +5,11 @@ Console frame class for PyGPSClient application.
 
 This handles a scrollable text box into which the serial data is printed.
 
+Formatted lines are held in a fixed-size ring buffer together with their
+colour tags, which are computed once when the line is formatted. Only the
+visible window of lines is materialised in the Text widget; the vertical
+scrollbar and mousewheel scroll the window over the ring.
+
 *** Remember that tcl indices look like floats but they're not! ***
 ("1.0:, "2.0") signifies "from the first character in
 line 1 (inclusive) to the first character in line 2 (exclusive)"
@@ -17,6 +22,8 @@ Created on 12 Sep 2020
 :license: BSD 3-Clause
 """
 
+from collections import deque
+from itertools import islice
 from tkinter import (
     END,
     EW,
@@ -29,8 +36,7 @@ from tkinter import (
     Scrollbar,
     Text,
 )
-
-from pyubx2 import hextable
+from tkinter.font import nametofont
 
 from pygpsclient.globals import (
     BGCOL,
@@ -39,9 +45,7 @@ from pygpsclient.globals import (
     FGCOL,
     FONT_FIXED,
     FONT_TEXT,
-    FORMAT_BINARY,
     FORMAT_BOTH,
-    FORMAT_HEXSTR,
     FORMAT_HEXTAB,
     INFOCOL,
     WIDGETU3,
@@ -52,6 +56,30 @@ HALT = "HALT"
 CONSOLELINES = 20
 
 
+def tag_console_line(line: str, colortags: list) -> tuple:
+    """
+    Find first occurrence of each colour tag in line - each tag
+    must be a tuple of (search term, highlight color).
+
+    :param str line: console line
+    :param list colortags: list of (search term, highlight color)
+    :return: tuple of (tuple of (tag, start, end), halt search term or "")
+    :rtype: tuple
+    """
+
+    tags = []
+    halt = ""
+    for match, color in colortags:
+        start = line.find(match)
+        if start != -1:  # If search string found in line
+            end = start + len(match)
+            if color.upper() == HALT:  # "HALT" tag terminates stream
+                halt = match
+                match = HALT
+            tags.append((match, start, end))
+    return tuple(tags), halt
+
+
 class ConsoleFrame(Frame):
     """
     Console frame class.
@@ -76,6 +104,12 @@ class ConsoleFrame(Frame):
         self.width = kwargs.get("width", def_w)
         self.height = kwargs.get("height", def_h)
         self._colortags = self.__app.configuration.get("colortags_l")
+        # ring buffer of (line, tags) tuples
+        self._ring = deque(maxlen=self.__app.configuration.get("maxlines_n"))
+        self._top = 0  # ring index of first visible line
+        self._follow = True  # keep last line in view
+        self._vislines = CONSOLELINES
+        self._font = FONT_TEXT
         self._body()
         self._do_layout()
         self._attach_events()
@@ -99,13 +133,13 @@ class ConsoleFrame(Frame):
             self,
             bg=self._console_bg,
             fg=self._console_fg,
-            yscrollcommand=self.sblogv.set,
             xscrollcommand=self.sblogh.set,
             wrap=NONE,
             height=15,
         )
         self.sblogh.config(command=self.txt_console.xview)
-        self.sblogv.config(command=self.txt_console.yview)
+        self.sblogv.config(command=self._on_scroll)
+        self.sblogv.set(0, 1)
 
         # making the textbox read only and fixed width font
         self.txt_console.configure(state="disabled")
@@ -135,6 +169,9 @@ class ConsoleFrame(Frame):
         self.txt_console.bind("<Double-Button-1>", self._on_clipboard)
         self.txt_console.bind("<Double-Button-2>", self._on_clipboard)
         self.txt_console.bind("<Double-Button-3>", self._on_clipboard)
+        self.txt_console.bind("<MouseWheel>", self._on_wheel)
+        self.txt_console.bind("<Button-4>", self._on_wheel)
+        self.txt_console.bind("<Button-5>", self._on_wheel)
         # self.txt_console.tag_bind(HALT, "<1>", self._on_halt) # doesn't seem to work on MacOS
 
     def update_frame(self, consoledata: list):
@@ -142,9 +179,9 @@ class ConsoleFrame(Frame):
         Print the formatted data stream to the console.
 
         'maxlines' defines the maximum number of scrollable lines that are
-        retained in the text box on a FIFO basis.
+        retained in the ring buffer on a FIFO basis.
 
-        :param list consoledata: list of tuples (raw, parsed, marker) \
+        :param list consoledata: list of FormattedMessage \
             accumulated since last console update
         """
 
@@ -152,76 +189,130 @@ class ConsoleFrame(Frame):
             return
 
         consoleformat = self.__app.configuration.get("consoleformat_s")
-        colortagging = self.__app.configuration.get("colortag_b")
+        colortags = (
+            self._colortags if self.__app.configuration.get("colortag_b") else ()
+        )
         maxlines = self.__app.configuration.get("maxlines_n")
+        if self._ring.maxlen != maxlines:
+            self._ring = deque(self._ring, maxlen=maxlines)
+        font = (
+            FONT_FIXED if consoleformat in (FORMAT_HEXTAB, FORMAT_BOTH) else FONT_TEXT
+        )
+        if font != self._font:
+            self._font = font
+            self.txt_console.configure(font=font)
+            self._set_vislines()
+
         self._halt = ""
-        consolestr = ""
-        self.txt_console.configure(font=FONT_TEXT)
-        for raw_data, parsed_data, marker in consoledata:
-            if consoleformat == FORMAT_BINARY:
-                data = f"{marker}{raw_data}\n"
-            elif consoleformat == FORMAT_HEXSTR:
-                data = f"{marker}{raw_data.hex()}\n"
-            elif consoleformat == FORMAT_HEXTAB:
-                self.txt_console.configure(font=FONT_FIXED)
-                data = hextable(raw_data)
-            elif consoleformat == FORMAT_BOTH:
-                self.txt_console.configure(font=FONT_FIXED)
-                data = f"{marker}{parsed_data}\n{hextable(raw_data)}"
-            else:
-                data = f"{marker}{parsed_data}\n"
-
-            consolestr += data
-
-        numlinesbefore = self.numlines
-        self.txt_console.configure(state="normal")
-        self.txt_console.insert(END, consolestr)
-
-        if colortagging:
-            self._tag_line(self.txt_console, numlinesbefore, self.numlines)
-            if self._halt != "":
-                self._on_halt(None)
-
-        while self.numlines > maxlines:
-            self.txt_console.delete("1.0", "2.0")  # delete top line
-
-        self.txt_console.see("end")
-        self.txt_console.configure(state="disabled")
-        self.txt_console.update_idletasks()
+        numlinesbefore = len(self._ring)
+        added = 0
+        for fmsg in consoledata:
+            for line in fmsg.console(consoleformat).splitlines():
+                tags, halt = tag_console_line(line, colortags)
+                if halt != "":
+                    self._halt = halt
+                self._ring.append((line, tags))
+                added += 1
+        if not added:
+            return
+        # keep window on same lines if scrolled back
+        self._top -= max(0, numlinesbefore + added - maxlines)
+        self._render()
+        if self._halt != "":
+            self._on_halt(None)
+
+    def _render(self):
+        """
+        Materialise visible window of ring buffer in text box.
+        """
+
+        numlines = len(self._ring)
+        bottom = max(0, numlines - self._vislines)
+        if self._follow:
+            self._top = bottom
+        self._top = min(max(0, self._top), bottom)
+        window = list(islice(self._ring, self._top, self._top + self._vislines))
+
+        con = self.txt_console
+        con.configure(state="normal")
+        con.delete("1.0", END)
+        con.insert(END, "\n".join(line for line, _ in window))
+        # one tag_add call per tag for all ranges in window
+        ranges = {}
+        for lineidx, (_, tags) in enumerate(window, 1):
+            for match, start, end in tags:
+                ranges.setdefault(match, []).extend(
+                    (f"{lineidx}.{start}", f"{lineidx}.{end}")
+                )
+        for match, idxs in ranges.items():
+            con.tag_add(match, *idxs)
+        con.configure(state="disabled")
+
+        if numlines:
+            self.sblogv.set(self._top / numlines, (self._top + len(window)) / numlines)
+        else:
+            self.sblogv.set(0, 1)
+
+    def _scroll_to(self, top: int):
+        """
+        Scroll visible window to ring index.
 
-    def _tag_line(self, con, startline: int, endline: int):
+        :param int top: ring index of first visible line
         """
-        Highlights any occurrence of tags in line - each tag
-        must be a tuple of (search term, highlight color)
 
-        :param object con: console textbox
-        :param int startline: starting line
-        :param int endline: ending line
-        :param str string: string in console
+        bottom = max(0, len(self._ring) - self._vislines)
+        self._top = min(max(0, top), bottom)
+        self._follow = self._top >= bottom
+        self._render()
+
+    def _on_scroll(self, *args):
+        """
+        Action on vertical scrollbar command.
+
+        :param args: ("moveto", fraction) or ("scroll", number, "units"|"pages")
+        """
 
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._ring)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._vislines
+            self._scroll_to(self._top + step)
+
+    def _on_wheel(self, event) -> str:
+        """
+        Action on mousewheel - scroll visible window.
+
+        :param event event: mousewheel event
+        :return: "break" to suppress default Text binding
+        :rtype: str
+        """
+
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self._top - 3)
+        elif event.num == 5 or getattr(event, "delta", 0) < 0:
+            self._scroll_to(self._top + 3)
+        return "break"
+
+    def _set_vislines(self):
+        """
+        Set number of visible lines from text box height and font.
         """
 
-        for lineidx in range(startline - 1, endline):
-            for match, color in self._colortags:
-                line = con.get(f"{lineidx}.0", END)
-                start = line.find(match)
-                end = start + len(match)
-                if start != -1:  # If search string found in line
-                    if color.upper() == HALT:  # "HALT" tag terminates stream
-                        self._halt = match
-                        match = HALT
-                    con.tag_add(match, f"{lineidx}.{start}", f"{lineidx}.{end}")
+        linespace = nametofont(self._font).metrics("linespace")
+        self._vislines = max(1, self.txt_console.winfo_height() // max(1, linespace))
 
     @property
     def numlines(self) -> int:
         """
-        Get number of lines in console.
+        Get number of lines in console ring buffer.
 
         :return: nmber of lines
         :type: int
         """
 
-        return int(self.txt_console.index("end-1c").split(".", 1)[0])
+        return len(self._ring)
 
     def _on_halt(self, event):  # pylint: disable=unused-argument
         """
@@ -242,7 +333,7 @@ class ConsoleFrame(Frame):
         """
 
         self.__master.clipboard_clear()
-        self.__master.clipboard_append(self.txt_console.get("1.0", END))
+        self.__master.clipboard_append("\n".join(line for line, _ in self._ring))
         self.__master.update()
         self.__app.status_label = (CONTENTCOPIED.format("console"), INFOCOL)
 
@@ -254,6 +345,8 @@ class ConsoleFrame(Frame):
         """
 
         self.width, self.height = self.get_size()
+        self._set_vislines()
+        self._render()
 
     def get_size(self):
         """
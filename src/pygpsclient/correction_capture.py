@@ -0,0 +1,200 @@
+"""
+correction_capture.py
+
+Synchronised capture and replay of GNSS and correction data streams.
+
+A capture file records GNSS receiver output and injected correction data
+(NTRIP RTCM3, MQTT SPARTN and L-band UBX RXM-PMP) interleaved in arrival
+order, each record time-stamped relative to the start of the capture, so
+that both streams can be replayed with their original relative timing.
+
+File format (little-endian):
+
+- header: CAPMAGIC (8 bytes).
+- records: elapsed seconds (float64), source (uint8 index into CAPSOURCES),
+  length (uint32), followed by the raw message bytes.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import struct
+from io import BytesIO
+from queue import Queue
+from threading import Lock
+from time import monotonic
+
+from pygnssutils import GNSSReader
+from pyspartn import SPARTNMessageError, SPARTNParseError, SPARTNReader
+from pyubx2 import ERR_IGNORE
+
+CAPMAGIC = b"PYGPSCAP"
+CAPEXT = "pgc"
+CAPGNSS = "GNSS"
+CAPNTRIP = "NTRIP"
+CAPSPARTN = "SPARTN"
+CAPSOURCES = (CAPGNSS, CAPNTRIP, CAPSPARTN)
+RECHDR = struct.Struct("<dBI")
+
+
+def is_capture(filename: str) -> bool:
+    """
+    Check if file is a capture file.
+
+    :param str filename: fully qualified file path
+    :return: True if capture file
+    :rtype: bool
+    """
+
+    try:
+        with open(filename, "rb") as infile:
+            return infile.read(len(CAPMAGIC)) == CAPMAGIC
+    except OSError:
+        return False
+
+
+def parse_raw(raw: bytes, msgmode: int = 0) -> object:
+    """
+    Parse a single raw GNSS or correction message.
+
+    :param bytes raw: raw message
+    :param int msgmode: message mode 0 = GET, 1 = SET, 2 = POLL
+    :return: parsed message, or None if not parseable
+    :rtype: object
+    """
+
+    if raw[0:1] == b"\x73":  # SPARTN, not decoded
+        try:
+            return SPARTNReader.parse(raw)
+        except (SPARTNMessageError, SPARTNParseError):
+            return None
+    _, parsed = GNSSReader(BytesIO(raw), msgmode=msgmode, quitonerror=ERR_IGNORE).read()
+    return parsed
+
+
+class CaptureWriter:
+    """
+    Capture file writer.
+
+    NB: write() may be called from the GNSS stream, NTRIP and SPARTN
+    client threads.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Constructor.
+
+        :param str filename: fully qualified capture file path
+        :raises: OSError
+        """
+
+        self.filename = filename
+        self._lock = Lock()
+        self._file = open(filename, "wb")  # pylint: disable=consider-using-with
+        self._file.write(CAPMAGIC)
+        self._start = monotonic()
+        self.records = 0
+
+    def write(self, source: str, raw: bytes):
+        """
+        Write time-stamped record.
+
+        :param str source: data source CAPGNSS, CAPNTRIP or CAPSPARTN
+        :param bytes raw: raw message
+        """
+
+        rec = RECHDR.pack(monotonic() - self._start, CAPSOURCES.index(source), len(raw))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(rec + raw)
+            self.records += 1
+
+    def close(self):
+        """
+        Close capture file.
+        """
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class CaptureReader:
+    """
+    Capture file reader. Iterating yields (elapsed seconds, source, raw)
+    tuples in capture order.
+    """
+
+    def __init__(self, stream: object):
+        """
+        Constructor.
+
+        :param object stream: binary capture file stream
+        :raises: ValueError if not a capture file
+        """
+
+        if stream.read(len(CAPMAGIC)) != CAPMAGIC:
+            raise ValueError("Not a PyGPSClient capture file")
+        self._stream = stream
+
+    def __iter__(self):
+        """Iterator."""
+
+        return self
+
+    def __next__(self) -> tuple:
+        """
+        Return next record.
+
+        :return: tuple of (elapsed seconds, source, raw)
+        :rtype: tuple
+        :raises: StopIteration at end of file (or truncated record)
+        """
+
+        hdr = self._stream.read(RECHDR.size)
+        if len(hdr) < RECHDR.size:
+            raise StopIteration
+        elapsed, source, length = RECHDR.unpack(hdr)
+        raw = self._stream.read(length)
+        if len(raw) < length or source >= len(CAPSOURCES):
+            raise StopIteration
+        return elapsed, CAPSOURCES[source], raw
+
+
+class CaptureQueue(Queue):
+    """
+    Queue which writes (raw, parsed) items to a capture file, if capture
+    is active.
+    """
+
+    def __init__(self, source: str = CAPGNSS, maxsize: int = 0):
+        """
+        Constructor.
+
+        :param str source: data source e.g. CAPGNSS
+        :param int maxsize: maximum queue size (0 = unlimited)
+        """
+
+        super().__init__(maxsize)
+        self.source = source
+        self.capture = None
+
+    def put(self, item: object, block: bool = True, timeout: float = None):
+        """
+        Overridden put method to capture data.
+
+        :param object item: tuple of (raw, parsed)
+        :param bool block: block if queue is full
+        :param float timeout: block timeout in seconds
+        """
+
+        capture = self.capture
+        if capture is not None and isinstance(item, tuple):
+            if isinstance(item[0], bytes):
+                capture.write(self.source, item[0])
+        super().put(item, block, timeout)
@@ -0,0 +1,221 @@
+"""
+correction_latency.py
+
+End-to-end correction latency tracking.
+
+Each correction frame (RTCM3, SPARTN or UBX RXM-PMP) is time-stamped
+when it arrives from the NTRIP, MQTT or L-band source, again when it is
+written to the receiver, and finally correlated (by message type, in
+order) with the receiver's UBX RXM-RTCM or RXM-SPARTN acknowledgement.
+This gives, for each message type:
+
+- queue latency - arrival to device write i.e. delay on our side.
+- end-to-end latency - arrival to receiver acknowledgement.
+- the receiver's reported correction age (diff_age) at acknowledgement.
+
+Percentiles are computed over a rolling window of samples per message type.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import csv
+from collections import deque
+from math import ceil
+from threading import Lock
+from time import monotonic
+
+LATENCYWINDOW = 1000  # samples retained per message type
+MAXPENDING = 2000  # maximum frames awaiting device write
+PERCENTILES = (50, 95, 99)
+QUEUE = "queue"
+E2E = "e2e"
+AGE = "age"
+
+
+def correction_type(raw: bytes) -> str:
+    """
+    Get correction message type from raw frame, in the same
+    form as the corresponding receiver acknowledgement.
+
+    :param bytes raw: raw correction frame
+    :return: message type e.g. "1077", "SPARTN-1-0", "RXM-PMP" or None
+    :rtype: str
+    """
+
+    if len(raw) > 5:
+        if raw[0] == 0xD3:  # RTCM3
+            return str(int.from_bytes(raw[3:5], "big") >> 4)
+        if raw[0] == 0x73:  # SPARTN
+            return f"SPARTN-{raw[1] >> 1}-{raw[4] >> 4}"
+        if raw[0:4] == b"\xb5\x62\x02\x72":  # UBX RXM-PMP
+            return "RXM-PMP"
+    return None
+
+
+def percentile(data: list, pct: float) -> float:
+    """
+    Get percentile of sorted data (nearest rank method).
+
+    :param list data: sorted data
+    :param float pct: percentile 0-100
+    :return: percentile value, or None if no data
+    :rtype: float
+    """
+
+    if not data:
+        return None
+    idx = max(0, min(len(data) - 1, ceil(pct / 100 * len(data)) - 1))
+    return data[idx]
+
+
+class CorrectionLatency:
+    """
+    Correction latency tracker.
+
+    NB: methods may be called from the correction client, device
+    stream and GUI threads.
+    """
+
+    def __init__(self, window: int = LATENCYWINDOW):
+        """
+        Constructor.
+
+        :param int window: samples retained per message type
+        """
+
+        self._window = window
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clear all latency data.
+        """
+
+        with self._lock:
+            self._pending = {}  # id(raw): (raw, msgtype, source, arrived)
+            self._unacked = {}  # msgtype: deque of arrival times
+            self._samples = {}  # msgtype: {QUEUE: deque, E2E: deque, AGE: deque}
+            self._sources = {}  # msgtype: source
+
+    def arrived(self, raw: bytes, source: str):
+        """
+        Record arrival of correction frame.
+
+        :param bytes raw: raw correction frame
+        :param str source: correction source e.g. "NTRIP"
+        """
+
+        msgtype = correction_type(raw)
+        if msgtype is None:
+            return
+        with self._lock:
+            # frames are identified by object, so a reference is held until written
+            self._pending[id(raw)] = (raw, msgtype, source, monotonic())
+            if len(self._pending) > MAXPENDING:  # e.g. no device connected
+                del self._pending[next(iter(self._pending))]
+
+    def written(self, raw: bytes):
+        """
+        Record correction frame written to device.
+
+        :param bytes raw: raw data written
+        """
+
+        now = monotonic()
+        with self._lock:
+            pending = self._pending.pop(id(raw), None)
+            if pending is None or pending[0] is not raw:
+                return
+            _, msgtype, source, arrived = pending
+            self._sources[msgtype] = source
+            self._sample(msgtype, QUEUE, now - arrived)
+            self._unacked.setdefault(msgtype, deque(maxlen=self._window)).append(
+                arrived
+            )
+
+    def acknowledged(self, msgtype: str, diffage: float = None):
+        """
+        Record receiver acknowledgement of correction message.
+
+        :param str msgtype: message type e.g. "1077"
+        :param float diffage: receiver's current correction age in seconds
+        """
+
+        now = monotonic()
+        with self._lock:
+            unacked = self._unacked.get(msgtype, None)
+            if not unacked:
+                return
+            self._sample(msgtype, E2E, now - unacked.popleft())
+            if isinstance(diffage, (int, float)):
+                self._sample(msgtype, AGE, diffage)
+
+    def _sample(self, msgtype: str, kind: str, value: float):
+        """
+        Add latency sample (lock must be held).
+
+        :param str msgtype: message type
+        :param str kind: QUEUE, E2E or AGE
+        :param float value: value in seconds
+        """
+
+        samples = self._samples.setdefault(
+            msgtype, {k: deque(maxlen=self._window) for k in (QUEUE, E2E, AGE)}
+        )
+        samples[kind].append(value)
+
+    def stats(self) -> dict:
+        """
+        Get latency statistics per message type.
+
+        :return: dict of {msgtype: {"source": source, "count": n,
+            QUEUE: (p50, p95, p99), E2E: (p50, p95, p99), AGE: (p50, p95, p99)}}
+        :rtype: dict
+        """
+
+        with self._lock:
+            snapshot = {
+                msgtype: {kind: sorted(vals) for kind, vals in samples.items()}
+                for msgtype, samples in self._samples.items()
+            }
+            sources = dict(self._sources)
+        stats = {}
+        for msgtype in sorted(snapshot):
+            samples = snapshot[msgtype]
+            stats[msgtype] = {
+                "source": sources.get(msgtype, ""),
+                "count": len(samples[QUEUE]),
+            }
+            for kind, vals in samples.items():
+                stats[msgtype][kind] = tuple(percentile(vals, p) for p in PERCENTILES)
+        return stats
+
+    def export(self, filename: str):
+        """
+        Export latency statistics to CSV file (latencies in ms,
+        correction age in seconds).
+
+        :param str filename: fully qualified file path
+        :raises: OSError
+        """
+
+        header = ["msgtype", "source", "count"]
+        for kind in (QUEUE, E2E, AGE):
+            header += [f"{kind}_p{p}" for p in PERCENTILES]
+        with open(filename, "w", newline="", encoding="utf-8") as outfile:
+            writer = csv.writer(outfile)
+            writer.writerow(header)
+            for msgtype, stat in self.stats().items():
+                row = [msgtype, stat["source"], stat["count"]]
+                for kind in (QUEUE, E2E, AGE):
+                    scale = 1 if kind == AGE else 1000
+                    row += [
+                        "" if val is None else round(val * scale, 3)
+                        for val in stat[kind]
+                    ]
+                writer.writerow(row)
@@ -0,0 +1,241 @@
+"""
+correction_passthrough.py
+
+Passthrough fast path for NTRIP correction data.
+
+In passthrough mode, incoming RTCM3 frames are validated by CRC only
+(rather than being fully parsed) and SPARTN frames are parsed without
+decoding. Each valid frame is placed directly on the GNSS device output
+queue from the NTRIP client thread (the raw bytes object itself, without
+copying), bypassing the GUI event loop. Only a sample of frames (1 in N)
+is passed on to the GUI for decoding and display in the console.
+
+Correction frames placed on a PassthroughQueue (whether or not in
+passthrough mode) are time-stamped on arrival for latency tracking.
+Frames forwarded in passthrough mode are also counted in the RTCM3
+statistics (otherwise this is done by the GUI), and written to the
+correction capture file, if capture is active.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+from datetime import datetime, timedelta
+from queue import Queue
+from socket import socket
+from threading import Event
+
+from pygnssutils import GNSSNTRIPClient
+from pygnssutils.exceptions import ParameterError
+from pygnssutils.globals import DEFAULT_BUFSIZE
+from pygnssutils.gnssntripclient import SPARTN
+from pygnssutils.gnssreader import ERR_LOG, PARSE_META, RTCM3_PROTOCOL, GNSSReader
+from pynmeagps import SocketWrapper
+from pyrtcm.rtcmhelpers import calc_crc24q
+from pyspartn import SPARTNReader
+
+from pygpsclient.correction_latency import CorrectionLatency
+from pygpsclient.rtcm_stats import RTCMStats
+
+PASSTHRUSAMPLE = 10  # 1 in N frames passed to GUI for display
+
+
+def rtcm_crc_ok(raw: bytes) -> bool:
+    """
+    Check CRC of raw RTCM3 frame.
+
+    :param bytes raw: raw RTCM3 frame, including 3 byte CRC
+    :return: True if CRC is valid
+    :rtype: bool
+    """
+
+    return len(raw) > 6 and raw[0] == 0xD3 and calc_crc24q(raw) == 0
+
+
+class PassthroughQueue(Queue):
+    """
+    Correction client output queue which can forward correction frames
+    directly to the GNSS device output queue.
+    """
+
+    def __init__(
+        self,
+        devqueue: Queue,
+        latency: CorrectionLatency = None,
+        source: str = "NTRIP",
+        rtcmstats: RTCMStats = None,
+        maxsize: int = 0,
+    ):
+        """
+        Constructor.
+
+        :param Queue devqueue: GNSS device output queue
+        :param CorrectionLatency latency: correction latency tracker (optional)
+        :param str source: correction source e.g. "NTRIP"
+        :param RTCMStats rtcmstats: RTCM3 statistics engine (optional)
+        :param int maxsize: maximum queue size (0 = unlimited)
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        super().__init__(maxsize)
+        self._devqueue = devqueue
+        self._latency = latency
+        self._rtcmstats = rtcmstats
+        self.source = source
+        self.capture = None  # CaptureWriter, if capture active
+        self.passthrough = False
+        self.sample = PASSTHRUSAMPLE
+        self.forwarded = 0
+        self.rejected = 0
+
+    def put(self, item: object, block: bool = True, timeout: float = None):
+        """
+        Overridden put method to time-stamp and capture arrival of
+        correction data.
+
+        :param object item: tuple of (raw, parsed)
+        :param bool block: block if queue is full
+        :param float timeout: block timeout in seconds
+        """
+
+        # in passthrough mode, frames are time-stamped when forwarded
+        if not self.passthrough and isinstance(item, tuple):
+            if isinstance(item[0], bytes):
+                if self._latency is not None:
+                    self._latency.arrived(item[0], self.source)
+                capture = self.capture
+                if capture is not None:
+                    capture.write(self.source, item[0])
+        super().put(item, block, timeout)
+
+    def forward(self, raw: bytes) -> bool:
+        """
+        Forward correction frame to GNSS device.
+
+        :param bytes raw: raw correction frame
+        :return: True if frame is also to be queued for display
+        :rtype: bool
+        """
+
+        if self._latency is not None:
+            self._latency.arrived(raw, self.source)
+        if self._rtcmstats is not None:
+            self._rtcmstats.update(raw, self.source)
+        capture = self.capture
+        if capture is not None:
+            capture.write(self.source, raw)
+        self._devqueue.put(raw)
+        self.forwarded += 1
+        return self.sample > 0 and self.forwarded % self.sample == 0
+
+
+class PassthroughNTRIPClient(GNSSNTRIPClient):
+    """
+    pygnssutils GNSSNTRIPClient with passthrough fast path.
+
+    Passthrough is used if the output medium is a PassthroughQueue with
+    passthrough enabled, otherwise data is parsed as normal. Passthrough
+    is enabled on the output queue only while the client is running.
+    """
+
+    def __init__(self, app: object = None, **kwargs):
+        """
+        Constructor.
+
+        :param object app: calling application (optional)
+        :param kwargs: optional GNSSNTRIPClient keyword arguments
+        """
+
+        super().__init__(app, **kwargs)
+        self.passthrough = False  # enable passthrough on next run()
+
+    def run(self, **kwargs) -> bool:
+        """
+        Overridden method to enable passthrough on output queue, if
+        requested, for duration of connection.
+
+        :param kwargs: GNSSNTRIPClient.run() keyword arguments
+        :return: True if mountpoint specified, False if sourcetable requested
+        :rtype: bool
+        """
+
+        output = kwargs.get("output", None)
+        passthrough = isinstance(output, PassthroughQueue)
+        if passthrough:
+            output.passthrough = self.passthrough
+        try:
+            return super().run(**kwargs)
+        except ParameterError:
+            if passthrough:
+                output.passthrough = False
+            raise
+
+    def stop(self):
+        """
+        Overridden method to disable passthrough on output queue, so that
+        any subsequent correction data is sent to the device as normal.
+        """
+
+        super().stop()
+        if isinstance(self._output, PassthroughQueue):
+            self._output.passthrough = False
+
+    def _parse_ntrip_data(
+        self,
+        sock: socket,
+        settings: dict,
+        stopevent: Event,
+        output: object,
+    ):
+        """
+        Overridden method to read incoming NTRIP RTCM3/SPARTN data stream.
+
+        :param socket sock: raw socket
+        :param dict settings: settings as dictionary
+        :param Event stopevent: stop event
+        :param object output: output medium
+        :raises: TimeoutError if inactivity timeout exceeded
+        """
+
+        if not (isinstance(output, PassthroughQueue) and output.passthrough):
+            super()._parse_ntrip_data(sock, settings, stopevent, output)
+            return
+
+        last_activity = datetime.now()
+        stream = SocketWrapper(sock, self.encoding)
+        spartn = settings["datatype"].lower() == SPARTN
+        if spartn:  # parse frame header and validate CRC, but don't decode
+            parser = SPARTNReader(
+                stream,
+                quitonerror=ERR_LOG,
+                bufsize=DEFAULT_BUFSIZE,
+                decode=False,
+                errorhandler=self._error_handler,
+            )
+        else:  # frame only, CRC checked below
+            parser = GNSSReader(
+                stream,
+                protfilter=RTCM3_PROTOCOL,
+                quitonerror=ERR_LOG,
+                bufsize=DEFAULT_BUFSIZE,
+                parsing=PARSE_META,
+                errorhandler=self._error_handler,
+            )
+
+        while not stopevent.is_set():
+            raw_data, parsed_data = parser.read()
+            if raw_data is None:
+                if datetime.now() - last_activity > timedelta(seconds=self._timeout):
+                    raise TimeoutError(
+                        f"Inactivity timeout error after {self._timeout} seconds"
+                    )
+            else:
+                last_activity = datetime.now()
+                if parsed_data is None or not (spartn or rtcm_crc_ok(raw_data)):
+                    output.rejected += 1
+                elif output.forward(raw_data):
+                    self._do_output(output, raw_data, parsed_data)
+            self._send_gga(sock, settings["ggainterval"], output)
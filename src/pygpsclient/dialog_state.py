@@ -19,6 +19,7 @@ from pygpsclient.about_dialog import AboutDialog
 from pygpsclient.globals import CLASS, RESIZE
 from pygpsclient.gpx_dialog import GPXViewerDialog
 from pygpsclient.importmap_dialog import ImportMapDialog
+from pygpsclient.log_extract_dialog import LogExtractDialog
 from pygpsclient.nmea_config_dialog import NMEAConfigDialog
 from pygpsclient.ntrip_client_dialog import NTRIPConfigDialog
 from pygpsclient.recorder_dialog import RecorderDialog
@@ -29,6 +30,7 @@ from pygpsclient.spartn_dialog import SPARTNConfigDialog
 from pygpsclient.strings import (
     DLG,
     DLGTABOUT,
+    DLGTEXTRACT,
     DLGTGPX,
     DLGTIMPORTMAP,
     DLGTNMEA,
@@ -111,6 +113,11 @@ class DialogState:
                 DLG: None,
                 RESIZE: False,
             },
+            DLGTEXTRACT: {
+                CLASS: LogExtractDialog,
+                DLG: None,
+                RESIZE: False,
+            },
             DLGTSETTINGS: {
                 CLASS: SettingsDialog,
                 DLG: None,
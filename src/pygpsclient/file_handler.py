@@ -5,6 +5,7 @@ Filehandler class for PyGPSClient application.
 
 This handles all the file i/o, including:
 - binary gnss log file
+- real-time RINEX log files
 - json configuration file save, load and validation
 - datalog export
 - gpx file export
@@ -24,8 +25,7 @@ from pathlib import Path
 from tkinter import Frame, Toplevel, filedialog
 from types import NoneType
 
-from pyubx2 import hextable
-
+from pygpsclient.formatted_message import FormattedMessage
 from pygpsclient.globals import (
     APPNAME,
     CONFIGFILE,
@@ -41,9 +41,15 @@ from pygpsclient.globals import (
     XML_HDR,
 )
 from pygpsclient.helpers import set_filename, valid_geom
+from pygpsclient.rinex_logger import RINEXLogger
 from pygpsclient.strings import CONFIGTITLE, GITHUB_URL, SAVETITLE
 
 DEFEXT = ("all files", "*.*")
+DATALOGEXT = (
+    ("binary log files", "*.log"),
+    ("binary UBXfiles", "*.ubx"),
+    ("all files", "*.*"),
+)
 
 
 class FileHandler:
@@ -66,6 +72,7 @@ class FileHandler:
         self._logpath = None
         self._logname = None
         self._logfile = None
+        self._rinexlogger = None
         self._trackpath = None
         self._databasepath = None
         self._trackname = None
@@ -82,6 +89,7 @@ class FileHandler:
         """
 
         self.close_logfile()
+        self.close_rinexlog(False)
         self.close_trackfile()
 
     def open_file(
@@ -111,6 +119,18 @@ class FileHandler:
         self._initdir[mode] = Path(fil).parent  # remember last directory
         return fil
 
+    def open_datalog(self, parent: Frame | Toplevel) -> Path | NoneType:
+        """
+        Open binary GNSS data log.
+
+        :param Frame | Toplevel parent: parent window
+        :return: path to data log, or None if user cancelled
+        :rtype: Path | NoneType
+        """
+
+        infile = self.open_file(parent, "GNSS data log", DATALOGEXT)
+        return None if infile in ("", None) else Path(infile)
+
     def load_config(self, filename: Path = CONFIGFILE) -> tuple:
         """
         Load configuration file. If filename is not provided, defaults
@@ -251,11 +271,11 @@ class FileHandler:
             self.__app.status_label = (f"{err}", ERRCOL)
             return 0
 
-    def write_logfile(self, raw_data, parsed_data):
+    def write_logfile(self, fmsg: FormattedMessage):
         """
         Append data to log file. Data will be converted to bytes.
 
-        :param data: data to be logged
+        :param FormattedMessage fmsg: message to be logged
         """
 
         if self._logfile is None:
@@ -266,13 +286,13 @@ class FileHandler:
         maxsize = self.__app.configuration.get("logsize_n")
         data = []
         if lfm in (FORMAT_PARSED, FORMAT_BOTH):
-            data.append(parsed_data)
+            data.append(fmsg.parsed)
         if lfm == FORMAT_BINARY:
-            data.append(raw_data)
+            data.append(fmsg.raw_data)
         if lfm == FORMAT_HEXSTR:
-            data.append(raw_data.hex())
+            data.append(fmsg.hexstr)
         if lfm in (FORMAT_HEXTAB, FORMAT_BOTH):
-            data.append(hextable(raw_data))
+            data.append(fmsg.hextab)
 
         for datum in data:
             if not isinstance(datum, bytes):
@@ -299,6 +319,54 @@ class FileHandler:
         except IOError:
             pass
 
+    def open_rinexlog(self) -> int:
+        """
+        Open real-time RINEX logger, if not already open.
+
+        :return: 0 = error, 1 = ok
+        :rtype: int
+        """
+
+        if self._rinexlogger is not None:  # keep current logging period
+            return 1
+        cfg = self.__app.configuration
+        try:
+            self._rinexlogger = RINEXLogger(
+                cfg.get("logpath_s") or HOME,
+                cfg.get("rinexlogperiod_n"),
+                cfg.get("rinexlogparams_s"),
+            )
+            return 1
+        except (OSError, ValueError) as err:
+            self.__app.status_label = (f"{err}", ERRCOL)
+            return 0
+
+    def write_rinexlog(self, fmsg: FormattedMessage):
+        """
+        Append observation or navigation data to real-time RINEX log.
+
+        :param FormattedMessage fmsg: message to be logged
+        """
+
+        if self._rinexlogger is None:
+            if not self.open_rinexlog():
+                return
+        try:
+            self._rinexlogger.write(fmsg.raw_data, fmsg.parsed_data)
+        except OSError as err:
+            self.__app.status_label = (f"{err}", ERRCOL)
+
+    def close_rinexlog(self, wait: bool = True):
+        """
+        Close real-time RINEX logger, converting any partial logging period.
+
+        :param bool wait: wait for conversion to complete
+        """
+
+        if self._rinexlogger is not None:
+            self._rinexlogger.close(wait)
+            self._rinexlogger = None
+
     def set_trackfile_path(self, initdir=HOME) -> Path:
         """
         Set track directory.
@@ -0,0 +1,99 @@
+"""
+formatted_message.py
+
+Formatted Message class.
+
+Wraps a raw and parsed message and lazily caches its string
+representations (parsed string, hex string and hex table), so that
+each representation is computed at most once, and only if some output
+(console, data log, etc.) actually requests it.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+from functools import cached_property
+
+from pyubx2 import hextable
+
+from pygpsclient.globals import (
+    FORMAT_BINARY,
+    FORMAT_BOTH,
+    FORMAT_HEXSTR,
+    FORMAT_HEXTAB,
+)
+
+
+class FormattedMessage:
+    """
+    Formatted Message class.
+    Lazily cached string representations of a single message.
+    """
+
+    def __init__(self, raw_data: bytes, parsed_data: object, marker: str = ""):
+        """
+        Constructor.
+
+        :param bytes raw_data: raw message data
+        :param object parsed_data: parsed message e.g. NMEAMessage, UBXMessage
+        :param str marker: string prepended to console entries e.g. "NTRIP>>"
+        """
+
+        self.raw_data = raw_data
+        self.parsed_data = parsed_data
+        self.marker = marker
+
+    @cached_property
+    def parsed(self) -> str:
+        """
+        Getter for parsed message as string.
+
+        :return: str(parsed_data)
+        :rtype: str
+        """
+
+        return str(self.parsed_data)
+
+    @cached_property
+    def hexstr(self) -> str:
+        """
+        Getter for raw message as hexadecimal string.
+
+        :return: raw_data.hex()
+        :rtype: str
+        """
+
+        return self.raw_data.hex()
+
+    @cached_property
+    def hextab(self) -> str:
+        """
+        Getter for raw message as hexadecimal table.
+
+        :return: hextable(raw_data)
+        :rtype: str
+        """
+
+        return hextable(self.raw_data)
+
+    def console(self, consoleformat: str) -> str:
+        """
+        Format message for console display.
+
+        :param str consoleformat: console format e.g. FORMAT_PARSED
+        :return: formatted (possibly multi-line) string
+        :rtype: str
+        """
+
+        if consoleformat == FORMAT_BINARY:
+            return f"{self.marker}{self.raw_data}\n"
+        if consoleformat == FORMAT_HEXSTR:
+            return f"{self.marker}{self.hexstr}\n"
+        if consoleformat == FORMAT_HEXTAB:
+            return self.hextab
+        if consoleformat == FORMAT_BOTH:
+            return f"{self.marker}{self.parsed}\n{self.hextab}"
+        return f"{self.marker}{self.parsed}\n"
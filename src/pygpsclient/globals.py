@@ -197,6 +197,8 @@ LICENSE_URL = "https://github.com/semuconsulting/PyGPSClient/blob/master/LICENSE
 LIN = "Linux"
 MAC = "Darwin"
 MAPAPI_URL = "https://developer.mapquest.com/user/login/sign-up"
+MAPCACHEDIR = path.join(HOME, f".{APPNAME}", "mapcache")  # web map image cache
+MAPTILEDIR = path.join(HOME, f".{APPNAME}", "maptiles")  # offline map tile cache
 MAINSCALE = 0.75  # initial size of main window relative to screen size
 MAX_SNR = 60  # upper limit of levelsview CNo axis
 MAXFLOAT = 2e20
@@ -233,8 +235,10 @@ SOCKSERVER_HOST = "0.0.0.0"  # i.e. bind to all host IP addresses
 SOCKSERVER_MAX_CLIENTS = 5
 SOCKSERVER_NTRIP_PORT = 2101
 SOCKSERVER_PORT = 50012
+SOURCETABLECACHEDIR = path.join(HOME, f".{APPNAME}", "sourcetables")  # NTRIP
 SPARTN_BASEDATE_CURRENT = -1
 SPARTN_BASEDATE_DATASTREAM = 0
+SPARTN_DECODED_EVENT = "<<spartn_decoded>>"
 SPARTN_DEFAULT_KEY = "abcd1234abcd1234abcd1234abcd1234"
 SPARTN_EOF_EVENT = "<<spartn_eof>>"
 SPARTN_ERR_EVENT = "<<spartn_error>>"
@@ -258,6 +262,7 @@ TOPIC_MGA = "/pp/ubx/mga"
 TOPIC_RXM = "/pp/ubx/0236/ip"
 TRACK = "track"
 TRACEMODE_WRITE = "write"
+TRK_TOLERANCE = 0.5  # map track simplification tolerance in pixels
 TTYOK = ("OK", "$R:")
 TTYERR = ("ERROR", "$R?", "FAIL", "CAN'T FOUND DEVICE")
 TTYMARKER = "TTY<<"
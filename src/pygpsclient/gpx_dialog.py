@@ -14,7 +14,6 @@ Created on 10 Jan 2023
 
 import logging
 import traceback
-from statistics import mean, median
 from tkinter import (
     ALL,
     EW,
@@ -28,10 +27,7 @@ from tkinter import (
     StringVar,
     W,
 )
-from xml.dom import minidom
-from xml.parsers import expat
-
-from pynmeagps import haversine, planar
+from xml.etree.ElementTree import ParseError
 
 from pygpsclient.canvas_map import HYB, MAP, SAT, CanvasMap
 from pygpsclient.canvas_subclasses import CanvasGraph
@@ -49,11 +45,9 @@ from pygpsclient.globals import (
     TRACEMODE_WRITE,
     TRACK,
     WAYPOINT,
-    Area,
-    Point,
-    TrackPoint,
 )
-from pygpsclient.helpers import get_range, get_units, isot2dt
+from pygpsclient.gpx_parser import GPXTrack
+from pygpsclient.helpers import decimate_minmax, get_range, get_units
 from pygpsclient.strings import (
     DLGGPXERROR,
     DLGGPXLOAD,
@@ -123,6 +117,8 @@ class GPXViewerDialog(ToplevelDialog):
         self._dist = 0
         self._minele = self._minspd = 1e20
         self._maxele = self._maxspd = -1e20
+        self._profile = {}  # decimated profiles, keyed on (channel, buckets)
+        self._profilewidth = 0
 
         self._body()
         self._do_layout()
@@ -283,6 +279,7 @@ class GPXViewerDialog(ToplevelDialog):
         self._mtt = self._maptype.trace_add(TRACEMODE_WRITE, self._on_maptype)
         self._mtz = self._mapzoom.trace_add(TRACEMODE_WRITE, self._on_mapzoom)
         self._mtg = self._gpxtype.trace_add(TRACEMODE_WRITE, self._on_gpxtype)
+        self._can_profile.bind("<Configure>", self._on_profile_resize)
 
     def _detach_events(self):
         """
@@ -375,85 +372,39 @@ class GPXViewerDialog(ToplevelDialog):
         if self._gpxfile is None:
             return
         ptyp = GPXTYPES[self._gpxtype.get()]
-        with open(self._gpxfile, "r", encoding="utf-8") as gpx:
-            try:
-                parser = minidom.parse(gpx)
-                trkpts = parser.getElementsByTagName(f"{ptyp}")
-                self._process_track(trkpts, ptyp)
-            except (TypeError, AttributeError, expat.ExpatError) as err:
-                self.status_label = (f"{DLGGPXERROR}\n{repr(err)}", ERRCOL)
-                self.logger.error(traceback.format_exc())
+        try:
+            with open(self._gpxfile, "rb") as gpx:
+                track = GPXTrack(gpx, ptyp)
+            self._process_track(track, ptyp)
+        except (TypeError, KeyError, ValueError, ParseError) as err:
+            self.status_label = (f"{DLGGPXERROR}\n{repr(err)}", ERRCOL)
+            self.logger.error(traceback.format_exc())
 
-    def _process_track(self, trkpts: list, ptyp: str):
+    def _process_track(self, track: GPXTrack, ptyp: str):
         """
-        Process trackpoint data.
+        Process parsed track data.
 
-        :param list trk: list of trackpoints
+        :param GPXTrack track: parsed track
         :param str ptyp: element type
         """
 
-        self._rng = len(trkpts)
-        self._no_time = False
-        self._no_ele = False
+        self._rng = len(track)
+        self._no_time = track.no_time
+        self._no_ele = track.no_ele
         if self._rng == 0:
             self.status_label = (DLGGPXNULL.format(ptyp), ERRCOL)
             return
 
-        minlat = minlon = 400
-        maxlat = maxlon = -400
-        track = []
-        start = end = 0
-        self._dist = 0
-        lat1 = lon1 = 0
-        tm = tim1 = spd = spd1 = 0
-        self._minele = self._minspd = 1e10
-        self._maxele = self._maxspd = -1e20
-        for i, trkpt in enumerate(trkpts):
-            lat = float(trkpt.attributes["lat"].value)
-            lon = float(trkpt.attributes["lon"].value)
-            # establish bounding box
-            minlat = min(minlat, lat)
-            minlon = min(minlon, lon)
-            maxlat = max(maxlat, lat)
-            maxlon = max(maxlon, lon)
-            try:
-                tim = isot2dt(trkpt.getElementsByTagName("time")[0].firstChild.data)
-            except IndexError:  # time element does not exist
-                self._no_time = True
-                tim = tm + i  # use synthetic timestamp if gpx has no time element
-            if i == 0:
-                lat1, lon1, tim1 = lat, lon, tim
-                start = tim
-            else:
-                leg = planar(lat1, lon1, lat, lon)  # m
-                if leg > 1000:
-                    leg = haversine(lat1, lon1, lat, lon) / 1000  # m
-                self._dist += leg
-                if tim > tim1:
-                    spd = leg / (tim - tim1)  # m/s
-                else:
-                    spd = spd1
-                spd1 = spd
-                self._maxspd = max(spd, self._maxspd)
-                self._minspd = min(spd, self._minspd)
-                lat1, lon1, tim1 = lat, lon, tim
-                end = tim
-            try:
-                ele = float(trkpt.getElementsByTagName("ele")[0].firstChild.data)
-                self._maxele = max(ele, self._maxele)
-                self._minele = min(ele, self._minele)
-            except IndexError:  # 'ele' element does not exist
-                self._no_ele = True
-                ele = 0.0
-
-            track.append(TrackPoint(lat, lon, tim, ele, spd))
-
-        self._bounds = Area(minlat, minlon, maxlat, maxlon)
-        self._center = Point((maxlat + minlat) / 2, (maxlon + minlon) / 2)
-        self._elapsed = end - start
-        self._mintim = start
-        self._maxtim = end
+        self._bounds = track.bounds
+        self._center = track.center
+        self._dist = track.dist
+        self._elapsed = track.elapsed
+        self._mintim = track.start
+        self._maxtim = track.end
+        self._minele, self._maxele = track.minele, track.maxele
+        self._minspd, self._maxspd = track.minspd, track.maxspd
         self._track = track
+        self._profile = {}
 
         self._draw_map()
         self._draw_profile()
@@ -473,11 +424,10 @@ class GPXViewerDialog(ToplevelDialog):
         bounds = self._can_mapview.zoom_bounds(
             self.height, self.width, location, zoom, maptype
         )
-        points = [Point(pnt.lat, pnt.lon) for pnt in self._track]
         self._can_mapview.draw_map(
             maptype,
             location=location,
-            track=points,
+            track=self._track.points(),
             bounds=bounds,
             zoom=zoom,
             marker=self._can_mapview.marker,
@@ -530,35 +480,55 @@ class GPXViewerDialog(ToplevelDialog):
             fontscale=10,
         )
 
-        # plot each channel's data points
+        # plot each channel's decimated data points as a single polyline
+        self._profilewidth = self._can_profile.width
         for chn in range(self._num_chans):
-            tm2 = self._mintim
-            vl2 = 0
-            for n, pnt in enumerate(self._track):
-                try:
-                    val = pnt.ele * ele_c if chn == CHANELE else pnt.spd * spd_c
-                except KeyError:
-                    val = None
-                if val is None:
-                    continue
-
-                tm1, vl1 = tm2, vl2
-                tm2, vl2 = pnt.tim, val
-                if n:
-                    self._can_profile.create_gline(
-                        tm1,
-                        vl1,
-                        tm2,
-                        vl2,
-                        fill=self._can_profile.ycol[chn],
-                        width=OL_WID,
-                        chn=chn,
-                        tags="spd" if chn else "ele",
-                    )
+            tims, vals = self._decimated_profile(chn)
+            unit_c = ele_c if chn == CHANELE else spd_c
+            xy = self._can_profile.d2xy_batch(tims, [val * unit_c for val in vals], chn)
+            if len(xy) > 2:
+                self._can_profile.create_line(
+                    *xy,
+                    fill=self._can_profile.ycol[chn],
+                    width=OL_WID,
+                    tags="spd" if chn else "ele",
+                )
 
         if self._no_time:
             self._timelegend()
 
+    def _decimated_profile(self, chn: int) -> tuple:
+        """
+        Get profile channel decimated to a few points per pixel column
+        of the plot area. The number of buckets is rounded up to a power
+        of 2, so the decimation is only recomputed when the plot width
+        changes significantly.
+
+        :param int chn: channel (CHANELE or CHANSPD)
+        :return: tuple of (times, values)
+        :rtype: tuple
+        """
+
+        # pylint: disable=no-member
+
+        plotwidth = self._can_profile.width - self._can_profile.xoffl * 2
+        buckets = 2 ** max(int(plotwidth), 1).bit_length()
+        key = (chn, buckets)
+        if key not in self._profile:
+            vals = self._track.ele if chn == CHANELE else self._track.spd
+            self._profile[key] = decimate_minmax(self._track.tim, vals, buckets)
+        return self._profile[key]
+
+    def _on_profile_resize(self, event):
+        """
+        Redraw profile if width of profile canvas has changed.
+
+        :param event event: resize event
+        """
+
+        if self._track is not None and event.width != self._profilewidth:
+            self._draw_profile()
+
     def _timelegend(self):
         """
         Draw nominal time legend.
@@ -605,27 +575,24 @@ class GPXViewerDialog(ToplevelDialog):
         if self._no_ele:
             ele = NA
         else:
-            elelist = [i.ele * ele_c for i in self._track]
-            ele_median = median(elelist)
-            ele_mean = mean(elelist)
-            ele_min = min(elelist)
-            ele_max = max(elelist)
+            ele_min, ele_max, ele_mean, ele_median, ele_asc, ele_dsc = (
+                val * ele_c for val in self._track.elestats
+            )
             ele = (
                 f"({ele_u}) min: {ele_min:,.2f} "
                 f"max: {ele_max:,.2f} "
                 f"avg: {ele_mean:,.2f} med: {ele_median:,.2f} "
-                f"dif: {(ele_max-ele_min):,.2f}"
+                f"dif: {(ele_max-ele_min):,.2f} "
+                f"asc: {ele_asc:,.2f} dsc: {ele_dsc:,.2f}"
             )
         self._info[1].set(f"Ele {ele}")
 
         if self._no_time:
             spd = NA
         else:
-            spdlist = [i.spd * spd_c for i in self._track]
-            spd_median = median(spdlist)
-            spd_mean = mean(spdlist)
-            spd_min = min(spdlist)
-            spd_max = max(spdlist)
+            spd_min, spd_max, spd_mean, spd_median = (
+                val * spd_c for val in self._track.spdstats
+            )
             spd = (
                 f"({spd_u}) min: {spd_min:,.2f} "
                 f"max: {spd_max:,.2f} "
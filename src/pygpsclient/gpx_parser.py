@@ -0,0 +1,257 @@
+"""
+gpx_parser.py
+
+Streaming GPX track parser.
+
+Track, route or waypoint elements are read incrementally from the GPX file
+and discarded as soon as they have been processed, with the numeric data held
+in compact array-backed columns (lat, lon, time, elevation, speed). The
+bounding box, distance, speed and elevation ranges are accumulated in the same
+single pass, so memory use is proportional to the number of points rather
+than the size of the XML document.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+from array import array
+from functools import cached_property
+from statistics import mean, median
+from xml.etree.ElementTree import iterparse
+
+from pynmeagps import haversine, planar
+
+from pygpsclient.globals import Area, Point, TrackPoint
+from pygpsclient.helpers import isot2dt
+
+
+def _localname(tag: str) -> str:
+    """
+    Strip any namespace from element tag e.g.
+    "{http://www.topografix.com/GPX/1/1}trkpt" -> "trkpt".
+
+    :param str tag: element tag
+    :return: tag without namespace
+    :rtype: str
+    """
+
+    return tag.rsplit("}", 1)[-1]
+
+
+class GPXTrack:
+    """
+    Array-backed GPX track.
+    """
+
+    def __init__(self, source: object, ptyp: str = "trkpt"):
+        """
+        Constructor. Parses GPX file.
+
+        :param object source: GPX file path or binary file object
+        :param str ptyp: point element type ("trkpt", "wpt" or "rtept")
+        :raises: ParseError if GPX is not well-formed XML
+        :raises: KeyError, ValueError, TypeError if point data is invalid
+        """
+
+        self.ptyp = ptyp
+        self.lat = array("d")
+        self.lon = array("d")
+        self.tim = array("d")
+        self.ele = array("d")
+        self.spd = array("d")
+        self.dist = 0
+        self.start = self.end = 0
+        self.minele = self.minspd = 1e10
+        self.maxele = self.maxspd = -1e20
+        self.no_time = False
+        self.no_ele = False
+        self._minlat = self._minlon = 400
+        self._maxlat = self._maxlon = -400
+        self._parse(source)
+
+    def _parse(self, source: object):
+        """
+        Parse GPX file in a single streaming pass.
+
+        :param object source: GPX file path or binary file object
+        """
+
+        stack = []  # open elements
+        tim = ele = None
+        for event, elem in iterparse(source, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                continue
+            stack.pop()
+            tag = _localname(elem.tag)
+            if tag == self.ptyp:
+                self._add(
+                    float(elem.attrib["lat"]), float(elem.attrib["lon"]), tim, ele
+                )
+                tim = ele = None
+                # discard processed point to keep memory use constant
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+            elif stack and _localname(stack[-1].tag) == self.ptyp:
+                if tag == "time":
+                    tim = elem.text
+                elif tag == "ele":
+                    ele = elem.text
+
+    def _add(self, lat: float, lon: float, tim: str, ele: str):
+        """
+        Add point to track, updating bounding box, distance,
+        speed and elevation ranges.
+
+        :param float lat: latitude
+        :param float lon: longitude
+        :param str tim: ISO time or None if point has no time element
+        :param str ele: elevation or None if point has no ele element
+        """
+
+        i = len(self.lat)
+        self._minlat = min(self._minlat, lat)
+        self._minlon = min(self._minlon, lon)
+        self._maxlat = max(self._maxlat, lat)
+        self._maxlon = max(self._maxlon, lon)
+        if tim is None:  # time element does not exist
+            self.no_time = True
+            tim = i  # use synthetic timestamp if gpx has no time element
+        else:
+            tim = isot2dt(tim)
+        if i == 0:
+            spd = 0
+            self.start = tim
+        else:
+            lat1, lon1, tim1 = self.lat[-1], self.lon[-1], self.tim[-1]
+            leg = planar(lat1, lon1, lat, lon)  # m
+            if leg > 1000:
+                leg = haversine(lat1, lon1, lat, lon) / 1000  # m
+            self.dist += leg
+            if tim > tim1:
+                spd = leg / (tim - tim1)  # m/s
+            else:
+                spd = self.spd[-1]
+            self.maxspd = max(spd, self.maxspd)
+            self.minspd = min(spd, self.minspd)
+            self.end = tim
+        if ele is None:  # 'ele' element does not exist
+            self.no_ele = True
+            ele = 0.0
+        else:
+            ele = float(ele)
+            self.maxele = max(ele, self.maxele)
+            self.minele = min(ele, self.minele)
+
+        self.lat.append(lat)
+        self.lon.append(lon)
+        self.tim.append(tim)
+        self.ele.append(ele)
+        self.spd.append(spd)
+
+    def __len__(self) -> int:
+        """
+        Get number of points in track.
+
+        :return: number of points
+        :rtype: int
+        """
+
+        return len(self.lat)
+
+    def __getitem__(self, i: int) -> TrackPoint:
+        """
+        Get individual track point.
+
+        :param int i: index
+        :return: track point
+        :rtype: TrackPoint
+        """
+
+        return TrackPoint(
+            self.lat[i], self.lon[i], self.tim[i], self.ele[i], self.spd[i]
+        )
+
+    def points(self) -> list:
+        """
+        Get track as list of Points.
+
+        :return: list of Point(lat, lon)
+        :rtype: list
+        """
+
+        return list(map(Point, self.lat, self.lon))
+
+    @property
+    def bounds(self) -> Area:
+        """
+        Getter for track bounding box.
+
+        :return: bounding box
+        :rtype: Area
+        """
+
+        return Area(self._minlat, self._minlon, self._maxlat, self._maxlon)
+
+    @property
+    def center(self) -> Point:
+        """
+        Getter for centre of track bounding box.
+
+        :return: centre
+        :rtype: Point
+        """
+
+        return Point(
+            (self._maxlat + self._minlat) / 2, (self._maxlon + self._minlon) / 2
+        )
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Getter for elapsed time.
+
+        :return: elapsed time in seconds
+        :rtype: float
+        """
+
+        return self.end - self.start
+
+    @cached_property
+    def elestats(self) -> tuple:
+        """
+        Getter for elevation statistics, computed once per track.
+
+        :return: tuple of (min, max, mean, median, ascent, descent) in m
+        :rtype: tuple
+        """
+
+        ascent = descent = 0
+        for ele1, ele2 in zip(self.ele, self.ele[1:]):
+            if ele2 > ele1:
+                ascent += ele2 - ele1
+            else:
+                descent += ele1 - ele2
+        return (
+            min(self.ele),
+            max(self.ele),
+            mean(self.ele),
+            median(self.ele),
+            ascent,
+            descent,
+        )
+
+    @cached_property
+    def spdstats(self) -> tuple:
+        """
+        Getter for speed statistics, computed once per track.
+
+        :return: tuple of (min, max, mean, median) in m/s
+        :rtype: tuple
+        """
+
+        return min(self.spd), max(self.spd), mean(self.spd), median(self.spd)
@@ -12,6 +12,7 @@ Created on 17 Apr 2021
 """
 
 import re
+from argparse import ArgumentParser
 from datetime import datetime, timedelta
 from math import (
     asin,
@@ -41,6 +42,13 @@ from tkinter import (
 from types import FunctionType, MethodType, NoneType
 from typing import Any, Literal
 
+from pygnssutils import (
+    VERBOSITY_CRITICAL,
+    VERBOSITY_DEBUG,
+    VERBOSITY_HIGH,
+    VERBOSITY_LOW,
+    VERBOSITY_MEDIUM,
+)
 from pygnssutils import version as PGVERSION
 from pynmeagps import WGS84_SMAJ_AXIS, NMEAMessage, haversine
 from pynmeagps import version as NMEAVERSION
@@ -103,6 +111,14 @@ from pygpsclient.globals import (
 )
 from pygpsclient.strings import NA
 
+try:
+    import numpy as np
+
+    HASNUMPY = True
+except (ImportError, ModuleNotFoundError):
+    HASNUMPY = False
+
+NUMPYMIN = 256  # minimum batch size for NumPy coordinate transforms
 # validation type flags
 MAXPORT = 65535
 MAXALT = 10000.0  # meters arbitrary
@@ -222,6 +238,40 @@ for var in (BooleanVar, DoubleVar, IntVar, StringVar):
 # ****************************************************************
 
 
+def add_logging_args(ap: ArgumentParser, default: int = VERBOSITY_LOW):
+    """
+    Add --verbosity and --logtofile logging arguments to CLI argument parser.
+
+    :param ArgumentParser ap: argument parser
+    :param int default: default verbosity
+    """
+
+    ap.add_argument(
+        "--verbosity",
+        help=(
+            f"Log message verbosity "
+            f"{VERBOSITY_CRITICAL} = critical, "
+            f"{VERBOSITY_LOW} = low (error), "
+            f"{VERBOSITY_MEDIUM} = medium (warning), "
+            f"{VERBOSITY_HIGH} = high (info), {VERBOSITY_DEBUG} = debug"
+        ),
+        type=int,
+        choices=[
+            VERBOSITY_LOW,
+            VERBOSITY_MEDIUM,
+            VERBOSITY_HIGH,
+            VERBOSITY_DEBUG,
+            VERBOSITY_CRITICAL,
+        ],
+        default=default,
+    )
+    ap.add_argument(
+        "--logtofile",
+        help="fully qualified log file name, or '' for no log file",
+        default="",
+    )
+
+
 def area_in_bounds(
     bounds: Area,
     extents: Area,
@@ -412,6 +462,51 @@ def date2wnotow(dat: datetime) -> tuple:
     return wno, tow
 
 
+def decimate_minmax(datax: list, datay: list, buckets: int) -> tuple:
+    """
+    Decimate x,y series for plotting by dividing the x range into a
+    number of equal buckets (e.g. one per pixel column) and retaining
+    only the minimum and maximum y values in each bucket, in their
+    original order. Peaks and troughs are therefore preserved at the
+    plotted resolution. The first and last points are always retained.
+
+    :param list datax: x data values (list, tuple or array)
+    :param list datay: y data values (list, tuple or array)
+    :param int buckets: number of buckets
+    :return: tuple of (decimated x values, decimated y values)
+    :rtype: tuple
+    """
+
+    num = min(len(datax), len(datay))
+    span = datax[num - 1] - datax[0] if num else 0
+    if num <= buckets * 2 or span <= 0:
+        return list(datax[:num]), list(datay[:num])
+
+    x0 = datax[0]
+    scale = buckets / span
+    keep = [0]
+
+    def flush(imin: int, imax: int):
+        keep.extend(sorted({imin, imax} - {keep[-1]}))
+
+    cur = imin = imax = 0
+    ymin = ymax = datay[0]
+    for i in range(1, num):
+        y = datay[i]
+        bucket = int((datax[i] - x0) * scale)
+        if bucket != cur:  # consecutive points in a new bucket
+            flush(imin, imax)
+            cur, imin, imax, ymin, ymax = bucket, i, i, y, y
+        elif y < ymin:
+            imin, ymin = i, y
+        elif y > ymax:
+            imax, ymax = i, y
+    flush(imin, imax)
+    if keep[-1] != num - 1:
+        keep.append(num - 1)
+    return [datax[i] for i in keep], [datay[i] for i in keep]
+
+
 def dop2str(dop: float) -> str:
     """
     Convert Dilution of Precision float to descriptive string.
@@ -747,6 +842,10 @@ def isot2dt(tim: str) -> float:
 
     if tim[-1] == "Z":  # strip timezone label
         tim = tim[0:-1]
+    try:  # fast path for standard formats
+        return datetime.fromisoformat(tim).timestamp()
+    except ValueError:
+        pass
     if tim[-4] == ".":  # has milliseconds
         tfm = "%Y-%m-%dT%H:%M:%S.%f"
     elif tim[-7] == ".":  # has microseconds
@@ -801,6 +900,45 @@ def lanip() -> str:
             return "N/A"
 
 
+def linear2xy(
+    datax: list,
+    datay: list,
+    xscale: float,
+    xoffset: float,
+    yscale: float,
+    yoffset: float,
+) -> list:
+    """
+    Apply linear transform to sequences of x and y data values and
+    return flattened list of coordinates [x0, y0, x1, y1, ...], suitable
+    for passing directly to e.g. Canvas.create_line() or Canvas.coords().
+
+    x = datax * xscale + xoffset, y = datay * yscale + yoffset
+
+    Uses NumPy (if installed) for larger sequences.
+
+    :param list datax: x data values (list, tuple or array)
+    :param list datay: y data values (list, tuple or array)
+    :param float xscale: x scale
+    :param float xoffset: x offset
+    :param float yscale: y scale
+    :param float yoffset: y offset
+    :return: flattened list of x,y coordinates
+    :rtype: list
+    """
+
+    num = min(len(datax), len(datay))
+    if HASNUMPY and num >= NUMPYMIN:
+        xy = np.empty(num * 2)
+        xy[0::2] = np.asarray(datax[:num], dtype=float) * xscale + xoffset
+        xy[1::2] = np.asarray(datay[:num], dtype=float) * yscale + yoffset
+        return xy.tolist()
+    xy = [0.0] * (num * 2)
+    xy[0::2] = [x * xscale + xoffset for x in datax[:num]]
+    xy[1::2] = [y * yscale + yoffset for y in datay[:num]]
+    return xy
+
+
 def ll2xy(width: int, height: int, bounds: Area, position: Point) -> tuple:
     """
     Convert lat/lon to canvas x/y.
@@ -820,6 +958,32 @@ def ll2xy(width: int, height: int, bounds: Area, position: Point) -> tuple:
     return x, y
 
 
+def ll2xy_batch(width: int, height: int, bounds: Area, lats: list, lons: list) -> list:
+    """
+    Convert sequences of lat/lon to flattened list of canvas
+    coordinates [x0, y0, x1, y1, ...].
+
+    :param int width: canvas width
+    :param int height: canvas height
+    :param Area bounds: lat/lon bounds of canvas
+    :param list lats: latitudes (list, tuple or array)
+    :param list lons: longitudes (list, tuple or array)
+    :return: flattened list of x,y canvas coordinates
+    :rtype: list
+    """
+
+    xscale = width / (bounds.lon2 - bounds.lon1)
+    yscale = height / (bounds.lat2 - bounds.lat1)
+    return linear2xy(
+        lons,
+        lats,
+        xscale,
+        -bounds.lon1 * xscale,
+        -yscale,
+        height + bounds.lat1 * yscale,
+    )
+
+
 def makeval(val: Any, default: Any = 0.0) -> Any:
     """
     Force value to be same type as default
@@ -1020,6 +1184,48 @@ def point_in_bounds(bounds: Area, point: Point) -> bool:
     )
 
 
+def polar2xy(
+    azis: list,
+    radii: list,
+    xc: float,
+    yc: float,
+    rscale: float = 1,
+    celestial: bool = False,
+) -> list:
+    """
+    Convert sequences of polar (azimuth/distance) or celestial
+    (azimuth/elevation) coordinates to flattened list of canvas
+    coordinates [x0, y0, x1, y1, ...], with North up.
+
+    Uses NumPy (if installed) for larger sequences.
+
+    :param list azis: azimuths in degrees (list, tuple or array)
+    :param list radii: distances, or elevations in degrees if celestial
+    :param float xc: x coordinate of center
+    :param float yc: y coordinate of center
+    :param float rscale: radius scaling factor (e.g. pixels per unit distance)
+    :param bool celestial: radii are elevations in degrees
+    :return: flattened list of x,y canvas coordinates
+    :rtype: list
+    """
+
+    num = min(len(azis), len(radii))
+    if HASNUMPY and num >= NUMPYMIN:
+        azi = np.radians((np.asarray(azis[:num], dtype=float) - 90) % 360)
+        rad = np.asarray(radii[:num], dtype=float)
+        rad = np.cos(np.radians(rad)) * rscale if celestial else rad * rscale
+        xy = np.empty(num * 2)
+        xy[0::2] = np.cos(azi) * rad + xc
+        xy[1::2] = np.sin(azi) * rad + yc
+        return xy.tolist()
+    xy = []
+    for azi, rad in zip(azis[:num], radii[:num]):
+        azi = radians((azi - 90) % 360)
+        rad = cos(radians(rad)) * rscale if celestial else rad * rscale
+        xy.extend((cos(azi) * rad + xc, sin(azi) * rad + yc))
+    return xy
+
+
 def pos2iso6709(lat: float, lon: float, alt: float, crs: str = "WGS_84") -> str:
     """
     convert decimal degrees and alt to iso6709 format.
@@ -1268,6 +1474,111 @@ def setubxrate(app: object, mid: str, rate: int = 1, prot: str = "UBX") -> UBXMe
     return msg
 
 
+def shorten_path(fpath: object, maxlen: int = 60) -> str:
+    """
+    Shorten file path for display, keeping its trailing characters.
+
+    :param object fpath: file path as str or Path
+    :param int maxlen: maximum length before shortening
+    :return: shortened path e.g. ".../logs/pygpsdata.log"
+    :rtype: str
+    """
+
+    sfp = str(fpath)
+    return f"...{sfp[-maxlen:]}" if len(sfp) > maxlen else sfp
+
+
+def simplify_track(
+    track: list, tolerance: float, xscale: float = 1, yscale: float = 1
+) -> list:
+    """
+    Simplify track using Douglas-Peucker algorithm, retaining only
+    those points which deviate from the simplified track by more
+    than the tolerance. Track start and end points are always retained.
+    Points closer than the tolerance to their predecessor are discarded
+    in an initial radial distance pass.
+
+    Lat/lon are multiplied by yscale/xscale before comparison, so the
+    tolerance can be expressed in display units e.g. pixels.
+
+    :param list track: list of Points (or other (lat, lon) tuples)
+    :param float tolerance: maximum permissible deviation
+    :param float xscale: longitude scaling factor e.g. pixels per degree
+    :param float yscale: latitude scaling factor e.g. pixels per degree
+    :return: simplified list of Points
+    :rtype: list
+    """
+
+    npts = len(track)
+    if npts < 3 or tolerance <= 0:
+        return list(track)
+
+    tol2 = tolerance * tolerance
+    # radial distance pass
+    pts = [track[0]]
+    xs = [track[0][1] * xscale]
+    ys = [track[0][0] * yscale]
+    for pnt in track[1:-1]:
+        x, y = pnt[1] * xscale, pnt[0] * yscale
+        if (x - xs[-1]) ** 2 + (y - ys[-1]) ** 2 > tol2:
+            pts.append(pnt)
+            xs.append(x)
+            ys.append(y)
+    pts.append(track[-1])
+    xs.append(track[-1][1] * xscale)
+    ys.append(track[-1][0] * yscale)
+    npts = len(pts)
+    if HASNUMPY and npts >= NUMPYMIN:
+        xs, ys = np.asarray(xs), np.asarray(ys)
+
+    def farthest(first: int, last: int) -> tuple:
+        """
+        Get index and squared distance of point farthest from segment.
+        Distance is to the segment itself rather than the line through
+        its ends, so out-and-back spurs beyond the segment are retained.
+        """
+
+        x1, y1 = xs[first], ys[first]
+        dx, dy = xs[last] - x1, ys[last] - y1
+        seglen2 = dx * dx + dy * dy
+        if HASNUMPY and last - first > NUMPYMIN:
+            px, py = xs[first + 1 : last] - x1, ys[first + 1 : last] - y1
+            if seglen2 == 0:  # degenerate segment (closed loop)
+                dist2 = px * px + py * py
+            else:  # squared distance from nearest point on segment
+                t = np.clip((px * dx + py * dy) / seglen2, 0, 1)
+                dist2 = (px - t * dx) ** 2 + (py - t * dy) ** 2
+            i = int(np.argmax(dist2))
+            return first + 1 + i, dist2[i]
+        idx, maxdist2 = -1, 0
+        for i in range(first + 1, last):
+            px, py = xs[i] - x1, ys[i] - y1
+            if seglen2 == 0:
+                dist2 = px * px + py * py
+            else:
+                t = min(max((px * dx + py * dy) / seglen2, 0), 1)
+                dist2 = (px - t * dx) ** 2 + (py - t * dy) ** 2
+            if dist2 > maxdist2:
+                idx, maxdist2 = i, dist2
+        return idx, maxdist2
+
+    # Douglas-Peucker pass
+    keep = [False] * npts
+    keep[0] = keep[-1] = True
+    stack = [(0, npts - 1)]  # iterative to avoid recursion limit
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        idx, maxdist2 = farthest(first, last)
+        if maxdist2 > tol2:
+            keep[idx] = True
+            stack.append((first, idx))
+            stack.append((idx, last))
+
+    return [pnt for pnt, kept in zip(pts, keep) if kept]
+
+
 def snr2col(snr: int) -> str:
     """
     Convert satellite signal-to-noise ratio to a color
@@ -1520,3 +1831,26 @@ def xy2ll(width: int, height: int, bounds: Area, xy: tuple) -> Point | NoneType:
     lon = bounds.lon1 + x / (width / lw)
     lat = bounds.lat1 + (height - y) / (height / lh)
     return Point(lat, lon)
+
+
+def xy2ll_batch(width: int, height: int, bounds: Area, xy: list) -> list | NoneType:
+    """
+    Convert flattened list of canvas coordinates [x0, y0, x1, y1, ...]
+    to list of lat/lon.
+
+    :param int width: canvas width
+    :param int height: canvas height
+    :param Area bounds: lat/lon bounds of canvas
+    :param list xy: flattened list of x,y canvas coordinates
+    :return: list of lat/lon
+    :rtype: list | NoneType
+    """
+
+    lw = bounds.lon2 - bounds.lon1
+    lh = bounds.lat2 - bounds.lat1
+    if lw == 0 or lh == 0:
+        return None
+    ll = linear2xy(
+        xy[0::2], xy[1::2], lw / width, bounds.lon1, -lh / height, bounds.lat1 + lh
+    )
+    return [Point(lat, lon) for lon, lat in zip(ll[0::2], ll[1::2])]
@@ -0,0 +1,128 @@
+"""
+latency_frame.py
+
+Correction Latency frame for PyGPSClient application.
+
+Shows percentile latencies for each correction message type, from
+arrival (NTRIP, MQTT or L-band) to device write and to receiver
+acknowledgement (UBX RXM-RTCM or RXM-SPARTN), together with the
+receiver's reported correction age. Statistics can be exported to
+a CSV file in the data log directory.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+from tkinter import Frame
+
+from pygpsclient.correction_latency import AGE, E2E, QUEUE
+from pygpsclient.globals import ERRCOL, HOME, INFOCOL
+from pygpsclient.helpers import set_filename, setubxrate
+from pygpsclient.strings import DLGWAITLATENCY
+from pygpsclient.table_frame import TableFrame
+
+
+def _ms(val: float) -> str:
+    """
+    Format latency in seconds as milliseconds.
+
+    :param float val: latency in seconds
+    :return: formatted latency
+    :rtype: str
+    """
+
+    return "-" if val is None else f"{val * 1000:.0f}"
+
+
+class LatencyFrame(TableFrame):  # pylint: disable=too-many-ancestors
+    """
+    Correction Latency frame class.
+    """
+
+    HEADER = ("Type", "Src", "N", "Queue p50/p95", "E2E p50/p95/p99", "Age p50")
+    COLS = (0, 0.17, 0.29, 0.38, 0.62, 0.88)
+
+    def __init__(self, app: Frame, parent: Frame, *args, **kwargs):
+        """
+        Constructor.
+
+        :param Frame app: reference to main tkinter application
+        :param Frame parent: reference to parent frame
+        :param args: optional args to pass to Frame parent class
+        :param kwargs: optional kwargs to pass to Frame parent class
+        """
+
+        self.__app = app  # Reference to main application class
+
+        super().__init__(app, parent, *args, **kwargs)
+        self.enable_messages(True)
+
+    def _buttons(self) -> tuple:
+        """
+        Get command buttons.
+
+        :return: tuple of (text, command)
+        :rtype: tuple
+        """
+
+        return (("Export", self._on_export), ("Reset", self._on_reset))
+
+    def enable_messages(self, status: int):
+        """
+        Enable/disable UBX RXM-RTCM & RXM-SPARTN acknowledgement
+        messages on default port(s).
+
+        :param int status: 0 = off, 1 = on
+        """
+
+        for msgid in ("RXM-RTCM", "RXM-SPARTN"):
+            setubxrate(self.__app, msgid, status)
+
+    def update_frame(self):
+        """
+        Update latency table.
+        """
+
+        rows = []
+        for msgtype, stat in self.__app.correction_latency.stats().items():
+            queue, e2e, age = stat[QUEUE], stat[E2E], stat[AGE]
+            vals = (
+                msgtype,
+                stat["source"],
+                stat["count"],
+                f"{_ms(queue[0])}/{_ms(queue[1])}",
+                f"{_ms(e2e[0])}/{_ms(e2e[1])}/{_ms(e2e[2])}",
+                "-" if age[0] is None else f"{age[0]:.1f}",
+            )
+            rows.append((vals, INFOCOL))
+        self.draw_rows(rows, DLGWAITLATENCY)
+
+    def _on_export(self):
+        """
+        Export latency statistics to CSV file in data log directory.
+        """
+
+        logpath = self.__app.configuration.get("logpath_s") or HOME
+        _, fpath = set_filename(logpath, "latency", "csv")
+        try:
+            self.__app.correction_latency.export(fpath)
+            self.__app.status_label = (
+                f"Latency statistics exported to {fpath}",
+                INFOCOL,
+            )
+        except OSError as err:
+            self.__app.status_label = (
+                f"Error exporting latency statistics {err}",
+                ERRCOL,
+            )
+
+    def _on_reset(self):
+        """
+        Reset latency statistics.
+        """
+
+        self.__app.correction_latency.reset()
+        self.init_frame()
@@ -14,15 +14,15 @@ Created on 14 Sep 2020
 
 # pylint: disable=no-member
 
-from tkinter import NE, NSEW, Frame, font
+from tkinter import NE, NSEW, Frame
 
 from pygpsclient.canvas_subclasses import (
-    TAG_DATA,
     TAG_GRID,
     TAG_WAIT,
     TAG_XLABEL,
     TAG_YLABEL,
     CanvasGraph,
+    CanvasItemPool,
 )
 from pygpsclient.globals import (
     BGCOL,
@@ -66,6 +66,8 @@ class LevelsviewFrame(Frame):
         self.height = kwargs.get("height", def_h)
         self._redraw = True
         self._waiting = True
+        self._xfnt = None
+        self._xfntkey = None
         self._body()
         self._attach_events()
 
@@ -80,6 +82,7 @@ class LevelsviewFrame(Frame):
             self.__app, self, width=self.width, height=self.height, bg=BGCOL
         )
         self._canvas.grid(column=0, row=0, sticky=NSEW)
+        self._pool = CanvasItemPool(self._canvas)
 
     def _attach_events(self):
         """
@@ -135,6 +138,8 @@ class LevelsviewFrame(Frame):
             fontscale=FONTSCALELG,
             tags=tags,
         )
+        if self._redraw:
+            self._pool.lift()
         self._redraw = False
 
     def _draw_legend(self):
@@ -145,26 +150,26 @@ class LevelsviewFrame(Frame):
         w = self.width / 12
         h = self.height / 18
 
-        lgfont = font.Font(size=int(min(self.width, self.height) / FONTSCALELG))
-        for i, (_, (gnssName, gnssCol)) in enumerate(GNSS_LIST.items()):
+        lgfont = self._canvas.sized_font(
+            int(min(self.width, self.height) / FONTSCALELG)
+        )
+        for i, (gnssId, (gnssName, gnssCol)) in enumerate(GNSS_LIST.items()):
             x = (self._canvas.xoffl * 2) + w * i
-            self._canvas.create_rectangle(
-                x,
-                self._canvas.yofft,
-                x + w - 5,
-                self._canvas.yofft + h,
+            self._pool.draw(
+                ("legend", gnssId),
+                "rectangle",
+                (x, self._canvas.yofft, x + w - 5, self._canvas.yofft + h),
                 outline=GRIDMAJCOL,
                 fill=gnssCol,
                 width=OL_WID,
-                tags=TAG_XLABEL,
             )
-            self._canvas.create_text(
-                (x + x + w - 5) / 2,
-                self._canvas.yofft + h / 2,
+            self._pool.draw(
+                ("legend", gnssId),
+                "text",
+                ((x + x + w - 5) / 2, self._canvas.yofft + h / 2),
                 text=gnssName,
                 fill=col2contrast(gnssCol),
                 font=lgfont,
-                tags=TAG_XLABEL,
             )
 
     def update_frame(self):
@@ -186,37 +191,48 @@ class LevelsviewFrame(Frame):
 
         offset = self._canvas.xoffl
         colwidth = (w - self._canvas.xoffl - self._canvas.xoffr + 1) / siv
-        xfnt, _, _, _ = fitfont(XLBLFMT, colwidth, self._canvas.yoffb, XLBLANGLE)
+        # only refit label font if column width has changed
+        if (colwidth, self._canvas.yoffb) != self._xfntkey:
+            self._xfnt, _, _, _ = fitfont(
+                XLBLFMT, colwidth, self._canvas.yoffb, XLBLANGLE
+            )
+            self._xfntkey = (colwidth, self._canvas.yoffb)
+        # reuse existing canvas items keyed on (gnssId, svid)
+        self._pool.start()
         for val in sorted(data.values()):  # sort by ascending gnssid, svid
             gnssId, prn, _, _, cno, _ = val
             if cno == 0 and not show_unused:
                 continue
             snr_y = int(cno) * (h - self._canvas.yoffb - 1) / MAX_SNR
             _, ol_col = GNSS_LIST[gnssId]
-            self._canvas.create_rectangle(
-                offset,
-                h - self._canvas.yoffb - 1,
-                offset + colwidth - OL_WID,
-                h - self._canvas.yoffb - 1 - snr_y,
+            self._pool.draw(
+                (gnssId, prn),
+                "rectangle",
+                (
+                    offset,
+                    h - self._canvas.yoffb - 1,
+                    offset + colwidth - OL_WID,
+                    h - self._canvas.yoffb - 1 - snr_y,
+                ),
                 outline=GRIDMAJCOL,
                 fill=ol_col,
                 width=OL_WID,
-                tags=TAG_DATA,
             )
-            self._canvas.create_text(
-                offset + colwidth / 2,
-                h - self._canvas.yoffb - 1,
+            self._pool.draw(
+                (gnssId, prn),
+                "text",
+                (offset + colwidth / 2, h - self._canvas.yoffb - 1),
                 text=f"{int(prn):02}",
                 fill=FGCOL,
-                font=xfnt,
+                font=self._xfnt,
                 angle=XLBLANGLE,
                 anchor=NE,
-                tags=TAG_DATA,
             )
             offset += colwidth
 
         if self.__app.configuration.get("legend_b"):
             self._draw_legend()
+        self._pool.purge()
         self.update_idletasks()
 
     def _on_resize(self, event):  # pylint: disable=unused-argument
@@ -0,0 +1,224 @@
+"""
+log_extract.py
+
+Identity, protocol and receiver time window extraction from raw binary
+GNSS data logs.
+
+Streams an input log through the header-only LogFramer and writes the
+selected frames, byte-for-byte, to an output log using large buffered
+writes, e.g. to hand a compact reproduction file to developers::
+
+    pygpsclient-extract capture.log repro.log -I NAV-PVT,RXM-RAWX --start 10:00 --end 10:30
+
+Frames with no receiver time of their own (e.g. RTCM3 1005 or UBX
+RXM-SFRBX) take the most recent receiver time seen in the log. Time windows
+are UTC time of day and may span midnight (e.g. --start 23:50 --end 00:10).
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import sys
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from os import path
+from threading import Event
+from time import perf_counter
+from types import MethodType
+
+from pygpsclient._version import __version__ as VERSION
+from pygpsclient.log_framer import PROTOCOLS, LogFramer, identify, receiver_time
+
+WRITEBUF = 4194304  # output write buffer size in bytes
+PROGRESSFRAMES = 10000  # frames between progress updates
+
+
+def parse_tod(val: str) -> float:
+    """
+    Parse time of day string "HH:MM[:SS[.sss]]" to seconds.
+
+    :param str val: time of day
+    :return: seconds since midnight
+    :rtype: float
+    :raises: ValueError if invalid
+    """
+
+    parts = val.strip().split(":")
+    if len(parts) not in (2, 3):
+        raise ValueError(f"Invalid time {val}, expected HH:MM[:SS]")
+    hrs, mins = int(parts[0]), int(parts[1])
+    secs = float(parts[2]) if len(parts) == 3 else 0.0
+    if not (0 <= hrs < 24 and 0 <= mins < 60 and 0 <= secs < 60):
+        raise ValueError(f"Invalid time {val}, expected HH:MM[:SS]")
+    return hrs * 3600 + mins * 60 + secs
+
+
+def in_window(tod: float, start: float = None, end: float = None) -> bool:
+    """
+    Check if time of day lies within window [start, end). Window may span
+    midnight (end < start).
+
+    :param float tod: time of day in seconds, or None if unknown
+    :param float start: window start in seconds (None = unbounded)
+    :param float end: window end in seconds (None = unbounded)
+    :return: True if in window
+    :rtype: bool
+    """
+
+    if start is None and end is None:
+        return True
+    if tod is None:
+        return False
+    if start is None:
+        return tod < end
+    if end is None:
+        return tod >= start
+    if end < start:
+        return tod >= start or tod < end
+    return start <= tod < end
+
+
+def extract_log(
+    instream: object,
+    outstream: object,
+    identities: tuple = (),
+    protocols: tuple = (),
+    start: float = None,
+    end: float = None,
+    stopevent: Event = None,
+    progcallback: MethodType = None,
+    size: int = 0,
+) -> dict:
+    """
+    Extract frames matching identity, protocol and receiver time window
+    filters from input stream and write them unaltered to output stream.
+
+    :param object instream: binary input stream
+    :param object outstream: binary output stream
+    :param tuple identities: identities to extract e.g. ("NAV-PVT", "1077") (() = all)
+    :param tuple protocols: protocols to extract e.g. ("UBX", "RTCM") (() = all)
+    :param float start: UTC time of day window start in seconds (None = unbounded)
+    :param float end: UTC time of day window end in seconds (None = unbounded)
+    :param Event stopevent: stop event for remote cancellation
+    :param MethodType progcallback: optional callback for % complete updates
+    :param int size: input size in bytes, for progress updates
+    :return: summary dict of {"frames", "extracted", "bytes", "unknown", "cancelled"}
+    :rtype: dict
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+
+    identities = set(identities)
+    protocols = set(protocols)
+    timed = start is not None or end is not None
+    framer = LogFramer(instream)
+    frames = extracted = written = 0
+    tod = None  # most recent receiver time
+    cancelled = False
+    for offset, protocol, raw in framer:
+        frames += 1
+        if progcallback is not None and size and not frames % PROGRESSFRAMES:
+            progcallback(int(offset * 100 / size))
+            if stopevent is not None and stopevent.is_set():
+                cancelled = True
+                break
+        identity = identify(raw, protocol) if identities or timed else ""
+        if timed:  # receiver time is tracked from all frames, not just those selected
+            rtime = receiver_time(raw, protocol, identity)
+            tod = tod if rtime is None else rtime
+        if protocols and protocol not in protocols:
+            continue
+        if identities and identity not in identities:
+            continue
+        if timed and not in_window(tod, start, end):
+            continue
+        outstream.write(raw)
+        extracted += 1
+        written += len(raw)
+    if progcallback is not None and not cancelled:
+        progcallback(100)
+    return {
+        "frames": frames,
+        "extracted": extracted,
+        "bytes": written,
+        "unknown": framer.unknown,
+        "cancelled": cancelled,
+    }
+
+
+def extract_file(infile: str, outfile: str, **kwargs) -> dict:
+    """
+    Extract frames from input log file to output log file.
+
+    :param str infile: input log path
+    :param str outfile: output log path
+    :param kwargs: filter keyword arguments passed to extract_log()
+    :return: summary dict from extract_log()
+    :rtype: dict
+    :raises: OSError, ValueError if input and output are the same file
+    """
+
+    if path.exists(outfile) and path.samefile(infile, outfile):
+        raise ValueError("Input and output must be different files")
+    with open(infile, "rb") as instream:
+        with open(outfile, "wb", buffering=WRITEBUF) as outstream:
+            return extract_log(instream, outstream, size=path.getsize(infile), **kwargs)
+
+
+def main():
+    """
+    CLI entry point.
+    """
+
+    ap = ArgumentParser(
+        formatter_class=ArgumentDefaultsHelpFormatter,
+        description="Extract messages by identity, protocol and receiver time "
+        "window from binary GNSS data logs",
+    )
+    ap.add_argument("-V", "--version", action="version", version="%(prog)s " + VERSION)
+    ap.add_argument("infile", help="Input log file")
+    ap.add_argument("outfile", help="Output log file")
+    ap.add_argument(
+        "-I",
+        "--identities",
+        help="Comma-separated message identities e.g. NAV-PVT,RXM-RAWX,GNGGA,1077",
+        default="",
+    )
+    ap.add_argument(
+        "-P",
+        "--protocols",
+        help=f"Comma-separated protocols from {','.join(PROTOCOLS)}",
+        default="",
+    )
+    ap.add_argument("--start", help="UTC window start time HH:MM[:SS]", default="")
+    ap.add_argument("--end", help="UTC window end time HH:MM[:SS]", default="")
+    kwargs = vars(ap.parse_args())
+
+    try:
+        protocols = tuple(p.upper() for p in kwargs["protocols"].split(",") if p)
+        invalid = [p for p in protocols if p not in PROTOCOLS]
+        if invalid != []:
+            raise ValueError(f"Invalid protocol(s) {', '.join(invalid)}")
+        start = perf_counter()
+        summary = extract_file(
+            kwargs["infile"],
+            kwargs["outfile"],
+            identities=tuple(i for i in kwargs["identities"].split(",") if i),
+            protocols=protocols,
+            start=parse_tod(kwargs["start"]) if kwargs["start"] else None,
+            end=parse_tod(kwargs["end"]) if kwargs["end"] else None,
+        )
+    except (OSError, ValueError) as err:
+        print(f"Error: {err}", file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"{summary['extracted']} of {summary['frames']} frames "
+        f"({summary['bytes']} bytes) extracted to {kwargs['outfile']} "
+        f"in {round(perf_counter() - start, 3)} s, "
+        f"{summary['unknown']} unrecognised bytes skipped"
+    )
+
+
+if __name__ == "__main__":
+    main()
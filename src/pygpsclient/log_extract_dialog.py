@@ -0,0 +1,312 @@
+"""
+log_extract_dialog.py
+
+Log extraction dialog. Extracts messages by identity, protocol and
+receiver time window from a binary GNSS data log to a compact,
+byte-exact output log alongside the input log.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+from logging import getLogger
+from pathlib import Path
+from threading import Event, Thread
+from tkinter import (
+    EW,
+    NORMAL,
+    NSEW,
+    Button,
+    Checkbutton,
+    E,
+    Entry,
+    Frame,
+    IntVar,
+    Label,
+    StringVar,
+    TclError,
+    W,
+    ttk,
+)
+from tkinter.ttk import Progressbar
+
+from pygpsclient.globals import CLICK_CURSOR, ERRCOL, INFOCOL, OKCOL, READONLY
+from pygpsclient.helpers import VALCUSTOM, VALNONBLANK, shorten_path, validate
+from pygpsclient.log_extract import extract_file, parse_tod
+from pygpsclient.log_framer import PROTOCOLS
+from pygpsclient.strings import (
+    DLGTEXTRACT,
+    LBLEXTRACTEND,
+    LBLEXTRACTIDENTITIES,
+    LBLEXTRACTOUTPUT,
+    LBLEXTRACTPROTOCOLS,
+    LBLEXTRACTSTART,
+    LBLRINEXINPUTFILE,
+)
+from pygpsclient.toplevel_dialog import ToplevelDialog
+
+OUTSUFFIX = "-extract"
+
+
+class LogExtractDialog(ToplevelDialog):
+    """
+    LogExtractDialog class.
+    """
+
+    def __init__(self, app, *args, **kwargs):  # pylint: disable=unused-argument
+        """
+        Constructor.
+
+        :param Frame app: reference to main tkinter application
+        :param args: optional args to pass to parent class (not currently used)
+        :param kwargs: optional kwargs to pass to parent class (not currently used)
+        """
+
+        self.__app = app  # Reference to main application class
+        self.logger = getLogger(__name__)
+        self.__master = self.__app.appmaster  # Reference to root class (Tk)
+
+        super().__init__(app, DLGTEXTRACT)
+        self._infile_path = None
+        self._infilepath = StringVar()
+        self._identities = StringVar()
+        self._starttime = StringVar()
+        self._endtime = StringVar()
+        self._output = StringVar()
+        self._protocols = {prot: IntVar() for prot in PROTOCOLS}
+        self._stopevent = Event()
+
+        self._body()
+        self._do_layout()
+        self._reset()
+        self._finalise()
+
+    def _body(self):
+        """
+        Set up frame and widgets.
+        """
+
+        self._frm_body = Frame(self)
+        self._lbl_infile = Label(self._frm_body, text=LBLRINEXINPUTFILE)
+        self._ent_infilepath = Entry(
+            self._frm_body,
+            textvariable=self._infilepath,
+            state=READONLY,
+            relief="sunken",
+            width=50,
+        )
+        self._btn_load = Button(
+            self._frm_body,
+            width=45,
+            height=35,
+            image=self.img_load,
+            command=self._on_load,
+            cursor=CLICK_CURSOR,
+        )
+        self._btn_extract = Button(
+            self._frm_body,
+            width=45,
+            height=35,
+            image=self.img_conn,
+            command=self._on_extract,
+            cursor=CLICK_CURSOR,
+        )
+        self._btn_cancel = Button(
+            self._frm_body,
+            width=45,
+            height=35,
+            image=self.img_cancel,
+            command=self._stopevent.set,
+            cursor=CLICK_CURSOR,
+        )
+        self._lbl_identities = Label(self._frm_body, text=LBLEXTRACTIDENTITIES)
+        self._ent_identities = Entry(
+            self._frm_body,
+            textvariable=self._identities,
+            state=NORMAL,
+            relief="sunken",
+        )
+        self._lbl_protocols = Label(self._frm_body, text=LBLEXTRACTPROTOCOLS)
+        self._chk_protocols = [
+            Checkbutton(self._frm_body, text=prot, variable=var, state=NORMAL)
+            for prot, var in self._protocols.items()
+        ]
+        self._lbl_starttime = Label(self._frm_body, text=LBLEXTRACTSTART)
+        self._ent_starttime = Entry(
+            self._frm_body,
+            width=10,
+            textvariable=self._starttime,
+            state=NORMAL,
+            relief="sunken",
+        )
+        self._lbl_endtime = Label(self._frm_body, text=LBLEXTRACTEND)
+        self._ent_endtime = Entry(
+            self._frm_body,
+            width=10,
+            textvariable=self._endtime,
+            state=NORMAL,
+            relief="sunken",
+        )
+        self._pgb_elapsed = Progressbar(
+            self._frm_body,
+            orient="horizontal",
+            mode="determinate",
+            length=100,
+        )
+        self._lbl_output = Label(self._frm_body, textvariable=self._output, anchor=W)
+
+    def _do_layout(self):
+        """
+        Position widgets in frame.
+        """
+
+        self._frm_body.grid(column=0, row=0, sticky=NSEW)
+        self._lbl_infile.grid(column=0, row=0, columnspan=5, padx=3, sticky=W)
+        self._ent_infilepath.grid(column=0, row=1, columnspan=5, padx=3, sticky=EW)
+        self._btn_load.grid(column=0, row=2, padx=3, sticky=W)
+        self._btn_extract.grid(column=3, row=2, padx=3, sticky=E)
+        self._btn_cancel.grid(column=4, row=2, padx=3, sticky=E)
+        ttk.Separator(self._frm_body).grid(
+            column=0, row=3, columnspan=5, padx=3, sticky=EW
+        )
+        self._lbl_identities.grid(column=0, row=4, columnspan=5, padx=3, sticky=W)
+        self._ent_identities.grid(column=0, row=5, columnspan=5, padx=3, sticky=EW)
+        self._lbl_protocols.grid(column=0, row=6, columnspan=5, padx=3, sticky=W)
+        for i, chk in enumerate(self._chk_protocols):
+            chk.grid(column=i, row=7, padx=3, sticky=W)
+        self._lbl_starttime.grid(column=0, row=8, padx=3, sticky=W)
+        self._ent_starttime.grid(column=1, row=8, padx=3, sticky=W)
+        self._lbl_endtime.grid(column=2, row=8, padx=3, sticky=W)
+        self._ent_endtime.grid(column=3, row=8, padx=3, sticky=W)
+        self._pgb_elapsed.grid(column=0, row=9, columnspan=5, padx=3, sticky=EW)
+        self._lbl_output.grid(column=0, row=10, columnspan=5, padx=3, sticky=EW)
+
+        for col in range(5):  # make columns equal width
+            self._frm_body.grid_columnconfigure(col, weight=1, uniform="col")
+
+    def _reset(self):
+        """
+        Reset dialog widgets.
+        """
+
+        for var in self._protocols.values():
+            var.set(1)
+        self._output.set(LBLEXTRACTOUTPUT.format(path=""))
+
+    def _on_load(self):
+        """
+        Load input data log.
+        """
+
+        infile = self.__app.file_handler.open_datalog(self)
+        if infile is not None:  # not cancelled
+            self._infile_path = infile
+            self._infilepath.set(shorten_path(infile))
+            validate(self._ent_infilepath, valmode=VALNONBLANK)
+
+    def _validtime(self, val: str) -> bool:
+        """
+        Validate optional time of day.
+
+        :param str val: time of day in format "HH:MM[:SS]", or "" for none
+        :return: Valid/Invalid
+        :rtype: bool
+        """
+
+        if val.strip() == "":
+            return True
+        try:
+            parse_tod(val)
+        except ValueError:
+            return False
+        return True
+
+    def _on_extract(self):
+        """
+        Validate settings and start extraction thread.
+        """
+
+        try:
+            valid = True
+            valid = valid & validate(self._ent_infilepath, valmode=VALNONBLANK)
+            for ent in (self._ent_starttime, self._ent_endtime):
+                valid = valid & validate(ent, valmode=VALCUSTOM, func=self._validtime)
+            protocols = tuple(
+                prot for prot, var in self._protocols.items() if var.get()
+            )
+            if not valid or not protocols:
+                self.status_label = ("Invalid Parameters", ERRCOL)
+                return
+
+            start, end = (
+                parse_tod(val) if val.strip() != "" else None
+                for val in (self._starttime.get(), self._endtime.get())
+            )
+            outfile = self._infile_path.with_name(
+                f"{self._infile_path.stem}{OUTSUFFIX}{self._infile_path.suffix}"
+            )
+            params = {
+                "identities": tuple(
+                    i.strip() for i in self._identities.get().split(",") if i.strip()
+                ),
+                "protocols": () if len(protocols) == len(PROTOCOLS) else protocols,
+                "start": start,
+                "end": end,
+                "stopevent": self._stopevent,
+                "progcallback": self._prog_callback_threaded,
+            }
+            self._stopevent.clear()
+            self.status_label = (f"Extracting from {self._infile_path.name}", INFOCOL)
+            Thread(
+                target=self._process_input,
+                args=(self._infile_path, outfile, params),
+                daemon=True,
+            ).start()
+        except TclError:
+            self.status_label = ("Extraction Failed", ERRCOL)
+
+    def _process_input(self, infile: Path, outfile: Path, params: dict):
+        """
+        THREADED
+
+        :param Path infile: input file path
+        :param Path outfile: output file path
+        :param dict params: extract_log() keyword arguments
+        """
+
+        try:
+            summary = extract_file(str(infile), str(outfile), **params)
+        except (OSError, ValueError) as err:
+            self.logger.error(f"Error extracting from {infile} - {err}")
+            self.status_label = (f"Error extracting from {infile.name}", ERRCOL)
+            return
+        if summary["cancelled"]:
+            self.status_label = ("Extraction cancelled", ERRCOL)
+            return
+        self._output.set(LBLEXTRACTOUTPUT.format(path=outfile.name))
+        self.status_label = (
+            f"{summary['extracted']:,} of {summary['frames']:,} messages extracted",
+            OKCOL if summary["extracted"] else ERRCOL,
+        )
+
+    def _prog_callback_threaded(self, progress: int):
+        """
+        Invoke progress callback function from thread.
+
+        :param int progress: % complete
+        """
+
+        self.after(0, self._prog_callback, progress)
+
+    def _prog_callback(self, progress: int):
+        """
+        Progress callback function.
+
+        :param int progress: % complete
+        """
+
+        self._pgb_elapsed["value"] = progress
+        self._pgb_elapsed.update()
@@ -0,0 +1,379 @@
+"""
+log_framer.py
+
+Header-only framing of raw binary GNSS data logs.
+
+LogFramer splits a binary stream containing UBX, NMEA, SBF, Unicore
+binary and RTCM3 messages into raw frames using only the protocol
+headers (sync bytes and length fields), reading the stream in large
+blocks and without decoding payloads, so that multi-GB logs can be
+processed at close to disk speed. Each frame's
+byte offset is reported, so the output can be used as a seekable index.
+
+While the stream is in sync, a binary frame with a known message identity
+is accepted on its header alone if it is immediately followed by another
+valid frame header or the end of the stream. Otherwise, and for every
+candidate found after resynchronising, the frame is fully validated - UBX,
+SBF, Unicore and RTCM3 checksums and NMEA sentence format (printable ASCII
+terminated by `*hh<CR><LF>`) - so that false sync sequences in corrupt or
+unknown data are skipped rather than swallowing real frames.
+
+identify() and receiver_time() extract the message identity and
+(where cheaply available) receiver time of day from a frame's header
+or first few payload bytes.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import re
+import struct
+import zlib
+from binascii import crc_hqx
+from itertools import accumulate
+
+from pyrtcm import RTCM_MSGIDS
+from pysbf2 import SBF_MSGIDS
+from pyubx2 import UBX_MSGIDS
+from pyunigps import UNI_MSGIDS
+
+UBX = "UBX"
+NMEA = "NMEA"
+SBF = "SBF"
+UNI = "UNI"
+RTCM = "RTCM"
+PROTOCOLS = (UBX, NMEA, SBF, UNI, RTCM)
+BUFSIZE = 4194304  # stream read block size in bytes
+MAXNMEA = 1024  # maximum NMEA sentence length
+GPSLEAPS = 18  # GPS - UTC leap seconds
+SECSINDAY = 86400
+DAYMS = SECSINDAY * 1000
+WEEKMS = 7 * DAYMS
+BDSOFFSET = 14000  # GPS - BeiDou time in ms
+GLOOFFSET = 10800000 - GPSLEAPS * 1000  # GLONASS time (UTC + 3h) - GPS time in ms
+NEEDMORE = -1
+INVALID = 0
+NMEAFRAME = re.compile(rb"\$[A-Z][\x20-\x23\x25-\x7e]*\*[0-9A-Fa-f]{2}\r?\n")
+RTCMTYPES = (range(1001, 1301), range(4001, 4096))  # standard, proprietary
+
+
+def _crc24q_table() -> tuple:
+    """
+    Generate byte-wise lookup table for RTCM3 CRC24Q (polynomial 0x1864CFB).
+
+    :return: lookup table
+    :rtype: tuple
+    """
+
+    table = []
+    for i in range(256):
+        crc = i << 16
+        for _ in range(8):
+            crc = (crc << 1) ^ 0x1864CFB if crc & 0x800000 else crc << 1
+        table.append(crc & 0xFFFFFF)
+    return tuple(table)
+
+
+CRC24Q = _crc24q_table()
+SYNC = re.compile(rb"\xb5\x62|\$[A-Z@]|\xd3[\x00-\x03]|\xaa\x44\xb5")
+NMEATIME = {"GGA": 1, "RMC": 1, "GNS": 1, "ZDA": 1, "GST": 1, "GLL": 5}
+MSMGPSTIME = tuple(  # MSM with GPS-aligned epoch time (GPS, Galileo, QZSS)
+    msg for start in (1071, 1091, 1111) for msg in range(start, start + 7)
+)
+
+
+def frame_length(buf: bytes, pos: int, eof: bool = False) -> tuple:
+    """
+    Get protocol and length of frame starting at buffer position,
+    using header only.
+
+    :param bytes buf: buffer
+    :param int pos: frame start position in buffer
+    :param bool eof: True if no more data follows buffer
+    :return: tuple of (protocol, length), where length is NEEDMORE if \
+        buffer is too short to determine, or INVALID if not a valid frame
+    :rtype: tuple
+    """
+    # pylint: disable=too-many-return-statements, too-many-branches
+
+    avail = len(buf) - pos
+    more = (None, INVALID) if eof else (None, NEEDMORE)
+    if avail < 3:
+        return more
+    byte0 = buf[pos]
+    if byte0 == 0xB5 and buf[pos + 1] == 0x62:
+        if avail < 6:
+            return more
+        return UBX, 8 + int.from_bytes(buf[pos + 4 : pos + 6], "little")
+    if byte0 == 0xD3 and not buf[pos + 1] & 0xFC:
+        if avail < 5:
+            return more
+        msgtype = int.from_bytes(buf[pos + 3 : pos + 5], "big") >> 4
+        if not any(msgtype in rng for rng in RTCMTYPES):
+            return None, INVALID
+        return RTCM, 6 + ((buf[pos + 1] & 0x03) << 8 | buf[pos + 2])
+    if byte0 == 0x24 and buf[pos + 1] == 0x40:  # "$@"
+        if avail < 8:
+            return more
+        length = int.from_bytes(buf[pos + 6 : pos + 8], "little")
+        if length < 8 or length % 4:
+            return None, INVALID
+        return SBF, length
+    if byte0 == 0x24 and 0x41 <= buf[pos + 1] <= 0x5A:  # "$A-Z"
+        end = buf.find(b"\n", pos, pos + MAXNMEA)
+        if end == -1:
+            return more if avail < MAXNMEA else (None, INVALID)
+        return NMEA, end + 1 - pos
+    if byte0 == 0xAA and buf[pos + 1 : pos + 3] == b"\x44\xb5":
+        if avail < 8:
+            return more
+        return UNI, 28 + int.from_bytes(buf[pos + 6 : pos + 8], "little")
+    return None, INVALID
+
+
+def frame_known(buf: bytes, pos: int, protocol: str) -> bool:
+    """
+    Check if binary frame header carries a known message identity. Used
+    as a plausibility check on frames accepted without checksum validation,
+    as false sync sequences in corrupt data rarely have a known identity.
+
+    :param bytes buf: buffer
+    :param int pos: frame start position in buffer
+    :param str protocol: protocol from frame_length()
+    :return: True if known
+    :rtype: bool
+    """
+
+    if protocol == UBX:
+        return buf[pos + 2 : pos + 4] in UBX_MSGIDS
+    if protocol == RTCM:
+        return str(int.from_bytes(buf[pos + 3 : pos + 5], "big") >> 4) in RTCM_MSGIDS
+    if protocol == SBF:
+        return int.from_bytes(buf[pos + 4 : pos + 6], "little") & 0x1FFF in SBF_MSGIDS
+    if protocol == UNI:
+        return int.from_bytes(buf[pos + 4 : pos + 6], "little") in UNI_MSGIDS
+    return False
+
+
+def frame_valid(raw: bytes, protocol: str) -> bool:
+    """
+    Validate complete candidate frame.
+
+    :param bytes raw: raw frame
+    :param str protocol: protocol from frame_length()
+    :return: True if valid
+    :rtype: bool
+    """
+
+    if protocol == UBX:  # 8-bit Fletcher checksum
+        data = raw[2:-2]
+        return raw[-2] == sum(data) & 0xFF and raw[-1] == sum(accumulate(data)) & 0xFF
+    if protocol == NMEA:
+        return NMEAFRAME.fullmatch(raw) is not None
+    if protocol == SBF:  # CRC-CCITT
+        return crc_hqx(raw[4:], 0) == int.from_bytes(raw[2:4], "little")
+    if protocol == UNI:  # CRC32 without initial and final inversion
+        crc = zlib.crc32(raw[:-4], 0xFFFFFFFF) ^ 0xFFFFFFFF
+        return crc == int.from_bytes(raw[-4:], "little")
+    if protocol == RTCM:  # CRC24Q, table-driven (~20x faster than bitwise)
+        crc, table = 0, CRC24Q
+        for byte in raw[:-3]:
+            crc = ((crc << 8) & 0xFFFFFF) ^ table[(crc >> 16) ^ byte]
+        return crc == int.from_bytes(raw[-3:], "big")
+    return False
+
+
+class LogFramer:
+    """
+    Header-only framer for raw binary GNSS data logs. Iterating yields
+    (byte offset, protocol, raw frame) tuples. Bytes which do not form part
+    of a recognised, valid frame are skipped and counted in `unknown`.
+    Binary frame checksums are only verified where the frame is in doubt,
+    i.e. after resynchronising, if its identity is unknown or if it is not
+    followed by a valid frame header.
+    """
+
+    def __init__(self, stream: object, bufsize: int = BUFSIZE):
+        """
+        Constructor.
+
+        :param object stream: binary input stream
+        :param int bufsize: stream read block size in bytes
+        """
+
+        self._stream = stream
+        self._bufsize = bufsize
+        self.unknown = 0  # bytes skipped
+
+    def __iter__(self):
+        """
+        Frame generator.
+
+        :return: generator of (offset, protocol, raw)
+        :rtype: generator
+        """
+
+        buf = b""
+        base = 0  # stream offset of buf[0]
+        pos = 0
+        eof = False
+        synced = True  # previous frame ended where this one starts
+        ahead = (-1, None, INVALID)  # (stream offset, protocol, length) of next frame
+        while pos < len(buf) or not eof:
+            if ahead[0] == base + pos:
+                _, protocol, length = ahead
+            else:
+                protocol, length = frame_length(buf, pos, eof)
+            end = pos + length
+            # known binary frame, end confirmed by next header or end of stream
+            confirmed = False
+            if (
+                synced
+                and 0 < length
+                and end <= len(buf)
+                and frame_known(buf, pos, protocol)
+            ):
+                if end == len(buf):
+                    confirmed = eof
+                    length = length if eof else NEEDMORE
+                else:
+                    nxtprot, nxtlen = frame_length(buf, end, eof)
+                    confirmed = nxtlen > 0
+                    if confirmed:
+                        ahead = (base + end, nxtprot, nxtlen)
+                    length = NEEDMORE if nxtlen == NEEDMORE else length
+            if length == NEEDMORE or (length > 0 and end > len(buf)):
+                if not eof:
+                    data = self._stream.read(max(self._bufsize, length))
+                    eof = data == b""
+                    buf, base, pos = buf[pos:] + data, base + pos, 0
+                    continue
+                length = INVALID  # truncated or false sync at end of stream
+            raw = buf[pos:end] if length > 0 else b""
+            if length == INVALID or not (confirmed or frame_valid(raw, protocol)):
+                # resynchronise on next sync sequence
+                match = SYNC.search(buf, pos + 1)
+                if match:
+                    nxt = match.start()
+                else:  # retain possible partial sync at end of buffer
+                    nxt = len(buf) if eof else max(pos + 1, len(buf) - 2)
+                self.unknown += nxt - pos
+                pos = nxt
+                synced = False
+                continue
+            yield base + pos, protocol, raw
+            pos = end
+            synced = True
+
+
+def identify(raw: bytes, protocol: str) -> str:
+    """
+    Get message identity from raw frame header e.g. "NAV-PVT", "GNGGA",
+    "1077", "PVTGeodetic", "OBSVM".
+
+    :param bytes raw: raw frame
+    :param str protocol: protocol
+    :return: identity
+    :rtype: str
+    """
+
+    if protocol == UBX:
+        return UBX_MSGIDS.get(raw[2:4], f"UBX-{raw[2]:02X}-{raw[3]:02X}")
+    if protocol == NMEA:
+        fields = raw[1:].split(b",", 2)
+        identity = fields[0].split(b"*")[0].decode("ascii", "replace")
+        if identity == "PUBX" and len(fields) > 1:
+            identity += fields[1].decode("ascii", "replace")
+        return identity
+    if protocol == RTCM:
+        return str(int.from_bytes(raw[3:5], "big") >> 4)
+    if protocol == SBF:
+        msgid = int.from_bytes(raw[4:6], "little") & 0x1FFF
+        return SBF_MSGIDS.get(msgid, (f"SBF-{msgid}",))[0]
+    if protocol == UNI:
+        msgid = int.from_bytes(raw[4:6], "little")
+        return UNI_MSGIDS.get(msgid, f"UNI-{msgid}")
+    return protocol
+
+
+def _gpstow2tod(tow: float) -> float:
+    """
+    Convert GPS time of week in seconds to UTC time of day in seconds.
+
+    :param float tow: GPS time of week
+    :return: UTC time of day
+    :rtype: float
+    """
+
+    return (tow - GPSLEAPS) % SECSINDAY
+
+
+def receiver_time(raw: bytes, protocol: str, identity: str) -> float:
+    """
+    Get receiver UTC time of day from raw frame, where available without
+    decoding the payload (UBX NAV-* iTOW and RXM-RAWX rcvTow, NMEA time
+    field, SBF TOW, Unicore header ms, RTCM3 GPS/GAL/QZS MSM epoch time).
+
+    :param bytes raw: raw frame
+    :param str protocol: protocol
+    :param str identity: identity from identify()
+    :return: UTC time of day in seconds, or None if not available
+    :rtype: float
+    """
+    # pylint: disable=too-many-return-statements
+
+    try:
+        if protocol == UBX:
+            if raw[2] == 0x01 and len(raw) >= 12:  # NAV-*
+                return _gpstow2tod(int.from_bytes(raw[6:10], "little") / 1000)
+            if identity == "RXM-RAWX" and len(raw) >= 16:
+                return _gpstow2tod(struct.unpack("<d", raw[6:14])[0])
+        elif protocol == NMEA:
+            fld = NMEATIME.get(identity[2:], None)
+            if fld is not None:
+                hms = raw.split(b",")[fld]
+                return int(hms[0:2]) * 3600 + int(hms[2:4]) * 60 + float(hms[4:])
+        elif protocol == SBF:
+            tow = int.from_bytes(raw[8:12], "little")
+            if tow != 0xFFFFFFFF:
+                return _gpstow2tod(tow / 1000)
+        elif protocol == UNI:
+            return _gpstow2tod(int.from_bytes(raw[12:16], "little") / 1000)
+        elif protocol == RTCM and int(identity) in MSMGPSTIME:
+            epoch = (int.from_bytes(raw[3:10], "big") >> 2) & 0x3FFFFFFF
+            return _gpstow2tod(epoch / 1000)
+    except (IndexError, ValueError, struct.error):
+        pass
+    return None
+
+
+class ReceiverClock:
+    """
+    Receiver clock which converts time of day to continuous elapsed seconds
+    from start of first day, allowing for midnight rollover.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        self._last = None
+        self._days = 0
+
+    def update(self, tod: float) -> float:
+        """
+        Update clock with new receiver time of day.
+
+        :param float tod: UTC time of day in seconds
+        :return: seconds since start of first day
+        :rtype: float
+        """
+
+        if self._last is not None and tod < self._last - SECSINDAY / 2:
+            self._days += 1
+        self._last = tod
+        return tod + self._days * SECSINDAY
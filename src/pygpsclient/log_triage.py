@@ -0,0 +1,209 @@
+"""
+log_triage.py
+
+Fast triage CLI for raw binary GNSS data logs.
+
+Scans a log using the header-only LogFramer (UBX class/id, NMEA
+talker/msgID, RTCM3 message type, SBF block id, Unicore message id)
+without decoding payloads, and reports for each message identity the
+count, byte share, average rate and maximum gap in receiver time, e.g.::
+
+    pygpsclient-triage pygpsdata-20261018091500.log --index
+
+Optionally writes a seekable CSV index sidecar (`<log>.idx`) recording the
+byte offset, length, protocol, identity and receiver time of every frame,
+so that individual messages can subsequently be located without rescanning.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import json
+import sys
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from time import perf_counter
+
+from pygpsclient._version import __version__ as VERSION
+from pygpsclient.log_framer import LogFramer, ReceiverClock, identify, receiver_time
+
+INDEXEXT = ".idx"
+INDEXHDR = "offset,length,protocol,identity,time\n"
+WRITEBUF = 4194304
+
+
+def scan_log(stream: object, index: object = None) -> dict:
+    """
+    Scan raw binary log and summarise message identities.
+
+    :param object stream: binary input stream
+    :param object index: text output stream for CSV index (None = no index)
+    :return: summary dict of {"bytes", "unknown", "frames", "start", "end",
+        "identities": {identity: {"protocol", "count", "bytes", "share",
+        "first", "last", "rate", "maxgap"}}}
+    :rtype: dict
+    """
+    # pylint: disable=too-many-locals
+
+    framer = LogFramer(stream)
+    clocks = {}  # per identity, as sources may not share the same timebase
+    stats = {}
+    frames = total = 0
+    if index is not None:
+        index.write(INDEXHDR)
+    for offset, protocol, raw in framer:
+        identity = identify(raw, protocol)
+        tod = receiver_time(raw, protocol, identity)
+        length = len(raw)
+        frames += 1
+        total += length
+        stat = stats.get(identity, None)
+        if stat is None:
+            stat = stats[identity] = {
+                "protocol": protocol,
+                "count": 0,
+                "bytes": 0,
+                "first": None,
+                "last": None,
+                "maxgap": 0.0,
+            }
+            clocks[identity] = ReceiverClock()
+        stat["count"] += 1
+        stat["bytes"] += length
+        if tod is not None:
+            tim = clocks[identity].update(tod)
+            if stat["first"] is None:
+                stat["first"] = tim
+            else:
+                stat["maxgap"] = max(stat["maxgap"], tim - stat["last"])
+            stat["last"] = tim
+        if index is not None:
+            index.write(
+                f"{offset},{length},{protocol},{identity},"
+                f"{'' if tod is None else round(tod, 3)}\n"
+            )
+
+    total += framer.unknown
+    times = [s["first"] for s in stats.values() if s["first"] is not None]
+    for stat in stats.values():
+        stat["share"] = round(stat["bytes"] * 100 / total, 2) if total else 0.0
+        span = None if stat["first"] is None else stat["last"] - stat["first"]
+        stat["rate"] = (
+            round((stat["count"] - 1) / span, 3) if span else None
+        )  # average rate in Hz
+        stat["maxgap"] = round(stat["maxgap"], 3) if stat["first"] is not None else None
+    return {
+        "bytes": total,
+        "unknown": framer.unknown,
+        "frames": frames,
+        "start": min(times) if times else None,
+        "end": (
+            max(s["last"] for s in stats.values() if s["last"] is not None)
+            if times
+            else None
+        ),
+        "identities": dict(
+            sorted(stats.items(), key=lambda item: item[1]["bytes"], reverse=True)
+        ),
+    }
+
+
+def triage_log(infile: str, index: bool = False) -> dict:
+    """
+    Scan raw binary log file, optionally writing CSV index to `<infile>.idx`.
+
+    :param str infile: input log path
+    :param bool index: write seekable index sidecar
+    :return: summary dict from scan_log()
+    :rtype: dict
+    :raises: OSError
+    """
+
+    with open(infile, "rb") as stream:
+        if not index:
+            return scan_log(stream)
+        with open(
+            infile + INDEXEXT, "w", encoding="utf-8", newline="", buffering=WRITEBUF
+        ) as idx:
+            return scan_log(stream, idx)
+
+
+def format_summary(summary: dict) -> str:
+    """
+    Format scan summary as text table.
+
+    :param dict summary: summary dict from scan_log()
+    :return: formatted table
+    :rtype: str
+    """
+
+    def fmt(val, width=9):
+        return f"{'-':>{width}}" if val is None else f"{val:>{width}.3f}"
+
+    lines = [
+        f"{'Identity':<20} {'Protocol':<8} {'Count':>10} {'Bytes':>12} "
+        f"{'Share%':>7} {'Rate Hz':>9} {'MaxGap s':>9}"
+    ]
+    for identity, stat in summary["identities"].items():
+        lines.append(
+            f"{identity:<20} {stat['protocol']:<8} {stat['count']:>10} "
+            f"{stat['bytes']:>12} {stat['share']:>7.2f} "
+            f"{fmt(stat['rate'])} {fmt(stat['maxgap'])}"
+        )
+    span = (
+        None
+        if summary["start"] is None
+        else round(summary["end"] - summary["start"], 3)
+    )
+    lines.append(
+        f"{summary['frames']} frames, {summary['bytes']} bytes "
+        f"({summary['unknown']} unknown), receiver time span {fmt(span, 0)} s"
+    )
+    return "\n".join(lines)
+
+
+def main():
+    """
+    CLI entry point.
+    """
+
+    ap = ArgumentParser(
+        formatter_class=ArgumentDefaultsHelpFormatter,
+        description="Summarise message identities, rates and gaps in binary GNSS "
+        "data logs without full parsing",
+    )
+    ap.add_argument("-V", "--version", action="version", version="%(prog)s " + VERSION)
+    ap.add_argument("inputs", nargs="+", help="Input log files")
+    ap.add_argument(
+        "--index",
+        help=f"Write seekable CSV index to <input>{INDEXEXT}",
+        action="store_true",
+    )
+    ap.add_argument(
+        "--json",
+        help="Output summary as JSON",
+        action="store_true",
+    )
+    kwargs = vars(ap.parse_args())
+
+    summaries = {}
+    for infile in kwargs["inputs"]:
+        start = perf_counter()
+        try:
+            summary = triage_log(infile, kwargs["index"])
+        except OSError as err:
+            print(f"Error: {err}", file=sys.stderr)
+            sys.exit(1)
+        summary["elapsed"] = round(perf_counter() - start, 3)
+        summaries[infile] = summary
+        if not kwargs["json"]:
+            print(f"{infile} scanned in {summary['elapsed']} s")
+            print(format_summary(summary))
+    if kwargs["json"]:
+        print(json.dumps(summaries, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+map_fetcher.py
+
+Asynchronous web map fetcher and LRU disk cache.
+
+MapFetcher retrieves web map images (e.g. from the MapQuest static map API)
+in a background worker thread, so that map requests never block the tkinter
+event loop. Requests are coalesced - if a new request arrives while a
+previous one is still waiting to be processed, the earlier request is dropped.
+
+MapCache holds retrieved map images on disk, keyed on the parameters which
+determine the image (map type, bounds, zoom, size, locations and track), with
+a configurable maximum size (least recently used images are evicted first)
+and expiry time.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import logging
+from collections import OrderedDict
+from hashlib import sha256
+from http.client import responses
+from os import makedirs, path, remove, scandir
+from threading import Condition, Lock, Thread
+from time import time
+
+from requests import ConnectionError as ConnError
+from requests import ConnectTimeout, RequestException, get
+
+from pygpsclient.mapquest_handler import MAPQTIMEOUT
+from pygpsclient.strings import NOCONN, NOWEBMAPCONN, NOWEBMAPHTTP
+
+CACHEEXT = ".img"
+MAPCACHESIZE = 50  # MB
+MAPCACHEEXPIRY = 168  # hours
+
+
+class MapCache:
+    """
+    LRU disk cache for map images.
+    """
+
+    def __init__(
+        self,
+        cachedir: str,
+        maxsize: int = MAPCACHESIZE * 1000000,
+        expiry: int = MAPCACHEEXPIRY * 3600,
+    ):
+        """
+        Constructor.
+
+        :param str cachedir: cache directory (will be created if necessary)
+        :param int maxsize: maximum total size of cached images in bytes \
+            (0 = caching disabled)
+        :param int expiry: maximum age of cached image in seconds
+        """
+
+        self.logger = logging.getLogger(__name__)
+        self._cachedir = cachedir
+        self.maxsize = maxsize
+        self.expiry = expiry
+        self._lock = Lock()
+        self._index = OrderedDict()  # key: size, least recently used first
+        self._size = 0
+        self._load_index()
+
+    def _load_index(self):
+        """
+        Index any existing cached images, least recently modified first.
+        """
+
+        if not path.isdir(self._cachedir):
+            return
+        entries = []
+        with scandir(self._cachedir) as files:
+            for fil in files:
+                if fil.is_file() and fil.name.endswith(CACHEEXT):
+                    stat = fil.stat()
+                    entries.append(
+                        (stat.st_mtime, fil.name[: -len(CACHEEXT)], stat.st_size)
+                    )
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+
+    def _path(self, key: str) -> str:
+        """
+        Get path of cached image.
+
+        :param str key: cache key
+        :return: file path
+        :rtype: str
+        """
+
+        return path.join(self._cachedir, key + CACHEEXT)
+
+    @staticmethod
+    def key(*params) -> str:
+        """
+        Create cache key from parameters which determine map image,
+        e.g. (maptype, bounds, zoom, width, height, locations, hacc).
+
+        :param params: map parameters
+        :return: cache key
+        :rtype: str
+        """
+
+        return sha256(repr(params).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> bytes:
+        """
+        Get cached image, if available and not expired.
+
+        :param str key: cache key
+        :return: image data or None
+        :rtype: bytes
+        """
+
+        with self._lock:
+            if key not in self._index:
+                return None
+            fpath = self._path(key)
+            try:
+                if time() - path.getmtime(fpath) > self.expiry:
+                    self._discard(key)
+                    return None
+                with open(fpath, "rb") as infile:
+                    data = infile.read()
+            except OSError:
+                self._index.pop(key, None)
+                return None
+            self._index.move_to_end(key)  # most recently used
+            return data
+
+    def put(self, key: str, data: bytes):
+        """
+        Add image to cache, evicting least recently used images
+        if maximum cache size is exceeded.
+
+        :param str key: cache key
+        :param bytes data: image data
+        """
+
+        if self.maxsize <= 0 or len(data) > self.maxsize:
+            return
+        with self._lock:
+            try:
+                makedirs(self._cachedir, exist_ok=True)
+                with open(self._path(key), "wb") as outfile:
+                    outfile.write(data)
+            except OSError as err:
+                self.logger.error(f"Unable to write map cache {err}")
+                return
+            self._size += len(data) - self._index.pop(key, 0)
+            self._index[key] = len(data)
+            while self._size > self.maxsize:
+                self._discard(next(iter(self._index)))
+
+    def _discard(self, key: str):
+        """
+        Remove image from cache.
+
+        :param str key: cache key
+        """
+
+        self._size -= self._index.pop(key, 0)
+        try:
+            remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Remove all images from cache.
+        """
+
+        with self._lock:
+            for key in list(self._index):
+                self._discard(key)
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Test if key is in cache.
+
+        :param str key: cache key
+        :return: True/False
+        :rtype: bool
+        """
+
+        return key in self._index
+
+    @property
+    def size(self) -> int:
+        """
+        Getter for total size of cached images.
+
+        :return: size in bytes
+        :rtype: int
+        """
+
+        return self._size
+
+
+class MapFetcher:
+    """
+    Asynchronous map fetcher with request coalescing.
+    """
+
+    def __init__(
+        self,
+        callback: object,
+        cache: MapCache = None,
+        timeout: int = MAPQTIMEOUT,
+    ):
+        """
+        Constructor.
+
+        :param object callback: function called (from the worker thread) \
+            when a result is available via result()
+        :param MapCache cache: optional disk cache
+        :param int timeout: HTTP request timeout in seconds
+        """
+
+        self.logger = logging.getLogger(__name__)
+        self._callback = callback
+        self._cache = cache
+        self._timeout = timeout
+        self._cond = Condition()
+        self._pending = None
+        self._result = None
+        self._stopped = False
+        self._thread = None
+
+    def request(self, key: str, url: str, context: object = None):
+        """
+        Request map image. Supersedes any request not yet being processed.
+
+        :param str key: cache key
+        :param str url: map URL
+        :param object context: arbitrary context returned with result
+        """
+
+        with self._cond:
+            if self._pending is not None:
+                self.logger.debug("Superseded map request dropped")
+            self._pending = (key, url, context)
+            self._stopped = False
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._worker, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def result(self) -> tuple:
+        """
+        Get (and clear) latest result.
+
+        :return: tuple of (key, context, data, error) or None
+        :rtype: tuple
+        """
+
+        with self._cond:
+            res = self._result
+            self._result = None
+            return res
+
+    def stop(self, wait: bool = True):
+        """
+        Stop worker thread.
+
+        :param bool wait: wait for any retrieval in progress to complete \
+            (if False, the worker exits once it completes)
+        """
+
+        with self._cond:
+            self._stopped = True
+            self._pending = None
+            self._cond.notify()
+        if self._thread is not None and wait:
+            self._thread.join()
+            self._thread = None
+
+    def _worker(self):
+        """
+        THREADED
+        Process most recent map request.
+        """
+
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                key, url, context = self._pending
+                self._pending = None
+
+            data, err = self.fetch(key, url)
+            with self._cond:
+                self._result = (key, context, data, err)
+            self._callback()
+
+    def fetch(self, key: str, url: str) -> tuple:
+        """
+        Retrieve map image from cache or URL.
+
+        :param str key: cache key
+        :param str url: map URL
+        :return: tuple of (image data or None, error message)
+        :rtype: tuple
+        """
+
+        if self._cache is not None:
+            data = self._cache.get(key)
+            if data is not None:
+                return data, ""
+
+        sc = NOCONN
+        try:
+            response = get(url, timeout=self._timeout)
+            sc = responses[response.status_code]  # get descriptive HTTP status
+            response.raise_for_status()  # raise Exception on HTTP error
+            if self._cache is not None:
+                self._cache.put(key, response.content)
+            return response.content, ""
+        except (ConnError, ConnectTimeout):
+            return None, NOWEBMAPCONN
+        except RequestException:
+            return None, NOWEBMAPHTTP.format(sc)
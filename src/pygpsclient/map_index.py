@@ -0,0 +1,146 @@
+"""
+map_index.py
+
+Spatial index over user-defined offline maps.
+
+Maps are registered in a uniform lat/lon grid, so that finding the maps
+which contain a given location or bounding box only requires testing the
+handful of maps registered in the relevant grid cell, rather than every
+map in the `usermaps_l` configuration setting. Where more than one map
+qualifies, the map with the highest resolution (pixels per degree) is
+selected, with ties resolved by order in `usermaps_l`.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+from copy import deepcopy
+from math import floor
+
+from PIL import Image
+
+from pygpsclient.globals import Area, Point
+from pygpsclient.helpers import area_in_bounds, normalise_area, point_in_bounds
+
+MINCELL = 0.001  # minimum grid cell size in degrees
+MAXCELLS = 64  # maps spanning more cells are held in an unindexed list
+
+
+def map_resolution(mappath: str, extents: Area) -> float:
+    """
+    Get resolution of map image in pixels per degree. Only the
+    image header is read.
+
+    :param str mappath: path to map image
+    :param Area extents: map extents
+    :return: resolution in pixels per degree, or 0 if image cannot be read
+    :rtype: float
+    """
+
+    try:
+        with Image.open(mappath) as img:
+            width, height = img.size
+    except (OSError, Image.DecompressionBombError):
+        return 0
+    latspan = extents.lat2 - extents.lat1
+    lonspan = extents.lon2 - extents.lon1
+    if latspan <= 0 or lonspan <= 0:
+        return 0
+    return min(width / lonspan, height / latspan)
+
+
+class MapIndex:
+    """
+    Spatial index over user-defined offline maps.
+    """
+
+    def __init__(self, usermaps: list):
+        """
+        Constructor.
+
+        :param list usermaps: list of [path, [lat1, lon1, lat2, lon2]]
+        :raises: ValueError, IndexError if usermaps entry is invalid
+        """
+
+        self.usermaps = deepcopy(usermaps)
+        self._maps = []  # list of (path, extents, resolution)
+        for fpath, extent in usermaps:
+            extents = normalise_area((extent[0], extent[1], extent[2], extent[3]))
+            self._maps.append((fpath, extents, map_resolution(fpath, extents)))
+
+        # cell size is median map span
+        spans = sorted(
+            max(ext.lat2 - ext.lat1, ext.lon2 - ext.lon1) for _, ext, _ in self._maps
+        )
+        self._cell = max(spans[len(spans) // 2], MINCELL) if spans else 1
+        self._grid = {}
+        self._large = []
+        for i, (_, ext, _) in enumerate(self._maps):
+            r1, c1 = self._cellof(ext.lat1, ext.lon1)
+            r2, c2 = self._cellof(ext.lat2, ext.lon2)
+            if (r2 - r1 + 1) * (c2 - c1 + 1) > MAXCELLS:
+                self._large.append(i)
+                continue
+            for row in range(r1, r2 + 1):
+                for col in range(c1, c2 + 1):
+                    self._grid.setdefault((row, col), []).append(i)
+
+    def _cellof(self, lat: float, lon: float) -> tuple:
+        """
+        Get grid cell containing coordinates.
+
+        :param float lat: latitude
+        :param float lon: longitude
+        :return: (row, col)
+        :rtype: tuple
+        """
+
+        return floor(lat / self._cell), floor(lon / self._cell)
+
+    def find(self, location: Point = None, bounds: Area = None) -> tuple:
+        """
+        Find highest resolution map whose extents contain either bounds
+        or location.
+
+        :param Point location: location
+        :param Area bounds: bounds
+        :return: tuple of (map path, map extents) or (None, None)
+        :rtype: tuple
+        """
+        # pylint: disable=arguments-out-of-order
+
+        candidates = set(self._large)
+        if location is not None:
+            candidates.update(
+                self._grid.get(self._cellof(location.lat, location.lon), ())
+            )
+        if bounds is not None:
+            candidates.update(
+                self._grid.get(self._cellof(bounds.lat1, bounds.lon1), ())
+            )
+
+        best = (None, None)
+        bestres = -1
+        for i in sorted(candidates):  # i.e. in usermaps order
+            fpath, extents, res = self._maps[i]
+            # check if bounds or location are within map extents
+            if (bounds is not None and area_in_bounds(extents, bounds)) or (
+                location is not None and point_in_bounds(extents, location)
+            ):
+                if res > bestres:
+                    best = (fpath, extents)
+                    bestres = res
+        return best
+
+    def __len__(self) -> int:
+        """
+        Get number of indexed maps.
+
+        :return: number of maps
+        :rtype: int
+        """
+
+        return len(self._maps)
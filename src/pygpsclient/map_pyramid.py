@@ -0,0 +1,381 @@
+"""
+map_pyramid.py
+
+Tiled multi-resolution image pyramid for offline maps.
+
+The first time a map image is opened, it is decoded once and saved to a
+disk cache as a pyramid of fixed-size tiles, each level half the resolution
+of the one below. The pyramid is built one strip of tiles at a time, so
+only the source image and a couple of strips per level are held in memory,
+and build() may be run in a background thread. Pyramids of map images
+which have since been edited or deleted are pruned from the cache.
+Subsequent redraws compose only those tiles which intersect the current
+view, at the lowest resolution level which still matches the display
+resolution, so the cost of panning and zooming is independent of the size
+of the original image and memory use is bounded by the number of decoded
+tiles held in memory.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import json
+import logging
+from collections import OrderedDict
+from hashlib import sha256
+from math import ceil, floor, log2
+from os import listdir, makedirs, path, stat, utime
+from shutil import rmtree
+from time import time
+
+from PIL import Image
+
+TILESIZE = 512  # tile width and height in pixels
+TILECACHE = 64  # maximum number of decoded tiles held in memory
+MAXPYRAMIDS = 20  # maximum number of pyramids retained in tile cache
+BUILDTIMEOUT = 3600  # age in seconds after which an incomplete pyramid is pruned
+METAFILE = "pyramid.json"
+
+
+def pyramid_key(mappath: str, tilesize: int = TILESIZE) -> str:
+    """
+    Get tile cache key of map image, which changes whenever the image
+    is edited.
+
+    :param str mappath: path to map image
+    :param int tilesize: tile width and height in pixels
+    :return: key
+    :rtype: str
+    :raises: FileNotFoundError, PermissionError
+    """
+
+    fstat = stat(mappath)
+    return sha256(
+        repr(
+            (path.abspath(mappath), fstat.st_mtime_ns, fstat.st_size, tilesize)
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def prune_pyramids(cachedir: str, maxpyramids: int = MAXPYRAMIDS, keep: str = None):
+    """
+    Remove pyramids from tile cache whose source map image has been edited
+    or deleted, incomplete pyramids which are no longer being built, and
+    least recently used pyramids in excess of maxpyramids.
+
+    :param str cachedir: root directory of tile cache
+    :param int maxpyramids: maximum number of pyramids to retain
+    :param str keep: key of pyramid to retain regardless
+    """
+
+    try:
+        keys = listdir(cachedir)
+    except OSError:
+        return
+    current = []
+    for key in keys:
+        tiledir = path.join(cachedir, key)
+        metapath = path.join(tiledir, METAFILE)
+        try:
+            if key == keep:
+                continue
+            try:
+                with open(metapath, "r", encoding="utf-8") as jfile:
+                    meta = json.load(jfile)
+            except FileNotFoundError:
+                if time() - stat(tiledir).st_mtime < BUILDTIMEOUT:
+                    continue  # may still be building
+                meta = None
+            if meta is not None:
+                try:
+                    valid = key == pyramid_key(meta["source"], meta["tilesize"])
+                except (OSError, KeyError):
+                    valid = False
+                if valid:
+                    current.append((stat(metapath).st_mtime, tiledir))
+                    continue
+            rmtree(tiledir, ignore_errors=True)
+        except (OSError, ValueError):
+            rmtree(tiledir, ignore_errors=True)
+    current.sort(reverse=True)  # most recently used first
+    for _, tiledir in current[max(0, maxpyramids - (keep is not None)) :]:
+        rmtree(tiledir, ignore_errors=True)
+
+
+class MapPyramid:
+    """
+    Tiled multi-resolution map image pyramid.
+    """
+
+    def __init__(
+        self,
+        mappath: str,
+        cachedir: str,
+        tilesize: int = TILESIZE,
+        maxtiles: int = TILECACHE,
+        build: bool = True,
+    ):
+        """
+        Constructor.
+
+        :param str mappath: path to map image
+        :param str cachedir: root directory of tile cache
+        :param int tilesize: tile width and height in pixels
+        :param int maxtiles: maximum number of decoded tiles held in memory
+        :param bool build: build pyramid now if not already cached (if False, \
+            call build() before rendering e.g. from a background thread)
+        :raises: FileNotFoundError, PermissionError, UnidentifiedImageError, \
+            Image.DecompressionBombError, OSError (if build is True)
+        """
+
+        self.logger = logging.getLogger(__name__)
+        self._mappath = mappath
+        self._cachedir = cachedir
+        self._key = pyramid_key(mappath, tilesize)
+        self._tiledir = path.join(cachedir, self._key)
+        self._tilesize = tilesize
+        self._maxtiles = maxtiles
+        self._tiles = OrderedDict()  # (level, tx, ty): Image, least recently used first
+        self._meta = self._load_meta()
+        if self._meta is None and build:
+            self.build()
+
+    def _load_meta(self) -> dict:
+        """
+        Load pyramid metadata, if pyramid has already been built.
+
+        :return: metadata dict or None
+        :rtype: dict
+        """
+
+        metapath = path.join(self._tiledir, METAFILE)
+        try:
+            with open(metapath, "r", encoding="utf-8") as jfile:
+                meta = json.load(jfile)
+            utime(metapath)  # mark as recently used
+            return meta
+        except (OSError, ValueError):
+            return None
+
+    def build(self):
+        """
+        Decode map image and save as tiled pyramid, if not already cached,
+        then prune stale pyramids from the tile cache.
+
+        The source image is decoded once in its native mode; tiles are then
+        converted and saved one strip at a time, and each strip is reduced
+        into the strips of the levels above, so no full-size converted or
+        reduced copy of the image is held in memory.
+
+        :raises: FileNotFoundError, PermissionError, UnidentifiedImageError, \
+            Image.DecompressionBombError, OSError
+        """
+
+        if self._meta is not None:
+            return
+        self.logger.debug(f"Building map tile pyramid for {self._mappath}")
+        tsz = self._tilesize
+        with Image.open(self._mappath) as src:
+            transparent = "A" in src.getbands() or "transparency" in src.info
+            mode = "RGBA" if transparent else "RGB"
+            sizes = [src.size]
+            while max(sizes[-1]) > tsz:  # as Image.reduce(2), rounding up
+                sizes.append(tuple((dim + 1) // 2 for dim in sizes[-1]))
+            for level in range(len(sizes)):
+                makedirs(path.join(self._tiledir, str(level)), exist_ok=True)
+            pending = [None] * len(sizes)  # even strip awaiting its pair, per level
+            for ty in range(ceil(src.height / tsz)):
+                strip = src.crop(
+                    (0, ty * tsz, src.width, min((ty + 1) * tsz, src.height))
+                ).convert(mode)
+                self._save_strip(strip, 0, ty, sizes, pending)
+
+        meta = {
+            "mode": mode,
+            "sizes": sizes,
+            "source": path.abspath(self._mappath),
+            "tilesize": tsz,
+        }
+        # metadata is written last and signifies a complete pyramid
+        with open(path.join(self._tiledir, METAFILE), "w", encoding="utf-8") as jfile:
+            json.dump(meta, jfile)
+        self._meta = meta
+        prune_pyramids(self._cachedir, keep=self._key)
+
+    def _save_strip(
+        self, strip: Image, level: int, ty: int, sizes: list, pending: list
+    ):  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        """
+        Save strip of tiles at pyramid level, then combine it with its
+        neighbouring strip and reduce into the level above.
+
+        :param Image strip: strip image, one tile high
+        :param int level: pyramid level (0 = full resolution)
+        :param int ty: tile row
+        :param list sizes: (width, height) of each level
+        :param list pending: even strip awaiting its pair, per level
+        """
+
+        tsz = self._tilesize
+        for tx in range(ceil(strip.width / tsz)):
+            # fast (lightly compressed) PNG encoding to minimise build time
+            strip.crop(
+                (tx * tsz, 0, min((tx + 1) * tsz, strip.width), strip.height)
+            ).save(self._tilepath(level, tx, ty), compress_level=1)
+        if level + 1 == len(sizes):
+            return
+        if ty % 2 == 0 and ty + 1 < ceil(sizes[level][1] / tsz):
+            pending[level] = strip
+            return
+        if ty % 2:
+            upper = pending[level]
+            pending[level] = None
+            pair = Image.new(strip.mode, (strip.width, upper.height + strip.height))
+            pair.paste(upper, (0, 0))
+            pair.paste(strip, (0, upper.height))
+            strip = pair
+        self._save_strip(strip.reduce(2), level + 1, ty // 2, sizes, pending)
+
+    def _tilepath(self, level: int, tx: int, ty: int) -> str:
+        """
+        Get path of tile.
+
+        :param int level: pyramid level (0 = full resolution)
+        :param int tx: tile column
+        :param int ty: tile row
+        :return: tile path
+        :rtype: str
+        """
+
+        return path.join(self._tiledir, str(level), f"{tx}_{ty}.png")
+
+    def _tile(self, level: int, tx: int, ty: int) -> Image:
+        """
+        Get decoded tile, from memory if available, otherwise from disk.
+
+        :param int level: pyramid level (0 = full resolution)
+        :param int tx: tile column
+        :param int ty: tile row
+        :return: tile image
+        :rtype: Image
+        """
+
+        key = (level, tx, ty)
+        tile = self._tiles.get(key, None)
+        if tile is None:
+            with Image.open(self._tilepath(level, tx, ty)) as img:
+                tile = img.convert(self.mode)
+            self._tiles[key] = tile
+            while len(self._tiles) > self._maxtiles:
+                self._tiles.popitem(last=False)
+        else:
+            self._tiles.move_to_end(key)
+        return tile
+
+    def render(self, box: tuple, size: tuple) -> Image:
+        """
+        Compose image of area of map at given display size.
+
+        Areas of the box outside the map image are left blank, as
+        for PIL Image.crop().
+
+        :param tuple box: area (x1, y1, x2, y2) in full resolution pixels
+        :param tuple size: display (width, height) in pixels
+        :return: rendered image
+        :rtype: Image
+        """
+
+        x1, y1, x2, y2 = box
+        width, height = max(1, int(size[0])), max(1, int(size[1]))
+        # select lowest resolution level which is not smaller than display
+        ratio = min((x2 - x1) / width, (y2 - y1) / height)
+        level = 0
+        if ratio >= 2:
+            level = min(int(log2(ratio)), self.levels - 1)
+        scale = 2**level
+        lx1, ly1, lx2, ly2 = x1 / scale, y1 / scale, x2 / scale, y2 / scale
+        ix1, iy1 = floor(lx1), floor(ly1)
+        ix2, iy2 = max(ceil(lx2), ix1 + 1), max(ceil(ly2), iy1 + 1)
+        lwidth, lheight = self._meta["sizes"][level]
+
+        region = Image.new(self.mode, (ix2 - ix1, iy2 - iy1))
+        tsz = self._tilesize
+        for ty in range(max(0, iy1 // tsz), min(ceil(lheight / tsz), ceil(iy2 / tsz))):
+            for tx in range(
+                max(0, ix1 // tsz), min(ceil(lwidth / tsz), ceil(ix2 / tsz))
+            ):
+                region.paste(
+                    self._tile(level, tx, ty), (tx * tsz - ix1, ty * tsz - iy1)
+                )
+        return region.resize(
+            (width, height), box=(lx1 - ix1, ly1 - iy1, lx2 - ix1, ly2 - iy1)
+        )
+
+    @property
+    def built(self) -> bool:
+        """
+        Getter for build status.
+
+        :return: True if pyramid has been built
+        :rtype: bool
+        """
+
+        return self._meta is not None
+
+    @property
+    def key(self) -> str:
+        """
+        Getter for tile cache key.
+
+        :return: key
+        :rtype: str
+        """
+
+        return self._key
+
+    @property
+    def width(self) -> int:
+        """
+        Getter for full resolution width.
+
+        :return: width in pixels
+        :rtype: int
+        """
+
+        return self._meta["sizes"][0][0]
+
+    @property
+    def height(self) -> int:
+        """
+        Getter for full resolution height.
+
+        :return: height in pixels
+        :rtype: int
+        """
+
+        return self._meta["sizes"][0][1]
+
+    @property
+    def levels(self) -> int:
+        """
+        Getter for number of pyramid levels.
+
+        :return: number of levels
+        :rtype: int
+        """
+
+        return len(self._meta["sizes"])
+
+    @property
+    def mode(self) -> str:
+        """
+        Getter for image mode.
+
+        :return: PIL image mode ("RGB" or "RGBA")
+        :rtype: str
+        """
+
+        return self._meta["mode"]
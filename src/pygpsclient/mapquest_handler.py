@@ -17,7 +17,10 @@ Created on 04 May 2023
 
 """
 
-from pygpsclient.globals import Area
+from math import cos, radians
+
+from pygpsclient.globals import TRK_TOLERANCE, Area
+from pygpsclient.helpers import simplify_track
 
 # MapQuest API URLS:
 MAPQURL = (
@@ -49,17 +52,32 @@ SAT = "sat"
 HYB = "hyb"
 
 
-def compress_track(track: tuple, precision: int = 6, limit: int = POINTLIMIT) -> str:
+def compress_track(
+    track: tuple, precision: int = 6, limit: int = POINTLIMIT, scale: float = 0
+) -> str:
     """
     Convert track to compressed Mapquest format.
 
+    If scale is provided, the track is first simplified to within
+    TRK_TOLERANCE pixels at that scale.
+
     :param tuple track: tuple of Points
     :param int precision: no decimal places precision (6)
     :param int limit: max no of points (500)
+    :param float scale: map scale in pixels per degree of longitude \
+        (0 = no simplification)
     :return: compressed track
     :rtype: str
     """
 
+    if scale > 0 and len(track) > 2:
+        # web mercator latitude scale increases by 1/cos(lat)
+        lats = [p.lat for p in track]
+        midlat = radians((min(lats) + max(lats)) / 2)
+        track = simplify_track(
+            track, TRK_TOLERANCE, scale, scale / max(cos(midlat), 1e-6)
+        )
+
     # if the number of trackpoints exceeds the MapQuest API limit,
     # increase step count until the number is within limits
     points = []
@@ -85,6 +103,7 @@ def format_mapquest_request(
     locations: list,
     bbox: Area = None,
     hacc: float = 0,
+    mapqurl: str = MAPQURL,
 ) -> str:
     """
     Formats URL for web map download.
@@ -97,12 +116,13 @@ def format_mapquest_request(
     :param list locations: list of Points
     :param Area bbox: bounding box (will override zoom)
     :param float hacc: horizontal accuracy
+    :param str mapqurl: base URL (can be overridden for testing)
     :return: formatted MapQuest URL
     :rtype: str
     """
     # pylint: disable=too-many-arguments, too-many-positional-arguments
 
-    url = MAPQURL.format(key=mqapikey, type=maptype, width=width, height=height)
+    url = mapqurl.format(key=mqapikey, type=maptype, width=width, height=height)
     radius = str(hacc / 1000)  # km
     zoom = min(20, zoom)
 
@@ -115,7 +135,12 @@ def format_mapquest_request(
 
     if isinstance(locations, list):  # at least one location
         if len(locations) > 1:  # multiple locations (track)
-            comp = compress_track(locations)
+            # simplify track to display resolution
+            if bbox is None:  # approx web mercator pixels per degree at zoom
+                scale = 256 * 2**zoom / 360
+            else:
+                scale = width / max(bbox.lon2 - bbox.lon1, 1e-9)
+            comp = compress_track(locations, scale=scale)
             url += LOCS.format(
                 lat1=locations[0].lat,
                 lon1=locations[0].lon,
@@ -17,6 +17,7 @@ from tkinter import Menu
 from pygpsclient.strings import DLGTSPARTN  # service discontinued by u-blox
 from pygpsclient.strings import (
     DLGTABOUT,
+    DLGTEXTRACT,
     DLGTGPX,
     DLGTIMPORTMAP,
     DLGTNMEA,
@@ -27,7 +28,9 @@ from pygpsclient.strings import (
     DLGTTTY,
     DLGTUBX,
     MENUABOUT,
+    MENUCAPSTART,
     MENUEXIT,
+    MENUEXTRACT,
     MENUFILE,
     MENUHELP,
     MENULOAD,
@@ -78,6 +81,14 @@ class MenuBar(Menu):
         self.file_menu.add_command(
             label=MENULOAD, underline=5, command=self.__app.load_config
         )
+        self.file_menu.add_command(
+            label=MENUCAPSTART, underline=6, command=self.__app.capture_toggle
+        )
+        self.file_menu.add_command(
+            label=MENUEXTRACT,
+            underline=0,
+            command=lambda: self.__app.start_dialog(DLGTEXTRACT),
+        )
         self.file_menu.add_command(
             label=MENUEXIT,
             underline=1,
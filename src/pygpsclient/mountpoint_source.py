@@ -0,0 +1,228 @@
+"""
+mountpoint_source.py
+
+Additional NTRIP caster mountpoint fed from a local receiver.
+
+Each source reads RTCM3 data from its own receiver connection, independent
+of the main PyGPSClient GNSS connection, and publishes the raw frames to its
+mountpoint's fan-out layer. Sources may be specified as:
+
+- "tcp://host:port" - TCP socket (e.g. a receiver's TCP server or ser2net).
+- "port@baud" - serial port e.g. "/dev/ttyACM1@38400" or "COM5@115200".
+- any other value - path to a binary RTCM3 log file, which is replayed
+  in a continuous loop, paced by the MSM epoch time of any constellation.
+
+The mountpoint's sourcetable position is taken from the base station's
+RTCM 1005/1006 antenna reference point, and its RTCM types entry from the
+message types and intervals observed.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import logging
+from select import select
+from socket import MSG_PEEK, create_connection, socket
+from threading import Event, Thread
+from time import monotonic
+
+from pyubx2 import ERR_IGNORE, RTCM3_PROTOCOL, UBXReader
+from serial import Serial, SerialException
+
+from pygpsclient.log_framer import BDSOFFSET, DAYMS, GLOOFFSET, WEEKMS
+from pygpsclient.ntrip_caster import Mountpoint
+from pygpsclient.rtcm3_handler import arp_position
+from pygpsclient.socket_fanout import FanOut
+
+SOURCETIMEOUT = 3  # seconds
+SOURCEIDLE = 60  # seconds without data before TCP source is reconnected
+RETRYDELAY = 5  # seconds between reconnection attempts
+MAXREPLAYDELAY = 1  # seconds
+TCPPREFIX = "tcp://"
+EPOCHOFFSETS = {  # MSM epoch time field: GPS - system time in ms
+    "DF004": 0,  # GPS
+    "DF248": 0,  # Galileo
+    "DF428": 0,  # QZSS
+    "DF546": 0,  # NavIC
+    "DF427": BDSOFFSET,  # BeiDou
+}
+
+
+def replay_epoch(parsed: object) -> int:
+    """
+    Get epoch time of RTCM3 observation message as GPS time of week.
+
+    :param RTCMMessage parsed: parsed RTCM3 message
+    :return: epoch in ms, or None if not an observation message with known epoch
+    :rtype: int
+    """
+
+    for attr, offset in EPOCHOFFSETS.items():
+        tow = getattr(parsed, attr, None)
+        if tow is not None:
+            return (tow + offset) % WEEKMS
+    dow = getattr(parsed, "DF416", 7)  # GLONASS day of week (7 = unknown)
+    tod = getattr(parsed, "DF034", None)  # GLONASS epoch time of day
+    if tod is None or dow == 7:
+        return None
+    return (dow * DAYMS + tod - GLOOFFSET) % WEEKMS
+
+
+def _socket_open(sock: socket) -> bool:
+    """
+    Check if socket is still open after a read returns no data, i.e.
+    whether the read timed out rather than the peer closing the connection.
+
+    :param socket sock: socket
+    :return: True if open
+    :rtype: bool
+    """
+
+    try:
+        readable, _, _ = select([sock], [], [], 0)
+        return not readable or sock.recv(1, MSG_PEEK) != b""
+    except OSError:
+        return False
+
+
+class MountpointSource(Mountpoint):
+    """
+    NTRIP caster mountpoint fed from a local receiver or RTCM3 log file.
+    """
+
+    def __init__(self, name: str, source: str, fanout: FanOut = None):
+        """
+        Constructor.
+
+        :param str name: mountpoint name
+        :param str source: "tcp://host:port", "port@baud" or file path
+        :param FanOut fanout: fan-out layer for mountpoint's clients
+        """
+
+        super().__init__(name, FanOut() if fanout is None else fanout, "")
+        self.logger = logging.getLogger(__name__)
+        self.source = source
+        self._rates = {}  # identity: [last seen, interval]
+        self._stopevent = Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Start source reader thread.
+        """
+
+        self._stopevent.clear()
+        self._thread = Thread(target=self._read_thread, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop source reader thread.
+        """
+
+        self._stopevent.set()
+        self.fanout.clear()
+
+    def _open(self) -> tuple:
+        """
+        Open source stream.
+
+        :return: tuple of (stream, replay y/n)
+        :rtype: tuple
+        :raises: OSError, SerialException, ValueError
+        """
+
+        if self.source.startswith(TCPPREFIX):
+            host, port = self.source[len(TCPPREFIX) :].rsplit(":", 1)
+            return create_connection((host, int(port)), SOURCETIMEOUT), False
+        if "@" in self.source:
+            port, baud = self.source.rsplit("@", 1)
+            return Serial(port, int(baud), timeout=SOURCETIMEOUT), False
+        return open(self.source, "rb"), True
+
+    def _read_thread(self):
+        """
+        THREADED
+        Read source, reconnecting (or restarting replay) until stopped.
+        """
+
+        while not self._stopevent.is_set():
+            delay = RETRYDELAY
+            try:
+                stream, replay = self._open()
+                with stream:
+                    self._read(stream, replay)
+                delay = MAXREPLAYDELAY if replay else RETRYDELAY
+            except (OSError, SerialException, ValueError) as err:
+                self.logger.error(
+                    f"Mountpoint {self.name} source {self.source} error {err}"
+                )
+            self._stopevent.wait(delay)
+
+    def _read(self, stream: object, replay: bool):
+        """
+        Read RTCM3 frames from stream and publish to mountpoint.
+
+        :param object stream: source stream
+        :param bool replay: pace replay by message epoch
+        """
+
+        ubr = UBXReader(stream, protfilter=RTCM3_PROTOCOL, quitonerror=ERR_IGNORE)
+        epoch = None
+        lastread = monotonic()
+        while not self._stopevent.is_set():
+            raw, parsed = ubr.read()
+            if raw is None:
+                if isinstance(stream, Serial):  # read timeout
+                    continue
+                if (
+                    isinstance(stream, socket)
+                    and monotonic() - lastread < SOURCEIDLE
+                    and _socket_open(stream)
+                ):  # read timeout e.g. base only sending 1005 every 10 s
+                    continue
+                return  # end of file, socket closed or idle
+            lastread = monotonic()
+            self._update(parsed)
+            if replay:
+                tow = replay_epoch(parsed)
+                if tow is not None:
+                    if epoch is not None and tow != epoch:
+                        # signed difference, allowing for week rollover
+                        delay = (tow - epoch + WEEKMS // 2) % WEEKMS - WEEKMS // 2
+                        self._stopevent.wait(min(max(delay / 1000, 0), MAXREPLAYDELAY))
+                    epoch = tow
+            self.publish(raw)
+
+    def _update(self, parsed: object):
+        """
+        Update mountpoint position and RTCM types from parsed message.
+
+        :param RTCMMessage parsed: parsed RTCM3 message
+        """
+
+        identity = parsed.identity
+        if identity in ("1005", "1006"):
+            try:
+                _, _, _, lat, lon, _ = arp_position(parsed)
+                self.lat, self.lon = round(lat, 8), round(lon, 8)
+            except AttributeError:
+                pass
+
+        now = monotonic()
+        rate = self._rates.get(identity, None)
+        if rate is None:
+            self._rates[identity] = [now, 0]
+        elif rate[0] != now:
+            interval = max(round(now - rate[0]), 1)
+            rate[0] = now
+            if interval != rate[1]:
+                rate[1] = interval
+                self.rtcmstr = ",".join(
+                    f"{ident}({intv})"
+                    for ident, (_, intv) in self._rates.items()
+                    if intv
+                )
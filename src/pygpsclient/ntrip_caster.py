@@ -0,0 +1,242 @@
+"""
+ntrip_caster.py
+
+NTRIP caster protocol helpers.
+
+Functions to parse NTRIP client requests and format the corresponding
+NTRIP 1.0 / 2.0 caster responses (401 unauthorized, sourcetable and
+data stream), independent of the socket server implementation.
+
+A caster may publish several mountpoints, each with its own fan-out
+layer, position and RTCM message types for the sourcetable.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+from base64 import b64encode
+
+from pygnssutils.globals import NTRIP1, PYGPSMP, RTCMSTR
+from pygnssutils.helpers import format_dates
+
+from pygpsclient._version import __version__ as VERSION
+
+CASTERNAME = f"{PYGPSMP.upper()}_NTRIP_Caster_{VERSION}"
+
+
+class Mountpoint:
+    """
+    NTRIP caster mountpoint.
+    """
+
+    def __init__(self, name: str, fanout: object, rtcmstr: str = RTCMSTR):
+        """
+        Constructor.
+
+        :param str name: mountpoint name
+        :param FanOut fanout: fan-out layer for mountpoint's clients
+        :param str rtcmstr: RTCM types sourcetable entry e.g. "1005(10),1077(1)"
+        """
+
+        self.name = name
+        self.fanout = fanout
+        self.rtcmstr = rtcmstr
+        self.lat = ""
+        self.lon = ""
+        # function used to publish raw data to fan-out layer
+        self.publish = fanout.publish
+
+
+def ntrip_credentials(user: str, password: str) -> bytes:
+    """
+    Format Basic authorization credentials.
+
+    :param str user: user name
+    :param str password: password
+    :return: base64 encoded credentials
+    :rtype: bytes
+    """
+
+    return b64encode(f"{user}:{password}".encode("utf-8"))
+
+
+def parse_ntrip_request(data: bytes) -> tuple:
+    """
+    Parse NTRIP client request.
+
+    :param bytes data: client request
+    :return: tuple of (mountpoint without leading "/", Basic credentials or None)
+    :rtype: tuple
+    """
+
+    mountpoint = ""
+    credentials = None
+    for part in data.strip().split(b"\r\n"):
+        if part[0:21] == b"Authorization: Basic ":
+            credentials = part[21:].strip()
+        elif part[0:3] == b"GET":
+            get = part.split(b" ")
+            if len(get) > 1:
+                mountpoint = get[1].decode("utf-8", errors="replace").lstrip("/")
+    return mountpoint, credentials
+
+
+def ntrip_response(
+    data: bytes,
+    credentials: bytes,
+    ntripversion: str,
+    address: tuple,
+    mountpoints: dict,
+) -> tuple:
+    """
+    Process NTRIP client request.
+
+    A sourcetable is returned if no mountpoint, or an unknown
+    mountpoint, is requested.
+
+    :param bytes data: client request
+    :param bytes credentials: valid Basic authorization credentials
+    :param str ntripversion: NTRIP version "1.0" or "2.0"
+    :param tuple address: caster (host, port)
+    :param dict mountpoints: dict of {name: Mountpoint}
+    :return: tuple of (HTTP response, requested Mountpoint or None)
+    :rtype: tuple
+    """
+
+    mountpoint, creds = parse_ntrip_request(data)
+    if creds != credentials:
+        return http_unauthorized(mountpoint, ntripversion), None
+    mpt = mountpoints.get(mountpoint, None)
+    if mpt is None:
+        sourcetable = format_sourcetable(
+            address[0],
+            address[1],
+            [(mp.name, mp.lat, mp.lon, mp.rtcmstr) for mp in mountpoints.values()],
+        )
+        return http_sourcetable(sourcetable, ntripversion), None
+    return http_data(ntripversion), mpt
+
+
+def format_sourcetable(host: str, port: int, mountpoints: list) -> str:
+    """
+    Format NTRIP sourcetable.
+
+    :param str host: caster host address
+    :param int port: caster port
+    :param list mountpoints: list of (mountpoint, lat, lon, rtcmstr)
+    :return: sourcetable
+    :rtype: str
+    """
+
+    pygu = PYGPSMP.upper()
+    lat, lon = (mountpoints[0][1], mountpoints[0][2]) if mountpoints else ("", "")
+    sourcetable = (
+        f"CAS;{host};{port};{PYGPSMP}/{VERSION};SEMU;0;GBR;{lat};{lon};0.0.0.0;0;none\r\n"
+        f"NET;{pygu};SEMU;B;N;none;none;none;none\r\n"
+    )
+    for mountpoint, lat, lon, rtcmstr in mountpoints:
+        sourcetable += (
+            f"STR;{mountpoint};{mountpoint.upper()};RTCM 3.3;{rtcmstr};"
+            f"2;GPS+GLO+GAL+BDS;{pygu};GBR;{lat};{lon};0;0;{pygu};none;B;N;0;\r\n"
+        )
+    return sourcetable + "ENDSOURCETABLE\r\n"
+
+
+def http_unauthorized(mountpoint: str, ntripversion: str) -> bytes:
+    """
+    Format HTTP 401 response.
+
+    :param str mountpoint: requested mountpoint
+    :param str ntripversion: NTRIP version "1.0" or "2.0"
+    :return: HTTP response
+    :rtype: bytes
+    """
+
+    http_date, server_date = format_dates()
+    if ntripversion == NTRIP1:
+        http = (
+            "HTTP/1.1 401 Unauthorized\r\n"
+            f"Date: {http_date}\r\n"
+            f'WWW-Authenticate: Basic realm="/{mountpoint}"\r\n'
+            "Content-Type: text/html\r\n"
+            "Connection: close\r\n\r\n"
+            "<!DOCTYPE html>\r\n"
+            "<html><head><title>401 Unauthorized</title></head><body>\r\n"
+            "<h1>The server does not recognize your privileges "
+            "to the requested entity/stream</h1>\r\n"
+            "</body></html>\r\n\r\n"
+        )
+    else:
+        http = (
+            "HTTP/1.1 401 Unauthorized\r\n"
+            "Ntrip-Version: Ntrip/2.0\r\n"
+            f"Server: {CASTERNAME}/of:{server_date}\r\n"
+            f"Date: {http_date}\r\n"
+            f'WWW-Authenticate: Basic realm="/{mountpoint}"\r\n'
+            "Connection: close\r\n\r\n"
+        )
+    return http.encode("utf-8")
+
+
+def http_sourcetable(sourcetable: str, ntripversion: str) -> bytes:
+    """
+    Format HTTP sourcetable response.
+
+    :param str sourcetable: sourcetable
+    :param str ntripversion: NTRIP version "1.0" or "2.0"
+    :return: HTTP response
+    :rtype: bytes
+    """
+
+    http_date, server_date = format_dates()
+    if ntripversion == NTRIP1:
+        http = (
+            "SOURCETABLE 200 OK\r\n"
+            f"Date: {http_date}\r\n"
+            "Connection: close\r\n"
+            "Content-Type: text/plain\r\n"
+            f"Content-Length: {len(sourcetable)}\r\n"
+            "\r\n"
+        )
+    else:
+        http = (
+            "HTTP/1.1 200 OK\r\n"
+            "Ntrip-Version: Ntrip/2.0\r\n"
+            f"Server: {CASTERNAME}/of:{server_date}\r\n"
+            f"Date: {http_date}\r\n"
+            "Connection: close\r\n"
+            "Content-Type: gnss/sourcetable\r\n"
+            f"Content-Length: {len(sourcetable)}\r\n"
+            "\r\n"
+        )
+    return (http + sourcetable).encode("utf-8")
+
+
+def http_data(ntripversion: str) -> bytes:
+    """
+    Format HTTP data stream response.
+
+    :param str ntripversion: NTRIP version "1.0" or "2.0"
+    :return: HTTP response
+    :rtype: bytes
+    """
+
+    http_date, server_date = format_dates()
+    if ntripversion == NTRIP1:
+        http = "ICY 200 OK\r\n\r\n"
+    else:
+        http = (
+            "HTTP/1.1 200 OK\r\n"
+            "Ntrip-Version: Ntrip/2.0\r\n"
+            f"Server: {CASTERNAME}/of:{server_date}\r\n"
+            f"Date: {http_date}\r\n"
+            "Cache-Control: no-store, no-cache, max-age=0\r\n"
+            "Pragma: no-cache\r\n"
+            "Connection: close\r\n"
+            "Content-Type: gnss/data\r\n"
+            "\r\n"
+        )
+    return http.encode("utf-8")
@@ -48,7 +48,6 @@ from tkinter import (
 from types import NoneType
 
 from pygnssutils import NOGGA
-from pygnssutils.helpers import find_mp_distance
 
 from pygpsclient.globals import (
     CLICK_CURSOR,
@@ -466,15 +465,13 @@ class NTRIPConfigDialog(ToplevelDialog):
             ):
                 ctl.config(state=(DISABLED if connected else NORMAL))
             # refresh sourcetable listbox ! NB PLACEMENT OF THIS CALL IS IMPORTANT !
+            self.__app.update_sourcetable(self._settings["sourcetable"])
             self.update_sourcetable(self._settings["sourcetable"])
             # update closest mountpoint name and distance (if available)
             lat, lon = self._get_coordinates()
             if isinstance(lat, float) and isinstance(lon, float):
-                mpname, mindist = find_mp_distance(
-                    lat,
-                    lon,
-                    self._settings["sourcetable"],
-                    self._settings["mountpoint"],
+                mpname, mindist = self._find_mp_distance(
+                    lat, lon, self._settings["mountpoint"]
                 )
                 self.set_mp_dist(mindist, mpname)
         except TclError:  # fudge during thread termination
@@ -500,13 +497,8 @@ class NTRIPConfigDialog(ToplevelDialog):
             self._ntrip_mountpoint.set(name)
             lat, lon = self._get_coordinates()
             if isinstance(lat, float) and isinstance(lon, float):
-                mpname, mindist = find_mp_distance(
-                    lat, lon, self._settings["sourcetable"], name
-                )
-                if mpname is None:
-                    self.set_mp_dist(None, name)
-                else:
-                    self.set_mp_dist(mindist, mpname)
+                mpname, mindist = self._find_mp_distance(lat, lon, name)
+                self.set_mp_dist(mindist, mpname)
         except (IndexError, KeyError):  # not yet populated
             pass
 
@@ -549,7 +541,10 @@ class NTRIPConfigDialog(ToplevelDialog):
             self._settings["flowinfo"] = cfg.get("ntripclientflowinfo_n")
             self._settings["scopeid"] = cfg.get("ntripclientscopeid_n")
             self._settings["mountpoint"] = cfg.get("ntripclientmountpoint_s")
-            self._settings["sourcetable"] = []  # this is generated by the NTRIP caster
+            # generated by the NTRIP caster, cached from previous retrieval
+            self._settings["sourcetable"] = self.__app.cached_sourcetable(
+                self._settings["server"], self._settings["port"]
+            )
             self._settings["version"] = cfg.get("ntripclientversion_s")
             self._settings["datatype"] = cfg.get("ntripclientdatatype_s")
             self._settings["ntripuser"] = cfg.get("ntripclientuser_s")
@@ -585,9 +580,7 @@ class NTRIPConfigDialog(ToplevelDialog):
         self._ntrip_gga_sep.set(self._settings["refsep"])
 
         lat, lon = self._get_coordinates()
-        mpname, mindist = find_mp_distance(
-            lat, lon, self._settings["sourcetable"], self._settings["mountpoint"]
-        )
+        mpname, mindist = self._find_mp_distance(lat, lon, self._settings["mountpoint"])
         self.set_mp_dist(mindist, mpname)
 
     def _set_settings(self):
@@ -627,12 +620,38 @@ class NTRIPConfigDialog(ToplevelDialog):
         :param list stable: sourcetable
         """
 
+        index = self.__app.ntrip_index
+        lat, lon = self._get_coordinates()
+        if stable is index.sourcetable and (lat, lon) != (0, 0):
+            stable = index.by_distance(lat, lon)  # nearest first
         self._lbx_sourcetable.unbind("<<ListboxSelect>>")
         self._lbx_sourcetable.delete(0, END)
-        for item in stable:
-            self._lbx_sourcetable.insert(END, item)
+        if stable:
+            self._lbx_sourcetable.insert(END, *stable)
         self._lbx_sourcetable.bind("<<ListboxSelect>>", self._on_select_mp)
 
+    def _find_mp_distance(self, lat: float, lon: float, name: str = "") -> tuple:
+        """
+        Find distance to named mountpoint or, if name is not provided,
+        the nearest mountpoint in the indexed sourcetable.
+
+        :param float lat: reference latitude
+        :param float lon: reference longitude
+        :param str name: mountpoint name
+        :return: tuple of (mountpoint name, distance in km or None)
+        :rtype: tuple
+        """
+
+        index = self.__app.ntrip_index
+        if name in (None, ""):
+            nearest = index.nearest(lat, lon, 1)
+            if not nearest:
+                return "", None
+            dist, entry = nearest[0]
+            return entry[0], round(dist, 2)
+        dist = index.distance(lat, lon, name)
+        return name, None if dist is None else round(dist, 2)
+
     def _connect(self):
         """
         Connect to NTRIP Server. NTRIP handler will invoke set_controls()
@@ -641,6 +660,9 @@ class NTRIPConfigDialog(ToplevelDialog):
 
         if self._valid_settings():
             self._set_settings()
+            cfg = self.__app.configuration
+            self.__app.ntrip_handler.passthrough = cfg.get("ntrippassthru_b")
+            self.__app.ntrip_inqueue.sample = cfg.get("ntrippassthrusample_n")
             # verbosity and logtofile set in App.__init__()
             self.__app.ntrip_handler.run(
                 ipprot=IP6 if self._settings["ipprot"] == AF_INET6 else IP4,
@@ -662,7 +684,7 @@ class NTRIPConfigDialog(ToplevelDialog):
                 refalt=self._settings["refalt"],
                 refsep=self._settings["refsep"],
                 # NTRIP SPARTN is unencrypted so key not needed
-                spartndecode=1,  # self._settings["spartndecode"],
+                spartndecode=0,  # decoded on demand by App.spartn_decoder
                 spartnkey=self._settings["spartnkey"],
                 spartnbasedate=self._settings["spartnbasedate"],
                 output=self.__app.ntrip_inqueue,
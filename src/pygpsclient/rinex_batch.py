@@ -0,0 +1,341 @@
+"""
+rinex_batch.py
+
+Batch RINEX conversion CLI for directories of binary GNSS data logs.
+
+Converts all logs matching the specified files, directories or glob
+patterns using a bounded pool of worker processes. Conversion parameters
+are read from an optional JSON parameter file mirroring the fields of the
+RINEX Conversion dialog, e.g.::
+
+    {
+        "rinex_version": "3.05",
+        "rinex_types": ["O", "N"],
+        "gnssfilter": ["G", "E", "R"],
+        "obsfilter": ["1C", "2L"],
+        "marker": ["MK01", "SITE01", "GEODETIC"],
+        "antenna": ["123456", "TRM59800.00"],
+        "antennahed": [1.5, 0.0, 0.0],
+        "receiver": ["7654321", "ZED-F9P", "HPG 1.51"]
+    }
+
+RINEX outputs are written alongside each input log. Logs which have
+already been converted (i.e. a newer RINEX file in the same directory
+records the log in its header) are skipped unless --force is set, so
+the command can be run repeatedly (e.g. nightly) against an archive.
+A JSON summary of each run is written to the --summarypath directory.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import json
+import sys
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from glob import glob
+from logging import getLogger
+from os import cpu_count, path
+from pathlib import Path
+from time import perf_counter, strftime
+
+from pygnssutils import VERBOSITY_HIGH, set_logging
+from pygnssutils.gnssreader import NMEA_PROTOCOL, RTCM3_PROTOCOL, UBX_PROTOCOL
+from pygnssutils.rinex_globals import (
+    RINEX_CANCELLED,
+    RINEX_ERROR,
+    RINEX_NORECS,
+    RINEX_OK,
+)
+
+from pygpsclient._version import __version__ as VERSION
+from pygpsclient.globals import APPNAME
+from pygpsclient.helpers import add_logging_args
+from pygpsclient.rinex_parallel import convert_chunk
+
+LOGPATTERN = "pygpsdata-*.log"
+RINEXEXT = "*.rnx"
+RESULTS = {
+    RINEX_OK: "converted",
+    RINEX_NORECS: "no records",
+    RINEX_CANCELLED: "cancelled",
+    RINEX_ERROR: "error",
+}
+SKIPPED = "skipped"
+DEFAULTPARAMS = {
+    "rinex_version": "4.02",
+    "rinex_types": ("O", "N"),
+    "gnssfilter": ("G", "E", "R", "C", "J", "I", "S"),
+    "obsfilter": ("",),
+    "starttime": "",
+    "minobs": 10,
+    "marker": ("", "", ""),
+    "antenna": ("", ""),
+    "antennahed": (0.0, 0.0, 0.0),
+    "receiver": ("", "", ""),
+    "observer": "",
+    "comments": ("PyGPSClient RINEX Batch Converter",),
+    "timecorr": 1,
+    "ionocorr": 1,
+    "eopcorr": 1,
+    "doi": "",
+    "license": "",
+    "station": "",
+    "country": "",
+    "obssource": "u-blox",
+    "navsource": "u-blox",
+    "metsource": "nmea",
+}
+
+
+def load_params(filename: str = "") -> dict:
+    """
+    Load conversion parameters from JSON parameter file. Any parameters
+    not in the file take default values.
+
+    :param str filename: fully qualified path to parameter file ("" = defaults)
+    :return: conversion parameters
+    :rtype: dict
+    :raises: ValueError if file contains unrecognised parameters
+    """
+
+    params = {
+        **DEFAULTPARAMS,
+        "protfilter": NMEA_PROTOCOL | RTCM3_PROTOCOL | UBX_PROTOCOL,
+    }
+    if filename != "":
+        with open(filename, "r", encoding="utf-8") as infile:
+            userparams = json.load(infile)
+        invalid = [key for key in userparams if key not in DEFAULTPARAMS]
+        if invalid != []:
+            raise ValueError(f"Invalid parameter(s) {', '.join(invalid)} in {filename}")
+        # RinexConverter expects tuples e.g. obsfilter=("",)
+        params.update(
+            {
+                key: tuple(val) if isinstance(val, list) else val
+                for key, val in userparams.items()
+            }
+        )
+    if params["starttime"] == "":  # all outputs share the same program run date
+        params["starttime"] = datetime.now(timezone.utc)
+    return params
+
+
+def find_inputs(sources: list, pattern: str = LOGPATTERN) -> list:
+    """
+    Find input logs from list of files, directories or glob patterns.
+    Directories are searched (non-recursively) for files matching pattern.
+
+    :param list sources: list of files, directories or glob patterns
+    :param str pattern: file name pattern for directory searches
+    :return: sorted list of unique input file paths
+    :rtype: list
+    """
+
+    inputs = set()
+    for source in sources:
+        if path.isdir(source):
+            matches = glob(path.join(source, pattern))
+        else:
+            matches = glob(source)
+        inputs.update(Path(match).resolve() for match in matches if path.isfile(match))
+    return sorted(inputs)
+
+
+def converted_logs(folder: Path) -> dict:
+    """
+    Get input logs recorded in the headers of existing RINEX files in folder.
+
+    :param Path folder: directory containing RINEX files
+    :return: dict of {input log path: most recent RINEX file modification time}
+    :rtype: dict
+    """
+
+    logs = {}
+    for rnx in folder.glob(RINEXEXT):
+        logname = None
+        with open(rnx, "r", encoding="utf-8", errors="ignore") as infile:
+            for line in infile:
+                label = line[60:].strip()
+                if label == "END OF HEADER":
+                    break
+                if label != "COMMENT":
+                    continue
+                if line.startswith("log: "):
+                    logname = line[5:60]
+                elif logname is not None and not line.startswith("format: "):
+                    logname += line[0:60]  # long path wraps onto next comment
+                elif logname is not None:
+                    break
+        if logname is not None:
+            logname = logname.strip()
+            logs[logname] = max(logs.get(logname, 0), path.getmtime(rnx))
+    return logs
+
+
+def is_converted(infile: Path, logs: dict) -> bool:
+    """
+    Check if input log has already been converted.
+
+    :param Path infile: input log path
+    :param dict logs: dict of converted logs from converted_logs()
+    :return: True if converted since log was last modified
+    :rtype: bool
+    """
+
+    return logs.get(str(infile), 0) >= path.getmtime(infile)
+
+
+def convert_file(infile: str, params: dict) -> dict:
+    """
+    Convert single input log. Runs in worker process.
+
+    :param str infile: input log path
+    :param dict params: RinexConverter keyword arguments
+    :return: conversion summary
+    :rtype: dict
+    """
+
+    start = perf_counter()
+    try:
+        res, outputs, _ = convert_chunk(infile, params)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        # one bad log must not halt an unattended batch
+        getLogger(__name__).error(f"Error converting {infile} {err}")
+        res, outputs = RINEX_ERROR, {}
+    return {
+        "input": infile,
+        "result": RESULTS.get(res, RESULTS[RINEX_ERROR]),
+        "outputs": {
+            rt: {"file": fnm, "records": recs} for rt, (fnm, recs) in outputs.items()
+        },
+        "elapsed": round(perf_counter() - start, 3),
+    }
+
+
+def batch_convert(
+    inputs: list, params: dict, workers: int = 0, force: bool = False
+) -> list:
+    """
+    Convert input logs concurrently using bounded pool of worker processes.
+
+    :param list inputs: list of input log paths
+    :param dict params: RinexConverter keyword arguments
+    :param int workers: maximum number of worker processes (0 = number of CPUs)
+    :param bool force: convert logs even if already converted
+    :return: list of conversion summaries, in input order
+    :rtype: list
+    """
+
+    logger = getLogger(__name__)
+    summary = {}
+    todo = []
+    folders = {}
+    for infile in inputs:
+        if not force and infile.parent not in folders:
+            folders[infile.parent] = converted_logs(infile.parent)
+        if not force and is_converted(infile, folders[infile.parent]):
+            summary[str(infile)] = {"input": str(infile), "result": SKIPPED}
+            logger.info(f"{infile} {SKIPPED}")
+        else:
+            todo.append(str(infile))
+
+    if todo:
+        workers = workers if workers > 0 else (cpu_count() or 1)
+        with ProcessPoolExecutor(min(workers, len(todo))) as executor:
+            futures = [executor.submit(convert_file, infile, params) for infile in todo]
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    summary[result["input"]] = result
+                    logger.info(f"{result['input']} {result['result']}")
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                for infile in todo:
+                    summary.setdefault(
+                        infile, {"input": infile, "result": RESULTS[RINEX_CANCELLED]}
+                    )
+
+    return [summary[str(infile)] for infile in inputs]
+
+
+def main():
+    """
+    CLI entry point.
+    """
+
+    ap = ArgumentParser(
+        formatter_class=ArgumentDefaultsHelpFormatter,
+        description="Batch convert binary GNSS data logs to RINEX",
+    )
+    ap.add_argument("-V", "--version", action="version", version="%(prog)s " + VERSION)
+    ap.add_argument(
+        "inputs",
+        nargs="+",
+        help="Input log files, directories or glob patterns",
+    )
+    ap.add_argument(
+        "-P",
+        "--params",
+        help="Fully-qualified path to JSON conversion parameter file",
+        default="",
+    )
+    ap.add_argument(
+        "--pattern",
+        help="File name pattern for logs in input directories",
+        default=LOGPATTERN,
+    )
+    ap.add_argument(
+        "-W",
+        "--workers",
+        help="Maximum number of worker processes (0 = number of CPUs)",
+        type=int,
+        default=0,
+    )
+    ap.add_argument(
+        "--force",
+        help="Convert logs even if already converted",
+        action="store_true",
+    )
+    ap.add_argument(
+        "--summarypath",
+        help="Directory for JSON conversion summary",
+        default=".",
+    )
+    add_logging_args(ap, VERBOSITY_HIGH)
+    kwargs = vars(ap.parse_args())
+
+    for logr in (getLogger(APPNAME), getLogger("pygnssutils")):
+        set_logging(logr, kwargs["verbosity"], kwargs["logtofile"])
+
+    params = load_params(kwargs["params"])
+    inputs = find_inputs(kwargs["inputs"], kwargs["pattern"])
+    start = perf_counter()
+    results = batch_convert(inputs, params, kwargs["workers"], kwargs["force"])
+    counts = {}
+    for result in results:
+        counts[result["result"]] = counts.get(result["result"], 0) + 1
+    summaryfile = path.join(
+        kwargs["summarypath"], f"pygpsrinex-{strftime('%Y%m%d%H%M%S')}.json"
+    )
+    with open(summaryfile, "w", encoding="utf-8") as outfile:
+        json.dump(
+            {
+                "params": {**params, "starttime": str(params["starttime"])},
+                "elapsed": round(perf_counter() - start, 3),
+                "counts": counts,
+                "files": results,
+            },
+            outfile,
+            indent=4,
+        )
+    getLogger(__name__).info(f"{len(inputs)} input(s) {counts}, summary {summaryfile}")
+    sys.exit(1 if counts.get(RESULTS[RINEX_ERROR], 0) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -67,7 +67,14 @@ from pygpsclient.globals import (
     READONLY,
     TRACEMODE_WRITE,
 )
-from pygpsclient.helpers import VALCUSTOM, VALFLOAT, VALNONBLANK, validate
+from pygpsclient.helpers import (
+    VALCUSTOM,
+    VALFLOAT,
+    VALNONBLANK,
+    shorten_path,
+    validate,
+)
+from pygpsclient.rinex_parallel import ParallelRinexConverter
 from pygpsclient.strings import (
     DLGTRINEX,
     LBLRINEXANTENNA,
@@ -82,6 +89,7 @@ from pygpsclient.strings import (
     LBLRINEXOBSERVER,
     LBLRINEXOBSTYPES,
     LBLRINEXOUTPUTS,
+    LBLRINEXPARALLEL,
     LBLRINEXRCVR,
     LBLRINEXSTARTTIME,
     LBLRINEXSTATION,
@@ -155,6 +163,7 @@ class RINEXDialog(ToplevelDialog):
         self._timecorrflag = IntVar()
         self._ionocorrflag = IntVar()
         self._eopcorrflag = IntVar()
+        self._parallel = IntVar()
         self._rxglonass = IntVar()
         self._rxgalileo = IntVar()
         self._rxbeidou = IntVar()
@@ -364,6 +373,12 @@ class RINEXDialog(ToplevelDialog):
             variable=self._eopcorrflag,
             state=NORMAL,
         )
+        self._chk_parallel = Checkbutton(
+            self._frm_basic,
+            text=LBLRINEXPARALLEL,
+            variable=self._parallel,
+            state=NORMAL,
+        )
         self._lbl_obstypes = Label(self._frm_basic, text=LBLRINEXOBSTYPES)
         self._ent_obstypes = Entry(
             self._frm_basic,
@@ -575,6 +590,7 @@ class RINEXDialog(ToplevelDialog):
         self._lbl_corr.grid(column=0, row=12, columnspan=2, padx=3, sticky=W)
         self._chk_timecorr.grid(column=2, row=12, padx=3, sticky=W)
         self._chk_ionocorr.grid(column=3, row=12, padx=3, sticky=W)
+        self._chk_parallel.grid(column=5, row=12, columnspan=2, padx=3, sticky=W)
         self._pgb_elapsed.grid(column=0, row=13, columnspan=7, padx=3, sticky=EW)
         ttk.Separator(self._frm_basic).grid(
             column=0, row=14, columnspan=7, padx=3, sticky=EW
@@ -699,6 +715,7 @@ class RINEXDialog(ToplevelDialog):
         self._timecorrflag.set(1)
         self._ionocorrflag.set(1)
         self._eopcorrflag.set(1)
+        self._parallel.set(0)
         rcvrname = self.__app.gnss_status.version_data.get("hwversion", NA)
         self._rcvrname.set("" if rcvrname == NA else rcvrname)
         rcvrversion = self.__app.gnss_status.version_data.get("fwversion", NA)
@@ -754,23 +771,12 @@ class RINEXDialog(ToplevelDialog):
         Load input data log.
         """
 
-        infile = self.__app.file_handler.open_file(
-            self,
-            "GNSS data log",
-            (
-                ("binary log files", "*.log"),
-                ("binary UBXfiles", "*.ubx"),
-                ("all files", "*.*"),
-            ),
-        )
-        if infile in ("", None):
+        infile = self.__app.file_handler.open_datalog(self)
+        if infile is None:
             return  # user cancelled
 
-        self._infile_path = Path(infile)
-        sfp = str(self._infile_path)
-        if len(sfp) > 60:
-            sfp = f"...{sfp[-60:]}"
-        self._infilepath.set(sfp)
+        self._infile_path = infile
+        self._infilepath.set(shorten_path(infile))
         self._ent_infilepath.update()
         validate(self._ent_infilepath, valmode=VALNONBLANK)
         self.status_label = (
@@ -933,31 +939,34 @@ class RINEXDialog(ToplevelDialog):
                 RINEXSOURCES[self._navsource.get()],
                 RINEXSOURCES[self._metsource.get()],
             ]
-            rc = RinexConverter(
-                self.__app,
-                rinex_version=rinex_version,
-                rinex_types=rinex_types,
-                gnssfilter=gnss_filter,
-                obsfilter=obs_filter,
-                datasource=datasource,
-                starttime=starttime,
-                minobs=minobs,
-                marker=marker,
-                antenna=antenna,
-                antennahed=antennahed,
-                timecorr=timecorr,
-                ionocorr=ionocorr,
-                eopcorr=eopcorr,
-                receiver=receiver,
-                observer=observer,
-                comments=comments,
-                protfilter=protfilter,
-                doi=doi,
-                license=licen,
-                station=station,
-                country=country,
+            params = {
+                "rinex_version": rinex_version,
+                "rinex_types": rinex_types,
+                "gnssfilter": gnss_filter,
+                "obsfilter": obs_filter,
+                "datasource": datasource,
+                "starttime": starttime,
+                "minobs": minobs,
+                "marker": marker,
+                "antenna": antenna,
+                "antennahed": antennahed,
+                "timecorr": timecorr,
+                "ionocorr": ionocorr,
+                "eopcorr": eopcorr,
+                "receiver": receiver,
+                "observer": observer,
+                "comments": comments,
+                "protfilter": protfilter,
+                "doi": doi,
+                "license": licen,
+                "station": station,
+                "country": country,
                 **kwargs,
-            )
+            }
+            if self._parallel.get():  # convert chunks in process pool
+                rc = ParallelRinexConverter(**params)
+            else:
+                rc = RinexConverter(self.__app, **params)
             self._stopevent.clear()
             rct = Thread(
                 target=self._process_input,
@@ -977,7 +986,7 @@ class RINEXDialog(ToplevelDialog):
 
     def _process_input(
         self,
-        rc: RinexConverter,
+        rc: RinexConverter | ParallelRinexConverter,
         infilepath: Path,
         stopevent: Event,
         progcallback: MethodType,
@@ -986,7 +995,7 @@ class RINEXDialog(ToplevelDialog):
         """
         THREADED
 
-        :param RinexConverter rc: RineXConverter instance
+        :param RinexConverter | ParallelRinexConverter rc: converter instance
         :param Path infilepath: input file path
         :param Event stopevent: stopevent for remote cancellation
         :param MethodType progcallback: callback for % complete updates
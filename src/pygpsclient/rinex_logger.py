@@ -0,0 +1,195 @@
+"""
+rinex_logger.py
+
+Real-time RINEX logging from the live GNSS data stream.
+
+Raw observation and navigation messages (UBX RXM-RAWX, RXM-SFRBX and
+RTCM3 MSM and ephemerides) are appended, unbuffered, to a spool file for
+the current logging period (e.g. hourly or daily). When an observation
+epoch falls into a new period, the spool file is closed and converted to
+RINEX in a background worker process, while logging continues into a new
+spool file, starting with the most recent navigation messages so that
+each period has complete ephemerides. Successfully converted spool files
+are removed, so the data log directory accumulates archive-ready RINEX
+files, one set per period.
+
+Periods are aligned to the observation epoch time (GPS time) where
+available, otherwise to the system clock (UTC).
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from logging import getLogger
+from os import path
+
+from pygpsclient.rinex_batch import convert_file, load_params
+from pygpsclient.rinex_parallel import NAVOVERLAP
+
+RINEXPERIOD = 3600  # default logging period in seconds (hourly)
+RINEXPERIODS = (3600, 86400)  # hourly, daily
+GPSEPOCH = datetime(1980, 1, 6, tzinfo=timezone.utc)
+OBSMSGS = ("RXM-RAWX",) + tuple(
+    str(msg) for start in range(1071, 1131, 10) for msg in range(start, start + 7)
+)
+NAVMSGS = ("RXM-SFRBX", "1019", "1020", "1041", "1042", "1044", "1045", "1046")
+SPOOLMODE = "rinex"
+SPOOLEXT = "log"
+
+
+def obs_epoch(parsed: object) -> datetime:
+    """
+    Get observation epoch time from parsed UBX RXM-RAWX message.
+
+    :param object parsed: parsed message
+    :return: epoch as GPS time, or None if not available
+    :rtype: datetime
+    """
+
+    if getattr(parsed, "identity", "") != "RXM-RAWX":
+        return None
+    return GPSEPOCH + timedelta(weeks=parsed.week, seconds=parsed.rcvTow)
+
+
+class RINEXLogger:
+    """
+    Real-time RINEX logger.
+    """
+
+    def __init__(self, logpath: str, period: int = RINEXPERIOD, paramfile: str = ""):
+        """
+        Constructor.
+
+        :param str logpath: directory for spool and RINEX files
+        :param int period: logging period in seconds e.g. 3600 = hourly
+        :param str paramfile: JSON conversion parameter file ("" = defaults)
+        :raises: OSError, ValueError if parameter file is invalid
+        """
+
+        self.logger = getLogger(__name__)
+        self.logpath = logpath
+        self.period = period
+        self._params = load_params(paramfile)
+        self._spool = None
+        self._spoolname = None
+        self._start = None  # start of current period
+        self._navmsgs = deque(maxlen=NAVOVERLAP)
+        self._executor = None
+        self.records = 0
+        self.converted = []  # conversion summaries of completed periods
+
+    def write(self, raw: bytes, parsed: object):
+        """
+        Append observation or navigation message to current period's spool file.
+        Other messages are ignored.
+
+        :param bytes raw: raw message
+        :param object parsed: parsed message
+        """
+
+        identity = getattr(parsed, "identity", "")
+        if identity in OBSMSGS:
+            epoch = obs_epoch(parsed) or datetime.now(timezone.utc)
+            start = self._period_start(epoch)
+            if start != self._start and self._start is not None:
+                self.rotate()
+            self._start = start
+        elif identity in NAVMSGS:
+            self._navmsgs.append(raw)
+        else:
+            return
+        if self._spool is None:
+            self._open_spool()
+            for nav in self._navmsgs:
+                if nav is not raw:
+                    self._spool.write(nav)
+        self._spool.write(raw)
+        self._spool.flush()
+        self.records += 1
+
+    def rotate(self):
+        """
+        Close current spool file and submit it for conversion to RINEX.
+        """
+
+        if self._spool is None:
+            return
+        self._spool.close()
+        self._spool = None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(1)
+        future = self._executor.submit(convert_file, self._spoolname, self._params)
+        future.add_done_callback(self._on_converted)
+
+    def close(self, wait: bool = True):
+        """
+        Convert current (partial) period and stop worker process.
+
+        :param bool wait: wait for pending conversions to complete
+        """
+
+        self.rotate()
+        self._start = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _period_start(self, epoch: datetime) -> datetime:
+        """
+        Get start of logging period containing epoch.
+
+        :param datetime epoch: epoch
+        :return: start of period
+        :rtype: datetime
+        """
+
+        secs = (epoch - GPSEPOCH).total_seconds()
+        return GPSEPOCH + timedelta(seconds=secs - secs % self.period)
+
+    def _open_spool(self):
+        """
+        Open spool file for current period.
+
+        :raises: OSError
+        """
+
+        start = self._start or self._period_start(datetime.now(timezone.utc))
+        self._spoolname = path.join(
+            self.logpath, f"pygps{SPOOLMODE}-{start:%Y%m%d%H%M%S}.{SPOOLEXT}"
+        )
+        # append in case logging restarted within same period
+        self._spool = open(self._spoolname, "ab")  # pylint: disable=consider-using-with
+
+    def _on_converted(self, future: object):
+        """
+        Conversion completed callback. Removes spool file if converted, and
+        any empty RINEX outputs (e.g. no navigation data in period).
+
+        :param object future: completed conversion future
+        """
+
+        if future.cancelled():
+            return
+        result = future.result()
+        self.converted.append(result)
+        if result["result"] == "converted":
+            empty = [
+                output["file"]
+                for output in result["outputs"].values()
+                if output["records"] == 0
+            ]
+            for fnm in [result["input"]] + empty:
+                try:
+                    os.remove(fnm)
+                except OSError:
+                    pass
+            self.logger.info(f"RINEX logged {list(result['outputs'].values())}")
+        else:
+            self.logger.error(f"RINEX logging {result['input']} {result['result']}")
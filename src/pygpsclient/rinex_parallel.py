@@ -0,0 +1,663 @@
+"""
+rinex_parallel.py
+
+Parallel, chunked RINEX conversion engine.
+
+Wraps pygnssutils.RinexConverter to convert large binary GNSS data logs
+using all available processor cores:
+
+1. A fast framing pass (no parsing) splits the input into chunks of
+   roughly equal size, always at an observation epoch boundary (a change
+   in UBX RXM-RAWX/RXM-RAW receiver time of week or RTCM3 MSM epoch time,
+   normalised to GPS time so that all constellations share each epoch).
+   Recent navigation frames (UBX RXM-SFRBX) are repeated at the start of
+   the next chunk, so ephemerides spanning a chunk boundary are not lost.
+2. Each chunk is converted by a separate RinexConverter in a process pool.
+3. The chunk outputs are merged into single observation, navigation and
+   meteorological files with consolidated headers (observation types,
+   first and last observation times, satellite counts, GLONASS slots,
+   ionospheric and time system corrections). Minimum observation counts
+   are applied to the file as a whole, and duplicate navigation records
+   are removed.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from logging import getLogger
+from os import cpu_count, path
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import Event
+from types import FunctionType, MethodType, NoneType
+
+from pygnssutils.gnssreader import GNSSReader
+from pygnssutils.rinex_conv import RinexConverter
+from pygnssutils.rinex_globals import (
+    COLWIDTH,
+    CONT,
+    EPOCHMAX,
+    EPOCHMIN,
+    MET,
+    NAV,
+    NMEA,
+    OBS,
+    RINEX_CANCELLED,
+    RINEX_ERROR,
+    RINEX_NORECS,
+    RINEX_OK,
+    UBLOX,
+)
+from pygnssutils.rinex_helpers import (
+    format_comments,
+    format_fileend,
+    format_filename,
+    format_glonassfrq,
+    format_numsats,
+    format_obstypes,
+    format_timefirstlast,
+)
+
+from pygpsclient.log_framer import BDSOFFSET, DAYMS, GLOOFFSET, WEEKMS
+
+CHUNKSIZE = 8000000  # approximate chunk size in bytes
+NAVOVERLAP = 200  # navigation frames repeated at start of next chunk
+FRAMEPROGRESS = 10  # % of progress allocated to framing pass
+MERGEPROGRESS = 10  # % of progress allocated to merging outputs
+RXMRAWX = b"\xb5\x62\x02\x15"
+RXMRAW = b"\xb5\x62\x02\x10"
+RXMSFRBX = b"\xb5\x62\x02\x13"
+MSMRANGES = tuple(range(start, start + 7) for start in range(1071, 1131, 10))
+MSMGLONASS = range(1081, 1088)
+MSMBEIDOU = range(1121, 1128)
+OBSFIELD = 16  # F14.3 + LLI + SSI
+ENDOFFILE = format_fileend()
+GLOSLOT = re.compile(r"([A-Z]\d{2})\s+(-?\d+)")
+
+
+def epoch_key(raw: bytes) -> bytes:
+    """
+    Get observation epoch from raw UBX RXM-RAWX, RXM-RAW or RTCM3 MSM frame,
+    without parsing. RTCM3 MSM epochs are normalised to GPS time of week.
+
+    :param bytes raw: raw message
+    :return: epoch as bytes, or None if not an observation message
+    :rtype: bytes
+    """
+
+    hdr = raw[0:4]
+    if hdr == RXMRAWX and len(raw) > 16:
+        return raw[6:16]  # rcvTow (R8) + week (U2)
+    if hdr == RXMRAW and len(raw) > 12:
+        return raw[6:12]  # rcvTow (I4) + week (I2)
+    if raw[0:1] == b"\xd3" and len(raw) > 10:
+        msgnum = int.from_bytes(raw[3:5], "big") >> 4
+        if any(msgnum in rng for rng in MSMRANGES):
+            # msgnum (12 bits), station id (12 bits), epoch time (30 bits)
+            epoch = (int.from_bytes(raw[3:10], "big") >> 2) & 0x3FFFFFFF
+            if msgnum in MSMGLONASS:  # day of week (3 bits), time of day (27 bits)
+                dow, tod = epoch >> 27, epoch & 0x7FFFFFF
+                if dow == 7:  # unknown
+                    return None
+                epoch = dow * DAYMS + tod - GLOOFFSET
+            elif msgnum in MSMBEIDOU:
+                epoch += BDSOFFSET
+            return (epoch % WEEKMS).to_bytes(4, "big")
+    return None
+
+
+def split_input(
+    infile: Path,
+    chunkdir: Path,
+    chunksize: int = CHUNKSIZE,
+    stopevent: Event | NoneType = None,
+    progcallback: FunctionType | MethodType | NoneType = None,
+) -> list:
+    """
+    Split binary GNSS data log into chunks at observation epoch boundaries.
+    Each chunk is written to its own subdirectory of chunkdir, as RINEX
+    outputs are created alongside the input.
+
+    :param Path infile: input file path
+    :param Path chunkdir: directory for chunk files
+    :param int chunksize: approximate chunk size in bytes
+    :param Event | NoneType stopevent: stop event for remote cancellation
+    :param FunctionType | MethodType | NoneType progcallback: callback for \
+        % of input read
+    :return: list of chunk file paths
+    :rtype: list
+    :raises: KeyboardInterrupt if cancelled
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    chunks = []
+    outfile = None
+    size = 0
+    lastepoch = None
+    navframes = deque(maxlen=NAVOVERLAP)
+    filesize = max(path.getsize(infile), 1)
+    try:
+        with open(infile, "rb") as stream:
+            for i, (raw, _) in enumerate(GNSSReader(stream, parsing=False)):
+                if raw is None:
+                    continue
+                epoch = epoch_key(raw)
+                newepoch = epoch is not None and epoch != lastepoch
+                if outfile is None or (newepoch and size >= chunksize):
+                    if stopevent is not None and stopevent.is_set():
+                        raise KeyboardInterrupt("Terminated by user")
+                    if outfile is not None:
+                        outfile.close()
+                    chunk = chunkdir / f"c{len(chunks):04d}" / f"c{len(chunks):04d}.bin"
+                    chunk.parent.mkdir()
+                    outfile = open(chunk, "wb")  # pylint: disable=consider-using-with
+                    chunks.append(chunk)
+                    size = 0
+                    for frame in navframes:  # overlap navigation data
+                        outfile.write(frame)
+                if newepoch:
+                    lastepoch = epoch
+                if raw[0:4] == RXMSFRBX:
+                    navframes.append(raw)
+                outfile.write(raw)
+                size += len(raw)
+                if progcallback is not None and not i % 1000:
+                    progcallback(stream.tell() / filesize)
+    finally:
+        if outfile is not None:
+            outfile.close()
+    return chunks
+
+
+def convert_chunk(chunkfile: str, params: dict) -> tuple:
+    """
+    Convert single chunk. Runs in worker process.
+
+    :param str chunkfile: chunk file path
+    :param dict params: RinexConverter keyword arguments
+    :return: tuple of (return code, {rinextype: (output file path, records)},
+        {rinextype: (first epoch, last epoch, interval)})
+    :rtype: tuple
+    """
+
+    rc = RinexConverter(None, **params)
+    res = rc.process_input(chunkfile)
+    outputs = {}
+    epochs = {}
+    if res == RINEX_OK:
+        outputs = {rt: (str(fnm), recs) for rt, (fnm, recs) in rc.outputs.items()}
+        epochs = {
+            rt: (rc.get_start_epoch(rt), rc.get_end_epoch(rt), rc.get_interval(rt))
+            for rt in outputs
+        }
+    return res, outputs, epochs
+
+
+def _label(line: str) -> str:
+    """
+    Get RINEX header line label.
+
+    :param str line: header line
+    :return: label e.g. "END OF HEADER"
+    :rtype: str
+    """
+
+    return line[60:].strip()
+
+
+def read_rinex(filename: Path) -> tuple:
+    """
+    Read RINEX file into header and body lines.
+
+    :param Path filename: RINEX file path
+    :return: tuple of (header lines, body lines), excluding END OF FILE comment
+    :rtype: tuple
+    """
+
+    header = []
+    body = []
+    with open(filename, "r", encoding="utf-8") as infile:
+        for line in infile:
+            header.append(line)
+            if _label(line) == "END OF HEADER":
+                break
+        body = [line for line in infile if line != ENDOFFILE]
+    return header, body
+
+
+def _log_comment(header: list, infile: Path) -> list:
+    """
+    Replace chunk log file comment in header with original input file.
+
+    :param list header: header lines
+    :param Path infile: original input file
+    :return: amended header lines
+    :rtype: list
+    """
+
+    out = []
+    inlog = False
+    for line in header:
+        if _label(line) == "COMMENT" and line.startswith("log: "):
+            out.append(format_comments(f"log: {infile}"))
+            inlog = True
+            continue
+        if inlog and _label(line) == "COMMENT" and not line.startswith("format: "):
+            continue  # continuation of long chunk file path
+        inlog = False
+        out.append(line)
+    return out
+
+
+def _obs_records(body: list):
+    """
+    Generator for observation records, joining any continuation lines.
+
+    :param list body: observation body lines
+    :return: generator of (record, is satellite record)
+    :rtype: generator
+    """
+
+    rec = None
+    for line in body:
+        line = line.rstrip("\n")
+        if line.startswith(CONT) and rec is not None:
+            rec += line[len(CONT) :]
+            continue
+        if rec is not None:
+            yield rec, True
+            rec = None
+        if line[0:1].isalpha() and line[1:3].strip().isdigit():
+            rec = line
+        else:
+            yield line, False
+    if rec is not None:
+        yield rec, True
+
+
+def _obs_types(header: list) -> dict:
+    """
+    Get observation types from header.
+
+    :param list header: header lines
+    :return: dict of {gnss: [obstype, ...]}
+    :rtype: dict
+    """
+
+    obstypes = {}
+    gnssr = None
+    for line in header:
+        if _label(line) == "SYS / # / OBS TYPES":
+            if line[0] != " ":
+                gnssr = line[0]
+                obstypes[gnssr] = []
+            if gnssr is not None:
+                obstypes[gnssr] += line[6:60].split()
+    return obstypes
+
+
+def merge_obs(chunks: list, outfile: Path, infile: Path, epochs: tuple, minobs: int):
+    """
+    Merge chunk observation files into single observation file.
+
+    :param list chunks: list of chunk observation file paths in time order
+    :param Path outfile: merged observation file path
+    :param Path infile: original input file
+    :param tuple epochs: (first epoch, last epoch) of merged file
+    :param int minobs: minimum observations per observation type
+    """
+    # pylint: disable=too-many-locals, too-many-branches, too-many-statements
+
+    # first pass - consolidate observation types, satellites and GLONASS slots
+    files = []
+    mergedtypes = {}
+    counts = {}
+    sats = set()
+    glonass = {}
+    leapsecs = []
+    for chunk in chunks:
+        header, body = read_rinex(chunk)
+        if not body:
+            continue
+        obstypes = _obs_types(header)
+        files.append((chunk, header, obstypes))
+        for gnssr, types in obstypes.items():
+            for obstype in types:
+                if obstype not in mergedtypes.setdefault(gnssr, []):
+                    mergedtypes[gnssr].append(obstype)
+        for line in header:
+            if _label(line) == "GLONASS SLOT / FRQ":
+                glonass.update(
+                    (sv, int(frq)) for sv, frq in GLOSLOT.findall(line[4:60])
+                )
+            if _label(line) == "LEAP SECONDS" and not leapsecs:
+                leapsecs.append(line)
+        for rec, issat in _obs_records(body):
+            if not issat:
+                continue
+            sats.add(rec[0:3])
+            for j, obstype in enumerate(obstypes.get(rec[0], [])):
+                val = rec[3 + j * OBSFIELD : 3 + j * OBSFIELD + 14]
+                if val.strip() != "":
+                    counts[(rec[0], obstype)] = counts.get((rec[0], obstype), 0) + 1
+
+    # apply minimum observations per observation type to file as a whole
+    for gnssr, types in mergedtypes.items():
+        mergedtypes[gnssr] = [
+            obstype for obstype in types if counts.get((gnssr, obstype), 0) >= minobs
+        ]
+
+    with open(outfile, "w", encoding="utf-8") as output:
+        if not files:
+            return
+        # header based on most recent chunk e.g. for approximate position
+        done = set()
+        for line in _log_comment(files[-1][1], infile):
+            label = _label(line)
+            if label == "SYS / # / OBS TYPES":
+                line = (
+                    ""
+                    if label in done
+                    else format_obstypes(
+                        {g: dict.fromkeys(t, 0) for g, t in mergedtypes.items()}
+                    )
+                )
+            elif label == "GLONASS SLOT / FRQ":
+                line = "" if label in done else format_glonassfrq(glonass)
+            elif label == "TIME OF FIRST OBS":
+                line = format_timefirstlast(epochs[0], "FIRST")
+            elif label == "TIME OF LAST OBS":
+                line = format_timefirstlast(epochs[1], "LAST")
+            elif label == "# OF SATELLITES":
+                line = format_numsats(len(sats))
+            elif label == "LEAP SECONDS" and leapsecs:
+                line = leapsecs[0]
+            done.add(label)
+            output.write(line)
+
+        # second pass - remap observations to consolidated observation types
+        for chunk, _, obstypes in files:
+            _, body = read_rinex(chunk)
+            for rec, issat in _obs_records(body):
+                if not issat:
+                    output.write(rec + "\n")
+                    continue
+                fields = {
+                    obstype: rec[3 + j * OBSFIELD : 3 + (j + 1) * OBSFIELD].ljust(
+                        OBSFIELD
+                    )
+                    for j, obstype in enumerate(obstypes.get(rec[0], []))
+                }
+                obs = rec[0:3] + "".join(
+                    fields.get(obstype, " " * OBSFIELD)
+                    for obstype in mergedtypes.get(rec[0], [])
+                )
+                output.write(obs[0:COLWIDTH] + "\n")
+                obs = obs[COLWIDTH:]
+                while len(obs) > 0:
+                    wid = COLWIDTH - len(CONT)
+                    output.write(CONT + obs[0:wid] + "\n")
+                    obs = obs[wid:]
+        output.write(ENDOFFILE)
+
+
+def merge_nav(chunks: list, outfile: Path, infile: Path):
+    """
+    Merge chunk navigation files into single navigation file,
+    removing duplicate records.
+
+    :param list chunks: list of chunk navigation file paths in time order
+    :param Path outfile: merged navigation file path
+    :param Path infile: original input file
+    """
+
+    header = []
+    corrs = set()
+    records = {}  # record key: record, in order
+    for chunk in chunks:
+        hdr, body = read_rinex(chunk)
+        if not body:
+            continue
+        if not header:
+            header = _log_comment(hdr, infile)
+            corrs = {(_label(line), line[0:5]) for line in header}
+        else:  # add any corrections not in first header
+            for line in hdr:
+                key = (_label(line), line[0:5])
+                if key[0] in ("IONOSPHERIC CORR", "TIME SYSTEM CORR") and (
+                    key not in corrs
+                ):
+                    header.insert(len(header) - 1, line)
+                    corrs.add(key)
+        rec = []
+        for line in body + [""]:
+            if line[0:1] != " " and rec:  # start of record or end of body
+                key = "".join(rec[0:2]) if rec[0].startswith(">") else rec[0]
+                records.setdefault(key, "".join(rec))
+                rec = []
+            rec.append(line)
+
+    with open(outfile, "w", encoding="utf-8") as output:
+        if not header:
+            return
+        output.write("".join(header))
+        output.write("".join(records.values()))
+        output.write(ENDOFFILE)
+
+
+def merge_met(chunks: list, outfile: Path, infile: Path):
+    """
+    Merge chunk meteorological files into single meteorological file.
+
+    :param list chunks: list of chunk meteorological file paths in time order
+    :param Path outfile: merged meteorological file path
+    :param Path infile: original input file
+    """
+
+    header = []
+    with open(outfile, "w", encoding="utf-8") as output:
+        for chunk in chunks:
+            hdr, body = read_rinex(chunk)
+            if not body:
+                continue
+            if not header:
+                header = _log_comment(hdr, infile)
+                output.write("".join(header))
+            output.write("".join(body))
+        if header:
+            output.write(ENDOFFILE)
+
+
+class ParallelRinexConverter:
+    """
+    Parallel chunked RINEX converter.
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        chunksize: int = CHUNKSIZE,
+        **params,
+    ):
+        """
+        Constructor.
+
+        :param int workers: number of worker processes (0 = number of CPUs)
+        :param int chunksize: approximate chunk size in bytes
+        :param dict params: RinexConverter keyword arguments (rinex_version, \
+            rinex_types, gnssfilter, obsfilter, minobs, marker, etc.)
+        """
+
+        self.logger = getLogger(__name__)
+        self._workers = workers if workers > 0 else (cpu_count() or 1)
+        self._chunksize = chunksize
+        # all chunks share the same header program run date
+        if params.get("starttime", "") == "":
+            params["starttime"] = datetime.now(timezone.utc)
+        self._params = params
+        self._outputs = {}
+        self._prev_progress = 0
+
+    def process_input(
+        self,
+        infile: Path | str,
+        stopevent: Event | NoneType = None,
+        progcallback: FunctionType | MethodType | NoneType = None,
+        **kwargs,
+    ) -> int:
+        """
+        Convert binary input file containing UBX, RTCM or NMEA GNSS messages.
+        RINEX outputs are written to the same directory as the input file.
+
+        :param Path | str infile: input binary file path
+        :param Event | NoneType stopevent: stop event for remote cancellation
+        :param FunctionType | MethodType | NoneType progcallback: callback for \
+            % complete updates
+        :param dict kwargs: for compatibility with RinexConverter (not used)
+        :return: return code (0 = success, >0 = error)
+        :rtype: int
+        """
+        # pylint: disable=unused-argument, too-many-return-statements
+
+        infile = Path(infile)
+        self._outputs = {}
+        self._prev_progress = 0
+        chunkdir = Path(mkdtemp(prefix="rnx"))
+        try:
+            chunks = split_input(
+                infile,
+                chunkdir,
+                self._chunksize,
+                stopevent,
+                lambda frac: self._progress(progcallback, frac * FRAMEPROGRESS),
+            )
+            if not chunks:
+                return RINEX_NORECS
+            results = self._convert(chunks, stopevent, progcallback)
+            codes = {res for res, _, _ in results}
+            if RINEX_CANCELLED in codes:
+                return RINEX_CANCELLED
+            if RINEX_ERROR in codes:
+                return RINEX_ERROR
+            results = [result for result in results if result[0] == RINEX_OK]
+            if not results:
+                return RINEX_NORECS
+            self._merge(results, infile)
+            self._progress(progcallback, 100)
+            return RINEX_OK
+        except KeyboardInterrupt:
+            self.logger.warning("Terminated by user")
+            return RINEX_CANCELLED
+        except (OSError, RuntimeError) as err:
+            self.logger.error(f"RINEX parallel conversion error {err}")
+            return RINEX_ERROR
+        finally:
+            rmtree(chunkdir, ignore_errors=True)
+
+    def _convert(
+        self,
+        chunks: list,
+        stopevent: Event | NoneType,
+        progcallback: FunctionType | MethodType | NoneType,
+    ) -> list:
+        """
+        Convert chunks in process pool.
+
+        :param list chunks: list of chunk file paths
+        :param Event | NoneType stopevent: stop event for remote cancellation
+        :param FunctionType | MethodType | NoneType progcallback: progress callback
+        :return: list of convert_chunk results, in chunk order
+        :rtype: list
+        :raises: KeyboardInterrupt if cancelled
+        """
+
+        # minimum observations are applied when chunk outputs are merged
+        params = {**self._params, "minobs": 0, "verbosity": -1}
+        results = [None] * len(chunks)
+        span = 100 - FRAMEPROGRESS - MERGEPROGRESS
+        with ProcessPoolExecutor(min(self._workers, len(chunks))) as executor:
+            futures = {
+                executor.submit(convert_chunk, str(chunk), params): i
+                for i, chunk in enumerate(chunks)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                if stopevent is not None and stopevent.is_set():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise KeyboardInterrupt("Terminated by user")
+                results[futures[future]] = future.result()
+                self._progress(progcallback, FRAMEPROGRESS + span * done / len(chunks))
+        return results
+
+    def _merge(self, results: list, infile: Path):
+        """
+        Merge chunk outputs into RINEX files in input file directory.
+
+        :param list results: list of convert_chunk results, in chunk order
+        :param Path infile: input file path
+        """
+
+        gnssfilter = self._params.get("gnssfilter", ("",))
+        sources = {
+            OBS: self._params.get("obssource", UBLOX),
+            NAV: self._params.get("navsource", UBLOX),
+            MET: self._params.get("metsource", NMEA),
+        }
+        for rt in results[0][1]:
+            start = min((epochs[rt][0] for _, _, epochs in results), default=EPOCHMAX)
+            end = max((epochs[rt][1] for _, _, epochs in results), default=EPOCHMIN)
+            interval = 0
+            for _, _, epochs in results:
+                interval = epochs[rt][2] or interval
+            outfile = format_filename(
+                rt, gnssfilter, start, end, interval, infile.parent, sources[rt]
+            )
+            chunkfiles = [Path(outputs[rt][0]) for _, outputs, _ in results]
+            if rt == OBS:
+                merge_obs(
+                    chunkfiles,
+                    outfile,
+                    infile,
+                    (start, end),
+                    self._params.get("minobs", 0),
+                )
+            elif rt == NAV:
+                merge_nav(chunkfiles, outfile, infile)
+            else:
+                merge_met(chunkfiles, outfile, infile)
+            recs = sum(outputs[rt][1] for _, outputs, _ in results)
+            self._outputs[rt] = (outfile, recs)
+
+    def _progress(
+        self, progcallback: FunctionType | MethodType | NoneType, progress: float
+    ):
+        """
+        Invoke callback function or method to report % complete.
+
+        :param FunctionType | MethodType | NoneType progcallback: callback
+        :param float progress: % complete
+        """
+
+        progress = int(progress)
+        if progcallback is not None and progress > self._prev_progress:
+            progcallback(progress)
+            self._prev_progress = progress
+
+    @property
+    def outputs(self) -> dict:
+        """
+        Getter for conversion outputs. For each rinex type:
+        (filename, number of records processed).
+
+        :return: outputs
+        :rtype: dict
+        """
+
+        return self._outputs
@@ -192,8 +192,11 @@ class RoverFrame(Frame):
         )
 
         # plot historical relative position track
-        for thdg, tdis in self.points:
-            x, y = self._canvas.d2xy(thdg, tdis / self._scale_c)
+        xy = self._canvas.d2xy_batch(
+            [thdg for thdg, _ in self.points],
+            [tdis / self._scale_c for _, tdis in self.points],
+        )
+        for x, y in zip(xy[0::2], xy[1::2]):
             self._canvas.create_circle(
                 x,
                 y,
@@ -202,7 +205,6 @@ class RoverFrame(Frame):
                 outline=TRKCOL,
                 tags=TAG_DATA,
             )
-            self.update_idletasks()
 
         # plot latest relative position with accuracy radius
         x, y = self._canvas.d2xy(hdg, dis / self._scale_c)
@@ -20,6 +20,20 @@ from pyrtcm import RTCMMessage
 from pygpsclient.dialog_state import DLGTSERVER
 
 
+def arp_position(parsed: RTCMMessage) -> tuple:
+    """
+    Get base station Antenna Reference Point from RTCM 1005/1006 message.
+
+    :param RTCMMessage parsed: 1005/1006 message
+    :return: tuple of (ecefx, ecefy, ecefz, lat, lon, hae)
+    :rtype: tuple
+    :raises: AttributeError if not a valid 1005/1006 message
+    """
+
+    ecefx, ecefy, ecefz = parsed.DF025, parsed.DF026, parsed.DF027
+    return (ecefx, ecefy, ecefz) + tuple(ecef2llh(ecefx, ecefy, ecefz))
+
+
 class RTCM3Handler:
     """
     RTCM3 handler class.
@@ -66,11 +80,11 @@ class RTCM3Handler:
         """
 
         try:
+            ecefx, ecefy, ecefz, lat2, lon2, _ = arp_position(parsed)
             self.__app.gnss_status.diff_station = parsed.DF003
-            self.__app.gnss_status.base_ecefx = parsed.DF025
-            self.__app.gnss_status.base_ecefy = parsed.DF026
-            self.__app.gnss_status.base_ecefz = parsed.DF027
-            lat2, lon2, _ = ecef2llh(parsed.DF025, parsed.DF026, parsed.DF027)
+            self.__app.gnss_status.base_ecefx = ecefx
+            self.__app.gnss_status.base_ecefy = ecefy
+            self.__app.gnss_status.base_ecefz = ecefz
             self.__app.gnss_status.rel_pos_length = (
                 haversine(
                     self.__app.gnss_status.lat,
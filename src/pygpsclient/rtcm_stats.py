@@ -0,0 +1,278 @@
+"""
+rtcm_stats.py
+
+Per-message-type RTCM3 statistics engine.
+
+Tracks count, mean interval, maximum gap, byte throughput and (for MSM
+messages) satellite and signal counts for each RTCM3 message type, per
+source (e.g. the GNSS receiver stream or NTRIP input). Statistics are
+derived from the raw frame header, so no RTCM3 parsing is required, and
+each update is O(1) - intervals and frame sizes are held in fixed-size
+ring buffers with running totals.
+
+Actual intervals can be compared with the expected intervals in an NTRIP
+sourcetable RTCM types entry e.g. "1005(10),1077(1)", to identify late
+or missing messages.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+from threading import Lock
+from time import monotonic
+
+RINGSIZE = 30  # intervals retained per message type
+LATEFACTOR = 2  # message is late if not seen within LATEFACTOR * expected interval
+MSMRANGES = (  # MSM message number ranges (GPS, GLO, GAL, SBS, QZS, BDS, NAVIC)
+    range(1071, 1078),
+    range(1081, 1088),
+    range(1091, 1098),
+    range(1101, 1108),
+    range(1111, 1118),
+    range(1121, 1128),
+    range(1131, 1138),
+)
+OK = "OK"
+LATE = "LATE"
+MISSING = "MISSING"
+
+
+def rtcm_identity(raw: bytes) -> str:
+    """
+    Get RTCM3 message identity from raw frame header, in the same form
+    as pyrtcm e.g. "1077" or "4072_0".
+
+    :param bytes raw: raw RTCM3 frame
+    :return: identity, or None if not an RTCM3 frame
+    :rtype: str
+    """
+
+    if len(raw) < 6 or raw[0] != 0xD3:
+        return None
+    msgnum = int.from_bytes(raw[3:5], "big") >> 4
+    if msgnum == 4072:  # u-blox proprietary, identified by subtype
+        return f"4072_{int.from_bytes(raw[4:6], 'big') & 0xFFF}"
+    return str(msgnum)
+
+
+def msm_counts(raw: bytes) -> tuple:
+    """
+    Get number of satellites and signals from raw RTCM3 MSM frame header.
+
+    :param bytes raw: raw RTCM3 frame
+    :return: tuple of (nsat, nsig), or (None, None) if not an MSM frame
+    :rtype: tuple
+    """
+
+    msgnum = int.from_bytes(raw[3:5], "big") >> 4 if len(raw) > 5 else 0
+    if len(raw) < 31 or not any(msgnum in rng for rng in MSMRANGES):
+        return None, None
+    # payload (from byte 3) header bits 0-72 (DF002 to DF418) precede
+    # satellite mask DF394 (64 bits) and signal mask DF395 (32 bits), so
+    # masks occupy bits 1-96 of the 104-bit window raw[12:25]
+    masks = (int.from_bytes(raw[12:25], "big") >> 7) & ((1 << 96) - 1)
+    nsat = bin(masks >> 32).count("1")
+    nsig = bin(masks & 0xFFFFFFFF).count("1")
+    return nsat, nsig
+
+
+def parse_rtcmstr(rtcmstr: str) -> dict:
+    """
+    Parse NTRIP sourcetable RTCM types entry e.g. "1005(10),1077(1)".
+
+    :param str rtcmstr: RTCM types entry
+    :return: dict of {identity: expected interval in seconds}
+    :rtype: dict
+    """
+
+    expected = {}
+    for item in rtcmstr.split(","):
+        ident, _, intv = item.strip().partition("(")
+        if not ident:
+            continue
+        try:
+            expected[ident] = float(intv.rstrip(")"))
+        except ValueError:
+            expected[ident] = None  # interval not specified
+    return expected
+
+
+class RTCMTypeStats:
+    """
+    Statistics for a single RTCM3 message type from a single source.
+    """
+
+    def __init__(self, ringsize: int = RINGSIZE):
+        """
+        Constructor.
+
+        :param int ringsize: number of intervals retained
+        """
+
+        self.count = 0
+        self.nbytes = 0
+        self.last = None
+        self.maxgap = 0
+        self.nsat = None
+        self.nsig = None
+        self._ring = [(0.0, 0)] * ringsize  # (interval, frame size)
+        self._idx = 0
+        self._n = 0
+        self._sumintv = 0.0
+        self._sumsize = 0
+
+    def update(self, now: float, size: int, nsat: int = None, nsig: int = None):
+        """
+        Update statistics with new message.
+
+        :param float now: monotonic arrival time
+        :param int size: frame size in bytes
+        :param int nsat: number of MSM satellites (optional)
+        :param int nsig: number of MSM signals (optional)
+        """
+
+        self.count += 1
+        self.nbytes += size
+        if nsat is not None:
+            self.nsat, self.nsig = nsat, nsig
+        if self.last is not None:
+            interval = now - self.last
+            self.maxgap = max(self.maxgap, interval)
+            oldintv, oldsize = self._ring[self._idx]
+            self._ring[self._idx] = (interval, size)
+            self._idx = (self._idx + 1) % len(self._ring)
+            self._sumintv += interval - oldintv
+            self._sumsize += size - oldsize
+            self._n = min(self._n + 1, len(self._ring))
+        self.last = now
+
+    @property
+    def interval(self) -> float:
+        """
+        Getter for mean interval over ring buffer.
+
+        :return: mean interval in seconds, or None if < 2 messages
+        :rtype: float
+        """
+
+        return self._sumintv / self._n if self._n else None
+
+    @property
+    def throughput(self) -> float:
+        """
+        Getter for byte throughput over ring buffer.
+
+        :return: bytes per second, or None if < 2 messages
+        :rtype: float
+        """
+
+        return self._sumsize / self._sumintv if self._sumintv > 0 else None
+
+
+class RTCMStats:
+    """
+    RTCM3 statistics engine.
+
+    NB: update() may be called from the NTRIP client thread in
+    correction passthrough mode.
+    """
+
+    def __init__(self, ringsize: int = RINGSIZE):
+        """
+        Constructor.
+
+        :param int ringsize: number of intervals retained per message type
+        """
+
+        self._ringsize = ringsize
+        self._lock = Lock()
+        self._types = {}  # (source, identity): RTCMTypeStats
+
+    def reset(self):
+        """
+        Clear all statistics.
+        """
+
+        with self._lock:
+            self._types = {}
+
+    def update(self, raw: bytes, source: str = ""):
+        """
+        Update statistics from raw frame. Non-RTCM3 frames are ignored.
+
+        :param bytes raw: raw frame
+        :param str source: data source e.g. "GNSS", "NTRIP"
+        """
+
+        identity = rtcm_identity(raw)
+        if identity is None:
+            return
+        nsat, nsig = msm_counts(raw)
+        now = monotonic()
+        with self._lock:
+            stats = self._types.get((source, identity), None)
+            if stats is None:
+                stats = self._types[(source, identity)] = RTCMTypeStats(self._ringsize)
+            stats.update(now, len(raw), nsat, nsig)
+
+    def stats(self, rtcmstr: str = "") -> list:
+        """
+        Get statistics for each message type, compared with expected
+        intervals from NTRIP sourcetable RTCM types entry (if provided).
+
+        :param str rtcmstr: sourcetable RTCM types entry e.g. "1005(10),1077(1)"
+        :return: list of dicts with keys "identity", "source", "count",
+            "expected", "interval", "maxgap", "age", "throughput", "nsat",
+            "nsig", "status", sorted by identity and source
+        :rtype: list
+        """
+
+        expected = parse_rtcmstr(rtcmstr) if rtcmstr else {}
+        now = monotonic()
+        rows = []
+        seen = set()
+        with self._lock:
+            for (source, identity), stats in self._types.items():
+                seen.add(identity)
+                exp = expected.get(identity, None)
+                age = now - stats.last
+                if identity in expected and exp is not None:
+                    status = LATE if age > exp * LATEFACTOR else OK
+                else:
+                    status = ""
+                rows.append(
+                    {
+                        "identity": identity,
+                        "source": source,
+                        "count": stats.count,
+                        "expected": exp,
+                        "interval": stats.interval,
+                        "maxgap": stats.maxgap,
+                        "age": age,
+                        "throughput": stats.throughput,
+                        "nsat": stats.nsat,
+                        "nsig": stats.nsig,
+                        "status": status,
+                    }
+                )
+        for identity, exp in expected.items():
+            if identity not in seen:
+                rows.append(
+                    {
+                        "identity": identity,
+                        "source": "",
+                        "count": 0,
+                        "expected": exp,
+                        "interval": None,
+                        "maxgap": None,
+                        "age": None,
+                        "throughput": None,
+                        "nsat": None,
+                        "nsig": None,
+                        "status": MISSING,
+                    }
+                )
+        return sorted(rows, key=lambda row: (row["identity"], row["source"]))
@@ -0,0 +1,106 @@
+"""
+rtcmstats_frame.py
+
+RTCM3 Statistics frame for PyGPSClient application.
+
+Shows count, mean interval, maximum gap, age, byte throughput and MSM
+satellite/signal counts for each RTCM3 message type received from the
+GNSS receiver or NTRIP input. While the NTRIP caster is running, actual
+intervals are compared with the expected intervals in the caster's
+sourcetable RTCM types entry, and late or missing messages highlighted.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+from tkinter import Frame
+
+from pygpsclient.globals import ERRCOL, INFOCOL, WIDGETU6
+from pygpsclient.rtcm_stats import LATE, MISSING
+from pygpsclient.strings import DLGWAITRTCM
+from pygpsclient.table_frame import TableFrame
+
+
+def _sec(val: float) -> str:
+    """
+    Format interval in seconds.
+
+    :param float val: interval in seconds
+    :return: formatted interval
+    :rtype: str
+    """
+
+    return "-" if val is None else f"{val:.1f}"
+
+
+class RTCMStatsFrame(TableFrame):  # pylint: disable=too-many-ancestors
+    """
+    RTCM3 Statistics frame class.
+    """
+
+    HEADER = ("Type", "Src", "N", "Exp", "Act", "Gap", "Age", "B/s", "Sat/Sig", "")
+    COLS = (0, 0.1, 0.2, 0.3, 0.38, 0.48, 0.58, 0.68, 0.78, 0.9)
+    SIZE = WIDGETU6
+
+    def __init__(self, app: Frame, parent: Frame, *args, **kwargs):
+        """
+        Constructor.
+
+        :param Frame app: reference to main tkinter application
+        :param Frame parent: reference to parent frame
+        :param args: optional args to pass to Frame parent class
+        :param kwargs: optional kwargs to pass to Frame parent class
+        """
+
+        self.__app = app  # Reference to main application class
+
+        super().__init__(app, parent, *args, **kwargs)
+
+    def _buttons(self) -> tuple:
+        """
+        Get command buttons.
+
+        :return: tuple of (text, command)
+        :rtype: tuple
+        """
+
+        return (("Reset", self._on_reset),)
+
+    def update_frame(self):
+        """
+        Update statistics table.
+        """
+
+        # expected intervals only apply while NTRIP caster is running
+        if self.__app.server_status >= 0 and self.__app.configuration.get("sockmode_b"):
+            rtcmstr = self.__app.ntriprtcmstr
+        else:
+            rtcmstr = ""
+        rows = []
+        for row in self.__app.rtcm_stats.stats(rtcmstr):
+            thru = row["throughput"]
+            vals = (
+                row["identity"],
+                row["source"],
+                row["count"],
+                _sec(row["expected"]),
+                _sec(row["interval"]),
+                _sec(row["maxgap"]),
+                _sec(row["age"]),
+                "-" if thru is None else f"{thru:.0f}",
+                "-" if row["nsat"] is None else f"{row['nsat']}/{row['nsig']}",
+                row["status"],
+            )
+            rows.append((vals, ERRCOL if row["status"] in (LATE, MISSING) else INFOCOL))
+        self.draw_rows(rows, DLGWAITRTCM)
+
+    def _on_reset(self):
+        """
+        Reset RTCM3 statistics.
+        """
+
+        self.__app.rtcm_stats.reset()
+        self.init_frame()
@@ -67,6 +67,7 @@ from pygpsclient.globals import (
 from pygpsclient.helpers import (
     get_point_at_vector,
     ll2xy,
+    ll2xy_batch,
     point_in_bounds,
     reorder_range,
     xy2ll,
@@ -486,12 +487,19 @@ class ScatterViewFrame(Frame):
         if not self._points:
             return
 
-        lp = len(self._points) - 1
-        for i, pnt in enumerate(self._points):
-            if i == lp:
-                break
-            self._draw_point(pnt, PNTCOL)
-            self.update_idletasks()
+        # transform all visible points in one batch
+        pnts = [pnt for pnt in self._points[:-1] if point_in_bounds(self._bounds, pnt)]
+        xy = ll2xy_batch(
+            self.width,
+            self.height,
+            self._bounds,
+            [pnt.lat for pnt in pnts],
+            [pnt.lon for pnt in pnts],
+        )
+        for x, y in zip(xy[0::2], xy[1::2]):
+            self._canvas.create_circle(
+                x, y, 2, fill=PNTCOL, outline=PNTCOL, tags=TAG_DATA
+            )
         if self._fixed is not None:
             self._draw_point(self._fixed, FIXCOL, 3)
         self._draw_point(self._points[-1], PNTTOPCOL)
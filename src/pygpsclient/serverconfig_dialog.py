@@ -24,6 +24,7 @@ from pathlib import Path
 from tkinter import (
     DISABLED,
     EW,
+    LEFT,
     NORMAL,
     NSEW,
     BooleanVar,
@@ -152,6 +153,7 @@ POS_ECEF = "ECEF"
 POS_LLH = "LLH"
 PQTMVER = "PQTMVER"
 POSMODES = (POS_LLH, POS_ECEF)
+MAXCLIENTLINES = 5  # maximum number of clients listed individually
 SOCK_NTRIP = "NTRIP CASTER"
 SOCK_SERVER = "SOCKET SERVER"
 SOCKMODES = (SOCK_SERVER, SOCK_NTRIP)
@@ -274,6 +276,12 @@ class ServerConfigDialog(ToplevelDialog):
             relief="sunken",
             width=6,
         )
+        self._lbl_clients = Label(
+            self._frm_basic,
+            text="",
+            justify=LEFT,
+            anchor=W,
+        )
         self._btn_toggle = Button(
             self._frm_basic,
             command=self._on_toggle_advanced,
@@ -439,6 +447,7 @@ class ServerConfigDialog(ToplevelDialog):
         self._lbl_publicip.grid(column=1, row=4, padx=2, pady=1, sticky=W)
         self._lbl_lanipl.grid(column=2, row=4, padx=2, pady=1, sticky=W)
         self._lbl_lanip.grid(column=3, row=4, padx=2, pady=1, sticky=W)
+        self._lbl_clients.grid(column=0, row=5, columnspan=5, padx=2, pady=1, sticky=W)
         self._btn_toggle.grid(column=4, row=0, sticky=E)
         self._frm_advanced.grid_forget()
         self._lbl_configure_base.grid(column=0, row=0, padx=2, pady=2, sticky=W)
@@ -687,6 +696,26 @@ class ServerConfigDialog(ToplevelDialog):
                 state = NORMAL
             wid.config(state=state)
         self._lbl_elapsed.config(text="")
+        if not self._socket_serve.get():
+            self._lbl_clients.config(text="")
+
+    def update_clients(self, clients: list):
+        """
+        Display socket client statistics, slowest clients first.
+
+        :param list clients: list of ClientStats
+        """
+
+        if not self._socket_serve.get():
+            return
+        tx = sum(cls.bytes for cls in clients)
+        skipped = sum(cls.skipped for cls in clients)
+        lines = [f"Clients: {len(clients)}; tx {tx/1000:,.1f} kB; skipped {skipped:,}"]
+        slowest = sorted(clients, key=lambda cls: cls.avglatency, reverse=True)
+        lines += [str(cls) for cls in slowest[:MAXCLIENTLINES]]
+        if len(clients) > MAXCLIENTLINES:
+            lines.append(f"... {len(clients) - MAXCLIENTLINES} more")
+        self._lbl_clients.config(text="\n".join(lines))
 
     def _on_configure_base(self, *args, **kwargs):  # pylint: disable=unused-argument
         """
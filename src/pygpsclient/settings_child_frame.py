@@ -39,6 +39,7 @@ from tkinter import (
 
 from PIL import Image, ImageTk
 
+from pygpsclient.correction_capture import CAPEXT
 from pygpsclient.globals import (
     BPSRATES,
     CLICK_CURSOR,
@@ -99,13 +100,14 @@ from pygpsclient.strings import (
     LBLNMEACONFIG,
     LBLNTRIPCONFIG,
     LBLPROTDISP,
+    LBLRINEXLOG,
     LBLSERVERCONFIG,
     LBLTRACKRECORD,
     LBLTTYCONFIG,
     LBLUBXCONFIG,
 )
 
-MAXLINES = ("200", "500", "1000", "2000", "100")
+MAXLINES = ("200", "500", "1000", "2000", "5000", "10000", "100")
 FILEDELAYS = (2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
 
 
@@ -149,6 +151,7 @@ class SettingsChildFrame(Frame):
         self._degrees_format = StringVar()
         self._console_format = StringVar()
         self._datalog = IntVar()
+        self._rinexlog = IntVar()
         self._logformat = StringVar()
         self._record_track = IntVar()
         self._record_database = IntVar()
@@ -359,6 +362,11 @@ class SettingsChildFrame(Frame):
             textvariable=self._logformat,
             state=READONLY,
         )
+        self._chk_rinexlog = Checkbutton(
+            self._frm_options,
+            text=LBLRINEXLOG,
+            variable=self._rinexlog,
+        )
         self._chk_recordtrack = Checkbutton(
             self._frm_options,
             text=LBLTRACKRECORD,
@@ -485,7 +493,8 @@ class SettingsChildFrame(Frame):
         self._lbl_filedelay.grid(column=2, row=6, padx=2, pady=2, sticky=E)
         self._spn_filedelay.grid(column=3, row=6, padx=2, pady=2, sticky=W)
         self._chk_datalog.grid(column=0, row=8, padx=2, pady=2, sticky=W)
-        self._spn_datalog.grid(column=1, row=8, columnspan=3, padx=2, pady=2, sticky=W)
+        self._spn_datalog.grid(column=1, row=8, columnspan=2, padx=2, pady=2, sticky=W)
+        self._chk_rinexlog.grid(column=3, row=8, padx=2, pady=2, sticky=W)
         self._chk_recordtrack.grid(
             column=0, row=9, columnspan=2, padx=2, pady=2, sticky=W
         )
@@ -533,6 +542,7 @@ class SettingsChildFrame(Frame):
         self._colortag.trace_update(tracemode, self._on_update_colortag, add)
         self._logformat.trace_update(tracemode, self._on_update_logformat, add)
         self._datalog.trace_update(tracemode, self._on_data_log, add)
+        self._rinexlog.trace_update(tracemode, self._on_rinex_log, add)
         self._record_track.trace_update(tracemode, self._on_record_track, add)
         self._record_database.trace_update(tracemode, self._on_record_database, add)
 
@@ -560,6 +570,7 @@ class SettingsChildFrame(Frame):
         self._console_format.set(cfg.get("consoleformat_s"))
         self._logformat.set(cfg.get("logformat_s"))
         self._datalog.set(cfg.get("datalog_b"))
+        self._rinexlog.set(cfg.get("rinexlog_b"))
         self.logpath = cfg.get("logpath_s")
         self._record_track.set(cfg.get("recordtrack_b"))
         self.trackpath = cfg.get("trackpath_s")
@@ -748,6 +759,33 @@ class SettingsChildFrame(Frame):
             self.__app.status_label = ("Data logging disabled", INFOCOL)
             self._spn_datalog.config(state=READONLY)
 
+    def _on_rinex_log(self, var, index, mode):
+        """
+        Start or stop real-time RINEX logger.
+        """
+
+        if self._rinexlog.get() == 1:
+            if self.logpath in ("", None):
+                self.logpath = self.__app.file_handler.set_logfile_path()
+            if self.logpath is not None:
+                self.__app.configuration.set("rinexlog_b", 1)
+                self.__app.configuration.set("logpath_s", self.logpath)
+                self.__app.status_label = (
+                    f"RINEX logging enabled: {self.logpath}",
+                    INFOCOL,
+                )
+                if not self.__app.file_handler.open_rinexlog():
+                    self.__app.configuration.set("rinexlog_b", 0)
+                    self._rinexlog.set(0)
+            else:
+                self.logpath = ""
+                self._rinexlog.set(0)
+        else:
+            self.__app.configuration.set("rinexlog_b", 0)
+            self._rinexlog.set(0)
+            self.__app.file_handler.close_rinexlog(False)
+            self.__app.status_label = ("RINEX logging disabled", INFOCOL)
+
     def _on_record_track(self, var, index, mode):
         """
         Start or stop track recorder.
@@ -838,6 +876,7 @@ class SettingsChildFrame(Frame):
                 (
                     ("datalog files", "*.log"),
                     ("u-center logs", "*.ubx"),
+                    ("capture files", f"*.{CAPEXT}"),
                     ("all files", "*.*"),
                 ),
             )
@@ -15,7 +15,7 @@ Created on 24 Dec 2025
 
 # pylint: disable=no-member, unused-variable, duplicate-code
 
-from tkinter import ALL, NSEW, NW, SE, Frame, N, S, font
+from tkinter import ALL, NSEW, NW, SE, Frame, N, S
 
 from pyubx2 import CORRSOURCE, SIGID, UBXMessage
 
@@ -26,6 +26,7 @@ from pygpsclient.canvas_subclasses import (
     TAG_XLABEL,
     TAG_YLABEL,
     CanvasGraph,
+    CanvasItemPool,
 )
 from pygpsclient.globals import (
     BGCOL,
@@ -91,6 +92,10 @@ class SignalsviewFrame(Frame):
         self._pending_confs = {}
         self._waits = 0
         self._waiting = True
+        self._xfnt = None
+        self._xfntkey = None
+        self._csfnt = None
+        self._csfntkey = None
         self._body()
         self._attach_events()
         self.enable_messages(True)
@@ -106,6 +111,7 @@ class SignalsviewFrame(Frame):
             self.__app, self, width=self.width, height=self.height, bg=BGCOL
         )
         self._canvas.grid(column=0, row=0, sticky=NSEW)
+        self._pool = CanvasItemPool(self._canvas)
 
     def _attach_events(self):
         """
@@ -196,6 +202,7 @@ class SignalsviewFrame(Frame):
 
         self.__app.gnss_status.sig_data = []
         self._canvas.delete(ALL)
+        self._pool.clear()
         self.update_frame()
 
     def init_frame(self):
@@ -218,6 +225,8 @@ class SignalsviewFrame(Frame):
             fontscale=FONTSCALELG,
             tags=tags,
         )
+        if self._redraw:
+            self._pool.lift()
         self._redraw = False
 
     def _draw_legend(self):
@@ -229,40 +238,42 @@ class SignalsviewFrame(Frame):
         h = self.height / 18
 
         # gnssid color code legend
-        lgfont = font.Font(size=int(min(self.width / 2, self.height) / FONTSCALELG))
-        for i, (_, (gnssName, gnssCol)) in enumerate(GNSS_LIST.items()):
+        lgfont = self._canvas.sized_font(
+            int(min(self.width / 2, self.height) / FONTSCALELG)
+        )
+        for i, (gnssId, (gnssName, gnssCol)) in enumerate(GNSS_LIST.items()):
             x = (self._canvas.xoffl * 2) + w * i
-            self._canvas.create_rectangle(
-                x,
-                self._canvas.yofft,
-                x + w - 5,
-                self._canvas.yofft + h,
+            self._pool.draw(
+                ("legend", gnssId),
+                "rectangle",
+                (x, self._canvas.yofft, x + w - 5, self._canvas.yofft + h),
                 outline=GRIDMAJCOL,
                 fill=gnssCol,
                 width=OL_WID,
-                tags=TAG_XLABEL,
             )
-            self._canvas.create_text(
-                (x + x + w - 5) / 2,
-                self._canvas.yofft + h / 2,
+            self._pool.draw(
+                ("legend", gnssId),
+                "text",
+                ((x + x + w - 5) / 2, self._canvas.yofft + h / 2),
                 text=gnssName,
                 fill=col2contrast(gnssCol),
                 font=lgfont,
-                tags=TAG_XLABEL,
             )
 
         # correction source legend
-        xfnt, _, _, _ = fitfont(
-            CL, self.width / 2 - self._canvas.xoffl, h / 2, maxsiz=12
-        )
-        self._canvas.create_text(
-            self.width / 2,
-            self._canvas.yofft + 1,
+        if (self.width, h) != self._csfntkey:
+            self._csfnt, _, _, _ = fitfont(
+                CL, self.width / 2 - self._canvas.xoffl, h / 2, maxsiz=12
+            )
+            self._csfntkey = (self.width, h)
+        self._pool.draw(
+            ("legend", "corrsource"),
+            "text",
+            (self.width / 2, self._canvas.yofft + 1),
             text=f"Correction Source:\n{CSLEG}",
             fill=FGCOL,
-            font=xfnt,
+            font=self._csfnt,
             anchor=NW,
-            tags=TAG_DATA,
         )
 
     def update_frame(self):
@@ -291,56 +302,66 @@ class SignalsviewFrame(Frame):
 
         offset = self._canvas.xoffl
         colwidth = (w - self._canvas.xoffl - self._canvas.xoffr + 1) / siv
-        xfnt, _, _, _ = fitfont(
-            XLBLFMT,
-            colwidth * 1.66,
-            self._canvas.yoffb,
-            XLBLANGLE,
-        )
+        # only refit label font if column width has changed
+        if (colwidth, self._canvas.yoffb) != self._xfntkey:
+            self._xfnt, _, _, _ = fitfont(
+                XLBLFMT,
+                colwidth * 1.66,
+                self._canvas.yoffb,
+                XLBLANGLE,
+            )
+            self._xfntkey = (colwidth, self._canvas.yoffb)
+        # reuse existing canvas items keyed on (gnssId, svid, sigid)
+        self._pool.start()
         for val in sorted(data.values()):  # sort by ascending gnssid, svid, sigid
             gnssId, prn, sigid, cno, corrsource, quality, flags, _ = val
             if cno == 0 and not show_unused:
                 continue
+            key = (gnssId, prn, sigid)
             sig = SIGID.get((gnssId, sigid), sigid)
             snr_y = int(cno) * (h - self._canvas.yoffb - 1) / MAX_SNR
             _, ol_col = GNSS_LIST[gnssId]
             prn = f"{int(prn):02}"
-            self._canvas.create_rectangle(
-                offset,
-                h - self._canvas.yoffb - 1,
-                offset + colwidth - OL_WID,
-                h - self._canvas.yoffb - snr_y - 1,
+            self._pool.draw(
+                key,
+                "rectangle",
+                (
+                    offset,
+                    h - self._canvas.yoffb - 1,
+                    offset + colwidth - OL_WID,
+                    h - self._canvas.yoffb - snr_y - 1,
+                ),
                 outline=GRIDMAJCOL,
                 fill=ol_col,
                 width=OL_WID,
-                tags=TAG_DATA,
             )
             # xlabel prn - sigid
-            self._canvas.create_text(
-                offset + colwidth,
-                h - self._canvas.yoffb + 3,
+            self._pool.draw(
+                key,
+                "text",
+                (offset + colwidth, h - self._canvas.yoffb + 3),
                 text=f"{prn} {sig}",
                 fill=FGCOL,
-                font=xfnt,
+                font=self._xfnt,
                 angle=XLBLANGLE,
                 anchor=SE,
-                tags=TAG_DATA,
             )
             # xcaption corrsource if > 0
             if corrsource:
-                self._canvas.create_text(
-                    offset + colwidth / 2,
-                    h - self._canvas.yoffb - snr_y + 2,
+                self._pool.draw(
+                    key,
+                    "text",
+                    (offset + colwidth / 2, h - self._canvas.yoffb - snr_y + 2),
                     text=corrsource,
                     fill=col2contrast(ol_col),
-                    font=xfnt,
+                    font=self._xfnt,
                     anchor=N,
-                    tags=TAG_DATA,
                 )
             offset += colwidth
 
         if self.__app.configuration.get("legend_b"):
             self._draw_legend()
+        self._pool.purge()
         self.update_idletasks()
 
     def _on_resize(self, event):  # pylint: disable=unused-argument
@@ -18,11 +18,11 @@ from tkinter import NSEW, Frame
 
 from pygpsclient.canvas_subclasses import (
     MODE_CEL,
-    TAG_DATA,
     TAG_GRID,
     TAG_WAIT,
     TAG_XLABEL,
     CanvasCompass,
+    CanvasItemPool,
 )
 from pygpsclient.globals import (
     BGCOL,
@@ -83,6 +83,7 @@ class SkyviewFrame(Frame):
             bg=self.bg_col,
         )
         self._canvas.grid(column=0, row=0, sticky=NSEW)
+        self._pool = CanvasItemPool(self._canvas)
 
     def _attach_events(self):
         """
@@ -102,6 +103,8 @@ class SkyviewFrame(Frame):
             fontscale=FONTSCALE,
             tags=tags,
         )
+        if self._redraw:
+            self._pool.lift()
         self._redraw = False
 
     def update_frame(self):
@@ -119,36 +122,43 @@ class SkyviewFrame(Frame):
         self._waiting = False
         self.init_frame()
 
+        sats = []
         for val in sorted(data.values(), key=lambda x: x[4]):  # sort by ascending C/N0
             try:
                 gnssId, prn, ele, azi, cno, _ = val
                 if ele in ("", None) or azi in ("", None):
                     continue
-                x, y = self._canvas.d2xy(int(azi), int(ele))
-                _, ol_col = GNSS_LIST[gnssId]
-                prn = f"{int(prn):02}"
-                bg_col = snr2col(cno)
-                self._canvas.create_circle(
-                    x,
-                    y,
-                    self._canvas.maxr / 10,
-                    outline=ol_col,
-                    fill=bg_col,
-                    width=OL_WID,
-                    tags=TAG_DATA,
-                )
-                self._canvas.create_text(
-                    x,
-                    y,
-                    text=prn,
-                    fill=col2contrast(bg_col),
-                    font=self._canvas.font,
-                    tags=TAG_DATA,
-                )
+                sats.append((gnssId, int(prn), int(ele), int(azi), cno))
             except ValueError:
                 pass
-
-            self.update_idletasks()
+        # transform all satellite positions in one batch
+        xy = self._canvas.d2xy_batch([sat[3] for sat in sats], [sat[2] for sat in sats])
+
+        # reuse existing canvas items keyed on (gnssId, svid)
+        self._pool.start()
+        r = self._canvas.maxr / 10
+        for (gnssId, prn, _, _, cno), x, y in zip(sats, xy[0::2], xy[1::2]):
+            _, ol_col = GNSS_LIST[gnssId]
+            bg_col = snr2col(cno)
+            self._pool.draw(
+                (gnssId, prn),
+                "oval",
+                (x - r, y - r, x + r, y + r),
+                outline=ol_col,
+                fill=bg_col,
+                width=OL_WID,
+            )
+            self._pool.draw(
+                (gnssId, prn),
+                "text",
+                (x, y),
+                text=f"{prn:02}",
+                fill=col2contrast(bg_col),
+                font=self._canvas.font,
+            )
+
+        self._pool.purge()
+        self.update_idletasks()
 
     def _on_resize(self, event):  # pylint: disable=unused-argument
         """
@@ -0,0 +1,482 @@
+"""
+socket_fanout.py
+
+Fan-out layer for the socket server / NTRIP caster.
+
+Each raw frame read from the GNSS connection is time-stamped once and
+appended by reference (i.e. without copying) to a bounded queue belonging
+to each connected client. Each client has its own writer, so a slow client
+never delays the others. If a client's queue fills up, it is handled
+according to the slow client policy:
+
+- "drop" - the client is disconnected.
+- "skip" - the oldest queued frames are discarded (the client sees a
+  gap in the data stream but remains connected).
+
+Per-client statistics (bytes and frames sent, frames skipped, queue depth
+and latency from receipt to transmission) are maintained for display.
+
+FanoutSocketServer and FanoutClientHandler(TLS) adapt the
+pygnssutils thread-per-client SocketServer to use the fan-out
+layer rather than a fixed pool of unbounded client queues. In NTRIP
+caster mode, additional mountpoints (each with their own fan-out
+layer) may be published alongside the default mountpoint.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import logging
+from collections import deque
+from socket import SHUT_RDWR
+from socketserver import StreamRequestHandler
+from ssl import CERT_OPTIONAL, PROTOCOL_TLS, SSLContext
+from threading import Condition, Lock
+from time import monotonic, time
+
+from pygnssutils.globals import CONNECTED, DISCONNECTED, PYGPSMP
+from pygnssutils.socket_server import BAD, RTCM, ClientHandler, SocketServer
+
+from pygpsclient.ntrip_caster import Mountpoint, ntrip_response
+
+CLIENTQUEUESIZE = 256  # maximum frames queued per client
+CLIENTTIMEOUT = 10  # seconds to wait for a blocked client write
+SLOWCLIENT_DROP = "drop"
+SLOWCLIENT_SKIP = "skip"
+SLOWCLIENTPOLICIES = (SLOWCLIENT_DROP, SLOWCLIENT_SKIP)
+WRITEBATCH = 64  # maximum frames written per client wake-up
+
+
+class ClientStats:
+    """
+    Socket client statistics.
+    """
+
+    def __init__(self, address: tuple):
+        """
+        Constructor.
+
+        :param tuple address: client address (host, port)
+        """
+
+        self.address = address
+        self.connected = time()
+        self.bytes = 0
+        self.frames = 0
+        self.skipped = 0
+        self.queued = 0
+        self.latency = 0.0  # latest, seconds
+        self.maxlatency = 0.0  # seconds
+        self._totlatency = 0.0
+
+    def sent(self, nbytes: int, latency: float):
+        """
+        Record frame sent to client.
+
+        :param int nbytes: frame length
+        :param float latency: time from receipt to transmission in seconds
+        """
+
+        self.bytes += nbytes
+        self.frames += 1
+        self.latency = latency
+        self.maxlatency = max(self.maxlatency, latency)
+        self._totlatency += latency
+
+    @property
+    def avglatency(self) -> float:
+        """
+        Getter for average latency.
+
+        :return: average latency in seconds
+        :rtype: float
+        """
+
+        return self._totlatency / self.frames if self.frames else 0.0
+
+    def __str__(self) -> str:
+        """
+        Format statistics for display.
+
+        :return: statistics summary
+        :rtype: str
+        """
+
+        return (
+            f"{self.address[0]}:{self.address[1]} "
+            f"tx {self.bytes/1000:,.1f} kB q {self.queued} "
+            f"lat {self.avglatency*1000:,.1f}/{self.maxlatency*1000:,.1f} ms "
+            f"skip {self.skipped}"
+        )
+
+
+class ClientQueue:
+    """
+    Bounded frame queue for a single socket client.
+    """
+
+    def __init__(
+        self,
+        address: tuple,
+        maxsize: int = CLIENTQUEUESIZE,
+        policy: str = SLOWCLIENT_DROP,
+        evict: object = None,
+    ):
+        """
+        Constructor.
+
+        :param tuple address: client address (host, port)
+        :param int maxsize: maximum frames held in queue
+        :param str policy: slow client policy ("drop" or "skip")
+        :param object evict: function called when client is evicted (optional)
+        """
+
+        self.stats = ClientStats(address)
+        self._maxsize = maxsize
+        self._policy = policy
+        self._evict = evict
+        self._frames = deque()  # (raw, timestamp)
+        self._cond = Condition()
+        self.closed = False
+
+    def put(self, raw: bytes, stamp: float) -> bool:
+        """
+        Add frame to queue, applying slow client policy if full.
+
+        :param bytes raw: raw frame
+        :param float stamp: monotonic time frame was received
+        :return: False if client has been evicted, otherwise True
+        :rtype: bool
+        """
+
+        with self._cond:
+            if self.closed:
+                return False
+            if len(self._frames) >= self._maxsize:
+                if self._policy == SLOWCLIENT_DROP:
+                    self._close()
+                    return False
+                self._frames.popleft()
+                self.stats.skipped += 1
+            self._frames.append((raw, stamp))
+            self.stats.queued = len(self._frames)
+            self._cond.notify()
+        return True
+
+    def get(self, timeout: float = None) -> list:
+        """
+        Wait for and remove queued frames.
+
+        :param float timeout: maximum time to wait in seconds
+        :return: list of (raw, timestamp), empty if timed out, or None if closed
+        :rtype: list
+        """
+
+        with self._cond:
+            if not self._frames and not self.closed:
+                self._cond.wait(timeout)
+            if self.closed:
+                return None
+            batch = []
+            while self._frames and len(batch) < WRITEBATCH:
+                batch.append(self._frames.popleft())
+            self.stats.queued = len(self._frames)
+            return batch
+
+    def close(self, evict: bool = True):
+        """
+        Close queue, waking any waiting writer.
+
+        :param bool evict: call client's evict function
+        """
+
+        with self._cond:
+            if not evict:
+                self._evict = None
+            self._close()
+
+    def _close(self):
+        """
+        Close queue and evict client (lock must be held).
+        """
+
+        if self.closed:
+            return
+        self.closed = True
+        self._frames.clear()
+        self._cond.notify_all()
+        if self._evict is not None:
+            self._evict()
+
+
+class FanOut:
+    """
+    Distributes raw frames to registered client queues.
+    """
+
+    def __init__(self, maxsize: int = CLIENTQUEUESIZE, policy: str = SLOWCLIENT_DROP):
+        """
+        Constructor.
+
+        :param int maxsize: maximum frames queued per client
+        :param str policy: slow client policy ("drop" or "skip")
+        """
+
+        self.logger = logging.getLogger(__name__)
+        self.maxsize = maxsize
+        self.policy = policy if policy in SLOWCLIENTPOLICIES else SLOWCLIENT_DROP
+        self._lock = Lock()
+        self._clients = []
+
+    def register(
+        self, address: tuple, evict: object = None, queuetype: type = ClientQueue
+    ) -> ClientQueue:
+        """
+        Register new client.
+
+        :param tuple address: client address
+        :param object evict: function called if client is evicted
+        :param type queuetype: client queue class
+        :return: client queue
+        :rtype: ClientQueue
+        """
+
+        clq = queuetype(address, self.maxsize, self.policy, evict)
+        with self._lock:
+            self._clients = self._clients + [clq]
+        return clq
+
+    def unregister(self, clq: ClientQueue, evict: bool = True):
+        """
+        Unregister client.
+
+        :param ClientQueue clq: client queue
+        :param bool evict: call client's evict function
+        """
+
+        clq.close(evict)
+        with self._lock:
+            self._clients = [c for c in self._clients if c is not clq]
+
+    def publish(self, raw: bytes):
+        """
+        Add frame to every client queue.
+
+        :param bytes raw: raw frame
+        """
+
+        stamp = monotonic()
+        # registry is replaced rather than mutated, so can be iterated unlocked
+        for clq in self._clients:
+            if not clq.put(raw, stamp):
+                self.logger.info(f"Slow client {clq.stats.address} dropped")
+                self.unregister(clq)
+
+    def clear(self):
+        """
+        Unregister (and evict) all clients.
+        """
+
+        for clq in self._clients:
+            self.unregister(clq)
+
+    def stats(self) -> list:
+        """
+        Get snapshot of client statistics.
+
+        :return: list of ClientStats
+        :rtype: list
+        """
+
+        return [clq.stats for clq in self._clients]
+
+    def __len__(self) -> int:
+        """
+        Get number of registered clients.
+
+        :return: number of clients
+        :rtype: int
+        """
+
+        return len(self._clients)
+
+
+class FanoutSocketServer(SocketServer):
+    """
+    pygnssutils SocketServer using per-client bounded queues.
+    """
+
+    def __init__(
+        self,
+        app,
+        ntripmode: int,
+        maxclients: int,
+        msgqueue: object,
+        *args,
+        fanout: FanOut = None,
+        mountpoints: list = None,
+        **kwargs,
+    ):
+        """
+        Constructor.
+
+        :param object app: reference to main application class
+        :param int ntripmode: 0 = open socket server, 1 = NTRIP caster
+        :param int maxclients: maximum number of clients
+        :param Queue msgqueue: queue containing raw GNSS frames
+        :param FanOut fanout: (kwarg) fan-out layer
+        :param list mountpoints: (kwarg) list of additional Mountpoints
+        """
+        # pylint: disable=too-many-arguments
+
+        self.fanout = FanOut() if fanout is None else fanout
+        # client queues are held by the fan-out layer rather than a fixed pool
+        super().__init__(app, ntripmode, 0, msgqueue, *args, **kwargs)
+        self._maxclients = maxclients
+        self._mountpoints = {
+            PYGPSMP: Mountpoint(PYGPSMP, self.fanout, self.ntriprtcmstr)
+        }
+        for mpt in mountpoints or []:
+            self._mountpoints[mpt.name] = mpt
+
+    @property
+    def mountpoints(self) -> dict:
+        """
+        Getter for published mountpoints, with default mountpoint
+        at current receiver position.
+
+        :return: dict of {name: Mountpoint}
+        :rtype: dict
+        """
+
+        mpt = self._mountpoints[PYGPSMP]
+        mpt.lat, mpt.lon = self.latlon
+        return self._mountpoints
+
+    def server_close(self):
+        """
+        Overridden server close routine. Evicts all connected clients,
+        so their handler threads do not remain waiting on the fan-out.
+        """
+
+        for mpt in self._mountpoints.values():
+            mpt.fanout.clear()
+        super().server_close()
+
+    def _read_thread(self, stopmqread, msgqueue, clientqueues):
+        """
+        THREADED
+        Read from main GNSS message queue and fan out to client queues.
+
+        :param Event stopmqread: stop event for mq read thread
+        :param Queue msgqueue: input message queue
+        :param list clientqueues: not used
+        """
+
+        while not stopmqread.is_set():
+            raw = msgqueue.get()
+            if raw is not None:
+                self.fanout.publish(raw)
+
+
+class FanoutClientHandler(ClientHandler):
+    """
+    Socket client handler which writes from its own fan-out queue.
+    """
+
+    def setup(self, *args, **kwargs):
+        """
+        Overridden client handler setup routine.
+        Registers client with fan-out layer.
+        """
+
+        self.request.settimeout(CLIENTTIMEOUT)
+        self._fanout = self.server.fanout
+        self._msgqueue = self._fanout.register(self.client_address, self._evict)
+        self._allowed = True
+        self.server.notify(self.client_address, CONNECTED)
+        StreamRequestHandler.setup(self, *args, **kwargs)
+
+    def finish(self, *args, **kwargs):
+        """
+        Overridden client handler finish routine.
+        Unregisters client from fan-out layer.
+        """
+
+        self._fanout.unregister(self._msgqueue)
+        self.server.notify(self.client_address, DISCONNECTED)
+        try:
+            StreamRequestHandler.finish(self, *args, **kwargs)
+        except OSError:  # client already gone
+            pass
+
+    def _evict(self):
+        """
+        Unblock any pending socket write if client is evicted.
+        """
+
+        try:
+            self.request.shutdown(SHUT_RDWR)
+        except OSError:
+            pass
+
+    def _process_ntrip_request(self, data: bytes) -> tuple:
+        """
+        Overridden NTRIP client request handler. Client is moved to
+        the fan-out layer of the requested mountpoint.
+
+        :param bytes data: client request
+        :return: tuple of (response type, HTTP response)
+        :rtype: tuple
+        """
+
+        resp, mpt = ntrip_response(
+            data,
+            self.server.credentials,
+            self.server.ntripversion,
+            self.server.server_address,
+            self.server.mountpoints,
+        )
+        if mpt is None:
+            return BAD, resp
+        if mpt.fanout is not self._fanout:
+            self._fanout.unregister(self._msgqueue, False)
+            self._fanout = mpt.fanout
+            self._msgqueue = self._fanout.register(self.client_address, self._evict)
+        return RTCM, resp
+
+    def _write_from_mq(self):
+        """
+        Write queued frames to socket.
+
+        :raises: ConnectionAbortedError if client has been evicted
+        """
+
+        batch = self._msgqueue.get(CLIENTTIMEOUT)
+        if batch is None:
+            raise ConnectionAbortedError("Client evicted")
+        stats = self._msgqueue.stats
+        for raw, stamp in batch:
+            self.request.sendall(raw)
+            stats.sent(len(raw), monotonic() - stamp)
+
+
+class FanoutClientHandlerTLS(FanoutClientHandler):
+    """
+    Socket client handler with TLS (HTTPS).
+    """
+
+    def __init__(self, request, client_address, server):
+        """
+        Overridden constructor.
+        """
+
+        context = SSLContext(PROTOCOL_TLS)
+        context.load_cert_chain(certfile=server.tlspempath)
+        context.verify_mode = CERT_OPTIONAL
+        context.check_hostname = False
+        request = context.wrap_socket(request, server_side=True)
+        super().__init__(request, client_address, server)
@@ -0,0 +1,422 @@
+"""
+sourcetable_index.py
+
+NTRIP sourcetable index, disk cache and nearest mountpoint selector.
+
+SourcetableIndex parses an NTRIP sourcetable once into structured
+mountpoint entries, held in a spatial index of fixed-size latitude /
+longitude cells. Nearest-N lookups only compute the distance to
+mountpoints in cells which could contain a closer mountpoint than those
+already found, rather than computing a haversine for every entry, so
+lookups remain fast even for national casters with thousands of
+mountpoints. Lookups can be filtered by format (e.g. "RTCM 3") and
+navigation system (e.g. "GAL").
+
+SourcetableCache holds retrieved sourcetables on disk, keyed on caster
+server and port, with a configurable expiry time.
+
+MountpointSelector re-selects the nearest mountpoint whenever the rover
+has moved more than a threshold distance since the last selection.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import json
+import logging
+from hashlib import sha256
+from math import asin, cos, radians, sin
+from os import makedirs, path
+from threading import Lock
+from time import time
+
+from pynmeagps import haversine
+
+CACHEEXT = ".json"
+STCACHEEXPIRY = 24  # hours
+AUTOSELECTDIST = 10  # km
+CELLSIZE = 1.0  # spatial index cell size in degrees
+RADIUS = 6378.137  # km, as used by pynmeagps.haversine
+
+
+def _lonsep(lon: float, lon1: float, lon2: float) -> float:
+    """
+    Get longitude separation in degrees between a longitude and a
+    longitude range, allowing for wraparound at the antimeridian.
+
+    :param float lon: longitude
+    :param float lon1: start of range
+    :param float lon2: end of range
+    :return: separation in degrees (0 if within range)
+    :rtype: float
+    """
+
+    if lon1 <= lon <= lon2:
+        return 0.0
+    return min(min(sep, 360 - sep) for sep in (abs(lon - lon1), abs(lon - lon2)))
+
+
+class SourcetableIndex:
+    """
+    Spatially indexed NTRIP sourcetable.
+    """
+
+    def __init__(self, sourcetable: list = None, cellsize: float = CELLSIZE):
+        """
+        Constructor.
+
+        :param list sourcetable: sourcetable as list of entries, where \
+            entry[0] = name, [2] = format, [5] = navsys, [8] & [9] = lat/lon
+        :param float cellsize: spatial index cell size in degrees
+        """
+
+        self._cellsize = cellsize
+        self.load(sourcetable or [])
+
+    def load(self, sourcetable: list):
+        """
+        Parse and index sourcetable.
+
+        :param list sourcetable: sourcetable as list of entries
+        """
+
+        names = {}  # name: (lat, lon) or None
+        cells = {}  # (latcell, loncell): [(lat, lon, entry)]
+        for entry in sourcetable:
+            try:
+                lat, lon = float(entry[8]), float(entry[9])
+                if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                    raise ValueError
+            except (IndexError, ValueError, TypeError):
+                if len(entry) > 0:  # mountpoint has no location
+                    names.setdefault(entry[0], None)
+                continue
+            names.setdefault(entry[0], (lat, lon))
+            cells.setdefault(self._cell(lat, lon), []).append((lat, lon, entry))
+        # replace index in one step, as lookups may run in another thread
+        self._names, self._cells, self.sourcetable = names, cells, sourcetable
+
+    def __len__(self) -> int:
+        """
+        Number of mountpoints in sourcetable.
+
+        :return: number of mountpoints
+        :rtype: int
+        """
+
+        return len(self.sourcetable)
+
+    def _cell(self, lat: float, lon: float) -> tuple:
+        """
+        Get spatial index cell containing position.
+
+        :param float lat: latitude
+        :param float lon: longitude
+        :return: cell as (latcell, loncell)
+        :rtype: tuple
+        """
+
+        return int((lat + 90) // self._cellsize), int((lon + 180) // self._cellsize)
+
+    def _mindist(self, lat: float, lon: float, cell: tuple) -> float:
+        """
+        Get lower bound of distance from position to any point in cell.
+
+        :param float lat: latitude
+        :param float lon: longitude
+        :param tuple cell: cell as (latcell, loncell)
+        :return: minimum distance in km
+        :rtype: float
+        """
+
+        lat1 = cell[0] * self._cellsize - 90
+        lat2 = lat1 + self._cellsize
+        lon1 = cell[1] * self._cellsize - 180
+        dlat = max(lat1 - lat, lat - lat2, 0)
+        dlon = _lonsep(lon, lon1, lon1 + self._cellsize)
+        latmax = min(max(abs(lat), abs(lat1), abs(lat2)), 90)
+        # great circle distance >= latitude separation, and >= the
+        # longitude separation at the highest latitude in question
+        return RADIUS * max(
+            radians(dlat), 2 * asin(cos(radians(latmax)) * sin(radians(dlon) / 2))
+        )
+
+    @staticmethod
+    def _match(entry: list, fmt: str, navsys: str) -> bool:
+        """
+        Check if sourcetable entry matches format and navsys filters
+        (case-insensitive substring match e.g. "RTCM 3", "GAL").
+
+        :param list entry: sourcetable entry
+        :param str fmt: format filter or None
+        :param str navsys: navigation system filter or None
+        :return: True if entry matches
+        :rtype: bool
+        """
+
+        if fmt and fmt.upper() not in (entry[2] if len(entry) > 2 else "").upper():
+            return False
+        if (
+            navsys
+            and navsys.upper() not in (entry[5] if len(entry) > 5 else "").upper()
+        ):
+            return False
+        return True
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        count: int = 1,
+        fmt: str = None,
+        navsys: str = None,
+    ) -> list:
+        """
+        Find nearest mountpoints to position.
+
+        :param float lat: latitude
+        :param float lon: longitude
+        :param int count: maximum number of mountpoints returned
+        :param str fmt: format filter e.g. "RTCM 3" (None = all)
+        :param str navsys: navigation system filter e.g. "GAL" (None = all)
+        :return: list of (distance in km, sourcetable entry), nearest first
+        :rtype: list
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        # search rings of cells outwards from the cell containing the position
+        # until no unsearched cell could contain a closer mountpoint
+        found = []
+        ncols = round(360 / self._cellsize)
+        latcell, loncell = self._cell(lat, lon)
+        ring = 0
+        while (2 * ring + 1) ** 2 < len(self._cells) and 2 * ring + 1 < ncols:
+            for cell in self._ring(latcell, loncell, ring, ncols):
+                self._scan(cell, lat, lon, fmt, navsys, found)
+            found.sort(key=lambda item: item[0])
+            # cells in next ring are at least ring * cellsize degrees away
+            sep = radians(ring * self._cellsize)
+            latmax = radians(min(abs(lat) + (ring + 2) * self._cellsize, 90))
+            if len(found) >= count and found[count - 1][0] < RADIUS * 2 * asin(
+                cos(latmax) * sin(sep / 2)
+            ):
+                return found[:count]
+            ring += 1
+
+        # otherwise search all cells in order of minimum distance
+        found = []
+        cells = sorted((self._mindist(lat, lon, cell), cell) for cell in self._cells)
+        for mindist, cell in cells:
+            if len(found) >= count and mindist > found[count - 1][0]:
+                break  # no closer mountpoints in remaining cells
+            self._scan(cell, lat, lon, fmt, navsys, found)
+            found.sort(key=lambda item: item[0])
+        return found[:count]
+
+    def _ring(self, latcell: int, loncell: int, ring: int, ncols: int):
+        """
+        Generator for cells in square ring around cell, allowing for
+        wraparound at the antimeridian.
+
+        :param int latcell: latitude cell
+        :param int loncell: longitude cell
+        :param int ring: ring (0 = cell itself)
+        :param int ncols: number of longitude cells
+        :return: generator of cells
+        :rtype: generator
+        """
+
+        for dlat in range(-ring, ring + 1):
+            step = 1 if abs(dlat) == ring else 2 * ring
+            for dlon in range(-ring, ring + 1, max(step, 1)):
+                yield latcell + dlat, (loncell + dlon) % ncols
+
+    def _scan(
+        self, cell: tuple, lat: float, lon: float, fmt: str, navsys: str, found: list
+    ):
+        """
+        Add distances to matching mountpoints in cell to found list.
+
+        :param tuple cell: cell as (latcell, loncell)
+        :param float lat: latitude
+        :param float lon: longitude
+        :param str fmt: format filter or None
+        :param str navsys: navigation system filter or None
+        :param list found: list of (distance in km, sourcetable entry)
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        for lat2, lon2, entry in self._cells.get(cell, ()):
+            if self._match(entry, fmt, navsys):
+                found.append((haversine(lat, lon, lat2, lon2), entry))
+
+    def distance(self, lat: float, lon: float, name: str) -> float:
+        """
+        Get distance from position to named mountpoint.
+
+        :param float lat: latitude
+        :param float lon: longitude
+        :param str name: mountpoint name
+        :return: distance in km, or None if mountpoint location unknown
+        :rtype: float
+        """
+
+        pos = self._names.get(name, None)
+        if pos is None:
+            return None
+        return haversine(lat, lon, pos[0], pos[1])
+
+    def by_distance(self, lat: float, lon: float) -> list:
+        """
+        Get sourcetable sorted by distance from position, nearest first.
+        Mountpoints without a location are listed last.
+
+        :param float lat: latitude
+        :param float lon: longitude
+        :return: sourcetable as list of entries
+        :rtype: list
+        """
+
+        located = [entry for _, entry in self.nearest(lat, lon, len(self.sourcetable))]
+        return located + [
+            entry
+            for entry in self.sourcetable
+            if len(entry) > 0 and self._names.get(entry[0], None) is None
+        ]
+
+
+class SourcetableCache:
+    """
+    Disk cache for NTRIP sourcetables.
+    """
+
+    def __init__(self, cachedir: str, expiry: int = STCACHEEXPIRY * 3600):
+        """
+        Constructor.
+
+        :param str cachedir: cache directory (will be created if necessary)
+        :param int expiry: maximum age of cached sourcetable in seconds \
+            (0 = caching disabled)
+        """
+
+        self.logger = logging.getLogger(__name__)
+        self._cachedir = cachedir
+        self.expiry = expiry
+        self._lock = Lock()
+
+    def _path(self, server: str, port: int) -> str:
+        """
+        Get path of cached sourcetable.
+
+        :param str server: caster server URL
+        :param int port: caster port
+        :return: file path
+        :rtype: str
+        """
+
+        key = sha256(f"{server}:{port}".encode("utf-8")).hexdigest()
+        return path.join(self._cachedir, key + CACHEEXT)
+
+    def get(self, server: str, port: int) -> list:
+        """
+        Get cached sourcetable, if available and not expired.
+
+        :param str server: caster server URL
+        :param int port: caster port
+        :return: sourcetable as list of entries, or None
+        :rtype: list
+        """
+
+        if self.expiry <= 0:
+            return None
+        fpath = self._path(server, port)
+        with self._lock:
+            try:
+                if time() - path.getmtime(fpath) > self.expiry:
+                    return None
+                with open(fpath, "r", encoding="utf-8") as infile:
+                    sourcetable = json.load(infile)
+            except (OSError, ValueError):
+                return None
+        return sourcetable if isinstance(sourcetable, list) else None
+
+    def put(self, server: str, port: int, sourcetable: list):
+        """
+        Add sourcetable to cache.
+
+        :param str server: caster server URL
+        :param int port: caster port
+        :param list sourcetable: sourcetable as list of entries
+        """
+
+        if self.expiry <= 0:
+            return
+        with self._lock:
+            try:
+                makedirs(self._cachedir, exist_ok=True)
+                with open(self._path(server, port), "w", encoding="utf-8") as outfile:
+                    json.dump(sourcetable, outfile)
+            except OSError as err:
+                self.logger.error(f"Unable to write sourcetable cache {err}")
+
+
+class MountpointSelector:
+    """
+    Automatic nearest mountpoint selector.
+    """
+
+    def __init__(self, threshold: float = AUTOSELECTDIST):
+        """
+        Constructor.
+
+        :param float threshold: distance in km the rover must move \
+            before the nearest mountpoint is re-selected
+        """
+
+        self.threshold = threshold
+        self._lastpos = None
+
+    def reset(self):
+        """
+        Force re-selection on next update.
+        """
+
+        self._lastpos = None
+
+    def update(
+        self,
+        index: SourcetableIndex,
+        lat: float,
+        lon: float,
+        current: str = "",
+        fmt: str = None,
+    ) -> tuple:
+        """
+        Re-select nearest mountpoint if rover has moved more than the
+        threshold distance since the last selection.
+
+        :param SourcetableIndex index: sourcetable index
+        :param float lat: rover latitude
+        :param float lon: rover longitude
+        :param str current: currently selected mountpoint
+        :param str fmt: format filter e.g. "RTCM" (None = all)
+        :return: tuple of (name, distance in km) if a different mountpoint \
+            is now nearest, otherwise (None, None)
+        :rtype: tuple
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        if self._lastpos is not None:
+            if haversine(lat, lon, *self._lastpos) < self.threshold:
+                return None, None
+        nearest = index.nearest(lat, lon, 1, fmt)
+        if not nearest:
+            return None, None
+        self._lastpos = (lat, lon)
+        dist, entry = nearest[0]
+        if entry[0] == current:
+            return None, None
+        return entry[0], dist
@@ -0,0 +1,194 @@
+"""
+spartn_decoder.py
+
+Asynchronous SPARTN decoder with decoded message cache.
+
+SPARTN correction data from the MQTT and NTRIP clients is received
+undecoded (header only) and forwarded to the receiver immediately.
+Where decoded content is required for display, the raw message is
+submitted to SPARTNDecoder, which decrypts and decodes it in a worker
+thread, so that expensive OCB/HPAC decoding never blocks the tkinter
+event loop.
+
+Messages are decoded by a single worker in submission order, as pyspartn
+resolves each message's 16-bit timetag from the most recent 32-bit timetag
+of earlier messages. Decoded messages are returned in submission order.
+Recently decoded messages are cached, keyed on the raw message, decryption
+key and basedate, so identical messages (e.g. received via more than one
+correction source) are only decoded once.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+import logging
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from pyspartn import (
+    TIMEBASE,
+    SPARTNDecryptionError,
+    SPARTNMessage,
+    SPARTNMessageError,
+    SPARTNParseError,
+    SPARTNReader,
+    SPARTNTypeError,
+)
+
+from pygpsclient.globals import SPARTN_BASEDATE_CURRENT, SPARTN_BASEDATE_DATASTREAM
+
+DECODECACHE = 256  # decoded messages retained
+MAXPENDING = 500  # maximum messages awaiting decode
+
+
+def spartn_basedate(basedate: int) -> object:
+    """
+    Convert `spartnbasedate_n` configuration setting to pyspartn basedate.
+
+    :param int basedate: -1 = current datetime, 0 = use gnssTimeTag \
+        in datastream, otherwise integer gnssTimeTag
+    :return: basedate as None, TIMEBASE or int
+    :rtype: object
+    """
+
+    if basedate == SPARTN_BASEDATE_CURRENT:
+        return None  # pyspartn will interpret 'None' as current datetime
+    if basedate == SPARTN_BASEDATE_DATASTREAM:
+        return TIMEBASE  # use gnssTimeTag in datastream
+    return basedate
+
+
+class SPARTNDecoder:
+    """
+    SPARTN decoder worker.
+    """
+
+    def __init__(self, callback: object, cachesize: int = DECODECACHE):
+        """
+        Constructor.
+
+        :param object callback: function called (from the worker thread) \
+            when decoded messages are available via completed()
+        :param int cachesize: number of decoded messages cached (0 = no cache)
+        """
+
+        self.logger = logging.getLogger(__name__)
+        self._callback = callback
+        self._cachesize = cachesize
+        self._cache = OrderedDict()  # (raw, key, basedate): decoded, least recent first
+        self._lock = Lock()
+        self._pending = deque()  # (future, raw, parsed, marker) in submission order
+        self._timetags = {}  # SPARTN timetags, only accessed by worker thread
+        self._executor = None
+        self.decoded = 0
+        self.cached = 0
+
+    def submit(
+        self,
+        raw: bytes,
+        parsed: SPARTNMessage,
+        marker: str = "",
+        key: str = None,
+        basedate: object = None,
+    ) -> bool:
+        """
+        Submit SPARTN message for decoding.
+
+        :param bytes raw: raw SPARTN message
+        :param SPARTNMessage parsed: undecoded message, returned if decode fails
+        :param str marker: console marker e.g. "MQTT>>"
+        :param str key: decryption key
+        :param object basedate: decryption basedate (datetime, TIMEBASE or None)
+        :return: True if submitted, False if too many messages pending
+        :rtype: bool
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        with self._lock:
+            if len(self._pending) >= MAXPENDING:
+                return False
+            if self._executor is None:  # single worker decodes in submission order
+                self._executor = ThreadPoolExecutor(
+                    1, thread_name_prefix="spartn_decoder"
+                )
+            future = self._executor.submit(self._decode, raw, key, basedate)
+            self._pending.append((future, raw, parsed, marker))
+        future.add_done_callback(lambda _: self._callback())
+        return True
+
+    def completed(self) -> list:
+        """
+        Get decoded messages, in submission order. A message is only returned
+        once all messages submitted before it have been decoded.
+
+        :return: list of (raw, parsed, marker) tuples
+        :rtype: list
+        """
+
+        done = []
+        with self._lock:
+            while self._pending and self._pending[0][0].done():
+                future, raw, parsed, marker = self._pending.popleft()
+                decoded = future.result()
+                done.append((raw, parsed if decoded is None else decoded, marker))
+        return done
+
+    def stop(self):
+        """
+        Stop worker thread and discard pending messages.
+        """
+
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _decode(self, raw: bytes, key: str, basedate: object) -> SPARTNMessage:
+        """
+        THREADED
+        Decode SPARTN message, from cache if available.
+
+        :param bytes raw: raw SPARTN message
+        :param str key: decryption key
+        :param object basedate: decryption basedate
+        :return: decoded message, or None if message could not be decoded
+        :rtype: SPARTNMessage
+        """
+
+        cachekey = (raw, key, basedate)
+        with self._lock:
+            decoded = self._cache.get(cachekey, None)
+            if decoded is not None:
+                self._cache.move_to_end(cachekey)
+                self.cached += 1
+                return decoded
+        try:
+            decoded = SPARTNReader.parse(
+                raw,
+                decode=True,
+                key=key,
+                basedate=basedate,
+                timetags=self._timetags,
+            )
+        except (
+            SPARTNDecryptionError,
+            SPARTNMessageError,
+            SPARTNParseError,
+            SPARTNTypeError,
+            ValueError,
+        ) as err:
+            self.logger.debug(f"SPARTN decode error {err}")
+            return None
+        with self._lock:
+            self.decoded += 1
+            if self._cachesize:
+                self._cache[cachekey] = decoded
+                while len(self._cache) > self._cachesize:
+                    self._cache.popitem(last=False)
+        return decoded
@@ -395,7 +395,10 @@ class SPARTNMQTTDialog(Frame):
         self._connected = self.__app.spartn_handler.connected
         if self._connected:
             # get settings from running instance
-            self._settings = self.__app.spartn_handler.settings
+            self._settings = dict(self.__app.spartn_handler.settings)
+            self._settings["spartndecode"] = self.__app.configuration.get(
+                "spartndecode_b"
+            )
         else:
             # get settings from saved configuration
             cfg = self.__app.configuration
@@ -564,7 +567,7 @@ class SPARTNMQTTDialog(Frame):
                 topic_freq=self._settings["topic_freq"],
                 tlscrt=self._settings["tlscrt"],
                 tlskey=self._settings["tlskey"],
-                spartndecode=self._settings["spartndecode"],
+                spartndecode=0,  # decoded on demand by App.spartn_decoder
                 spartnkey=self._settings["spartnkey"],
                 spartnbasedate=self._settings["spartnbasedate"],
                 output=self._settings["output"],
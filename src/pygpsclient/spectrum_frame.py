@@ -317,22 +317,17 @@ class SpectrumviewFrame(Frame):
             # draw legend for this RF block
             self._plot_rf_legend(col, mode, rf, i)
 
-            # plot spectrum for this RF block
-            hz2 = self._minhz / GHZ
-            db2 = self._mindb
-            for n, (hz, db) in enumerate(rfblock):
-                hz1, db1 = hz2, db2
-                hz2, db2 = hz / GHZ, db
-                if n:
-                    self._canvas.create_gline(
-                        hz1,
-                        db1,
-                        hz2,
-                        db2,
-                        fill=col,
-                        width=OL_WID,
-                        tags=(mode, TAG_DATA),
-                    )
+            # plot spectrum for this RF block as a single polyline
+            xy = self._canvas.d2xy_batch(
+                [hz / GHZ for hz, _ in rfblock], [db for _, db in rfblock]
+            )
+            if len(xy) > 2:
+                self._canvas.create_line(
+                    *xy,
+                    fill=col,
+                    width=OL_WID,
+                    tags=(mode, TAG_DATA),
+                )
             self.update_idletasks()
 
         # display any marked db/hz coordinate
@@ -43,7 +43,7 @@ from socket import (
     socket,
 )
 from threading import Event, Thread
-from time import sleep
+from time import monotonic, sleep
 from tkinter import Frame, Label, Tk
 
 from certifi import where as findcacerts
@@ -72,6 +72,13 @@ except (ImportError, ModuleNotFoundError):
 
 from serial import Serial, SerialException, SerialTimeoutException
 
+from pygpsclient.correction_capture import (
+    CAPNTRIP,
+    CAPSPARTN,
+    CaptureReader,
+    is_capture,
+    parse_raw,
+)
 from pygpsclient.globals import (
     ASCII,
     BSR,
@@ -81,6 +88,8 @@ from pygpsclient.globals import (
     CONNECTED_SOCKET,
     DEFAULT_BUFSIZE,
     ERRCOL,
+    NTRIP_EVENT,
+    SPARTN_EVENT,
     TTY_PROTOCOL,
     UBXSIMULATOR,
 )
@@ -200,13 +209,16 @@ class StreamHandler:
             elif conntype == CONNECTED_FILE:
                 in_filepath = settings["in_filepath"]
                 with open(in_filepath, "rb") as stream:
-                    self._readloop(
-                        master,
-                        stopevent,
-                        stream,
-                        settings,
-                        inactivity_timeout,
-                    )
+                    if is_capture(in_filepath):
+                        self._readloopcapture(master, stopevent, stream, settings)
+                    else:
+                        self._readloop(
+                            master,
+                            stopevent,
+                            stream,
+                            settings,
+                            inactivity_timeout,
+                        )
 
             elif conntype == CONNECTED_SOCKET:
                 soc = settings["socket_settings"]
@@ -374,6 +386,7 @@ class StreamHandler:
                                 data = settings["outqueue"].get(False)
                                 if data is not None:
                                     ubr.datastream.write(data)
+                                    self.__app.correction_latency.written(data)
                                 settings["outqueue"].task_done()
                         except Empty:
                             pass
@@ -405,6 +418,48 @@ class StreamHandler:
             # allow for any tkinter events e.g. dialogs
             self.__app.update_idletasks()
 
+    def _readloopcapture(
+        self,
+        master: Tk,
+        stopevent: Event,
+        stream: BufferedReader,
+        settings: dict,
+    ):
+        """
+        THREADED PROCESS
+        Replay GNSS and correction data from capture file with original
+        relative timing. GNSS data is processed as for any other data stream;
+        correction data is placed on the NTRIP or SPARTN input queue, as if
+        received from the NTRIP or SPARTN client.
+
+        :param Tk master: reference to Tk root
+        :param Event stopevent: thread stop event
+        :param BufferedReader stream: capture file stream
+        :param dict settings: settings dictionary
+        :raises: EOFError at end of capture
+        """
+
+        correction = {
+            CAPNTRIP: (self.__app.ntrip_inqueue, NTRIP_EVENT),
+            CAPSPARTN: (self.__app.spartn_inqueue, SPARTN_EVENT),
+        }
+        start = monotonic()
+        for elapsed, source, raw_data in CaptureReader(stream):
+            delay = elapsed - (monotonic() - start)
+            if delay > 0 and stopevent.wait(delay):
+                return
+            if stopevent.is_set():
+                return
+            parsed_data = parse_raw(raw_data, settings["msgmode"])
+            if parsed_data is None:
+                continue
+            inqueue, event = correction.get(
+                source, (settings["inqueue"], settings["read_event"])
+            )
+            inqueue.put((raw_data, parsed_data))
+            master.event_generate(event)
+        raise EOFError
+
     def _readlooptty(
         self,
         master: Tk,
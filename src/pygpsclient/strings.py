@@ -35,6 +35,9 @@ NA = "N/A"
 BADJSONERROR = "ERROR! Invalid metadata file"
 BREWWARN = "Function unavailable under Homebrew"
 BREWUPDATE = "In-app update not available under Homebrew. Use terminal."
+CAPTUREERR = "ERROR! Capture file could not be opened {}"
+CAPTURESTART = "Capturing GNSS and correction data to {}"
+CAPTURESTOP = "Capture stopped, {:,} records saved to {}"
 CONFIGBAD = "{} command rejected"
 CONFIGERR = "Invalid configuration data {}"
 CONFIGOK = "{} command accepted"
@@ -55,9 +58,12 @@ LOADCONFIGNK = "Unrecognised configuration setting '{}: {}'"
 LOADCONFIGNONE = "Configuration file not found {}. Using defaults"
 LOADCONFIGOK = "Configuration loaded {}{}"
 LOADCONFIGRESAVE = ". Consider re-saving"
+MAPBUILDING = "Preparing map tiles...\n{}"
 MAPCONFIGERR = "Custom map configuration error"
 MAPOPENERR = "Unable to open custom map:\n{}"
 MAPPERMERR = "Permission denied to open custom map:\n{}"
+MAPSIZEERR = "Custom map too large to open:\n{}"
+MAPTILEERR = "Unable to save custom map tiles:\n{}"
 MQTTCONN = "Connecting to MQTT server {}..."
 NMEAVALERROR = "Value error in NMEA message: {}"
 NOCONN = "NO CONNECTION"
@@ -100,8 +106,11 @@ WARNING = "WARNING>>"
 
 # Menu text
 MENUABOUT = "About"
+MENUCAPSTART = "Start Data Capture"
+MENUCAPSTOP = "Stop Data Capture"
 MENUCAN = "Cancel"
 MENUEXIT = "Exit"
+MENUEXTRACT = "Extract from Log..."
 MENUFILE = "File"
 MENUHELP = "Help"
 MENULOAD = "Load Configuration"
@@ -132,10 +141,16 @@ LBLCTL = "Controls"
 LBLDATABASERECORD = "Database"
 LBLDATADISP = "Format"
 LBLDATALOG = "Datalog"
+LBLRINEXLOG = "RINEX"
 LBLDATATYPE = "Data Type"
 LBLDEGFORMAT = "Units"
 LBLDISNMEA = "Disable NMEA"
 LBLDURATIONS = "Duration (s)"
+LBLEXTRACTEND = "End (UTC):"
+LBLEXTRACTIDENTITIES = "Message Identities (comma-separated, blank for ALL):"
+LBLEXTRACTOUTPUT = "Output file: {path}"
+LBLEXTRACTPROTOCOLS = "Protocols:"
+LBLEXTRACTSTART = "Start (UTC):"
 LBLFILEDELAY = "File Read Delay"
 LBLGGAFIXED = "Fixed Reference"
 LBLGGALIVE = "Receiver"
@@ -166,6 +181,7 @@ LBLRINEXLICENSE = "License of Use:"
 LBLRINEXMARKER = "Marker Number / Name / Type:"
 LBLRINEXOBSERVER = "Observer / Agency:"
 LBLRINEXOBSTYPES = "Observation Codes (comma-separated, blank for ALL):"
+LBLRINEXPARALLEL = "Parallel"
 LBLRINEXOUTPUTS = "Output files and process counts{path}:"
 LBLRINEXRCVR = "Receiver Number / Name / Version:"
 LBLRINEXSTARTTIME = "Approximate Start Time of RTCM 3 Data:"
@@ -223,6 +239,7 @@ DLGNOTLS = "TLS PEM file '{hostpem}' not found"
 DLGSPARTNWARN = "WARNING! Disconnect from {} client before using {} client"
 DLGSTOPRTK = "WARNING! Stop all active connections before loading configuration"
 DLGTABOUT = f"About {TITLE}"
+DLGTEXTRACT = "Log Extract"
 DLGTGPX = "GPX Track Viewer"
 DLGTIMPORTMAP = "Import Custom Map"
 DLGTNMEA = "NMEA Configuration"
@@ -237,8 +254,10 @@ DLGTUBX = "UBX Configuration"
 DLGWAITAZI = "Waiting for ELV/AZI data"
 DLGWAITCNO = "Waiting for CNO data"
 DLGWAITATTITUDE = "Waiting for Attitude data"
+DLGWAITLATENCY = "Waiting for correction data"
 DLGWAITMONSPAN = "Waiting for UBX MON-SPAN data"
 DLGWAITMONSYS = "Waiting for UBX MON-SYS data"
 DLGWAITNAVSIG = "Waiting for UBX NAV-SIG data"
 DLGWAITPOS = "Waiting for LAT/LON data"
 DLGWAITRELPOS = "Waiting for RELPOS data"
+DLGWAITRTCM = "Waiting for RTCM3 data"
@@ -0,0 +1,167 @@
+"""
+table_frame.py
+
+Tabular statistics frame base class for PyGPSClient widgets.
+
+Draws a table of fixed column positions on a canvas, with a row of
+command buttons beneath. Subclasses define the column header, the
+buttons and the table rows.
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: 2026 semuadmin
+:license: BSD 3-Clause
+"""
+
+from tkinter import EW, NSEW, NW, Button, Canvas, Frame, W
+
+from pygpsclient.canvas_subclasses import TAG_DATA, TAG_WAIT
+from pygpsclient.globals import BGCOL, FGCOL, PNTCOL, WIDGETU2
+
+INSET = 4
+
+
+class TableFrame(Frame):
+    """
+    Tabular statistics frame base class.
+    """
+
+    HEADER = ()  # column headings
+    COLS = ()  # column positions as fraction of width
+    SIZE = WIDGETU2  # default (width, height)
+
+    def __init__(self, app: Frame, parent: Frame, *args, **kwargs):
+        """
+        Constructor.
+
+        :param Frame app: reference to main tkinter application
+        :param Frame parent: reference to parent frame
+        :param args: optional args to pass to Frame parent class
+        :param kwargs: optional kwargs to pass to Frame parent class
+        """
+
+        self.__app = app  # Reference to main application class
+
+        super().__init__(parent, *args, **kwargs)
+
+        def_w, def_h = self.SIZE
+        self.width = kwargs.get("width", def_w)
+        self.height = kwargs.get("height", def_h)
+        self._font = self.__app.font_sm
+        self._fonth = self._font.metrics("linespace")
+        self._body()
+        self._attach_events()
+
+    def _buttons(self) -> tuple:
+        """
+        Get command buttons, overridden by subclasses.
+
+        :return: tuple of (text, command)
+        :rtype: tuple
+        """
+
+        return ()
+
+    def _body(self):
+        """
+        Set up frame and widgets.
+        """
+
+        self._canvas = Canvas(self, width=self.width, height=self.height, bg=BGCOL)
+        self._frm_status = Frame(self, bg=BGCOL)
+        self._canvas.grid(column=0, row=0, padx=0, pady=0, sticky=NSEW)
+        self._frm_status.grid(column=0, row=1, padx=2, pady=2, sticky=EW)
+        for i, (text, command) in enumerate(self._buttons()):
+            Button(
+                self._frm_status,
+                text=text,
+                fg=PNTCOL,
+                bg=BGCOL,
+                command=command,
+            ).grid(column=i, row=0, padx=2, pady=0, sticky=W)
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+    def _attach_events(self):
+        """
+        Bind events to frame.
+        """
+
+        self.bind("<Configure>", self._on_resize)
+
+    def init_frame(self):
+        """
+        Initialise table.
+        """
+
+        width, _ = self.get_size()
+        self._canvas.delete("all")
+        for col, hdr in zip(self.COLS, self.HEADER):
+            self._canvas.create_text(
+                INSET + col * width,
+                INSET,
+                text=hdr,
+                fill=FGCOL,
+                font=self._font,
+                anchor=NW,
+            )
+
+    def update_frame(self):
+        """
+        Update table, overridden by subclasses.
+        """
+
+    def draw_rows(self, rows: list, waitmsg: str):
+        """
+        Draw table rows, as many as fit the canvas.
+
+        :param list rows: list of (values, color) tuples, one per row
+        :param str waitmsg: alert shown if there are no rows
+        """
+
+        self._canvas.delete(TAG_DATA)
+        if not rows:
+            if not self._canvas.find_withtag(TAG_WAIT):
+                self._canvas.create_alert(waitmsg, tags=TAG_WAIT)
+            return
+        self._canvas.delete(TAG_WAIT)
+
+        width, height = self.get_size()
+        y = INSET + self._fonth
+        for vals, color in rows:
+            if y + self._fonth > height:
+                break
+            for col, val in zip(self.COLS, vals):
+                self._canvas.create_text(
+                    INSET + col * width,
+                    y,
+                    text=val,
+                    fill=color,
+                    font=self._font,
+                    anchor=NW,
+                    tags=TAG_DATA,
+                )
+            y += self._fonth
+
+    def _on_resize(self, event):  # pylint: disable=unused-argument
+        """
+        Resize frame.
+
+        :param Event event: resize event
+        """
+
+        self.width, self.height = self.get_size()
+        self.init_frame()
+        self.update_frame()
+
+    def get_size(self) -> tuple:
+        """
+        Get current canvas size.
+
+        :return: window size (width, height)
+        :rtype: tuple
+        """
+
+        self.update_idletasks()  # Make sure we know about resizing
+        return self._canvas.winfo_width(), self._canvas.winfo_height()
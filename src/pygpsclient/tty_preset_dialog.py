@@ -34,6 +34,7 @@ from tkinter import (
 )
 
 from pygpsclient.confirm_box import ConfirmBox
+from pygpsclient.formatted_message import FormattedMessage
 from pygpsclient.globals import (
     ASCII,
     BSR,
@@ -294,7 +295,7 @@ class TTYPresetDialog(ToplevelDialog):
                 self._record_command(cmd)
                 if self._echo.get():  # echo output command to console
                     self.__app.consoledata.append(
-                        (cmd, cmd.decode(ASCII, errors=BSR), TTYMARKER)
+                        FormattedMessage(cmd, cmd.decode(ASCII, errors=BSR), TTYMARKER)
                     )
                 cmds.append(cmd)
             self.__app.send_to_device(cmds, interval=self._delay.get() * CMDPAUSE)
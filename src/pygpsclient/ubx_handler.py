@@ -114,6 +114,8 @@ class UBXHandler:
             self._process_RXM_RTCM(parsed_data)
         elif parsed_data.identity == "RXM-PMP":
             self._process_RXM_PMP(parsed_data)
+        elif parsed_data.identity == "RXM-SPARTN":
+            self._process_RXM_SPARTN(parsed_data)
         elif parsed_data.identity == "RXM-SPARTN-KEY":
             self._process_RXM_SPARTN_KEY(parsed_data)
 
@@ -589,6 +591,20 @@ class UBXHandler:
 
         self.__app.gnss_status.diff_corr = data.msgUsed >= 1
         self.__app.gnss_status.diff_station = data.refStation
+        self.__app.correction_latency.acknowledged(
+            str(data.msgType), self.__app.gnss_status.diff_age
+        )
+
+    def _process_RXM_SPARTN(self, data: UBXMessage):
+        """
+        Process RXM-SPARTN sentences - SPARTN Input Status.
+
+        :param UBXMessage data: RXM-SPARTN parsed message
+        """
+
+        self.__app.correction_latency.acknowledged(
+            f"SPARTN-{data.msgType}-{data.subType}", self.__app.gnss_status.diff_age
+        )
 
     def _process_MON_SPAN(self, data: UBXMessage):
         """
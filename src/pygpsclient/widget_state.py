@@ -26,9 +26,11 @@ from pygpsclient.attitude_frame import AttitudeFrame
 from pygpsclient.chart_frame import ChartviewFrame
 from pygpsclient.console_frame import ConsoleFrame
 from pygpsclient.globals import CLASS, FRAME
+from pygpsclient.latency_frame import LatencyFrame
 from pygpsclient.levelsview_frame import LevelsviewFrame
 from pygpsclient.map_frame import MapviewFrame
 from pygpsclient.rover_frame import RoverFrame
+from pygpsclient.rtcmstats_frame import RTCMStatsFrame
 from pygpsclient.scatter_frame import ScatterViewFrame
 from pygpsclient.signalsview_frame import SignalsviewFrame
 from pygpsclient.skyview_frame import SkyviewFrame
@@ -57,6 +59,8 @@ WDGSYSMON = "System Monitor"
 WDGCHART = "Chart Plot"
 WDGATTMON = "Attitude Monitor"
 WDGSIGNALS = "Signals"
+WDGLATENCY = "Correction Latency"
+WDGRTCMSTATS = "RTCM3 Statistics"
 
 
 class WidgetState:
@@ -135,5 +139,15 @@ class WidgetState:
                 FRAME: "frm_attitudemon",
                 VISIBLE: False,
             },
+            WDGLATENCY: {
+                CLASS: LatencyFrame,
+                FRAME: "frm_latency",
+                VISIBLE: False,
+            },
+            WDGRTCMSTATS: {
+                CLASS: RTCMStatsFrame,
+                FRAME: "frm_rtcmstats",
+                VISIBLE: False,
+            },
             # add any new widgets here
         }
@@ -12,15 +12,60 @@ Created on 3 Oct 2020
 
 # pylint: disable=missing-docstring
 
+import io
+import math
+import os
+import random
+import tempfile
 import unittest
+from binascii import crc_hqx
 from datetime import datetime, timezone
-
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from queue import Queue
+from socket import create_connection, create_server, socketpair
+from threading import Event, Thread
+from xml.etree.ElementTree import ParseError
+
+from PIL import Image
+from pygnssutils.exceptions import ParameterError
+from pygnssutils.rinex_conv import RinexConverter
 from pynmeagps import SET, NMEAMessage
-from pyubx2 import UBXMessage, UBXReader
+from pyrtcm import RTCMMessage, RTCMReader
+from pyspartn import TIMEBASE, SPARTNReader
+from pyubx2 import POLL, UBXMessage, UBXReader
 
+from pygpsclient.async_server import AsyncSocketServer
 from pygpsclient.configuration import Configuration, INITMARKER
+from pygpsclient.correction_capture import (
+    CAPGNSS,
+    CAPNTRIP,
+    CAPSPARTN,
+    CaptureQueue,
+    CaptureReader,
+    CaptureWriter,
+    is_capture,
+    parse_raw,
+)
+from pygpsclient.console_frame import tag_console_line
+from pygpsclient.correction_latency import (
+    CorrectionLatency,
+    correction_type,
+    percentile,
+)
+from pygpsclient.correction_passthrough import (
+    PassthroughNTRIPClient,
+    PassthroughQueue,
+    rtcm_crc_ok,
+)
+from pygpsclient.formatted_message import FormattedMessage
 from pygpsclient.gnss_status import GNSSStatus
 from pygpsclient.globals import (
+    FORMAT_BINARY,
+    FORMAT_BOTH,
+    FORMAT_HEXSTR,
+    FORMAT_HEXTAB,
+    FORMAT_PARSED,
     Area,
     AreaXY,
     Point,
@@ -30,7 +75,9 @@ from pygpsclient.globals import (
     UIK,
     UMK,
 )
+from pygpsclient.gpx_parser import GPXTrack
 from pygpsclient.helpers import (
+    decimate_minmax,
     area_in_bounds,
     bitsval,
     bytes2unit,
@@ -53,7 +100,9 @@ from pygpsclient.helpers import (
     kmph2ms,
     knots2ms,
     lanip,
+    linear2xy,
     ll2xy,
+    ll2xy_batch,
     makeval,
     m2ft,
     ms2kmph,
@@ -64,10 +113,12 @@ from pygpsclient.helpers import (
     normalise_area,
     parse_rxmspartnkey,
     point_in_bounds,
+    polar2xy,
     pos2iso6709,
     publicip,
     reorder_range,
     secs2unit,
+    simplify_track,
     snr2col,
     str2rgb,
     stringvar2val,
@@ -79,13 +130,63 @@ from pygpsclient.helpers import (
     valid_geom,
     valid_hex,
     xy2ll,
+    xy2ll_batch,
 )
+from pygpsclient.log_extract import extract_log, in_window, parse_tod
+from pygpsclient.log_framer import LogFramer, ReceiverClock, identify, receiver_time
+from pygpsclient.log_triage import format_summary, scan_log
+from pygpsclient.map_fetcher import MapCache, MapFetcher
+from pygpsclient.map_index import MapIndex
+from pygpsclient.rinex_batch import (
+    batch_convert,
+    converted_logs,
+    find_inputs,
+    load_params,
+)
+from pygpsclient.rinex_logger import RINEXLogger
+from pygpsclient.rinex_parallel import (
+    ParallelRinexConverter,
+    epoch_key,
+    merge_nav,
+    split_input,
+)
+from pygpsclient.map_pyramid import MapPyramid, prune_pyramids
 from pygpsclient.mapquest_handler import (
     compress_track,
     format_mapquest_request,
     mapq_compress,
     mapq_decompress,
 )
+from pygpsclient.mountpoint_source import MountpointSource, replay_epoch
+from pygpsclient.ntrip_caster import (
+    Mountpoint,
+    format_sourcetable,
+    ntrip_credentials,
+    parse_ntrip_request,
+)
+from pygpsclient.rtcm3_handler import arp_position
+from pygpsclient.rtcm_stats import (
+    LATE,
+    MISSING,
+    OK,
+    RTCMStats,
+    msm_counts,
+    parse_rtcmstr,
+    rtcm_identity,
+)
+from pygpsclient.socket_fanout import (
+    SLOWCLIENT_DROP,
+    SLOWCLIENT_SKIP,
+    FanOut,
+    FanoutClientHandler,
+    FanoutSocketServer,
+)
+from pygpsclient.sourcetable_index import (
+    MountpointSelector,
+    SourcetableCache,
+    SourcetableIndex,
+)
+from pygpsclient.spartn_decoder import SPARTNDecoder, spartn_basedate
 from pygpsclient.widget_state import (
     DEFAULT,
     FRAME,
@@ -94,6 +195,53 @@ from pygpsclient.widget_state import (
 )
 
 
+# raw UBX RXM-RAWX observations
+def rxmrawx(tow: float, sats: list) -> bytes:
+    kwargs = {"rcvTow": tow, "week": 2400, "leapS": 18, "numMeas": len(sats)}
+    for i, (gnss, sv, sig) in enumerate(sats, start=1):
+        kwargs.update(
+            {
+                f"prMes_{i:02d}": 2.1e7 + sv * 1000 + tow,
+                f"cpMes_{i:02d}": 1.1e8 + sv + tow,
+                f"doMes_{i:02d}": -100.5 + sv,
+                f"gnssId_{i:02d}": gnss,
+                f"svId_{i:02d}": sv,
+                f"sigId_{i:02d}": sig,
+                f"cno_{i:02d}": 40,
+                f"trkStat_{i:02d}": b"\x0f",
+            }
+        )
+    return UBXMessage("RXM", "RXM-RAWX", 0, **kwargs).serialize()
+
+
+# raw RTCM3 MSM7
+def rtcmmsm7(sats: list, sigs: list, msgnum: int = 1077, epoch: int = 0) -> bytes:
+    ncell = len(sats) * len(sigs)
+    # DF002 to DF418 (73 bits)
+    bits = f"{msgnum:012b}" + "0" * 12 + f"{epoch:030b}" + "0" * 19
+    bits += "".join("1" if prn in sats else "0" for prn in range(1, 65))
+    bits += "".join("1" if sig in sigs else "0" for sig in range(1, 33))
+    bits += "1" * ncell + "0" * (36 * len(sats) + 80 * ncell)  # zeroed data
+    bits += "0" * (-len(bits) % 8)
+    payload = int(bits, 2).to_bytes(len(bits) // 8, "big")
+    return RTCMMessage(payload=payload).serialize()
+
+
+# frames with ~5% junk incl false syncs
+def junked(frames: list, seed: int = 1) -> tuple:
+    rng = random.Random(seed)
+    data, offsets = b"", []
+    for frame in frames:
+        if rng.random() < 0.05:
+            data += rng.choice(
+                (b"$G", b"\xb5\x62", b"\xd3\x00", b"$@", b"\xaa\x44\xb5")
+            )
+            data += bytes(rng.randrange(256) for _ in range(rng.randrange(1, 40)))
+        offsets.append(len(data))
+        data += frame
+    return data, offsets
+
+
 class DummyFileHandler:
 
     def load_config(self, filename):
@@ -143,7 +291,7 @@ class StaticTest(unittest.TestCase):
         self.assertEqual(cfg.get("lbandclientdrat_n"), 2400)
         self.assertEqual(cfg.get("userport_s"), "")
         self.assertEqual(cfg.get("spartnport_s"), "")
-        self.assertEqual(len(cfg.settings), 157)
+        self.assertEqual(len(cfg.settings), 174)
         kwargs = {"userport": "/dev/ttyACM0", "spartnport": "/dev/ttyACM1"}
         cfg.loadcli(**kwargs)
         self.assertEqual(cfg.get("userport_s"), "/dev/ttyACM0")
@@ -636,6 +784,48 @@ class StaticTest(unittest.TestCase):
         self.assertAlmostEqual(pos.lat, 53.52345, 5)
         self.assertAlmostEqual(pos.lon, -1.81264, 5)
 
+    def testlinear2xy(self):
+        res = linear2xy([1, 2, 3], (4, 5, 6), 2, 1, -1, 10)
+        self.assertEqual(res, [3, 6, 5, 5, 7, 4])
+        res = linear2xy(range(1000), range(1000), 0.5, 0, 2, 0)
+        self.assertEqual(len(res), 2000)
+        self.assertAlmostEqual(res[1998], 499.5)
+        self.assertAlmostEqual(res[1999], 1998)
+        self.assertEqual(linear2xy([], [], 1, 0, 1, 0), [])
+
+    def testll2xybatch(self):
+        bounds = Area(53, -2, 54, -1)
+        pnts = [Point(53.5, -1.5), Point(53.52345, -1.81264)] * 200
+        res = ll2xy_batch(
+            600, 400, bounds, [p.lat for p in pnts], [p.lon for p in pnts]
+        )
+        self.assertEqual(len(res), 800)
+        for i, pnt in enumerate(pnts):
+            x, y = ll2xy(600, 400, bounds, pnt)
+            self.assertAlmostEqual(res[i * 2], x, 5)
+            self.assertAlmostEqual(res[i * 2 + 1], y, 5)
+
+    def testxy2llbatch(self):
+        bounds = Area(53, -2, 54, -1)
+        res = xy2ll_batch(600, 400, bounds, [300, 200, 112.416, 190.620])
+        self.assertAlmostEqual(res[0].lat, 53.5, 5)
+        self.assertAlmostEqual(res[0].lon, -1.5, 5)
+        self.assertAlmostEqual(res[1].lat, 53.52345, 5)
+        self.assertAlmostEqual(res[1].lon, -1.81264, 5)
+        self.assertIsNone(xy2ll_batch(600, 400, Area(53, -2, 53, -2), [300, 200]))
+
+    def testpolar2xy(self):
+        res = polar2xy([0, 90, 180, 270], [10, 10, 10, 10], 100, 100, 2)
+        for act, exp in zip(res, [100, 80, 120, 100, 100, 120, 80, 100]):
+            self.assertAlmostEqual(act, exp, 5)
+        res = polar2xy([0, 45], [90, 60], 100, 100, 50, True)
+        for act, exp in zip(res, [100, 100, 117.67767, 82.32233]):
+            self.assertAlmostEqual(act, exp, 5)
+        res = polar2xy([45] * 300, [60] * 300, 100, 100, 50, True)
+        self.assertEqual(len(res), 600)
+        self.assertAlmostEqual(res[-2], 117.67767, 5)
+        self.assertAlmostEqual(res[-1], 82.32233, 5)
+
     def testnormalise_area(self):
         points = (53, -2, 54, -1)
         res = normalise_area(points)
@@ -973,6 +1163,1251 @@ class StaticTest(unittest.TestCase):
         self.assertFalse(valid_hex("asdfttwergazz", 4))
         self.assertFalse(valid_hex("", 4))
 
+    def testformattedmessage(self):
+        parsed = UBXMessage("MON", "MON-VER", POLL)
+        raw = parsed.serialize()
+        fmsg = FormattedMessage(raw, parsed, ">")
+        self.assertEqual(fmsg.console(FORMAT_PARSED), ">" + str(parsed) + "\n")
+        self.assertEqual(
+            fmsg.console(FORMAT_BINARY), ">b'\\xb5b\\n\\x04\\x00\\x00\\x0e4'\n"
+        )
+        self.assertEqual(fmsg.console(FORMAT_HEXSTR), ">b5620a0400000e34\n")
+        self.assertEqual(fmsg.console(FORMAT_HEXTAB).splitlines()[0][:4], "000:")
+        res = fmsg.console(FORMAT_BOTH).splitlines()
+        self.assertEqual(res[0], ">" + str(parsed))
+        self.assertEqual(len(res), 2)
+        # representations are computed once and cached
+        self.assertIs(fmsg.parsed, fmsg.parsed)
+        self.assertIs(fmsg.hextab, fmsg.hextab)
+        self.assertEqual(
+            set(vars(fmsg)) - {"raw_data", "parsed_data", "marker"},
+            {"parsed", "hexstr", "hextab"},
+        )
+        fmsg = FormattedMessage(raw, parsed)
+        fmsg.console(FORMAT_HEXSTR)
+        self.assertNotIn("parsed", vars(fmsg))
+        self.assertNotIn("hextab", vars(fmsg))
+
+    def testtagconsoleline(self):
+        COLORTAGS = [("GNGGA", "green"), ("NAV-PVT", "blue"), ("ACK-NAK", "HALT")]
+        self.assertEqual(
+            tag_console_line("<NMEA(GNGGA, time=12:00:00)>", COLORTAGS),
+            ((("GNGGA", 6, 11),), ""),
+        )
+        self.assertEqual(
+            tag_console_line("<UBX(NAV-SAT, numSvs=3)>", COLORTAGS), ((), "")
+        )
+        self.assertEqual(
+            tag_console_line("<UBX(ACK-NAK, clsID=CFG)>", COLORTAGS),
+            ((("HALT", 5, 12),), "ACK-NAK"),
+        )
+        self.assertEqual(
+            tag_console_line("<UBX(NAV-PVT, iTOW=12:00:00)>", ()), ((), "")
+        )
+
+    def testmapcache(self):
+        with tempfile.TemporaryDirectory() as cachedir:
+            cache = MapCache(cachedir, maxsize=25, expiry=3600)
+            k1 = MapCache.key("map", None, 10, 600, 400, (Point(53, -2),), 0)
+            k2 = MapCache.key("map", None, 11, 600, 400, (Point(53, -2),), 0)
+            k3 = MapCache.key("sat", None, 10, 600, 400, (Point(53, -2),), 0)
+            self.assertNotEqual(k1, k2)
+            self.assertEqual(
+                k1, MapCache.key("map", None, 10, 600, 400, (Point(53, -2),), 0)
+            )
+            cache.put(k1, b"x" * 10)
+            cache.put(k2, b"y" * 10)
+            self.assertEqual(cache.get(k1), b"x" * 10)  # k1 now most recently used
+            cache.put(k3, b"z" * 10)  # evicts least recently used k2
+            self.assertIn(k1, cache)
+            self.assertNotIn(k2, cache)
+            self.assertIsNone(cache.get(k2))
+            self.assertEqual(cache.size, 20)
+            # index rebuilt from disk
+            cache2 = MapCache(cachedir, maxsize=25, expiry=3600)
+            self.assertEqual(cache2.get(k3), b"z" * 10)
+            # expiry
+            os.utime(os.path.join(cachedir, k3 + ".img"), (0, 0))
+            self.assertIsNone(cache2.get(k3))
+            self.assertNotIn(k3, cache2)
+            cache2.clear()
+            self.assertEqual(cache2.size, 0)
+            self.assertEqual(os.listdir(cachedir), [])
+
+    def testmapfetcher(self):  # uses local HTTP stand-in for MapQuest
+        hits = []
+        release = Event()
+        hold = Event()
+
+        class MapHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                if "zoom=1&" in self.path:  # block first request
+                    release.wait(5)
+                if "zoom=5&" in self.path:  # block until after stop
+                    hold.wait(5)
+                body = self.path.encode("utf-8")
+                self.send_response(200 if "key=good" in self.path else 403)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), MapHandler)
+        Thread(target=server.serve_forever, daemon=True).start()
+        mapqurl = f"http://127.0.0.1:{server.server_port}/map?key={{key}}&type={{type}}&size={{width}},{{height}}"
+        done = Event()
+        results = []
+
+        def callback():
+            results.append(fetcher.result())
+            done.set()
+
+        def url(zoom, key="good"):
+            return format_mapquest_request(
+                key, "map", 600, 400, zoom, [Point(53, -2)], mapqurl=mapqurl
+            )
+
+        with tempfile.TemporaryDirectory() as cachedir:
+            fetcher = MapFetcher(callback, MapCache(cachedir), timeout=5)
+            try:
+                fetcher.request("k1", url(1), "ctx1")  # in flight, blocked
+                while not hits:
+                    done.wait(0.01)
+                fetcher.request("k2", url(2), "ctx2")  # superseded
+                fetcher.request("k3", url(3), "ctx3")
+                release.set()
+                while len(results) < 2:
+                    done.wait(0.1)
+                    done.clear()
+                self.assertEqual([r[0] for r in results], ["k1", "k3"])
+                self.assertEqual(results[1][1], "ctx3")
+                self.assertIn(b"zoom=3", results[1][2])
+                self.assertEqual(len(hits), 2)
+                # revisited area served from cache
+                fetcher.request("k3", url(3), "ctx3")
+                while len(results) < 3:
+                    done.wait(0.1)
+                    done.clear()
+                self.assertEqual(results[2][2], results[1][2])
+                self.assertEqual(len(hits), 2)
+                # HTTP error
+                fetcher.request("k4", url(4, "bad"), "ctx4")
+                while len(results) < 4:
+                    done.wait(0.1)
+                    done.clear()
+                self.assertIsNone(results[3][2])
+                self.assertIn("Forbidden", results[3][3])
+                # non-blocking stop with retrieval in progress
+                fetcher.request("k5", url(5), "ctx5")
+                while len(hits) < 4:
+                    done.wait(0.01)
+                worker = fetcher._thread
+                fetcher.stop(False)
+                self.assertTrue(worker.is_alive())
+                hold.set()
+                worker.join(5)
+                self.assertFalse(worker.is_alive())
+            finally:
+                hold.set()
+                fetcher.stop()
+                server.shutdown()
+                server.server_close()
+
+    def testmappyramid(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # 1000 x 600 image with red, green, blue, white quadrants
+            img = Image.new("RGB", (1000, 600))
+            img.paste((255, 0, 0), (0, 0, 500, 300))
+            img.paste((0, 255, 0), (500, 0, 1000, 300))
+            img.paste((0, 0, 255), (0, 300, 500, 600))
+            img.paste((255, 255, 255), (500, 300, 1000, 600))
+            mappath = os.path.join(tmpdir, "map.png")
+            img.save(mappath)
+            cachedir = os.path.join(tmpdir, "tiles")
+            pyr = MapPyramid(mappath, cachedir, tilesize=128)
+            self.assertEqual((pyr.width, pyr.height), (1000, 600))
+            self.assertEqual(pyr.levels, 4)  # 1000, 500, 250, 125
+            self.assertEqual(pyr.mode, "RGB")
+            # full view at low resolution
+            res = pyr.render((0, 0, 1000, 600), (100, 60))
+            self.assertEqual(res.size, (100, 60))
+            self.assertEqual(res.getpixel((10, 10)), (255, 0, 0))
+            self.assertEqual(res.getpixel((90, 10)), (0, 255, 0))
+            self.assertEqual(res.getpixel((10, 50)), (0, 0, 255))
+            self.assertEqual(res.getpixel((90, 50)), (255, 255, 255))
+            # zoomed view across quadrant boundary at full resolution
+            res = pyr.render((400, 200, 600, 400), (400, 400))
+            self.assertEqual(res.getpixel((10, 10)), (255, 0, 0))
+            self.assertEqual(res.getpixel((390, 390)), (255, 255, 255))
+            # view extending beyond image is blank outside
+            res = pyr.render((-500, -300, 500, 300), (100, 60))
+            self.assertEqual(res.getpixel((10, 10)), (0, 0, 0))
+            self.assertEqual(res.getpixel((90, 50)), (255, 0, 0))
+            # pyramid reused from disk cache
+            ntiles = sum(len(files) for _, _, files in os.walk(cachedir))
+            pyr2 = MapPyramid(mappath, cachedir, tilesize=128, maxtiles=2)
+            self.assertEqual(
+                sum(len(files) for _, _, files in os.walk(cachedir)), ntiles
+            )
+            res = pyr2.render((0, 0, 1000, 600), (500, 300))
+            self.assertEqual(res.getpixel((490, 290)), (255, 255, 255))
+            self.assertEqual(len(pyr2._tiles), 2)
+            # tiles of every level match whole-image reduction
+            ref = img
+            for level in range(pyr.levels):
+                out = Image.new("RGB", ref.size)
+                for ty in range(math.ceil(ref.height / 128)):
+                    for tx in range(math.ceil(ref.width / 128)):
+                        out.paste(pyr._tile(level, tx, ty), (tx * 128, ty * 128))
+                self.assertEqual(out.tobytes(), ref.tobytes())
+                ref = ref.reduce(2)
+
+    def testmappyramidbuild(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mappath = os.path.join(tmpdir, "map.png")
+            Image.new("RGB", (300, 200), (255, 0, 0)).save(mappath)
+            cachedir = os.path.join(tmpdir, "tiles")
+            # deferred build e.g. from background thread
+            pyr = MapPyramid(mappath, cachedir, tilesize=128, build=False)
+            self.assertFalse(pyr.built)
+            self.assertFalse(os.path.exists(cachedir))
+            pyr.build()
+            self.assertTrue(pyr.built)
+            self.assertEqual(os.listdir(cachedir), [pyr.key])
+            # editing map image prunes its stale pyramid
+            Image.new("RGB", (300, 200), (0, 0, 255)).save(mappath)
+            os.utime(mappath, ns=(0, 10**18))
+            pyr2 = MapPyramid(mappath, cachedir, tilesize=128)
+            self.assertNotEqual(pyr2.key, pyr.key)
+            self.assertEqual(os.listdir(cachedir), [pyr2.key])
+            res = pyr2.render((0, 0, 300, 200), (30, 20))
+            self.assertEqual(res.getpixel((1, 1)), (0, 0, 255))
+            # pyramids of deleted maps and in excess of limit are pruned
+            maps = []
+            for i in range(3):
+                maps.append(os.path.join(tmpdir, f"map{i}.png"))
+                Image.new("RGB", (300, 200)).save(maps[-1])
+                MapPyramid(maps[-1], cachedir, tilesize=128)
+            self.assertEqual(len(os.listdir(cachedir)), 4)
+            os.remove(maps[0])
+            os.utime(os.path.join(cachedir, pyr2.key, "pyramid.json"), (0, 0))
+            prune_pyramids(cachedir, maxpyramids=2)
+            self.assertEqual(len(os.listdir(cachedir)), 2)
+            self.assertNotIn(pyr2.key, os.listdir(cachedir))
+            # oversize image
+            maxpixels = Image.MAX_IMAGE_PIXELS
+            Image.MAX_IMAGE_PIXELS = 10000
+            try:
+                with self.assertRaises(Image.DecompressionBombError):
+                    MapPyramid(mappath, os.path.join(tmpdir, "tiles2"))
+            finally:
+                Image.MAX_IMAGE_PIXELS = maxpixels
+
+    def testmapindex(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            usermaps = []
+            # 200 small 0.1 degree maps tiled across 10 x 20 grid
+            for i in range(200):
+                lat, lon = 50 + (i // 20) * 0.1, -5 + (i % 20) * 0.1
+                usermaps.append(
+                    [
+                        os.path.join(tmpdir, f"tile{i}.png"),
+                        [lat + 0.1, lon, lat, lon + 0.1],
+                    ]
+                )
+            lores = os.path.join(tmpdir, "lores.png")  # 1000px across 10 degrees
+            hires = os.path.join(tmpdir, "hires.png")  # 1000px across 1 degree
+            Image.new("RGB", (1000, 1000)).save(lores)
+            Image.new("RGB", (1000, 1000)).save(hires)
+            usermaps.insert(0, [lores, [45, -10, 55, 0]])
+            usermaps.append([hires, [50, -4, 51, -3]])
+            idx = MapIndex(usermaps)
+            self.assertEqual(len(idx), 202)
+            # tile maps have no readable image so resolution = 0
+            self.assertEqual(
+                idx.find(Point(50.05, -4.95)), (lores, Area(45, -10, 55, 0))
+            )
+            # highest resolution wins regardless of order
+            self.assertEqual(idx.find(Point(50.55, -3.55))[0], hires)
+            self.assertEqual(idx.find(None, Area(50.1, -3.9, 50.2, -3.8))[0], hires)
+            # bounds not within any map
+            self.assertEqual(idx.find(None, Area(40, -20, 60, 10)), (None, None))
+            self.assertEqual(idx.find(Point(10, 10)), (None, None))
+            # equal resolution - first in usermaps order
+            idx = MapIndex(usermaps[1:201])
+            self.assertEqual(idx.find(Point(50.05, -4.95))[0], usermaps[1][0])
+            self.assertEqual(idx.find(Point(50.95, -3.05))[0], usermaps[200][0])
+            self.assertEqual(idx.usermaps, usermaps[1:201])
+            self.assertEqual(MapIndex([]).find(Point(0, 0)), (None, None))
+            with self.assertRaises(IndexError):
+                MapIndex([["path", [1, 2, 3]]])
+
+    def testsimplifytrack(self):
+        # straight line with small deviations collapses to end points
+        track = [
+            Point(53 + i * 0.001, -2 + i * 0.001 + (i % 2) * 1e-7) for i in range(1000)
+        ]
+        res = simplify_track(track, 0.5, 1000, 1000)
+        self.assertEqual(res, [track[0], track[-1]])
+        # significant deviations are retained
+        track = [
+            Point(53, -2),
+            Point(53.001, -1.999),
+            Point(53.1, -1.95),
+            Point(53.0667, -1.9),
+            Point(53, -1.8),
+        ]
+        res = simplify_track(track, 0.5, 1000, 1000)
+        self.assertEqual(res, [track[0], track[2], track[-1]])
+        self.assertEqual(simplify_track(track, 0), track)
+        self.assertEqual(simplify_track(track[:2], 0.5), track[:2])
+        # closed loop
+        loop = [
+            Point(53 + 0.01 * math.sin(i / 100), -2 + 0.01 * math.cos(i / 100))
+            for i in range(629)
+        ] + [Point(53, -1.99)]
+        res = simplify_track(loop, 0.5, 10000, 10000)
+        self.assertEqual((res[0], res[-1]), (loop[0], loop[-1]))
+        self.assertTrue(10 < len(res) < 100)
+
+        # all original points within tolerance of simplified track
+        def segdist(pnt, seg1, seg2, scale=100000):  # pixel distance to segment
+            (px, py), (x1, y1), (x2, y2) = (
+                (p.lon * scale, p.lat * scale) for p in (pnt, seg1, seg2)
+            )
+            dx, dy = x2 - x1, y2 - y1
+            t = max(
+                0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy or 1))
+            )
+            return math.hypot(px - x1 - t * dx, py - y1 - t * dy)
+
+        res = simplify_track(loop, 0.5, 100000, 100000)
+        self.assertLess(len(res), 629)
+        for pnt in loop:
+            self.assertLessEqual(
+                min(segdist(pnt, res[i], res[i + 1]) for i in range(len(res) - 1)), 0.5
+            )
+        # simplified MapQuest track
+        self.assertEqual(
+            compress_track(track, scale=1000),
+            mapq_compress([53, -2, 53.1, -1.95, 53, -1.8], 6),
+        )
+        # web mercator latitude scale at 60N is double longitude scale,
+        # so 0.4 px deviation is 0.8 px
+        track = [Point(60, -2), Point(60.0004, -1.5), Point(60, -1)]
+        self.assertEqual(
+            compress_track(track, scale=1000),
+            mapq_compress([60, -2, 60.0004, -1.5, 60, -1], 6),
+        )
+        self.assertEqual(len(simplify_track(track, 0.5, 1000, 1000)), 2)
+        # out-and-back spur beyond segment end is retained
+        track = [
+            Point(53, -2),
+            Point(53, -1.99),
+            Point(53, -1.98),
+            Point(53, -1.97),
+            Point(53, -1.985),
+        ]
+        res = simplify_track(track, 0.5, 1000, 1000)
+        self.assertEqual(res, [track[0], track[3], track[4]])
+        # backtrack along route retains turnaround points
+        track = [Point(53, -2 + i * 0.001) for i in range(50)]
+        track += [Point(53, -1.951 - i * 0.001) for i in range(30)]
+        track += [Point(53 + i * 0.001, -1.98) for i in range(20)]
+        res = simplify_track(track, 0.5, 1000, 1000)
+        self.assertIn(track[49], res)
+        for pnt in track:
+            self.assertLessEqual(
+                min(
+                    segdist(pnt, res[i], res[i + 1], 1000) for i in range(len(res) - 1)
+                ),
+                0.5,
+            )
+
+    def testgpxtrack(self):
+        gpx = (
+            b'<?xml version="1.0" encoding="UTF-8"?>'
+            b'<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1"><trk><name>test</name><trkseg>'
+            b'<trkpt lat="53.0" lon="-2.0"><ele>100.0</ele><time>2026-10-18T10:00:00Z</time></trkpt>'
+            b'<trkpt lat="53.001" lon="-2.0"><ele>110.5</ele><time>2026-10-18T10:00:10Z</time></trkpt>'
+            b'<trkpt lat="53.002" lon="-1.999"><ele>105.0</ele><time>2026-10-18T10:00:20.500Z</time></trkpt>'
+            b'<trkpt lat="53.002" lon="-1.998"><time>2026-10-18T10:00:20.500Z</time></trkpt>'
+            b"</trkseg></trk></gpx>"
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = os.path.join(tmpdir, "test.gpx")
+            with open(fpath, "wb") as gfile:
+                gfile.write(gpx)
+            trk = GPXTrack(fpath, "trkpt")
+        self.assertEqual(len(trk), 4)
+        self.assertEqual(list(trk.lat), [53.0, 53.001, 53.002, 53.002])
+        self.assertEqual(list(trk.ele), [100.0, 110.5, 105.0, 0.0])
+        self.assertEqual(trk.bounds, Area(53.0, -2.0, 53.002, -1.998))
+        self.assertAlmostEqual(trk.center.lat, 53.001, 6)
+        self.assertAlmostEqual(trk.center.lon, -1.999, 6)
+        self.assertEqual(trk.elapsed, 20.5)
+        self.assertAlmostEqual(trk.dist, 308.23, 2)
+        self.assertAlmostEqual(trk.spd[1], 11.13, 2)
+        self.assertEqual(trk.spd[3], trk.spd[2])  # no time elapsed
+        self.assertEqual((trk.minele, trk.maxele), (100.0, 110.5))
+        self.assertEqual((trk.no_time, trk.no_ele), (False, True))
+        self.assertEqual(
+            trk[1], TrackPoint(53.001, -2.0, trk.tim[1], 110.5, trk.spd[1])
+        )
+        self.assertEqual(trk.points()[2], Point(53.002, -1.999))
+        # waypoints without time, route with no matching elements
+        wpx = b'<gpx><wpt lat="1" lon="2"><ele>5</ele></wpt><wpt lat="1.5" lon="2"/></gpx>'
+        trk = GPXTrack(io.BytesIO(wpx), "wpt")
+        self.assertEqual((len(trk), trk.no_time, list(trk.tim)), (2, True, [0.0, 1.0]))
+        self.assertEqual(len(GPXTrack(io.BytesIO(wpx), "rtept")), 0)
+        with self.assertRaises(ParseError):
+            GPXTrack(io.BytesIO(b"<gpx><wpt lat="), "wpt")
+
+    def testgpxtrackstats(self):
+        wpx = (
+            b"<gpx>"
+            + b"".join(
+                f'<wpt lat="{53 + i * 0.001}" lon="-2"><ele>{e}</ele></wpt>'.encode()
+                for i, e in enumerate((100, 110, 105, 120, 90))
+            )
+            + b"</gpx>"
+        )
+        trk = GPXTrack(io.BytesIO(wpx), "wpt")
+        self.assertEqual(trk.elestats, (90, 120, 105, 105, 25, 35))
+        spdmin, spdmax, _, _ = trk.spdstats
+        self.assertEqual((spdmin, spdmax), (0, max(trk.spd)))
+
+    def testdecimateminmax(self):
+        xs = list(range(1000))
+        ys = [math.sin(x / 50) for x in xs]
+        ys[333] = 5  # spike
+        dx, dy = decimate_minmax(xs, ys, 50)
+        self.assertLessEqual(len(dx), 102)
+        self.assertEqual((dx[0], dx[-1]), (0, 999))
+        self.assertIn(333, dx)
+        self.assertEqual(max(dy), 5)
+        self.assertEqual(min(dy), min(ys))
+        self.assertEqual(dx, sorted(dx))
+        self.assertEqual(dy, [ys[x] for x in dx])
+        # too few points or zero span, unchanged
+        self.assertEqual(decimate_minmax(xs[:50], ys[:50], 50), (xs[:50], ys[:50]))
+        self.assertEqual(
+            decimate_minmax([1] * 500, ys[:500], 50), ([1] * 500, ys[:500])
+        )
+        self.assertEqual(decimate_minmax([], [], 50), ([], []))
+
+    def testfanout(self):
+        evicted = []
+        fan = FanOut(3, SLOWCLIENT_SKIP)
+        clq1 = fan.register(("1.2.3.4", 1))
+        clq2 = fan.register(("1.2.3.5", 2), lambda: evicted.append(2))
+        frames = [bytes([i]) * 10 for i in range(5)]
+        for frm in frames:
+            fan.publish(frm)
+        batch = clq1.get(0)
+        self.assertEqual([raw for raw, _ in batch], frames[2:])
+        self.assertIs(batch[0][0], frames[2])  # by reference, not copied
+        self.assertEqual(clq2.stats.skipped, 2)
+        self.assertEqual(clq1.get(0), [])
+        fan.unregister(clq2)
+        self.assertEqual((len(fan), evicted, clq2.get(0)), (1, [2], None))
+        clq1.stats.sent(10, 0.002)
+        clq1.stats.sent(10, 0.004)
+        self.assertAlmostEqual(clq1.stats.avglatency, 0.003)
+        self.assertEqual(
+            str(clq1.stats), "1.2.3.4:1 tx 0.0 kB q 0 lat 3.0/4.0 ms skip 2"
+        )
+        # slow client dropped
+        fan = FanOut(2, SLOWCLIENT_DROP)
+        clq1 = fan.register(("1.2.3.4", 1), lambda: evicted.append(1))
+        clq2 = fan.register(("1.2.3.5", 2))
+        for frm in frames[:2]:
+            fan.publish(frm)
+        clq2.get(0)
+        fan.publish(frames[2])
+        self.assertEqual(
+            (len(fan), evicted, fan.stats()[0].address), (1, [2, 1], ("1.2.3.5", 2))
+        )
+
+    def testfanoutsocketserver(self):
+        msgq = Queue()
+        server = FanoutSocketServer(
+            None, 0, 10, msgq, ("127.0.0.1", 0), FanoutClientHandler
+        )
+        Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            clients = [create_connection(server.server_address, 5) for _ in range(3)]
+            for _ in range(50):
+                if len(server.fanout) == 3:
+                    break
+                Event().wait(0.05)
+            self.assertEqual(len(server.fanout), 3)
+            msgq.put(b"\xd3\x00\x01abc")
+            msgq.put(b"def")
+            for cli in clients:
+                data = b""
+                while len(data) < 9:
+                    data += cli.recv(100)
+                self.assertEqual(data, b"\xd3\x00\x01abcdef")
+            for cli in clients[1:]:
+                cli.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        # remaining client evicted when server is closed
+        self.assertEqual(len(server.fanout), 0)
+        self.assertEqual(clients[0].recv(100), b"")
+        clients[0].close()
+
+    def testfanoutsocketservermountpoint(self):
+        mpt = Mountpoint("base2", FanOut(), "1005(10)")
+        server = FanoutSocketServer(
+            None,
+            1,
+            10,
+            Queue(),
+            ("127.0.0.1", 0),
+            FanoutClientHandler,
+            mountpoints=[mpt],
+        )
+        Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            cli = create_connection(server.server_address, 5)
+            cli.sendall(
+                b"GET /base2 HTTP/1.1\r\nAuthorization: Basic "
+                + ntrip_credentials("anon", "password")
+                + b"\r\n\r\n"
+            )
+            resp = b""
+            while not resp.endswith(b"\r\n\r\n"):
+                resp += cli.recv(1)
+            self.assertTrue(resp.startswith(b"HTTP/1.1 200 OK\r\n"))
+            for _ in range(50):
+                if len(mpt.fanout) == 1:
+                    break
+                Event().wait(0.05)
+            self.assertEqual((len(mpt.fanout), len(server.fanout)), (1, 0))
+            mpt.publish(b"\xd3\x00\x01abc")
+            data = b""
+            while len(data) < 6:
+                data += cli.recv(100)
+            self.assertEqual(data, b"\xd3\x00\x01abc")
+            cli.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def testntripcaster(self):
+        req = (
+            b"GET /mp1 HTTP/1.1\r\nUser-Agent: NTRIP test\r\nAuthorization: Basic "
+            + ntrip_credentials("anon", "password")
+            + b"\r\n\r\n"
+        )
+        self.assertEqual(parse_ntrip_request(req), ("mp1", b"YW5vbjpwYXNzd29yZA=="))
+        self.assertEqual(parse_ntrip_request(b"GET / HTTP/1.1\r\n\r\n"), ("", None))
+        srt = format_sourcetable("1.2.3.4", 2101, [("mp1", 53.1, -2.1, "1005(10)")])
+        self.assertEqual(
+            srt.splitlines()[2],
+            "STR;mp1;MP1;RTCM 3.3;1005(10);2;GPS+GLO+GAL+BDS;PYGNSSUTILS;GBR;53.1;-2.1;0;0;PYGNSSUTILS;none;B;N;0;",
+        )
+        self.assertTrue(srt.endswith("ENDSOURCETABLE\r\n"))
+
+    def testasyncsocketserver(self):
+        def request(req):
+            with create_connection(server.server_address, 5) as cli:
+                cli.sendall(req)
+                resp = b""
+                while True:
+                    data = cli.recv(4096)
+                    if not data:
+                        return resp
+                    resp += data
+
+        msgq = Queue()
+        server = AsyncSocketServer(
+            None, 1, 10, msgq, ("127.0.0.1", 0), ntripuser="user", ntrippassword="pwd"
+        )
+        Thread(target=server.serve_forever, daemon=True).start()
+        self.assertTrue(server.started.wait(5))
+        try:
+            auth = b"Authorization: Basic " + ntrip_credentials("user", "pwd") + b"\r\n"
+            resp = request(b"GET /pygnssutils HTTP/1.1\r\n\r\n")
+            self.assertTrue(resp.startswith(b"HTTP/1.1 401 Unauthorized"))
+            resp = request(b"GET / HTTP/1.1\r\n" + auth + b"\r\n")
+            self.assertIn(b"STR;pygnssutils;", resp)
+            # data stream
+            cli = create_connection(server.server_address, 5)
+            cli.sendall(b"GET /pygnssutils HTTP/1.1\r\n" + auth + b"\r\n")
+            resp = b""
+            while not resp.endswith(b"\r\n\r\n"):
+                resp += cli.recv(1)
+            self.assertTrue(resp.startswith(b"HTTP/1.1 200 OK\r\n"))
+            for _ in range(50):
+                if len(server.fanout) == 1:
+                    break
+                Event().wait(0.05)
+            msgq.put(b"\xd3\x00\x01abc")
+            data = b""
+            while len(data) < 6:
+                data += cli.recv(100)
+            self.assertEqual(data, b"\xd3\x00\x01abc")
+            cli.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def testmountpointsource(self):
+        rtcm1005 = bytes.fromhex("d300133ed0070208e616efd23fa43563780bd3ea7c0067255e")
+        _, parsed = UBXReader(io.BytesIO(rtcm1005), protfilter=4).read()
+        x, y, z, lat, lon, _ = arp_position(parsed)
+        self.assertEqual((round(x, 4), y, z), (3822000.1234, -154000.5, 5080000.0))
+        self.assertAlmostEqual(lat, 53.20616466, 7)
+        self.assertAlmostEqual(lon, -2.30738041, 7)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = os.path.join(tmpdir, "base2.log")
+            with open(fpath, "wb") as outfile:
+                outfile.write(rtcm1005 * 3)
+            mpt = MountpointSource("base2", fpath)
+            server = AsyncSocketServer(
+                None, 1, 10, Queue(), ("127.0.0.1", 0), mountpoints=[mpt]
+            )
+            Thread(target=server.serve_forever, daemon=True).start()
+            self.assertTrue(server.started.wait(5))
+            try:
+                auth = b"Authorization: Basic " + ntrip_credentials("anon", "password")
+                cli = create_connection(server.server_address, 5)
+                cli.sendall(b"GET /base2 HTTP/1.1\r\n" + auth + b"\r\n\r\n")
+                resp = b""
+                while not resp.endswith(b"\r\n\r\n"):
+                    resp += cli.recv(1)
+                self.assertTrue(resp.startswith(b"HTTP/1.1 200 OK\r\n"))
+                for _ in range(50):
+                    if len(mpt.fanout) == 1:
+                        break
+                    Event().wait(0.05)
+                self.assertEqual(len(server.fanout), 0)
+                mpt.start()
+                data = b""
+                while len(data) < len(rtcm1005):
+                    data += cli.recv(100)
+                self.assertEqual(data[: len(rtcm1005)], rtcm1005)
+                cli.close()
+                for _ in range(50):
+                    if mpt.rtcmstr:
+                        break
+                    Event().wait(0.05)
+                self.assertEqual((mpt.lat, mpt.lon), (53.20616466, -2.30738041))
+                self.assertIn("1005(", mpt.rtcmstr)
+                cli = create_connection(server.server_address, 5)
+                cli.sendall(b"GET / HTTP/1.1\r\n" + auth + b"\r\n\r\n")
+                resp = b""
+                while True:
+                    data = cli.recv(4096)
+                    if not data:
+                        break
+                    resp += data
+                cli.close()
+                self.assertIn(b"STR;pygnssutils;", resp)
+                self.assertIn(b"STR;base2;BASE2;RTCM 3.3;", resp)
+                self.assertIn(b";53.20616466;-2.30738041;", resp)
+            finally:
+                mpt.stop()
+                server.shutdown()
+                server.server_close()
+
+    def testmountpointsourceread(self):
+        rtcm1005 = bytes.fromhex("d300133ed0070208e616efd23fa43563780bd3ea7c0067255e")
+        # epoch of each constellation as GPS time of week in ms
+        tow = 345600000 + 3723000  # Thursday 01:02:03 GPS
+        glo = (4 << 27) + 3723000 + 10800000 - 18000  # day 4, GLONASS time
+        for msgnum, epoch in (
+            (1077, tow),
+            (1097, tow),
+            (1117, tow),
+            (1127, tow - 14000),
+            (1087, glo),
+        ):
+            self.assertEqual(
+                replay_epoch(RTCMReader.parse(rtcmmsm7([1], [2], msgnum, epoch))), tow
+            )
+        self.assertEqual(
+            replay_epoch(RTCMReader.parse(rtcmmsm7([1], [2], 1087, 7 << 27))), None
+        )
+        self.assertEqual(replay_epoch(RTCMReader.parse(rtcm1005)), None)
+        # read timeouts on TCP source do not drop connection
+        mpt = MountpointSource("base2", "tcp://127.0.0.1:1")
+        clq = mpt.fanout.register(("1.2.3.4", 1))
+        src, peer = socketpair()
+        src.settimeout(0.1)
+        reader = Thread(target=mpt._read, args=(src, False), daemon=True)
+        reader.start()
+        peer.sendall(rtcm1005)
+        Event().wait(0.5)  # lull longer than read timeout
+        peer.sendall(rtcm1005)
+        data = b""
+        for _ in range(10):
+            data += b"".join(raw for raw, _ in clq.get(0.5) or [])
+            if len(data) == 2 * len(rtcm1005):
+                break
+        self.assertEqual(data, rtcm1005 * 2)
+        self.assertTrue(reader.is_alive())
+        peer.close()  # source closed
+        reader.join(5)
+        self.assertFalse(reader.is_alive())
+        src.close()
+
+    def testcorrectionpassthrough(self):
+        rtcm1005 = bytes.fromhex("d300133ed0070208e616efd23fa43563780bd3ea7c0067255e")
+        bad = rtcm1005[:-1] + b"\x00"
+        self.assertTrue(rtcm_crc_ok(rtcm1005))
+        self.assertFalse(rtcm_crc_ok(bad))
+        self.assertFalse(rtcm_crc_ok(b"\xd3\x00"))
+        devq = Queue()
+        outq = PassthroughQueue(devq)
+        outq.passthrough = True
+        outq.sample = 2
+        sock, caster = socketpair()
+        caster.sendall(rtcm1005 + bad + rtcm1005 * 2)
+        caster.close()
+        ntc = PassthroughNTRIPClient(None, timeout=1)
+        with self.assertRaises(TimeoutError):
+            ntc._parse_ntrip_data(
+                sock, {"datatype": "RTCM", "ggainterval": -1}, Event(), outq
+            )
+        sock.close()
+        self.assertEqual((devq.qsize(), outq.rejected), (3, 1))
+        self.assertEqual(devq.get(), rtcm1005)
+        self.assertEqual(outq.qsize(), 1)  # 1 in 2 forwarded frames sampled
+        raw, parsed = outq.get()
+        self.assertEqual((raw, parsed.identity), (rtcm1005, 1005))
+        # passthrough is only enabled on output queue while client is running
+        outq.passthrough = False
+        ntc.passthrough = True
+        with self.assertRaises(ParameterError):
+            ntc.run(server="", output=outq)
+        self.assertFalse(outq.passthrough)
+        with create_server(("127.0.0.1", 0)) as server:
+            port = server.getsockname()[1]
+            ntc.run(server="127.0.0.1", port=port, mountpoint="MP", output=outq)
+            self.assertTrue(outq.passthrough)
+            ntc.stop()
+            self.assertFalse(outq.passthrough)
+
+    def testcorrectionlatency(self):
+        rtcm1005 = bytes.fromhex("d300133ed0070208e616efd23fa43563780bd3ea7c0067255e")
+        self.assertEqual(correction_type(rtcm1005), "1005")
+        self.assertEqual(correction_type(b"\x73\x02\x00\x00\x10\x00"), "SPARTN-1-1")
+        self.assertEqual(correction_type(b"\xb5\x62\x02\x72\x00\x00"), "RXM-PMP")
+        self.assertIsNone(correction_type(b"$GPGGA,,,"))
+        self.assertEqual(percentile(list(range(1, 101)), 95), 95)
+        self.assertEqual(percentile([3], 50), 3)
+        self.assertIsNone(percentile([], 50))
+        lat = CorrectionLatency()
+        devq = Queue()
+        ntq = PassthroughQueue(devq, lat, "NTRIP")
+        frames = [rtcm1005[:1] + rtcm1005[1:] for _ in range(3)]
+        for raw in frames:
+            ntq.put((raw, None))
+        ntq.put((b"$GPGGA,,,", None))  # not a correction, ignored
+        lat.written(rtcm1005[:1] + rtcm1005[1:])  # different object, ignored
+        for raw in frames:
+            lat.written(raw)
+        lat.acknowledged("1005", 1.5)
+        lat.acknowledged("1005", 2.5)
+        lat.acknowledged("1077", 1.0)  # never sent, ignored
+        stats = lat.stats()
+        self.assertEqual(list(stats), ["1005"])
+        stat = stats["1005"]
+        self.assertEqual((stat["source"], stat["count"]), ("NTRIP", 3))
+        self.assertTrue(0 <= stat["queue"][0] <= stat["queue"][2] < 1)
+        self.assertTrue(stat["queue"][0] <= stat["e2e"][0] < 1)
+        self.assertEqual(stat["age"], (1.5, 2.5, 2.5))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = os.path.join(tmpdir, "latency.csv")
+            lat.export(fpath)
+            with open(fpath, encoding="utf-8") as infile:
+                lines = infile.read().splitlines()
+        self.assertEqual(
+            lines[0],
+            "msgtype,source,count,queue_p50,queue_p95,queue_p99,e2e_p50,e2e_p95,e2e_p99,age_p50,age_p95,age_p99",
+        )
+        self.assertTrue(lines[1].startswith("1005,NTRIP,3,"))
+        self.assertTrue(lines[1].endswith(",1.5,2.5,2.5"))
+        lat.reset()
+        self.assertEqual(lat.stats(), {})
+
+    def testrtcmstats(self):
+        rtcm1005 = bytes.fromhex("d300133ed0070208e616efd23fa43563780bd3ea7c0067255e")
+        rtcm1077 = rtcmmsm7([3, 10, 20], [2, 16])
+        self.assertEqual(rtcm_identity(rtcm1005), "1005")
+        self.assertEqual(rtcm_identity(rtcm1077), "1077")
+        self.assertEqual(rtcm_identity(b"\xd3\x00\x08\xfe\x80\x01\x00"), "4072_1")
+        self.assertIsNone(rtcm_identity(b"$GPGGA,,,"))
+        for sats, sigs, msgnum in (
+            ([3, 10, 20], [2, 16], 1077),
+            ([1, 64], [32], 1087),
+            ([5], [1, 2, 3], 1127),
+            ([2, 7, 11, 30, 33], [1, 31], 1097),
+        ):
+            raw = rtcmmsm7(sats, sigs, msgnum)
+            parsed = RTCMReader.parse(raw)  # checks CRC and length
+            self.assertEqual((parsed.NSat, parsed.NSig), (len(sats), len(sigs)))
+            self.assertEqual(msm_counts(raw), (len(sats), len(sigs)))
+        self.assertEqual(msm_counts(rtcm1005), (None, None))
+        self.assertEqual(
+            parse_rtcmstr("1005(10),1077(1),4072_0"),
+            {"1005": 10.0, "1077": 1.0, "4072_0": None},
+        )
+        rts = RTCMStats(ringsize=3)
+        for _ in range(5):
+            rts.update(rtcm1077, "GNSS")
+        rts.update(rtcm1005, "NTRIP")
+        rts.update(b"$GPGGA,,,", "GNSS")  # not RTCM3, ignored
+        rows = rts.stats("1005(10),1077(0.000001),1230(1)")
+        self.assertEqual(
+            [(r["identity"], r["source"], r["count"], r["status"]) for r in rows],
+            [
+                ("1005", "NTRIP", 1, OK),
+                ("1077", "GNSS", 5, LATE),
+                ("1230", "", 0, MISSING),
+            ],
+        )
+        row = rows[1]
+        self.assertEqual((row["nsat"], row["nsig"]), (3, 2))
+        self.assertTrue(0 <= row["interval"] <= row["maxgap"] < 1)
+        self.assertIsNone(rows[0]["interval"])
+        self.assertEqual([r["status"] for r in rts.stats()], ["", ""])
+        rts.reset()
+        self.assertEqual(rts.stats(), [])
+
+    def testspartndecoder(self):
+        self.assertIsNone(spartn_basedate(-1))
+        self.assertEqual(spartn_basedate(0), TIMEBASE)
+        self.assertEqual(spartn_basedate(425599250), 425599250)
+        # unencrypted OCB-GPS message with no satellites
+        ocb = bytes.fromhex("73000380002690100000000000000023")
+        bad = bytes.fromhex("73000400002690100000000000000000ad")  # undecodable
+        ocbu = SPARTNReader.parse(ocb)
+        badu = SPARTNReader.parse(bad)
+        self.assertFalse(hasattr(ocbu, "SF011"))
+        ready = Event()
+        dec = SPARTNDecoder(ready.set, cachesize=3)
+        self.assertTrue(dec.submit(ocb, ocbu, "MQTT>>"))
+        self.assertTrue(dec.submit(bad, badu, "MQTT>>"))
+        self.assertTrue(dec.submit(ocb[:1] + ocb[1:], ocbu, "NTRIP>>"))
+        self.assertTrue(dec.submit(ocb, ocbu, "NTRIP>>", basedate=425599250))
+        done = []
+        for _ in range(50):
+            ready.wait(1)
+            ready.clear()
+            done += dec.completed()
+            if len(done) == 4:
+                break
+        self.assertEqual(
+            [d[2] for d in done], ["MQTT>>", "MQTT>>", "NTRIP>>", "NTRIP>>"]
+        )
+        self.assertEqual(done[0][1].SF011, 0)
+        self.assertIs(done[1][1], badu)  # not decoded, so undecoded returned
+        self.assertIs(done[2][1], done[0][1])  # from cache
+        self.assertIsNot(done[3][1], done[0][1])  # different basedate, not cached
+        self.assertEqual((dec.decoded, dec.cached), (2, 1))
+        dec.stop()
+        self.assertEqual(dec.completed(), [])
+
+    def testcorrectioncapture(self):
+        rtcm1005 = bytes.fromhex("d300133ed0070208e616efd23fa43563780bd3ea7c0067255e")
+        ocb = bytes.fromhex("73000380002690100000000000000023")
+        gga = b"$GNGGA,103607.00,5327.03942,N,00214.42462,W,1,12,0.71,76.9,M,48.5,M,,*69\r\n"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fpath = os.path.join(tmpdir, "capture.pgc")
+            cap = CaptureWriter(fpath)
+            gnssq = CaptureQueue(CAPGNSS)
+            ntripq = PassthroughQueue(Queue(), source=CAPNTRIP)
+            spartnq = PassthroughQueue(Queue(), source=CAPSPARTN)
+            gnssq.put((gga, None))  # not captured
+            for que in (gnssq, ntripq, spartnq):
+                que.capture = cap
+            gnssq.put((gga, None))
+            ntripq.put((rtcm1005, None))
+            ntripq.passthrough = True
+            ntripq.forward(rtcm1005)
+            ntripq.put((rtcm1005, None))  # passthrough sample, already captured
+            spartnq.put((ocb, None))
+            cap.close()
+            gnssq.put((gga, None))  # closed, not captured
+            self.assertEqual(cap.records, 4)
+            self.assertTrue(is_capture(fpath))
+            self.assertFalse(is_capture(os.path.join(tmpdir, "nonexistent.pgc")))
+            with open(fpath, "rb") as stream:
+                recs = list(CaptureReader(stream))
+            with open(fpath, "rb") as stream:
+                stream.seek(1)
+                with self.assertRaises(ValueError):
+                    CaptureReader(stream)
+        self.assertEqual(
+            [(src, raw) for _, src, raw in recs],
+            [
+                (CAPGNSS, gga),
+                (CAPNTRIP, rtcm1005),
+                (CAPNTRIP, rtcm1005),
+                (CAPSPARTN, ocb),
+            ],
+        )
+        times = [tim for tim, _, _ in recs]
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(parse_raw(gga).identity, "GNGGA")
+        self.assertEqual(parse_raw(rtcm1005).identity, "1005")
+        self.assertEqual(parse_raw(ocb).identity, "SPARTN-1X-OCB-GPS")
+        self.assertIsNone(parse_raw(b"\x73\x00\x00"))
+
+    def testsourcetableindex(self):
+        stable = [
+            [
+                "MAN",
+                "Manchester",
+                "RTCM 3.3",
+                "1077(1)",
+                "2",
+                "GPS+GAL",
+                "",
+                "GBR",
+                "53.48",
+                "-2.24",
+            ],
+            [
+                "LDS",
+                "Leeds",
+                "RTCM 3.2",
+                "1074(1)",
+                "2",
+                "GPS",
+                "",
+                "GBR",
+                "53.80",
+                "-1.55",
+            ],
+            [
+                "LON",
+                "London",
+                "RTCM 3.3",
+                "1077(1)",
+                "2",
+                "GPS+GAL",
+                "",
+                "GBR",
+                "51.51",
+                "-0.13",
+            ],
+            [
+                "FJI",
+                "Fiji",
+                "RTCM 3.3",
+                "1077(1)",
+                "2",
+                "GPS",
+                "",
+                "FJI",
+                "-17.7",
+                "179.9",
+            ],
+            ["SAM", "Samoa", "RAW", "", "2", "GPS", "", "WSM", "-13.8", "-172.1"],
+            ["NOLOC", "No location", "RTCM 3.3"],
+        ]
+        idx = SourcetableIndex(stable)
+        self.assertEqual(len(idx), 6)
+        self.assertEqual(
+            [e[0] for _, e in idx.nearest(53.4, -2.0, 3)], ["MAN", "LDS", "LON"]
+        )
+        self.assertEqual(
+            [e[0] for _, e in idx.nearest(53.4, -2.0, 3, "rtcm 3.3", "gal")],
+            ["MAN", "LON"],
+        )
+        # across antimeridian
+        self.assertEqual(idx.nearest(-17.0, -179.9, 1)[0][1][0], "FJI")
+        self.assertEqual(idx.nearest(-17.0, -179.9, 1, "RAW")[0][1][0], "SAM")
+        self.assertAlmostEqual(idx.distance(53.48, -2.24, "MAN"), 0)
+        self.assertIsNone(idx.distance(53.48, -2.24, "NOLOC"))
+        self.assertIsNone(idx.distance(53.48, -2.24, "XXX"))
+        self.assertEqual(
+            [e[0] for e in idx.by_distance(51.5, 0)],
+            ["LON", "MAN", "LDS", "SAM", "FJI", "NOLOC"],
+        )
+        self.assertEqual(SourcetableIndex().nearest(0, 0, 1), [])
+        sel = MountpointSelector(threshold=10)
+        self.assertEqual(sel.update(idx, 53.4, -2.0, "LON", "RTCM")[0], "MAN")
+        self.assertEqual(sel.update(idx, 53.45, -2.0), (None, None))  # < 10 km moved
+        self.assertEqual(sel.update(idx, 53.81, -1.56, "MAN")[0], "LDS")
+        self.assertEqual(sel.update(idx, 51.5, -0.1, "LON"), (None, None))
+        with tempfile.TemporaryDirectory() as cachedir:
+            cache = SourcetableCache(cachedir, expiry=3600)
+            self.assertIsNone(cache.get("caster.com", 2101))
+            cache.put("caster.com", 2101, stable)
+            self.assertEqual(cache.get("caster.com", 2101), stable)
+            self.assertIsNone(cache.get("caster.com", 443))
+            for fil in os.listdir(cachedir):
+                os.utime(os.path.join(cachedir, fil), (0, 0))
+            self.assertIsNone(cache.get("caster.com", 2101))  # expired
+
+    def testrinexparallel(self):
+        params = {
+            "rinex_version": "4.02",
+            "rinex_types": ("O",),
+            "gnssfilter": ("",),
+            "obsfilter": ("",),
+            "timecorr": False,
+            "ionocorr": False,
+            "eopcorr": False,
+            "starttime": "20261018000000+0000",
+            "minobs": 10,
+            "marker": ("", "", ""),
+            "antenna": ("", ""),
+            "antennahed": (0, 0, 0),
+            "receiver": ("", "", ""),
+            "observer": "",
+            "comments": ("",),
+            "verbosity": -1,
+        }
+        raw = rxmrawx(300000.5, [])
+        self.assertEqual(epoch_key(raw), raw[6:16])
+        self.assertIsNone(epoch_key(b"$GNGGA,,,,*00\r\n"))
+        # multi-GNSS RTCM3 MSM epochs are split at GPS epoch boundaries only
+        data = b""
+        for epoch in range(5):
+            tow = 300000000 + epoch * 1000  # GPS time of week in ms
+            glo = (tow + 10800000 - 18000) % 604800000  # GLONASS day + time of day
+            data += rtcmmsm7([1], [2], 1077, tow)
+            data += rtcmmsm7([1], [2], 1087, (glo // 86400000) << 27 | glo % 86400000)
+            data += rtcmmsm7([1], [2], 1127, tow - 14000)
+        self.assertIsNone(epoch_key(rtcmmsm7([1], [2], 1087, 7 << 27)))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            infile = os.path.join(tmpdir, "in.rtcm")
+            with open(infile, "wb") as outfile:
+                outfile.write(data)
+            chunks = split_input(Path(infile), Path(tmpdir), 1)
+            self.assertEqual(len(chunks), 5)
+            for chunk in chunks:
+                with open(chunk, "rb") as stream:
+                    keys = {epoch_key(raw) for raw, _ in RTCMReader(stream)}
+                self.assertEqual(len(keys), 1)
+        data = b""
+        for epoch in range(60):
+            sats = [(0, 1, 0), (0, 5, 0), (2, 11, 0), (6, 3, 0)]
+            if epoch > 30:  # new signal appears mid-file
+                sats.append((2, 12, 6))
+            data += rxmrawx(300000.0 + epoch, sats)
+        outputs = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for folder, conv in (
+                ("single", RinexConverter(None, **params)),
+                ("parallel", ParallelRinexConverter(2, 1000, **params)),
+            ):
+                os.mkdir(os.path.join(tmpdir, folder))
+                infile = os.path.join(tmpdir, folder, "in.ubx")
+                with open(infile, "wb") as outfile:
+                    outfile.write(data)
+                self.assertEqual(conv.process_input(infile), 0)
+                fnm, count = conv.outputs["O"]
+                self.assertEqual(count, 60)
+                with open(fnm, "r", encoding="utf-8") as rnx:
+                    outputs.append((fnm.name, rnx.readlines()))
+            self.assertEqual(outputs[0][0], outputs[1][0])
+            hdr = outputs[0][1].index(
+                next(l for l in outputs[0][1] if "END OF HEADER" in l)
+            )
+            self.assertEqual(outputs[0][1][hdr:], outputs[1][1][hdr:])  # body
+            for label in ("OBS TYPES", "FIRST OBS", "LAST OBS", "# OF SATELLITES"):
+                self.assertEqual(
+                    [l for l in outputs[0][1] if label in l],
+                    [l for l in outputs[1][1] if label in l],
+                )
+
+            # duplicate navigation records in chunk overlap are removed
+            hdr = "     4.02           N: GNSS NAV DATA    M: MIXED            RINEX VERSION / TYPE\n"
+            eoh = " " * 60 + "END OF HEADER\n"
+            recs = [
+                "G01 2026 01 07 12 00 00\n",
+                "     1.0\n",
+                "G02 2026 01 07 12 00 00\n",
+                "     2.0\n",
+            ]
+            chunks = []
+            for i, body in enumerate(
+                (recs, recs[2:] + ["E11 2026 01 07 12 00 00\n", "     3.0\n"])
+            ):
+                chunks.append(os.path.join(tmpdir, f"nav{i}.rnx"))
+                with open(chunks[-1], "w", encoding="utf-8") as outfile:
+                    outfile.writelines([hdr, eoh] + body)
+            merged = os.path.join(tmpdir, "nav.rnx")
+            merge_nav(chunks, merged, "in.ubx")
+            with open(merged, "r", encoding="utf-8") as rnx:
+                lines = rnx.readlines()
+            self.assertEqual(
+                lines[2:8], recs + ["E11 2026 01 07 12 00 00\n", "     3.0\n"]
+            )
+            self.assertIn("END OF FILE", lines[-1])
+
+    def testrinexbatch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paramfile = os.path.join(tmpdir, "params.json")
+            with open(paramfile, "w", encoding="utf-8") as outfile:
+                outfile.write('{"rinex_types": ["O"], "marker": ["M1", "SITE", ""]}')
+            params = load_params(paramfile)
+            self.assertEqual(params["rinex_types"], ("O",))
+            self.assertEqual(params["marker"], ("M1", "SITE", ""))
+            self.assertEqual(params["obsfilter"], ("",))
+            with open(paramfile, "w", encoding="utf-8") as outfile:
+                outfile.write('{"rinex_types": ["O"], "xmarker": "M1"}')
+            with self.assertRaises(ValueError):
+                load_params(paramfile)
+            for i in range(2):
+                with open(
+                    os.path.join(tmpdir, f"pygpsdata-2026101800000{i}.log"), "wb"
+                ) as outfile:
+                    for epoch in range(20):
+                        outfile.write(rxmrawx(300000.0 + epoch + i * 100, [(0, 1, 0)]))
+            inputs = find_inputs([tmpdir, os.path.join(tmpdir, "*.log")])
+            self.assertEqual(len(inputs), 2)
+            self.assertEqual(find_inputs([tmpdir], "*.ubx"), [])
+            results = batch_convert(inputs, params, workers=2)
+            self.assertEqual([r["result"] for r in results], ["converted", "converted"])
+            self.assertEqual(results[0]["outputs"]["O"]["records"], 20)
+            self.assertEqual(
+                sorted(converted_logs(inputs[0].parent)), [str(i) for i in inputs]
+            )
+            os.utime(inputs[1])  # log modified since conversion
+            results = batch_convert(inputs, params, workers=2)
+            self.assertEqual([r["result"] for r in results], ["skipped", "converted"])
+            results = batch_convert(inputs, params, force=True)
+            self.assertEqual([r["result"] for r in results], ["converted", "converted"])
+
+    def testrinexlogger(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rnxlog = RINEXLogger(tmpdir, period=60)
+            rnxlog.write(b"$GNGGA,,,,*00\r\n", NMEAMessage("GN", "GGA", 0))  # ignored
+            for epoch in range(90):  # spans two logging periods
+                raw = rxmrawx(300000.0 + epoch, [(0, 1, 0), (2, 11, 0)])
+                rnxlog.write(raw, UBXReader.parse(raw))
+            self.assertEqual(rnxlog.records, 90)
+            self.assertIn("pygpsrinex-20260107112100.log", os.listdir(tmpdir))
+            rnxlog.close()
+            self.assertEqual(
+                [(r["result"], r["outputs"]["O"]["records"]) for r in rnxlog.converted],
+                [("converted", 60), ("converted", 30)],
+            )
+            files = sorted(os.listdir(tmpdir))  # spool and empty NAV files removed
+            self.assertEqual(len(files), 2)
+            self.assertTrue(all(fnm.endswith("_MO.rnx") for fnm in files))
+
+    def testlogframer(self):
+        gga = b"$GNGGA,235959.00,5327.04,N,00214.41,W,1,12,0.5,10.0,M,48.0,M,,*5B\r\n"
+        pvt = UBXMessage("NAV", "NAV-PVT", 0, iTOW=345600000).serialize()
+        rtcm = bytes.fromhex("d300133ed0070208e616efd23fa43563780bd3ea7c0067255e")
+        sbfbody = b"\xa7\x0f\x10\x00" + (1000).to_bytes(4, "little") + b"\x00" * 4
+        sbf = b"$@" + crc_hqx(sbfbody, 0).to_bytes(2, "little") + sbfbody
+        data = b"junk" + pvt + gga + b"\xd3\xff" + rtcm + sbf + b"\xb5"
+        for bufsize in (5, 64, 1024):  # frames spanning block boundaries
+            framer = LogFramer(io.BytesIO(data), bufsize)
+            frames = [(off, prot, identify(raw, prot)) for off, prot, raw in framer]
+            self.assertEqual(
+                frames,
+                [
+                    (4, "UBX", "NAV-PVT"),
+                    (104, "NMEA", "GNGGA"),
+                    (173, "RTCM", "1005"),
+                    (198, "SBF", "PVTGeodetic"),
+                ],
+            )
+            self.assertEqual(framer.unknown, 7)
+        self.assertEqual(receiver_time(pvt, "UBX", "NAV-PVT"), 86382.0)
+        self.assertEqual(receiver_time(gga, "NMEA", "GNGGA"), 86399.0)
+        self.assertEqual(receiver_time(sbf, "SBF", "PVTGeodetic"), 86383.0)
+        self.assertIsNone(receiver_time(rtcm, "RTCM", "1005"))
+        clock = ReceiverClock()
+        self.assertEqual([clock.update(t) for t in (86399, 0.5)], [86399, 86400.5])
+        # after resync, invalid checksums or NMEA format are rejected, not framed
+        badgga = b"$GNGGA,\x00\x01,*5B\r\n"
+        badpvt = pvt[:-1] + bytes([pvt[-1] ^ 1])
+        framer = LogFramer(io.BytesIO(b"junk" + badgga + badpvt + rtcm[:-1] + b"\x00"))
+        self.assertEqual(list(framer), [])
+        self.assertEqual(framer.unknown, len(b"junk" + badgga + badpvt + rtcm))
+        # in sync, frames confirmed by following header or end of stream are
+        # accepted without checksum validation
+        framer = LogFramer(io.BytesIO(badpvt + pvt + badpvt))
+        self.assertEqual([raw for _, _, raw in framer], [badpvt, pvt, badpvt])
+        framer = LogFramer(io.BytesIO(pvt + badpvt + b"junk"))
+        self.assertEqual([raw for _, _, raw in framer], [pvt])
+        # junk containing false sync sequences does not swallow real frames
+        frames = []
+        for i in range(1000):
+            frames.append(UBXMessage("NAV", "NAV-PVT", 0, iTOW=i * 1000).serialize())
+            frames.append(gga.replace(b"235959", b"%06d" % i))
+            if not i % 10:
+                frames += [rtcm, sbf]
+        data, offsets = junked(frames)
+        for bufsize in (64, 4194304):
+            framer = LogFramer(io.BytesIO(data), bufsize)
+            self.assertEqual(
+                [(off, raw) for off, _, raw in framer], list(zip(offsets, frames))
+            )
+            self.assertEqual(framer.unknown, len(data) - len(b"".join(frames)))
+
+    def testlogtriage(self):
+        data = b"".join(
+            rxmrawx(300000.0 + epoch, [(0, 1, 0)]) for epoch in range(10) if epoch != 5
+        )
+        index = io.StringIO()
+        summary = scan_log(io.BytesIO(data + b"\x00" * 10), index)
+        stat = summary["identities"]["RXM-RAWX"]
+        self.assertEqual((summary["frames"], summary["unknown"]), (9, 10))
+        self.assertEqual((stat["count"], stat["rate"], stat["maxgap"]), (9, 0.889, 2.0))
+        self.assertEqual(stat["share"], round(len(data) * 100 / (len(data) + 10), 2))
+        lines = index.getvalue().splitlines()
+        self.assertEqual(lines[0], "offset,length,protocol,identity,time")
+        self.assertEqual(lines[1], f"0,{len(data) // 9},UBX,RXM-RAWX,40782.0")
+        self.assertIn("RXM-RAWX", format_summary(summary))
+
+    def testlogextract(self):
+        gga = b"$GNGGA,112100.00,5327.04,N,00214.41,W,1,12,0.5,10.0,M,48.0,M,,*5B\r\n"
+        # 1005, no receiver time
+        rtcm = bytes.fromhex("d300133ed0070208e616efd23fa43563780bd3ea7c0067255e")
+        raws = [rxmrawx(300000.0 + epoch, [(0, 1, 0)]) for epoch in range(10)]
+        data = b"".join(raw + rtcm for raw in raws) + gga
+        out = io.BytesIO()
+        summary = extract_log(io.BytesIO(data), out)  # no filters
+        self.assertEqual(out.getvalue(), data)
+        self.assertEqual((summary["frames"], summary["extracted"]), (21, 21))
+        out = io.BytesIO()  # RXM-RAWX rcvTow 300000 = 11:19:42 UTC
+        summary = extract_log(
+            io.BytesIO(data),
+            out,
+            identities=("RXM-RAWX", "1005"),
+            start=parse_tod("11:19:45"),
+            end=parse_tod("11:19:48"),
+        )
+        self.assertEqual(out.getvalue(), b"".join(raw + rtcm for raw in raws[3:6]))
+        out = io.BytesIO()
+        extract_log(io.BytesIO(data), out, protocols=("NMEA",))
+        self.assertEqual(out.getvalue(), gga)
+        # junk between frames is dropped; no frames lost, no garbage written
+        frames = [f for raw in raws * 20 for f in (raw, rtcm)] + [gga]
+        data, _ = junked(frames, seed=2)
+        self.assertGreater(len(data), len(b"".join(frames)))
+        out = io.BytesIO()
+        summary = extract_log(io.BytesIO(data), out)
+        self.assertEqual(out.getvalue(), b"".join(frames))
+        self.assertEqual(summary["unknown"], len(data) - len(b"".join(frames)))
+        out = io.BytesIO()
+        extract_log(io.BytesIO(data), out, identities=("1005",))
+        self.assertEqual(out.getvalue(), rtcm * 200)
+        self.assertTrue(in_window(parse_tod("23:55"), parse_tod("23:50"), 600))
+        self.assertFalse(in_window(None, parse_tod("23:50")))
+        with self.assertRaises(ValueError):
+            parse_tod("25:00")
+
+
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
     unittest.main()
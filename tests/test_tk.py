@@ -16,7 +16,13 @@ Created on 5 Nov 2025
 
 import unittest
 
-from tkinter import Entry, Tk, TclError
+from tkinter import Canvas, Entry, Tk, TclError
+from pygpsclient.canvas_subclasses import (
+    TAG_GRID,
+    TAG_POOL,
+    CanvasGraph,
+    CanvasItemPool,
+)
 from pygpsclient.globals import (
     VALBLANK,
     VALNONBLANK,
@@ -124,3 +130,65 @@ class TkTest(unittest.TestCase):
                 print(f"{err}\nCan't execute this test without Window environment")
             else:
                 raise TclError from err
+
+    def testCanvasItemPool(self):
+
+        try:
+
+            root = Tk()
+            can = Canvas(root)
+            pool = CanvasItemPool(can)
+            pool.start()
+            iid1 = pool.draw((0, 1), "rectangle", (0, 0, 10, 10), fill="red")
+            iid2 = pool.draw((0, 1), "text", (5, 5), text="01")
+            iid3 = pool.draw((0, 2), "rectangle", (10, 0, 20, 10), fill="blue")
+            pool.purge()
+            self.assertEqual(len(pool), 3)
+            self.assertEqual(len(can.find_withtag(TAG_POOL)), 3)
+            # existing items are updated in place
+            pool.start()
+            self.assertEqual(
+                pool.draw((0, 1), "rectangle", (0, 0, 10, 20), fill="green"), iid1
+            )
+            self.assertEqual(pool.draw((0, 1), "text", (5, 5), text="01"), iid2)
+            pool.purge()
+            self.assertEqual(can.coords(iid1), [0.0, 0.0, 10.0, 20.0])
+            self.assertEqual(can.itemcget(iid1, "fill"), "green")
+            # items not drawn are deleted
+            self.assertEqual(len(pool), 2)
+            self.assertEqual(can.find_withtag(iid3), ())
+            pool.clear()
+            self.assertEqual(len(pool), 0)
+            self.assertEqual(can.find_withtag(TAG_POOL), ())
+
+        except TclError as err:
+            if str(err) == "no display name and no $DISPLAY environment variable":
+                print(f"{err}\nCan't execute this test without Window environment")
+            else:
+                raise TclError from err
+
+    def testCanvasGraphStaticLayers(self):
+
+        class DummyApp:
+            def __init__(self, master):
+                self.appmaster = master
+
+        try:
+
+            root = Tk()
+            can = CanvasGraph(DummyApp(root), root, width=300, height=200)
+            can.create_graph(xtickmaj=5, ytickmaj=5)
+            grid1 = can.find_withtag(TAG_GRID)
+            self.assertTrue(len(grid1) > 0)
+            # unchanged static layers are not redrawn
+            can.create_graph(xtickmaj=5, ytickmaj=5)
+            self.assertEqual(can.find_withtag(TAG_GRID), grid1)
+            # changed axes are redrawn
+            can.create_graph(xtickmaj=10, ytickmaj=5)
+            self.assertNotEqual(can.find_withtag(TAG_GRID), grid1)
+
+        except TclError as err:
+            if str(err) == "no display name and no $DISPLAY environment variable":
+                print(f"{err}\nCan't execute this test without Window environment")
+            else:
+                raise TclError from err